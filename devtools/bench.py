@@ -0,0 +1,442 @@
+"""Benchmark suite for scan, replay, analysis, and Click round-trip workloads.
+
+Usage (from repo root):
+    uv run python devtools/bench.py                          # run, compare to baseline
+    uv run python devtools/bench.py -k scan --sizes 50,200   # subset
+    uv run python devtools/bench.py --save                   # rewrite the baseline
+    uv run python devtools/bench.py --json out.json --no-compare
+
+Each case times one operation (a scan, a history lookup, an export, ...)
+and reports the median seconds per call over ``--repeats`` rounds.  Scan
+cases run at several program sizes built by `synthetic_program()`, so
+the results form scaling curves rather than single points.
+
+Results are compared against ``bench/baseline.json``; a case more than
+``--tolerance`` slower than its baseline is reported as a regression and
+the run exits non-zero.  Baselines are machine-specific: regenerate with
+``--save`` on the reference machine after an intentional change.  The
+baseline records the machine it was measured on; on any other machine the
+comparison is skipped with a warning unless ``--force-compare`` is given.
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import functools
+import json
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import warnings
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_BASELINE = REPO_ROOT / "bench" / "baseline.json"
+DEFAULT_SIZES = (50, 200, 800)
+
+# Scans driven before timing, so first-scan setup (tag seeding, kernel
+# compile, PDG build) is not counted as steady-state scan cost.
+_WARMUP_SCANS = 20
+# History cases record this many scans of a small program; effect()
+# walks forward from the transition, so its cost grows with both.
+_HISTORY_RUNGS = 40
+_HISTORY_SCANS = 2000
+# Rungs emitted per machine cell by synthetic_program().
+_RUNGS_PER_CELL = 5
+
+
+@dataclass(frozen=True)
+class Case:
+    """One benchmark: ``setup()`` returns the zero-argument callable to time."""
+
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    # Seconds of timing per round; calls per round are scaled to fit.
+    budget: float = 0.2
+    # Single-shot cases (seconds per call) skip calibration.
+    single: bool = False
+
+
+@dataclass(frozen=True)
+class Result:
+    name: str
+    seconds: float
+    calls: int
+
+
+# ---------------------------------------------------------------------------
+# Synthetic programs
+# ---------------------------------------------------------------------------
+
+
+def synthetic_program(rungs: int) -> tuple[Any, Any]:
+    """Build a ``(Program, TagMap)`` pair with *rungs* rungs.
+
+    *rungs* is rounded down to a multiple of five (at least one cell).
+    Each block of five rungs is a small machine cell: a start latch, a
+    stop reset, an on-delay timer, an edge-counted cycle counter, and a
+    compare that copies the count into a data register.  Every tag maps to a Click
+    address, so the same program feeds scan, replay, and export cases.
+    """
+    from pyrung.click import TagMap, c, ct, ctd, ds, t, td
+    from pyrung.core import (
+        Bool,
+        Counter,
+        Int,
+        Program,
+        PyrungNameWarning,
+        Rung,
+        Timer,
+        copy,
+        count_up,
+        latch,
+        on_delay,
+        reset,
+        rise,
+    )
+
+    cells = _cells(rungs)
+    # Tag names differ from their local variable names on purpose.
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", PyrungNameWarning)
+        stop = Bool("Stop")
+        clear = Bool("Clear")
+        mappings = [stop.map_to(c[1999]), clear.map_to(c[2000])]
+        with Program(strict=False) as logic:
+            for i in range(1, cells + 1):
+                start = Bool(f"Start{i}")
+                running = Bool(f"Running{i}")
+                timer = Timer.clone(f"Dwell{i}")
+                counter = Counter.clone(f"Cycles{i}")
+                shown = Int(f"Shown{i}")
+                with Rung(start):
+                    latch(running)
+                with Rung(stop):
+                    reset(running)
+                with Rung(running):
+                    on_delay(timer, preset=20 + (i % 7) * 10)
+                with Rung(rise(timer.Done)):
+                    count_up(counter, preset=1000).reset(clear)
+                with Rung(counter.Acc > i % 5):
+                    copy(counter.Acc, shown)
+                mappings += [
+                    start.map_to(c[i]),
+                    running.map_to(c[1000 + i]),
+                    timer.Done.map_to(t[i]),
+                    timer.Acc.map_to(td[i]),
+                    counter.Done.map_to(ct[i]),
+                    counter.Acc.map_to(ctd[i]),
+                    shown.map_to(ds[i]),
+                ]
+    return logic, TagMap(mappings, include_system=False)
+
+
+def _cells(rungs: int) -> int:
+    return max(1, rungs // _RUNGS_PER_CELL)
+
+
+def _drive(plc: Any, scans: int, cells: int) -> None:
+    """Toggle cell start buttons so timers, edges, and counters all move."""
+    for scan in range(scans):
+        cell = scan % cells + 1
+        plc.patch({f"Start{cell}": True, "Stop": scan % 97 == 0})
+        plc.step()
+
+
+# ---------------------------------------------------------------------------
+# Cases
+# ---------------------------------------------------------------------------
+
+
+def _scan_interpreted(size: int) -> Callable[[], object]:
+    from pyrung.core import PLC
+
+    logic, _ = synthetic_program(size)
+    plc = PLC(logic, dt=0.01, history_budget=1 << 20)
+    _drive(plc, _WARMUP_SCANS, _cells(size))
+    return plc.step
+
+
+def _scan_compiled(size: int) -> Callable[[], object]:
+    from pyrung.core import CompiledPLC
+
+    logic, _ = synthetic_program(size)
+    plc = CompiledPLC(logic, dt=0.01)
+    _drive(plc, _WARMUP_SCANS, _cells(size))
+    return plc.step_replay
+
+
+@functools.cache
+def _long_history() -> Any:
+    from pyrung.core import PLC
+
+    logic, _ = synthetic_program(_HISTORY_RUNGS)
+    plc = PLC(logic, dt=0.01)
+    _drive(plc, _HISTORY_SCANS, _cells(_HISTORY_RUNGS))
+    return plc
+
+
+def _history_at() -> Callable[[], object]:
+    plc = _long_history()
+    scan_ids = iter(range(10**9))
+    tip = plc.current_state.scan_id
+
+    def run() -> object:
+        return plc.history.at(tip - next(scan_ids) % tip)
+
+    return run
+
+
+def _replay_to() -> Callable[[], object]:
+    plc = _long_history()
+    target = plc.current_state.scan_id // 2 + 7
+    return lambda: plc.replay_to(target)
+
+
+def _cause() -> Callable[[], object]:
+    plc = _long_history()
+    return lambda: plc.cause(f"Shown{_cells(_HISTORY_RUNGS)}")
+
+
+def _effect() -> Callable[[], object]:
+    plc = _long_history()
+    return lambda: plc.effect("Start1")
+
+
+def _reachable_states() -> Callable[[], object]:
+    sys.path.insert(0, str(REPO_ROOT))
+    from examples.packml_bench import logic
+    from pyrung.core.analysis.prove import reachable_states
+
+    return lambda: reachable_states(logic, project=["StateCurrent"], max_states=20_000)
+
+
+def _ladder_export() -> Callable[[], object]:
+    from pyrung.click import pyrung_to_ladder
+
+    logic, tag_map = synthetic_program(200)
+    return lambda: pyrung_to_ladder(logic, tag_map)
+
+
+@functools.cache
+def _exported_project() -> Path:
+    from pyrung.click import pyrung_to_ladder
+
+    logic, tag_map = synthetic_program(200)
+    directory = Path(tempfile.mkdtemp(prefix="pyrung-bench-"))
+    atexit.register(shutil.rmtree, directory, ignore_errors=True)
+    pyrung_to_ladder(logic, tag_map).write(directory)
+    tag_map.to_nickname_file(directory / "nicknames.csv")
+    return directory
+
+
+def _ladder_import() -> Callable[[], object]:
+    from pyrung.click import ladder_to_pyrung
+
+    directory = _exported_project()
+    return lambda: ladder_to_pyrung(directory, nickname_csv=directory / "nicknames.csv")
+
+
+def _tag_map_load() -> Callable[[], object]:
+    from pyrung.click import TagMap
+
+    path = _exported_project() / "nicknames.csv"
+    return lambda: TagMap.from_nickname_file(path, cache=False)
+
+
+def _import_pyrung() -> Callable[[], object]:
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from importtime import _sample
+
+    # ``import pyrung`` in a fresh interpreter; the sample's own total
+    # excludes interpreter startup.
+    return lambda: _sample("pyrung").total_us
+
+
+def build_cases(sizes: tuple[int, ...]) -> list[Case]:
+    cases: list[Case] = []
+    for size in sizes:
+        cases.append(Case(f"scan.interpreted[{size}]", lambda size=size: _scan_interpreted(size)))
+        cases.append(Case(f"scan.compiled[{size}]", lambda size=size: _scan_compiled(size)))
+    cases += [
+        Case("history.at", _history_at),
+        Case("history.replay_to", _replay_to, budget=1.0),
+        Case("causal.cause", _cause, budget=1.0),
+        Case("causal.effect", _effect, budget=1.0),
+        Case("prove.reachable_states[packml]", _reachable_states, single=True),
+        Case("click.ladder_export[200]", _ladder_export, budget=1.0),
+        Case("click.ladder_import[200]", _ladder_import, budget=1.0),
+        Case("click.tag_map_load[200]", _tag_map_load, budget=0.5),
+        Case("import.pyrung", _import_pyrung, budget=1.0),
+    ]
+    return cases
+
+
+# ---------------------------------------------------------------------------
+# Timing
+# ---------------------------------------------------------------------------
+
+
+def _calibrate(fn: Callable[[], object], budget: float) -> int:
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= budget / 4 or calls >= 1 << 20:
+            return max(1, int(calls * budget / max(elapsed, 1e-9)))
+        calls *= 4
+
+
+def measure(case: Case, repeats: int) -> Result:
+    fn = case.setup()
+    if case.single:
+        samples = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - start)
+        return Result(case.name, statistics.median(samples), 1)
+    calls = _calibrate(fn, case.budget)
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        samples.append((time.perf_counter() - start) / calls)
+    return Result(case.name, statistics.median(samples), calls)
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:8.2f} s "
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:8.2f} ms"
+    return f"{seconds * 1e6:8.1f} us"
+
+
+# ---------------------------------------------------------------------------
+# Baselines
+# ---------------------------------------------------------------------------
+
+
+def _machine() -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def load_baseline(path: Path) -> tuple[dict[str, str] | None, dict[str, float]]:
+    """Return the baseline's recorded machine (if any) and its results."""
+    if not path.exists():
+        return None, {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    results = {name: float(seconds) for name, seconds in data.get("results", {}).items()}
+    return data.get("machine"), results
+
+
+def save_results(path: Path, results: list[Result]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "machine": _machine(),
+        "results": {result.name: result.seconds for result in results},
+    }
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def compare(
+    results: list[Result], baseline: dict[str, float], tolerance: float
+) -> Iterator[tuple[Result, float | None, bool]]:
+    """Yield ``(result, ratio_to_baseline, regressed)`` for each result."""
+    for result in results:
+        reference = baseline.get(result.name)
+        if reference is None or reference <= 0:
+            yield result, None, False
+            continue
+        ratio = result.seconds / reference
+        yield result, ratio, ratio > 1 + tolerance
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", "--filter", default=None, help="Run cases whose name contains this")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma-separated rung counts for scan cases",
+    )
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown ratio")
+    parser.add_argument("--save", action="store_true", help="Write results as the new baseline")
+    parser.add_argument("--json", type=Path, default=None, help="Also write results here")
+    parser.add_argument("--no-compare", action="store_true")
+    parser.add_argument(
+        "--force-compare",
+        action="store_true",
+        help="Compare even if the baseline was recorded on another machine",
+    )
+    args = parser.parse_args(argv)
+
+    sizes = tuple(int(size) for size in args.sizes.split(",") if size)
+    cases = [case for case in build_cases(sizes) if not args.filter or args.filter in case.name]
+    baseline_machine, baseline = load_baseline(args.baseline)
+    same_machine = baseline_machine == _machine()
+    if args.no_compare:
+        baseline = {}
+    elif baseline and not same_machine and not args.force_compare:
+        print(
+            f"warning: {args.baseline} was recorded on another machine "
+            f"({baseline_machine}); skipping comparison (use --force-compare)",
+            file=sys.stderr,
+        )
+        baseline = {}
+
+    results: list[Result] = []
+    regressions: list[str] = []
+    width = max((len(case.name) for case in cases), default=0)
+    for case in cases:
+        result = measure(case, args.repeats)
+        results.append(result)
+        _, ratio, regressed = next(compare([result], baseline, args.tolerance))
+        line = f"{case.name:<{width}}  {_format_seconds(result.seconds)}"
+        if ratio is not None:
+            line += f"  {ratio:5.2f}x baseline"
+            if regressed:
+                line += "  REGRESSION"
+                regressions.append(case.name)
+        print(line, flush=True)
+
+    if args.json is not None:
+        save_results(args.json, results)
+    if args.save:
+        # Results from another machine are not merged into this one's baseline.
+        merged = dict(load_baseline(args.baseline)[1]) if same_machine else {}
+        merged.update({result.name: result.seconds for result in results})
+        save_results(
+            args.baseline,
+            [Result(name, seconds, 0) for name, seconds in sorted(merged.items())],
+        )
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+    if regressions:
+        print(
+            f"\n{len(regressions)} case(s) slower than baseline by more than {args.tolerance:.0%}"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,96 @@
+"""Track the startup cost of ``import pyrung``.
+
+Usage (from repo root):
+    uv run python devtools/importtime.py [--module pyrung] [--runs 9] [--top 15]
+    uv run python devtools/importtime.py --budget-ms 250   # fail above budget
+
+Runs ``python -X importtime -c "import <module>"`` in fresh interpreters and
+reports the median total, the modules with the largest cumulative import
+time, and whether any deferred stack (Modbus clients, asyncio, the analysis
+package, source-based name inference) was imported eagerly.  CLI commands,
+debug-adapter launches, and every pytest-xdist worker pay this cost, so
+the check exits non-zero when a deferred module leaks onto the import path
+or the median exceeds ``--budget-ms``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+
+# Modules that ``import pyrung`` must not load; each is imported on first use.
+DEFERRED_MODULES = (
+    "pyclickplc",
+    "pymodbus",
+    "asyncio",
+    "concurrent.futures",
+    "executing",
+    "pyrung.core.analysis",
+    "pyrung.core.harness",
+    "pyrung.core.instruction.send_receive",
+)
+
+
+@dataclass(frozen=True)
+class ImportSample:
+    total_us: int
+    cumulative_us: dict[str, int]
+
+
+def _sample(module: str) -> ImportSample:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative: dict[str, int] = {}
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self, cum, name = line[len("import time:") :].split("|")
+        stripped = name.strip()
+        cumulative[stripped] = int(cum)
+        if stripped == module:
+            total = int(cum)
+    return ImportSample(total_us=total, cumulative_us=cumulative)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="pyrung")
+    parser.add_argument("--runs", type=int, default=9)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    samples = [_sample(args.module) for _ in range(args.runs)]
+    median_ms = statistics.median(sample.total_us for sample in samples) / 1000
+
+    print(f"import {args.module}: median {median_ms:.1f} ms over {args.runs} runs")
+    last = samples[-1].cumulative_us
+    print(f"\nLargest cumulative imports (last run, top {args.top}):")
+    for name, cum in sorted(last.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"  {cum / 1000:8.1f} ms  {name}")
+
+    failed = False
+    leaked = [
+        name
+        for name in DEFERRED_MODULES
+        if any(loaded == name or loaded.startswith(f"{name}.") for loaded in last)
+    ]
+    if leaked:
+        print(f"\nDeferred modules imported eagerly: {', '.join(leaked)}")
+        failed = True
+    if args.budget_ms is not None and median_ms > args.budget_ms:
+        print(f"\nMedian {median_ms:.1f} ms exceeds budget {args.budget_ms:.1f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
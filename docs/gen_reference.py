@@ -50,8 +50,15 @@ CLICK_BLOCK_SYMBOLS: tuple[str, ...] = (
 CLICK_HELPER_SYMBOLS: tuple[str, ...] = (
     "pyrung.click.TagMap",
     "pyrung.click.LadderBundle",
+    "pyrung.click.LadderExportCache",
     "pyrung.click.LadderExportError",
+    "pyrung.click.ClickValidationCache",
     "pyrung.click.ClickDataProvider",
+    "pyrung.click.HilMismatch",
+    "pyrung.click.HilReport",
+    "pyrung.click.ModbusReplayTarget",
+    "pyrung.click.SoftPlcTarget",
+    "pyrung.click.replay_hil",
     "pyrung.click.ModbusAddress",
     "pyrung.click.ModbusReceiveInstruction",
     "pyrung.click.ModbusRtuTarget",
@@ -59,6 +66,7 @@ CLICK_HELPER_SYMBOLS: tuple[str, ...] = (
     "pyrung.click.ModbusTcpTarget",
     "pyrung.click.RegisterType",
     "pyrung.click.WordOrder",
+    "pyrung.click.iter_ladder_to_pyrung",
     "pyrung.click.ladder_to_pyrung",
     "pyrung.click.ladder_to_pyrung_project",
     "pyrung.click.pyrung_to_ladder",
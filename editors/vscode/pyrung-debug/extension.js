@@ -37,6 +37,7 @@ exports.activate = function (context) {
     getConditionLinesForDocument: (document) => decorator.conditionLinesForDocument(document),
   });
   const sessionExecutionState = new Map();
+  const scanFrameSubscriptions = new Map();
   const requestLogCommands = new Set([
     "continue",
     "pause",
@@ -252,6 +253,15 @@ exports.activate = function (context) {
       .catch(() => {});
   }
 
+  // Live scan frames only need `changes` for tags the history panel watches.
+  function syncScanFrameSubscription(session) {
+    const tags = historyPanel.subscribedTags();
+    const key = tags.join("\n");
+    if (scanFrameSubscriptions.get(session.id) === key) return;
+    scanFrameSubscriptions.set(session.id, key);
+    session.customRequest("pyrungSubscribeTags", { tags }).catch(() => {});
+  }
+
   context.subscriptions.push(
     vscode.window.onDidChangeActiveTextEditor(() => {
       const debugSession = vscode.debug.activeDebugSession;
@@ -318,6 +328,7 @@ exports.activate = function (context) {
               const trace = body.trace || {};
               historyPanel.updateHints(trace.tagHints || {});
               historyPanel.appendLiveChanges(body.changes || [], body.scanId);
+              syncScanFrameSubscription(session);
               if (trace.tagValues) {
                 dataView.updateTrace(
                   trace.tagValues,
@@ -373,6 +384,7 @@ exports.activate = function (context) {
               output.appendLine(`[state] ${session.id} -> running (event: continued)`);
             } else if (message.event === "terminated" || message.event === "exited") {
               sessionExecutionState.delete(session.id);
+              scanFrameSubscriptions.delete(session.id);
               output.appendLine(`[state] ${session.id} -> terminated`);
               setMonitorStatus(0);
               historyPanel.setSession(null);
@@ -400,6 +412,7 @@ exports.activate = function (context) {
     vscode.debug.onDidTerminateDebugSession((session) => {
       if (isPyrungSession(session)) {
         sessionExecutionState.delete(session.id);
+        scanFrameSubscriptions.delete(session.id);
         setMonitorStatus(0);
         historyPanel.setSession(null);
         dataView.setSession(null);
@@ -250,6 +250,10 @@ class PyrungHistoryPanelProvider {
     });
   }
 
+  subscribedTags() {
+    return Array.from(this._watchedTags).sort();
+  }
+
   appendLiveChanges(changes, scanId) {
     if (!this._watchedTags.size || !changes.length) {
       return;
@@ -3,8 +3,14 @@
 Import user-facing DSL symbols from this module:
 
     from pyrung import Bool, Program, Rung, PLC
+
+The autoharness and Modbus send/receive symbols are resolved from
+``pyrung.core`` on first access, keeping their imports off the
+``import pyrung`` path.
 """
 
+from typing import TYPE_CHECKING, Any
+
 from pyrung.core import (
     PLC,
     And,
@@ -14,17 +20,12 @@ from pyrung.core import (
     Char,
     CharBlock,
     Counter,
-    Coupling,
     Dint,
     DintBlock,
     Field,
-    Harness,
     InputBlock,
     Int,
     IntBlock,
-    ModbusAddress,
-    ModbusRtuTarget,
-    ModbusTcpTarget,
     Or,
     OutputBlock,
     Physical,
@@ -35,14 +36,12 @@ from pyrung.core import (
     RangeSlotView,
     Real,
     RealBlock,
-    RegisterType,
     Rung,
     SlotView,
     TagType,
     Timer,
     Word,
     WordBlock,
-    WordOrder,
     auto,
     blockcopy,
     branch,
@@ -65,9 +64,7 @@ from pyrung.core import (
     pack_bits,
     pack_text,
     pack_words,
-    profile,
     program,
-    receive,
     reset,
     return_early,
     rise,
@@ -75,7 +72,6 @@ from pyrung.core import (
     run_function,
     rung,
     search,
-    send,
     shift,
     subroutine,
     system,
@@ -89,6 +85,50 @@ from pyrung.core import (
     unpack_to_words,
 )
 
+if TYPE_CHECKING:
+    from pyrung.core import (
+        Coupling,
+        Harness,
+        ModbusAddress,
+        ModbusRtuTarget,
+        ModbusTcpTarget,
+        RegisterType,
+        WordOrder,
+        profile,
+        receive,
+        send,
+    )
+
+_LAZY_EXPORTS = frozenset(
+    {
+        "Coupling",
+        "Harness",
+        "profile",
+        "ModbusAddress",
+        "ModbusRtuTarget",
+        "ModbusTcpTarget",
+        "RegisterType",
+        "WordOrder",
+        "receive",
+        "send",
+    }
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import pyrung.core
+
+    value = getattr(pyrung.core, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_EXPORTS)
+
+
 __all__ = [
     "PLC",
     "Physical",
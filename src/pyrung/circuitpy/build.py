@@ -0,0 +1,269 @@
+"""Ahead-of-time ``.mpy`` build for the P1AM-200.
+
+CircuitPython compiles ``code.py`` on the board at boot, and the
+compiler's parse tree for a large generated program can exhaust the heap
+before the first scan.  :func:`build_circuitpy` compiles on the host
+instead with ``mpy-cross``:
+
+- the generated program becomes ``pyrung_app.mpy``;
+- ``code.py`` shrinks to ``import pyrung_app``;
+- the runtime becomes ``lib/pyrung_rt.mpy``.
+
+The output directory mirrors the ``CIRCUITPY`` drive, so it can be copied
+over as-is.  Builds are deterministic: the same program, options, and
+``mpy-cross`` produce byte-identical files.
+
+The report's import-heap figure is the compiled bytecode size (loaded
+into RAM on import) plus the generator's data estimate
+(:class:`~pyrung.circuitpy.codegen.ResourceReport`).  Boot time can only
+be measured on the board; ``profile=True`` adds on-target scan timing.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from pyrung.circuitpy.codegen import ResourceReport, generate_circuitpy
+from pyrung.circuitpy.codegen.generate import _DEFAULT_RUNSTOP, MappedTagScope
+from pyrung.circuitpy.hardware import P1AM
+from pyrung.circuitpy.modbus import ModbusClientConfig, ModbusServerConfig
+from pyrung.circuitpy.p1am import RunStopConfig
+from pyrung.circuitpy.profile import PROFILE_LAYOUT_FILENAME
+from pyrung.click.tag_map import TagMap
+from pyrung.core.program import Program
+
+APP_MODULE = "pyrung_app"
+MPY_CROSS_ENV = "MPY_CROSS"
+
+_CODE_STUB = (
+    "# Generated by pyrung build-circuitpy. The program is compiled in pyrung_app.mpy.\n"
+    f"import {APP_MODULE}\n"
+)
+
+
+@dataclass(frozen=True)
+class BuildBudget:
+    """Limits a build must fit; ``None`` disables a check.
+
+    Args:
+        flash_bytes: Total size of every file written to the drive.
+        ram_bytes: Estimated heap needed to import the program.
+    """
+
+    flash_bytes: int | None = None
+    ram_bytes: int | None = None
+
+
+@dataclass(frozen=True)
+class BuiltFile:
+    """One file in the build output, relative to the output directory."""
+
+    path: str
+    source_bytes: int
+    size_bytes: int
+
+
+@dataclass(frozen=True)
+class BuildReport:
+    """Sizes and budget checks for one :func:`build_circuitpy` run."""
+
+    files: tuple[BuiltFile, ...]
+    resources: ResourceReport
+    mpy_cross_version: str
+    budget: BuildBudget
+
+    @property
+    def flash_bytes(self) -> int:
+        return sum(f.size_bytes for f in self.files)
+
+    @property
+    def bytecode_bytes(self) -> int:
+        return sum(f.size_bytes for f in self.files if f.path.endswith(".mpy"))
+
+    @property
+    def import_heap_bytes(self) -> int:
+        return self.bytecode_bytes + self.resources.estimated_ram_bytes
+
+    @property
+    def violations(self) -> list[str]:
+        """Budget checks that failed, as messages (empty when within budget)."""
+        messages: list[str] = []
+        flash = self.budget.flash_bytes
+        if flash is not None and self.flash_bytes > flash:
+            messages.append(f"flash: {self.flash_bytes} bytes exceeds budget of {flash}")
+        ram = self.budget.ram_bytes
+        if ram is not None and self.import_heap_bytes > ram:
+            messages.append(f"RAM: ~{self.import_heap_bytes} bytes exceeds budget of {ram}")
+        return messages
+
+    def format(self) -> str:
+        """Render the report as short human-readable lines."""
+        lines = [f"Compiled with {self.mpy_cross_version}"]
+        lines.append(f"{'File':<24} {'source':>10} {'written':>10}")
+        for f in self.files:
+            lines.append(f"{f.path:<24} {f.source_bytes:>10} {f.size_bytes:>10}")
+        flash_limit = self.budget.flash_bytes
+        ram_limit = self.budget.ram_bytes
+        lines.append(
+            f"Flash: {self.flash_bytes} bytes"
+            + (f" (budget {flash_limit})" if flash_limit is not None else "")
+        )
+        lines.append(
+            f"Import heap: ~{self.import_heap_bytes} bytes "
+            f"({self.bytecode_bytes} bytecode + {self.resources.estimated_ram_bytes} data)"
+            + (f" (budget {ram_limit})" if ram_limit is not None else "")
+        )
+        lines.append(
+            f"Bus transactions per scan: {self.resources.bus_reads_per_scan} read(s), "
+            f"0-{self.resources.bus_writes_per_scan} output write(s)"
+        )
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.format()
+
+
+class BuildBudgetError(RuntimeError):
+    """Raised by :func:`build_circuitpy` when a :class:`BuildBudget` is exceeded.
+
+    Nothing is written to the output directory; the report is attached.
+    """
+
+    def __init__(self, report: BuildReport) -> None:
+        self.report = report
+        super().__init__("Build exceeds budget: " + "; ".join(report.violations))
+
+
+def find_mpy_cross(explicit: str | Path | None = None) -> Path:
+    """Locate ``mpy-cross``: *explicit*, then ``$MPY_CROSS``, then ``PATH``."""
+    candidate = explicit or os.environ.get(MPY_CROSS_ENV) or shutil.which("mpy-cross")
+    if not candidate:
+        raise FileNotFoundError(
+            "mpy-cross not found; pass mpy_cross=..., set $MPY_CROSS, or put it on PATH. "
+            "Use the mpy-cross release matching the board's CircuitPython major version."
+        )
+    path = Path(candidate)
+    if not path.is_file():
+        raise FileNotFoundError(f"mpy-cross not found at {path}")
+    return path
+
+
+def _mpy_cross_version(mpy_cross: Path) -> str:
+    proc = subprocess.run([str(mpy_cross), "--version"], check=True, capture_output=True, text=True)
+    return proc.stdout.strip()
+
+
+def _compile(mpy_cross: Path, source: Path, output: Path, *, source_name: str) -> None:
+    proc = subprocess.run(
+        [str(mpy_cross), "-o", str(output), "-s", source_name, str(source)],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"mpy-cross failed for {source_name}: {proc.stderr.strip()}")
+
+
+def build_circuitpy(
+    program: Program,
+    hw: P1AM,
+    *,
+    output_dir: str | Path,
+    target_scan_ms: float,
+    watchdog_ms: int | None = None,
+    runstop: RunStopConfig | None = _DEFAULT_RUNSTOP,
+    modbus_server: ModbusServerConfig | None = None,
+    modbus_client: ModbusClientConfig | None = None,
+    tag_map: TagMap | None = None,
+    mapped_tag_scope: MappedTagScope = "referenced_only",
+    profile: bool = False,
+    budget: BuildBudget | None = None,
+    mpy_cross: str | Path | None = None,
+) -> BuildReport:
+    """Generate, compile to ``.mpy``, and write a ``CIRCUITPY`` drive layout.
+
+    Accepts the same generation parameters as
+    :func:`~pyrung.circuitpy.generate_circuitpy`.  The runtime module is
+    always included.  Raises :class:`BuildBudgetError` (writing nothing)
+    when *budget* is exceeded.
+    """
+    budget = budget or BuildBudget()
+    tool = find_mpy_cross(mpy_cross)
+    result = generate_circuitpy(
+        program,
+        hw,
+        target_scan_ms=target_scan_ms,
+        watchdog_ms=watchdog_ms,
+        runstop=runstop,
+        modbus_server=modbus_server,
+        modbus_client=modbus_client,
+        tag_map=tag_map,
+        mapped_tag_scope=mapped_tag_scope,
+        force_runtime=True,
+        resource_report=True,
+        profile=profile,
+    )
+    assert result.resources is not None
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        stage = Path(tmpdir) / "stage"
+        (stage / "lib").mkdir(parents=True)
+        sources = Path(tmpdir) / "src"
+        sources.mkdir()
+
+        builds: list[tuple[str, str, str]] = [
+            (f"{APP_MODULE}.py", f"{APP_MODULE}.mpy", result.code),
+            ("pyrung_rt.py", "lib/pyrung_rt.mpy", result.runtime),
+        ]
+        files: list[BuiltFile] = []
+        for source_name, target, text in builds:
+            source = sources / source_name
+            source.write_text(text, encoding="utf-8")
+            _compile(tool, source, stage / target, source_name=source_name)
+            files.append(
+                BuiltFile(
+                    path=target,
+                    source_bytes=len(text.encode("utf-8")),
+                    size_bytes=(stage / target).stat().st_size,
+                )
+            )
+        (stage / "code.py").write_text(_CODE_STUB, encoding="utf-8")
+        stub_bytes = len(_CODE_STUB.encode("utf-8"))
+        files.insert(0, BuiltFile(path="code.py", source_bytes=stub_bytes, size_bytes=stub_bytes))
+        if result.profile_layout is not None:
+            layout_bytes = result.profile_layout.to_json().encode("utf-8")
+            (stage / PROFILE_LAYOUT_FILENAME).write_bytes(layout_bytes)
+            files.append(
+                BuiltFile(
+                    path=PROFILE_LAYOUT_FILENAME,
+                    source_bytes=len(layout_bytes),
+                    size_bytes=len(layout_bytes),
+                )
+            )
+
+        report = BuildReport(
+            files=tuple(files),
+            resources=result.resources,
+            mpy_cross_version=_mpy_cross_version(tool),
+            budget=budget,
+        )
+        if report.violations:
+            raise BuildBudgetError(report)
+
+        out = Path(output_dir)
+        shutil.copytree(stage, out, dirs_exist_ok=True)
+    return report
+
+
+__all__ = [
+    "BuildBudget",
+    "BuildBudgetError",
+    "BuildReport",
+    "BuiltFile",
+    "build_circuitpy",
+    "find_mpy_cross",
+]
@@ -15,11 +15,13 @@ from pyrung.circuitpy.codegen.context import (
 )
 from pyrung.circuitpy.codegen.generate import CircuitPyOutput, generate_circuitpy, write_circuitpy
 from pyrung.circuitpy.codegen.render_kernel import compile_kernel
+from pyrung.circuitpy.codegen.resources import ResourceReport
 
 __all__ = [
     "BlockBinding",
     "CircuitPyOutput",
     "CodegenContext",
+    "ResourceReport",
     "SlotBinding",
     "compile_condition",
     "compile_expression",
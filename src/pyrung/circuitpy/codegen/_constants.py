@@ -20,6 +20,11 @@ _TYPE_DEFAULTS: dict[TagType, Any] = {
 }
 
 
+# BOOL blocks at least this long are declared as ``bytearray`` (one byte per
+# element) instead of a list (one object pointer per element).
+_PACKED_BOOL_BLOCK_MIN = 32
+
+
 _HELPER_ORDER = (
     "_clamp_int",
     "_wrap_int",
@@ -73,6 +73,7 @@ from pyrung.core.instruction.send_receive import (
     ModbusSendInstruction,
 )
 from pyrung.core.memory_block import BlockRange, IndirectBlockRange, IndirectExprRef, IndirectRef
+from pyrung.core.profiler import _rung_label
 from pyrung.core.rung import Rung as LogicRung
 from pyrung.core.tag import ImmediateRef, Tag
 from pyrung.core.validation.walker import _condition_children
@@ -95,6 +96,13 @@ def _contact_tag_name(tag: Tag | ImmediateRef) -> str:
     return tag.name
 
 
+def _edge_prev_expr(tag: Tag | ImmediateRef, ctx: CodegenContext) -> str:
+    name = _contact_tag_name(tag)
+    if ctx.kernel_runtime:
+        return f'_prev.get("{name}", False)'
+    return f"_prev[{ctx.edge_prev_slot(name)}]"
+
+
 def _collect_helper_conditions(
     rung: LogicRung,
 ) -> list[tuple[Any, str, Any]]:
@@ -416,7 +424,6 @@ def compile_condition(
         ]
         return "(" + " or ".join(parts) + ")" if parts else "False"
     if isinstance(cond, RisingEdgeCondition):
-        ctx.mark_helper("_rise")
         if ctx._current_function is not None:
             ctx.mark_function_global(ctx._current_function, "_prev")
         tag_expr = _snapshot_tag_symbol(
@@ -425,9 +432,12 @@ def compile_condition(
             scalar_snapshots=scalar_snapshots,
             block_snapshots=block_snapshots,
         )
-        return f'_rise(bool({tag_expr}), bool(_prev.get("{_contact_tag_name(cond.tag)}", False)))'
+        prev_expr = _edge_prev_expr(cond.tag, ctx)
+        if ctx.optimize:
+            return f"(bool({tag_expr}) and not {prev_expr})"
+        ctx.mark_helper("_rise")
+        return f"_rise(bool({tag_expr}), bool({prev_expr}))"
     if isinstance(cond, FallingEdgeCondition):
-        ctx.mark_helper("_fall")
         if ctx._current_function is not None:
             ctx.mark_function_global(ctx._current_function, "_prev")
         tag_expr = _snapshot_tag_symbol(
@@ -436,7 +446,11 @@ def compile_condition(
             scalar_snapshots=scalar_snapshots,
             block_snapshots=block_snapshots,
         )
-        return f'_fall(bool({tag_expr}), bool(_prev.get("{_contact_tag_name(cond.tag)}", False)))'
+        prev_expr = _edge_prev_expr(cond.tag, ctx)
+        if ctx.optimize:
+            return f"(not {tag_expr} and bool({prev_expr}))"
+        ctx.mark_helper("_fall")
+        return f"_fall(bool({tag_expr}), bool({prev_expr}))"
     if isinstance(cond, IndirectCompareEq):
         return (
             f"({_compile_indirect_value(cond.indirect_ref, ctx, scalar_snapshots=scalar_snapshots, block_snapshots=block_snapshots)}"
@@ -724,17 +738,30 @@ def compile_rungs(
     fn_name: str,
     ctx: CodegenContext,
     indent: int = 0,
+    *,
+    profile: bool = False,
 ) -> list[str]:
-    """Compile a sequence of top-level rungs, preserving continued() chains."""
+    """Compile a sequence of top-level rungs, preserving continued() chains.
+
+    With *profile*, each chain is timed into its own ``_prof_ns`` bucket.
+    """
     lines: list[str] = []
+    pad = " " * indent
     i = 0
     while i < len(rungs):
+        first = i
         chain = [rungs[i]]
         i += 1
         while i < len(rungs) and rungs[i]._use_prior_snapshot:
             chain.append(rungs[i])
             i += 1
 
+        bucket: int | None = None
+        if profile:
+            span = f"{first}" if len(chain) == 1 else f"{first}-{i - 1}"
+            bucket = ctx.profile_bucket("rung", _rung_label(f"rung {span}", chain[0]))
+            lines.append(f"{pad}_prof_t = time.monotonic_ns()")
+
         snapshot_lines, snapshot = _collect_rung_snapshot_bindings(
             chain,
             ctx,
@@ -751,6 +778,9 @@ def compile_rungs(
                     condition_snapshot=snapshot,
                 )
             )
+        if bucket is not None:
+            lines.append(f"{pad}_prof_ns[{bucket}] += time.monotonic_ns() - _prof_t")
+            lines.append(f"{pad}_prof_n[{bucket}] += 1")
     return lines
 
 
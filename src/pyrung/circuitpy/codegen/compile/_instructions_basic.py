@@ -38,6 +38,7 @@ from ._core import _get_condition_snapshot, compile_condition
 from ._primitives import (
     _compile_assignment_lines,
     _compile_guarded_instruction,
+    _compile_int_value,
     _compile_lvalue,
     _compile_set_address_error_fault_body,
     _compile_set_out_of_range_fault_body,
@@ -162,7 +163,7 @@ def _compile_on_delay_instruction(
     acc_write = _compile_lvalue(instr.accumulator, ctx)
     frac_key = f"_frac:{instr.accumulator.name}"
     preset_key = prove_effective_preset_key(instr.done_bit.name)
-    preset = _compile_value(instr.preset, ctx)
+    preset = _compile_int_value(instr.preset, ctx)
     unit_expr = _timer_dt_to_units_expr(instr.unit, "_dt", "_frac")
     if ctx._current_function is not None:
         ctx.mark_function_global(ctx._current_function, "_mem")
@@ -196,7 +197,7 @@ def _compile_on_delay_instruction(
             f"{' ' * (inner + 4)}_int_units = int(_dt_units)",
             f"{' ' * (inner + 4)}_new_frac = _dt_units - _int_units",
             f"{' ' * (inner + 4)}_acc = min(_acc + _int_units, {_INT_MAX})",
-            f"{' ' * (inner + 4)}_preset = int({preset})",
+            f"{' ' * (inner + 4)}_preset = {preset}",
             f'{" " * (inner + 4)}_mem["{frac_key}"] = _new_frac',
             f"{' ' * (inner + 4)}{done_write} = (_acc >= _preset)",
             f"{' ' * (inner + 4)}{acc_write} = _acc",
@@ -228,7 +229,7 @@ def _compile_off_delay_instruction(
     acc_write = _compile_lvalue(instr.accumulator, ctx)
     frac_key = f"_frac:{instr.accumulator.name}"
     preset_key = prove_effective_preset_key(instr.done_bit.name)
-    preset = _compile_value(instr.preset, ctx)
+    preset = _compile_int_value(instr.preset, ctx)
     unit_expr = _timer_dt_to_units_expr(instr.unit, "_dt", "_frac")
     if ctx._current_function is not None:
         ctx.mark_function_global(ctx._current_function, "_mem")
@@ -249,7 +250,7 @@ def _compile_off_delay_instruction(
         f"{sp8}_int_units = int(_dt_units)",
         f"{sp8}_new_frac = _dt_units - _int_units",
         f"{sp8}_acc = min(_acc + _int_units, {_INT_MAX})",
-        f"{sp8}_preset = int({preset})",
+        f"{sp8}_preset = {preset}",
         f'{sp8}_mem["{frac_key}"] = _new_frac',
         f"{sp8}{done_write} = (_acc < _preset)",
         f"{sp8}{acc_write} = _acc",
@@ -269,7 +270,7 @@ def _compile_count_up_instruction(
     acc_read = _compile_value(instr.accumulator, ctx)
     acc_write = _compile_lvalue(instr.accumulator, ctx)
     preset_key = prove_effective_preset_key(instr.done_bit.name)
-    preset = _compile_value(instr.preset, ctx)
+    preset = _compile_int_value(instr.preset, ctx)
     if ctx.proof_metadata and ctx._current_function is not None:
         ctx.mark_function_global(ctx._current_function, "_mem")
     sp = " " * indent
@@ -311,7 +312,7 @@ def _compile_count_up_instruction(
     lines.extend(
         [
             f"{' ' * inner}_acc = max({_DINT_MIN}, min({_DINT_MAX}, _acc + _delta))",
-            f"{' ' * inner}_preset = int({preset})",
+            f"{' ' * inner}_preset = {preset}",
             f"{' ' * inner}{done_write} = (_acc >= _preset)",
             f"{' ' * inner}{acc_write} = _acc",
         ]
@@ -331,7 +332,7 @@ def _compile_count_down_instruction(
     acc_read = _compile_value(instr.accumulator, ctx)
     acc_write = _compile_lvalue(instr.accumulator, ctx)
     preset_key = prove_effective_preset_key(instr.done_bit.name)
-    preset = _compile_value(instr.preset, ctx)
+    preset = _compile_int_value(instr.preset, ctx)
     if ctx.proof_metadata and ctx._current_function is not None:
         ctx.mark_function_global(ctx._current_function, "_mem")
     sp = " " * indent
@@ -358,7 +359,7 @@ def _compile_count_down_instruction(
             f"{isp}if {enabled_expr}:",
             f"{' ' * (inner + 4)}_acc -= 1",
             f"{' ' * inner}_acc = max({_DINT_MIN}, min({_DINT_MAX}, _acc))",
-            f"{' ' * inner}_preset = int({preset})",
+            f"{' ' * inner}_preset = {preset}",
             f"{' ' * inner}{done_write} = (_acc <= -_preset)",
             f"{' ' * inner}{acc_write} = _acc",
         ]
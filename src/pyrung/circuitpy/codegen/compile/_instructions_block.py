@@ -31,6 +31,7 @@ from pyrung.core.tag import TagType
 from ._core import _get_condition_snapshot, compile_condition
 from ._primitives import (
     _compile_guarded_instruction,
+    _compile_int_value,
     _compile_lvalue,
     _compile_range_setup,
     _compile_set_out_of_range_fault_body,
@@ -552,7 +553,7 @@ def _compile_time_drum_instruction(
     jog_prev_key = f"_drum_jog_prev:{key_base}"
     max_acc = _INT_MAX if instr.accumulator.type == TagType.INT else _DINT_MAX
 
-    preset_exprs = [f"int({_compile_value(preset, ctx)})" for preset in instr.presets]
+    preset_exprs = [_compile_int_value(preset, ctx) for preset in instr.presets]
     reset_expr = _get_condition_snapshot(instr, "reset_condition", ctx) or compile_condition(
         instr.reset_condition, ctx
     )
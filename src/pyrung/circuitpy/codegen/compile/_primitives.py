@@ -851,3 +851,10 @@ def _compile_value(
             block_snapshots=block_snapshots,
         )
     return repr(value)
+
+
+def _compile_int_value(value: Any, ctx: CodegenContext) -> str:
+    """Compile ``int(value)``, folding numeric literals when optimizing."""
+    if ctx.optimize and isinstance(value, int | float) and not isinstance(value, bool):
+        return repr(int(value))
+    return f"int({_compile_value(value, ctx)})"
@@ -20,6 +20,7 @@ from pyrung.circuitpy.codegen._util import _first_defined_name, _io_kind, _mangl
 from pyrung.circuitpy.hardware import P1AM
 from pyrung.circuitpy.modbus import ModbusClientConfig, ModbusServerConfig
 from pyrung.circuitpy.p1am import RunStopConfig
+from pyrung.circuitpy.profile import BucketKind, ProfileBucket
 from pyrung.core.condition import (
     Condition,
     FallingEdgeCondition,
@@ -109,6 +110,8 @@ class CodegenContext:
     blockless: bool = False
     kernel_runtime: bool = False
     proof_metadata: bool = False
+    optimize: bool = False
+    profile: bool = False
     modbus_server: ModbusServerConfig | None = None
     modbus_client: ModbusClientConfig | None = None
     tag_map: Any = None
@@ -121,6 +124,7 @@ class CodegenContext:
         force_rung_enable: bool = False,
         blockless: bool = False,
         proof_metadata: bool = False,
+        optimize: bool = False,
     ) -> CodegenContext:
         """Create a hardware-free context for kernel compilation."""
         ctx = cls(
@@ -132,6 +136,7 @@ class CodegenContext:
             blockless=blockless,
             kernel_runtime=True,
             proof_metadata=proof_metadata,
+            optimize=optimize,
         )
         ctx._runtime_state_keys = True
         ctx.collect_program_references()
@@ -145,6 +150,11 @@ class CodegenContext:
     referenced_tags: dict[str, Tag] = field(default_factory=dict)
     retentive_tags: dict[str, Tag] = field(default_factory=dict)
     edge_prev_tags: set[str] = field(default_factory=set)
+    # Index of each edge tag in the generated ``_prev`` list (CircuitPy
+    # only; the kernel keeps ``prev`` as a name-keyed dict).
+    edge_prev_slots: dict[str, int] = field(default_factory=dict)
+    # On-target profiling accumulators, in ``_prof_ns`` index order.
+    profile_buckets: list[ProfileBucket] = field(default_factory=list)
 
     subroutine_names: list[str] = field(default_factory=list)
     function_sources: dict[str, str] = field(default_factory=dict)
@@ -224,6 +234,7 @@ class CodegenContext:
     def collect_program_references(self) -> None:
         self.referenced_tags.clear()
         self.edge_prev_tags.clear()
+        self.edge_prev_slots.clear()
         self.subroutine_names = sorted(self.program.subroutines)
         seen_values: set[int] = set()
 
@@ -381,6 +392,15 @@ class CodegenContext:
     def mark_helper(self, helper_name: str) -> None:
         self.used_helpers.add(helper_name)
 
+    def edge_prev_slot(self, tag_name: str) -> int:
+        """Return the ``_prev`` list index holding *tag_name*'s last-scan value."""
+        return self.edge_prev_slots.setdefault(tag_name, len(self.edge_prev_slots))
+
+    def profile_bucket(self, kind: BucketKind, name: str) -> int:
+        """Register a profiling accumulator and return its ``_prof_ns`` index."""
+        self.profile_buckets.append(ProfileBucket(kind, name))
+        return len(self.profile_buckets) - 1
+
     def mark_function_global(self, fn_name: str, symbol: str) -> None:
         self.function_globals.setdefault(fn_name, set()).add(symbol)
 
@@ -11,9 +11,11 @@ from pyrung.circuitpy.codegen._constants import _TYPE_DEFAULTS
 from pyrung.circuitpy.codegen.context import CodegenContext
 from pyrung.circuitpy.codegen.render import _render_code
 from pyrung.circuitpy.codegen.render_runtime import _render_runtime
+from pyrung.circuitpy.codegen.resources import ResourceReport, estimate_resources
 from pyrung.circuitpy.hardware import P1AM
 from pyrung.circuitpy.modbus import ModbusClientConfig, ModbusServerConfig
 from pyrung.circuitpy.p1am import RunStopConfig, board
+from pyrung.circuitpy.profile import PROFILE_LAYOUT_FILENAME, ProfileLayout
 from pyrung.circuitpy.validation import validate_circuitpy_program
 from pyrung.click.tag_map import TagMap
 from pyrung.core.memory_block import Block
@@ -33,11 +35,16 @@ class CircuitPyOutput:
     *code* is the ``code.py`` content (program-specific, stays as ``.py``).
     *runtime* is the ``pyrung_rt.py`` content (generic runtime library,
     intended to be compiled to ``.mpy`` via ``mpy-cross``).  An empty
-    string means no runtime module is needed.
+    string means no runtime module is needed.  *resources* holds the
+    estimated RAM and bus-traffic report when ``resource_report=True``,
+    and *profile_layout* names the on-target profiling buckets when
+    ``profile=True``.
     """
 
     code: str
     runtime: str
+    resources: ResourceReport | None = None
+    profile_layout: ProfileLayout | None = None
 
 
 def _needs_modbus_backing(tag: Tag, mode: MappedTagScope) -> bool:
@@ -58,6 +65,8 @@ def generate_circuitpy(
     tag_map: TagMap | None = None,
     mapped_tag_scope: MappedTagScope = "referenced_only",
     force_runtime: bool = False,
+    resource_report: bool = False,
+    profile: bool = False,
 ) -> CircuitPyOutput:
     if not isinstance(program, Program):
         raise TypeError(f"program must be Program, got {type(program).__name__}")
@@ -99,6 +108,7 @@ def generate_circuitpy(
         modbus_server=modbus_server,
         modbus_client=modbus_client,
         tag_map=tag_map,
+        profile=profile,
     )
     ctx.collect_hw_bindings()
     ctx.collect_program_references()
@@ -122,9 +132,7 @@ def generate_circuitpy(
                     if _needs_modbus_backing(tag, mapped_tag_scope):
                         ctx.ensure_tag_referenced(tag)
         if mapped_tag_scope == "all_mapped":
-            for slot in tag_map.mapped_slots():
-                if slot.source != "system":
-                    continue
+            for slot in tag_map.iter_mapped_slots("system"):
                 system_tag = SYSTEM_TAGS_BY_NAME.get(slot.logical_name)
                 if system_tag is not None:
                     ctx.ensure_tag_referenced(system_tag)
@@ -169,7 +177,11 @@ def generate_circuitpy(
         compile(source, "code.py", "exec")
     except SyntaxError as exc:
         raise RuntimeError(f"Generated source is invalid: {exc}") from exc
-    return CircuitPyOutput(code=source, runtime=runtime_source)
+    resources = estimate_resources(ctx) if resource_report else None
+    profile_layout = ProfileLayout(tuple(ctx.profile_buckets)) if profile else None
+    return CircuitPyOutput(
+        code=source, runtime=runtime_source, resources=resources, profile_layout=profile_layout
+    )
 
 
 def write_circuitpy(
@@ -185,11 +197,14 @@ def write_circuitpy(
     tag_map: TagMap | None = None,
     mapped_tag_scope: MappedTagScope = "referenced_only",
     force_runtime: bool = False,
+    profile: bool = False,
 ) -> Path:
     """Generate and write ``code.py`` (and ``pyrung_rt.py`` when needed) to *output_dir*.
 
     Accepts the same parameters as :func:`generate_circuitpy` plus
-    ``output_dir``.  Returns the path to the written ``code.py``.
+    ``output_dir``.  With ``profile=True`` the bucket layout is also
+    written to ``pyrung_profile.json`` for ``pyrung circuitpy-profile``.
+    Returns the path to the written ``code.py``.
     """
     result = generate_circuitpy(
         program,
@@ -202,6 +217,7 @@ def write_circuitpy(
         tag_map=tag_map,
         mapped_tag_scope=mapped_tag_scope,
         force_runtime=force_runtime,
+        profile=profile,
     )
     out = Path(output_dir)
     code_path = out / "code.py"
@@ -209,4 +225,7 @@ def write_circuitpy(
     if result.runtime:
         runtime_path = out / "pyrung_rt.py"
         runtime_path.write_text(result.runtime, encoding="utf-8")
+    if result.profile_layout is not None:
+        layout_path = out / PROFILE_LAYOUT_FILENAME
+        layout_path.write_text(result.profile_layout.to_json(), encoding="utf-8")
     return code_path
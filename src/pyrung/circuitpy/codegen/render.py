@@ -14,6 +14,7 @@ from pyrung.circuitpy.codegen._constants import (
     _HELPER_ORDER,
     _INT_MAX,
     _INT_MIN,
+    _PACKED_BOOL_BLOCK_MIN,
     _SD_DELETE_ALL_CMD_TAG,
     _SD_EJECT_CMD_TAG,
     _SD_ERROR_CODE_TAG,
@@ -47,6 +48,12 @@ from pyrung.circuitpy.codegen.render_modbus import (
     _render_modbus_server,
     _render_modbus_server_init,
 )
+from pyrung.circuitpy.profile import (
+    PROFILE_LAYOUT_VERSION,
+    PROFILE_REGISTER_BASE,
+    SERIAL_PREFIX,
+)
+from pyrung.core.tag import Tag, TagType
 
 
 def _tag_is_input_endpoint(ctx: CodegenContext, tag_name: str) -> bool:
@@ -96,6 +103,101 @@ def _render_stop_output_clear_lines(ctx: CodegenContext) -> list[str]:
     return lines
 
 
+def _is_packed_bool_block(tag_type: TagType, size: int) -> bool:
+    return tag_type == TagType.BOOL and size >= _PACKED_BOOL_BLOCK_MIN
+
+
+def _save_value_expr(symbol: str, tag: Tag) -> str:
+    # Packed BOOL blocks read back as 0/1; keep memory.json values typed.
+    return f"bool({symbol})" if tag.type == TagType.BOOL else symbol
+
+
+def _prev_list_literal(ctx: CodegenContext) -> str:
+    """Edge-detection state: one last-scan value per ``ctx.edge_prev_slots`` index."""
+    count = len(ctx.edge_prev_slots)
+    return f"[False] * {count}" if count else "[]"
+
+
+def _register_profile_phases(ctx: CodegenContext) -> None:
+    ctx.profile_buckets.clear()
+    if not ctx.profile:
+        return
+    phases = ["scan", "sd_commands", "read_inputs", "logic", "write_outputs"]
+    if ctx.modbus_server is not None:
+        phases.append("modbus_server")
+    if ctx.modbus_client is not None:
+        phases.append("modbus_client")
+    if ctx.retentive_tags:
+        phases.append("retentive_save")
+    for phase in phases:
+        ctx.profile_bucket("phase", phase)
+
+
+def _profile_phase(ctx: CodegenContext, name: str) -> int | None:
+    for index, bucket in enumerate(ctx.profile_buckets):
+        if bucket.kind == "phase" and bucket.name == name:
+            return index
+    return None
+
+
+def _timed(ctx: CodegenContext, phase: str, body: list[str], *, indent: int = 4) -> list[str]:
+    """Wrap *body* in ``_prof_ns`` accounting for *phase* when profiling."""
+    index = _profile_phase(ctx, phase)
+    if index is None:
+        return body
+    pad = " " * indent
+    return [
+        f"{pad}_prof_t = time.monotonic_ns()",
+        *body,
+        f"{pad}_prof_ns[{index}] += time.monotonic_ns() - _prof_t",
+        f"{pad}_prof_n[{index}] += 1",
+    ]
+
+
+def _render_profile_section(ctx: CodegenContext) -> list[str]:
+    """Accumulators and Modbus register view for ``generate_circuitpy(profile=True)``."""
+    if not ctx.profile:
+        return []
+    count = len(ctx.profile_buckets)
+    lines = [_section("Scan profiling")]
+    for index, bucket in enumerate(ctx.profile_buckets):
+        lines.append(f"# {index}: {bucket.kind} {bucket.name}")
+    lines.extend(
+        [
+            f"_prof_ns = [0] * {count}",
+            f"_prof_n = [0] * {count}",
+            "_prof_max_ns = 0",
+            "_prof_t = 0",
+            "_prof_last_print = time.monotonic()",
+            f"_PROF_REG_BASE = {PROFILE_REGISTER_BASE}",
+            f"_PROF_REG_COUNT = {4 + 4 * count}",
+            "",
+            "def _prof_reset():",
+            "    global _prof_max_ns",
+            f"    for _i in range({count}):",
+            "        _prof_ns[_i] = 0",
+            "        _prof_n[_i] = 0",
+            "    _prof_max_ns = 0",
+            "",
+            "def _prof_reg(offset):",
+            "    if offset == 0:",
+            f"        return {PROFILE_LAYOUT_VERSION}",
+            "    if offset == 1:",
+            f"        return {count}",
+            "    if offset < 4:",
+            "        _value = _prof_max_ns // 1000",
+            "    else:",
+            "        _i, _part = divmod(offset - 4, 4)",
+            "        _value = _prof_ns[_i] // 1000 if _part < 2 else _prof_n[_i]",
+            "    if offset % 2:",
+            "        return (_value >> 16) & 0xFFFF",
+            "    return _value & 0xFFFF",
+            "",
+        ]
+    )
+    return lines
+
+
 def _section(label: str) -> str:
     """Build a fixed-width 80-char ASCII section header."""
     prefix = f"# -- {label} "
@@ -159,6 +261,7 @@ def _render_runtime_wiring(ctx: CodegenContext) -> list[str]:
 
 
 def _render_code(ctx: CodegenContext, *, has_runtime: bool = False) -> str:
+    _register_profile_phases(ctx)
     main_fn_lines = _render_main_function(ctx)
     sub_fn_lines = _render_subroutine_functions(ctx)
     io_lines = _render_io_helpers(ctx)
@@ -238,6 +341,7 @@ def _render_code(ctx: CodegenContext, *, has_runtime: bool = False) -> str:
             f"TARGET_SCAN_MS = {ctx.target_scan_ms!r}",
             f"WATCHDOG_MS = {ctx.watchdog_ms!r}",
             "PRINT_SCAN_OVERRUNS = False",
+            *(["PROFILE_PRINT_S = 5.0"] if ctx.profile else []),
             "",
             f"_SLOT_MODULES = {[slot.part_number for slot in ctx.slot_bindings]!r}",
             f"_RET_DEFAULTS = {_ret_defaults_literal(ctx)!r}",
@@ -315,12 +419,18 @@ def _render_code(ctx: CodegenContext, *, has_runtime: bool = False) -> str:
     lines.append("")
 
     lines.append("# Blocks (list-backed; PLC addresses remain 1-based, list indexes are 0-based).")
+    lines.append(
+        f"# BOOL blocks of {_PACKED_BOOL_BLOCK_MIN}+ elements are bytearrays (0/1 per element)."
+    )
     block_bindings = sorted(
         ctx.block_bindings.values(), key=lambda b: (ctx.block_symbols[b.block_id], b.block_id)
     )
     for binding in block_bindings:
         symbol = ctx.block_symbols[binding.block_id]
         size = binding.end - binding.start + 1
+        if _is_packed_bool_block(binding.tag_type, size):
+            lines.append(f"{symbol} = bytearray({size})")
+            continue
         default = _TYPE_DEFAULTS[binding.tag_type]
         lines.append(f"{symbol} = [{repr(default)}] * {size}")
     lines.append("")
@@ -329,7 +439,7 @@ def _render_code(ctx: CodegenContext, *, has_runtime: bool = False) -> str:
     lines.extend(
         [
             "_mem = {}",
-            "_prev = {}",
+            f"_prev = {_prev_list_literal(ctx)}",
             "_last_scan_ts = time.monotonic()",
             "_scan_overrun_count = 0",
             "",
@@ -352,6 +462,7 @@ def _render_code(ctx: CodegenContext, *, has_runtime: bool = False) -> str:
             "",
         ]
     )
+    lines.extend(_render_profile_section(ctx))
     if ctx.runstop is not None:
         lines.extend(
             [
@@ -498,7 +609,7 @@ def _render_code(ctx: CodegenContext, *, has_runtime: bool = False) -> str:
         lines.extend(
             [
                 f'    if {symbol} != _RET_DEFAULTS["{name}"]:',
-                f'        values["{name}"] = {{"type": "{tag.type.name}", "value": {symbol}}}',
+                f'        values["{name}"] = {{"type": "{tag.type.name}", "value": {_save_value_expr(symbol, tag)}}}',
             ]
         )
     lines.extend(
@@ -649,7 +760,7 @@ def _render_helper_section(ctx: CodegenContext, *, helpers_in_runtime: bool = Fa
         lines.extend(
             [
                 "    _mem = {}",
-                "    _prev = {}",
+                f"    _prev = {_prev_list_literal(ctx)}",
                 "    _ret_snapshot = {}",
                 "    _sd_save_cmd = False",
                 "    _sd_eject_cmd = False",
@@ -960,7 +1071,20 @@ def _render_subroutine_functions(ctx: CodegenContext) -> list[str]:
         fn_name = _subroutine_symbol(sub_name)
         ctx.function_globals[fn_name] = set()
         ctx.set_current_function(fn_name)
-        body = compile_rungs(ctx.program.subroutines[sub_name], fn_name, ctx, indent=4)
+        if ctx.profile:
+            bucket = ctx.profile_bucket("subroutine", sub_name)
+            body = compile_rungs(ctx.program.subroutines[sub_name], fn_name, ctx, indent=8)
+            # try/finally so return_early() exits are still timed.
+            body = [
+                "    _prof_sub_t = time.monotonic_ns()",
+                "    try:",
+                *(body or ["        pass"]),
+                "    finally:",
+                f"        _prof_ns[{bucket}] += time.monotonic_ns() - _prof_sub_t",
+                f"        _prof_n[{bucket}] += 1",
+            ]
+        else:
+            body = compile_rungs(ctx.program.subroutines[sub_name], fn_name, ctx, indent=4)
         ctx.set_current_function(None)
         globals_line = _global_line(ctx.globals_for_function(fn_name), indent=4)
         lines.append(f"def {fn_name}():")
@@ -978,7 +1102,7 @@ def _render_main_function(ctx: CodegenContext) -> list[str]:
     fn_name = "_run_main_rungs"
     ctx.function_globals[fn_name] = set()
     ctx.set_current_function(fn_name)
-    body = compile_rungs(ctx.program.rungs, fn_name, ctx, indent=4)
+    body = compile_rungs(ctx.program.rungs, fn_name, ctx, indent=4, profile=ctx.profile)
     ctx.set_current_function(None)
 
     lines = [f"def {fn_name}():"]
@@ -1041,6 +1165,9 @@ def _render_io_helpers(ctx: CodegenContext) -> list[str]:
     ctx.function_globals[write_fn] = set()
     ctx.set_current_function(write_fn)
     write_body: list[str] = []
+    # ``_out_last[i]`` holds the value last sent for bus write ``i`` so each
+    # scan only touches the base-controller SPI bus for outputs that changed.
+    out_last_count = 0
     for slot in ctx.slot_bindings:
         if slot.output_block_id is None:
             continue
@@ -1051,15 +1178,28 @@ def _render_io_helpers(ctx: CodegenContext) -> list[str]:
             write_body.append(f"    {mask} = 0")
             for ch in range(1, slot.output_count + 1):
                 index = ch - binding.start
-                write_body.append(f"    if bool({symbol}[{index}]):")
-                write_body.append(f"        {mask} |= (1 << {ch - 1})")
-            write_body.append(f"    base.writeDiscrete({mask}, {slot.slot_number})")
+                write_body.append(f"    if {symbol}[{index}]:")
+                write_body.append(f"        {mask} |= {1 << (ch - 1)}")
+            write_body.extend(
+                [
+                    f"    if {mask} != _out_last[{out_last_count}]:",
+                    f"        base.writeDiscrete({mask}, {slot.slot_number})",
+                    f"        _out_last[{out_last_count}] = {mask}",
+                ]
+            )
+            out_last_count += 1
         elif slot.output_kind == "analog":
             for ch in range(1, slot.output_count + 1):
                 index = ch - binding.start
-                write_body.append(
-                    f"    base.writeAnalog(int({symbol}[{index}]), {slot.slot_number}, {ch})"
+                write_body.extend(
+                    [
+                        f"    _out_value = int({symbol}[{index}])",
+                        f"    if _out_value != _out_last[{out_last_count}]:",
+                        f"        base.writeAnalog(_out_value, {slot.slot_number}, {ch})",
+                        f"        _out_last[{out_last_count}] = _out_value",
+                    ]
                 )
+                out_last_count += 1
     board_led_symbol = ctx.symbol_if_referenced(_BOARD_LED_TAG)
     if board_led_symbol is not None:
         write_body.append(f"    _board_led_io.value = bool({board_led_symbol})")
@@ -1080,6 +1220,9 @@ def _render_io_helpers(ctx: CodegenContext) -> list[str]:
             ]
         )
     ctx.set_current_function(None)
+    if out_last_count:
+        lines.append(f"_out_last = [None] * {out_last_count}")
+        lines.append("")
     lines.append(f"def {write_fn}():")
     write_globals = _global_line(ctx.globals_for_function(write_fn), indent=4)
     if write_globals is not None:
@@ -1109,6 +1252,7 @@ def _render_scan_loop(ctx: CodegenContext, *, has_runtime: bool = False) -> list
     lines = [
         "while True:",
         "    scan_start = time.monotonic()",
+        *(["    _prof_scan_t = time.monotonic_ns()"] if ctx.profile else []),
         "    _sd_write_status = False",
         "    dt = scan_start - _last_scan_ts",
         "    if dt < 0:",
@@ -1124,11 +1268,7 @@ def _render_scan_loop(ctx: CodegenContext, *, has_runtime: bool = False) -> list
         lines.append(f"    _sd_eject_cmd = bool({sd_eject_symbol})")
     if sd_delete_symbol is not None:
         lines.append(f"    _sd_delete_all_cmd = bool({sd_delete_symbol})")
-    lines.extend(
-        [
-            "    _service_sd_commands()",
-        ]
-    )
+    lines.extend(_timed(ctx, "sd_commands", ["    _service_sd_commands()"]))
     if sd_save_symbol is not None:
         lines.append(f"    {sd_save_symbol} = _sd_save_cmd")
     if sd_eject_symbol is not None:
@@ -1144,11 +1284,7 @@ def _render_scan_loop(ctx: CodegenContext, *, has_runtime: bool = False) -> list
     if sd_error_code_symbol is not None:
         lines.append(f"    {sd_error_code_symbol} = int(_sd_error_code)")
 
-    lines.extend(
-        [
-            "    _read_inputs()",
-        ]
-    )
+    lines.extend(_timed(ctx, "read_inputs", ["    _read_inputs()"]))
     if ctx.runstop is not None:
         if runstop_source_symbol is None:
             raise RuntimeError("RunStopConfig source tag was not referenced")
@@ -1194,34 +1330,26 @@ def _render_scan_loop(ctx: CodegenContext, *, has_runtime: bool = False) -> list
         )
         if ctx.runstop.expose_mode_tags and mode_run_symbol is not None:
             lines.append(f"    {mode_run_symbol} = bool(_mode_run)")
+        lines.append("    if _mode_run:")
+        lines.extend(_timed(ctx, "logic", ["        _run_main_rungs()"], indent=8))
+        lines.extend(_timed(ctx, "write_outputs", ["        _write_outputs()"], indent=8))
         lines.extend(
             [
-                "    if _mode_run:",
-                "        _run_main_rungs()",
-                "        _write_outputs()",
                 "    else:",
                 "        _force_outputs_off()",
                 "",
             ]
         )
     else:
-        lines.extend(
-            [
-                "    _run_main_rungs()",
-                "    _write_outputs()",
-                "",
-            ]
-        )
+        lines.extend(_timed(ctx, "logic", ["    _run_main_rungs()"]))
+        lines.extend(_timed(ctx, "write_outputs", ["    _write_outputs()"]))
+        lines.append("")
     if ctx.modbus_server is not None:
-        if has_runtime:
-            lines.append("    _rt.service_modbus_server()")
-        else:
-            lines.append("    service_modbus_server()")
+        service = "_rt.service_modbus_server()" if has_runtime else "service_modbus_server()"
+        lines.extend(_timed(ctx, "modbus_server", [f"    {service}"]))
     if ctx.modbus_client is not None:
-        if has_runtime:
-            lines.append("    _rt.service_modbus_client()")
-        else:
-            lines.append("    service_modbus_client()")
+        service = "_rt.service_modbus_client()" if has_runtime else "service_modbus_client()"
+        lines.extend(_timed(ctx, "modbus_client", [f"    {service}"]))
     if ctx.modbus_server is not None or ctx.modbus_client is not None:
         lines.append("")
 
@@ -1232,23 +1360,42 @@ def _render_scan_loop(ctx: CodegenContext, *, has_runtime: bool = False) -> list
             dirty_parts.append(f'{symbol} != _ret_snapshot.get("{name}")')
         dirty_check = " or ".join(dirty_parts)
         lines.extend(
-            [
-                "    if (scan_start - _ret_last_save_ts) >= _RET_AUTO_SAVE_S:",
-                f"        if {dirty_check}:",
-                "            save_memory()",
-                "        else:",
-                "            _ret_last_save_ts = scan_start",
-                "",
-            ]
+            _timed(
+                ctx,
+                "retentive_save",
+                [
+                    "    if (scan_start - _ret_last_save_ts) >= _RET_AUTO_SAVE_S:",
+                    f"        if {dirty_check}:",
+                    "            save_memory()",
+                    "        else:",
+                    "            _ret_last_save_ts = scan_start",
+                ],
+            )
         )
+        lines.append("")
 
-    for tag_name in sorted(ctx.edge_prev_tags):
+    for tag_name, slot in sorted(ctx.edge_prev_slots.items(), key=lambda item: item[1]):
         tag = ctx.referenced_tags[tag_name]
-        lines.append(f'    _prev["{tag_name}"] = {ctx.symbol_for_tag(tag)}')
+        lines.append(f"    _prev[{slot}] = {ctx.symbol_for_tag(tag)}  # {tag_name}")
     lines.append("")
     if ctx.watchdog_ms is not None:
         lines.append("    _wd_pet()")
         lines.append("")
+    scan_bucket = _profile_phase(ctx, "scan")
+    if scan_bucket is not None:
+        lines.extend(
+            [
+                "    _prof_t = time.monotonic_ns() - _prof_scan_t",
+                f"    _prof_ns[{scan_bucket}] += _prof_t",
+                f"    _prof_n[{scan_bucket}] += 1",
+                "    if _prof_t > _prof_max_ns:",
+                "        _prof_max_ns = _prof_t",
+                "    if (scan_start - _prof_last_print) >= PROFILE_PRINT_S:",
+                "        _prof_last_print = scan_start",
+                f'        print("{SERIAL_PREFIX}" + json.dumps([_prof_max_ns // 1000, [_v // 1000 for _v in _prof_ns], _prof_n]))',
+                "",
+            ]
+        )
     lines.extend(
         [
             "    elapsed_ms = (time.monotonic() - scan_start) * 1000.0",
@@ -3,10 +3,17 @@
 Reuses the same compile_rung() pipeline as the CircuitPy renderer but
 wraps the output in a plain-Python function that reads/writes kernel
 dicts instead of module-level globals backed by hardware I/O.
+
+With ``optimize=True`` (the default) the step function keeps every tag
+that no other generated function touches in a local variable, writes
+back only tags the main body can assign, inlines edge detection, and
+folds literal timer/counter/drum presets.  Tags shared with subroutines
+or indexed-address helpers stay module globals.
 """
 
 from __future__ import annotations
 
+import ast
 from collections.abc import Mapping
 from typing import Any
 
@@ -95,13 +102,20 @@ def compile_kernel(
     force_rung_enable: bool = False,
     blockless: bool = False,
     proof_metadata: bool = False,
+    optimize: bool = True,
 ) -> CompiledKernel:
-    """Compile a Program into a fast in-process replay kernel."""
+    """Compile a Program into a fast in-process replay kernel.
+
+    ``optimize=False`` renders the unoptimized step function (every tag a
+    module global, written back every scan), which is easier to read when
+    debugging codegen.
+    """
     ctx = CodegenContext.for_kernel(
         program,
         force_rung_enable=force_rung_enable,
         blockless=blockless,
         proof_metadata=proof_metadata,
+        optimize=optimize,
     )
     source = _render_kernel_source(ctx)
 
@@ -169,7 +183,10 @@ def _render_kernel_source(ctx: CodegenContext) -> str:
     lines.extend(_render_embedded_functions(ctx))
     lines.extend(_render_declarations(ctx))
     lines.extend(sub_fn_lines)
-    lines.extend(_render_step_function(ctx, main_body))
+    if ctx.optimize:
+        lines.extend(_render_optimized_step_function(ctx, main_body, "\n".join(lines)))
+    else:
+        lines.extend(_render_step_function(ctx, main_body))
     return "\n".join(lines).rstrip() + "\n"
 
 
@@ -628,3 +645,85 @@ def _render_step_function(ctx: CodegenContext, main_body: list[str]) -> list[str
 
     lines.append("")
     return lines
+
+
+def _function_names(source: str) -> tuple[set[str], set[str]]:
+    """Return ``(referenced, assigned)`` names inside the functions of *source*."""
+    referenced: set[str] = set()
+    assigned: set[str] = set()
+    for node in ast.parse(source).body:
+        if not isinstance(node, ast.FunctionDef):
+            continue
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name):
+                referenced.add(child.id)
+                if isinstance(child.ctx, ast.Store):
+                    assigned.add(child.id)
+            elif isinstance(child, ast.Global):
+                referenced.update(child.names)
+    return referenced, assigned
+
+
+def _render_optimized_step_function(
+    ctx: CodegenContext, main_body: list[str], module_source: str
+) -> list[str]:
+    """Render ``_kernel_step`` with tag symbols hoisted into locals.
+
+    A symbol stays a module global only if a subroutine, indexed-address
+    helper, or embedded function also references it; everything else is a
+    local (``LOAD_FAST``).  Symbols the main body never mentions are not
+    loaded, and only symbols that some function assigns are written back.
+    """
+    shared, shared_assigned = _function_names(module_source)
+    body_used, body_assigned = _function_names(
+        "\n".join(["def _kernel_step():", *(main_body or ["    pass"])])
+    )
+    assigned = body_assigned | (shared_assigned & shared)
+
+    entries: list[tuple[str, str]] = [
+        (tag_name, ctx.symbol_table[tag_name])
+        for tag_name in sorted(ctx.scalar_tags)
+        if ctx.symbol_table[tag_name] in body_used or ctx.symbol_table[tag_name] in shared
+    ]
+    block_symbols: list[str] = []
+    if not ctx.blockless:
+        for binding in sorted(
+            ctx.block_bindings.values(),
+            key=lambda b: (ctx.block_symbols[b.block_id], b.block_id),
+        ):
+            compact = ctx.compact_block_map.get(binding.block_id)
+            if compact is not None and len(compact) == 0:
+                continue
+            symbol = ctx.block_symbols[binding.block_id]
+            if symbol in body_used or symbol in shared:
+                block_symbols.append(symbol)
+    state_symbols = [name for name in ("_mem", "_prev") if name in body_used or name in shared]
+
+    global_symbols = sorted(
+        symbol
+        for symbol in (*(symbol for _name, symbol in entries), *block_symbols, *state_symbols)
+        if symbol in shared
+    )
+    lines: list[str] = ["def _kernel_step(tags, blocks, memory, prev, dt):"]
+    globals_line = _global_line(global_symbols, indent=4)
+    if globals_line is not None:
+        lines.append(globals_line)
+    for tag_name, symbol in entries:
+        lines.append(f"    {symbol} = tags[{tag_name!r}]")
+    for symbol in block_symbols:
+        lines.append(f"    {symbol} = blocks[{symbol!r}]")
+    if "_mem" in state_symbols:
+        lines.append("    _mem = memory")
+    if "_prev" in state_symbols:
+        lines.append("    _prev = prev")
+    lines.append('    memory["_dt"] = dt')
+
+    if main_body:
+        lines.extend(main_body)
+
+    for tag_name, symbol in entries:
+        if symbol in assigned:
+            lines.append(f"    tags[{tag_name!r}] = {symbol}")
+
+    lines.append("")
+    return lines
@@ -70,7 +70,7 @@ def _modbus_backed_slots(ctx: CodegenContext) -> tuple[_ModbusBackedSlot, ...]:
     if ctx.tag_map is None:
         return ()
     slots: list[_ModbusBackedSlot] = []
-    for slot in ctx.tag_map.mapped_slots():
+    for slot in ctx.tag_map.iter_mapped_slots():
         tag = ctx.referenced_tags.get(slot.logical_name)
         if tag is None:
             continue
@@ -528,6 +528,19 @@ def _render_modbus_accessors(ctx: CodegenContext) -> list[str]:
                 "        return True",
             ]
         )
+    # Profile counters sit in a register range no Click bank uses.
+    profile_read_lines: list[str] = []
+    profile_write_lines: list[str] = []
+    if ctx.profile:
+        profile_read_lines = [
+            "    if _PROF_REG_BASE <= int(addr) < _PROF_REG_BASE + _PROF_REG_COUNT:",
+            "        return _prof_reg(int(addr) - _PROF_REG_BASE)",
+        ]
+        profile_write_lines = [
+            "    if int(addr) == _PROF_REG_BASE:",
+            "        _prof_reset()",
+            "        return True",
+        ]
     lines.extend(
         [
             '    if bank in ("DS", "DD", "DH", "DF", "TXT", "TD", "CTD"):',
@@ -551,6 +564,7 @@ def _render_modbus_accessors(ctx: CodegenContext) -> list[str]:
             "    return _mb_write_coil_plc(_bank, _index, val)",
             "",
             "def _mb_read_reg(addr):",
+            *profile_read_lines,
             "    _mapped = _mb_reverse_register(int(addr))",
             "    if _mapped is None:",
             "        return None",
@@ -558,6 +572,7 @@ def _render_modbus_accessors(ctx: CodegenContext) -> list[str]:
             "    return _mb_read_reg_plc(_bank, _index, _reg_pos)",
             "",
             "def _mb_write_reg(addr, val):",
+            *profile_write_lines,
             "    _mapped = _mb_reverse_register(int(addr))",
             "    if _mapped is None:",
             "        return False",
@@ -0,0 +1,104 @@
+"""Static RAM and bus-traffic estimates for generated CircuitPython code.
+
+The numbers model a 32-bit CircuitPython heap: object pointers are one
+word, bools and small ints are immediate values, and floats and strings
+are boxed heap objects.  They cover the tag, block, and scan-state data
+the generated ``code.py`` allocates — not bytecode, the runtime library,
+or Modbus buffers — and are meant for comparing programs against the
+P1AM-200's heap, not as an exact measurement.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from pyrung.circuitpy.codegen.context import CodegenContext
+from pyrung.circuitpy.codegen.render import _is_packed_bool_block
+from pyrung.core.tag import TagType
+
+_WORD_BYTES = 4
+_CONTAINER_HEADER_BYTES = 16
+_GLOBAL_ENTRY_BYTES = 2 * _WORD_BYTES
+_BOXED_VALUE_BYTES: dict[TagType, int] = {
+    TagType.REAL: 16,
+    TagType.CHAR: 16,
+}
+
+
+@dataclass(frozen=True)
+class ResourceReport:
+    """Estimated data RAM and per-scan base-controller bus transactions.
+
+    ``bus_writes_per_scan`` is the worst case, when every output changes;
+    outputs are written only when they change, so a steady-state scan
+    performs none.  The watchdog pet, when enabled, is counted separately.
+    """
+
+    scalar_tags: int
+    block_elements: int
+    packed_bool_elements: int
+    edge_tags: int
+    estimated_ram_bytes: int
+    bus_reads_per_scan: int
+    bus_writes_per_scan: int
+    watchdog_pets_per_scan: int
+
+    def format(self) -> str:
+        """Render the report as short human-readable lines."""
+        return "\n".join(
+            [
+                f"Estimated data RAM: {self.estimated_ram_bytes} bytes",
+                f"  scalar tags: {self.scalar_tags}",
+                f"  block elements: {self.block_elements}"
+                f" ({self.packed_bool_elements} in packed BOOL blocks)",
+                f"  edge-detect slots: {self.edge_tags}",
+                f"Bus transactions per scan: {self.bus_reads_per_scan} read(s),"
+                f" 0-{self.bus_writes_per_scan} output write(s),"
+                f" {self.watchdog_pets_per_scan} watchdog pet(s)",
+            ]
+        )
+
+    def __str__(self) -> str:
+        return self.format()
+
+
+def estimate_resources(ctx: CodegenContext) -> ResourceReport:
+    """Estimate resources for a context that has already been rendered."""
+    ram = 0
+    for tag in ctx.scalar_tags.values():
+        ram += _GLOBAL_ENTRY_BYTES + _BOXED_VALUE_BYTES.get(tag.type, 0)
+
+    block_elements = 0
+    packed_elements = 0
+    for binding in ctx.block_bindings.values():
+        size = binding.end - binding.start + 1
+        block_elements += size
+        ram += _GLOBAL_ENTRY_BYTES + _CONTAINER_HEADER_BYTES
+        if _is_packed_bool_block(binding.tag_type, size):
+            packed_elements += size
+            ram += size
+        else:
+            ram += size * (_WORD_BYTES + _BOXED_VALUE_BYTES.get(binding.tag_type, 0))
+
+    reads = 0
+    writes = 0
+    for slot in ctx.slot_bindings:
+        if slot.input_block_id is not None:
+            reads += 1 if slot.input_kind == "discrete" else slot.input_count
+        if slot.output_block_id is not None:
+            writes += 1 if slot.output_kind == "discrete" else slot.output_count
+
+    edge_tags = len(ctx.edge_prev_slots)
+    for count in (edge_tags, writes):
+        ram += _GLOBAL_ENTRY_BYTES + _CONTAINER_HEADER_BYTES + count * _WORD_BYTES
+
+    return ResourceReport(
+        scalar_tags=len(ctx.scalar_tags),
+        block_elements=block_elements,
+        packed_bool_elements=packed_elements,
+        edge_tags=edge_tags,
+        estimated_ram_bytes=ram,
+        bus_reads_per_scan=reads,
+        bus_writes_per_scan=writes,
+        watchdog_pets_per_scan=1 if ctx.watchdog_ms is not None else 0,
+    )
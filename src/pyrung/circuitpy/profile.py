@@ -0,0 +1,362 @@
+"""On-target scan profiling for generated CircuitPython code.
+
+``generate_circuitpy(..., profile=True)`` instruments the generated scan
+loop with ``time.monotonic_ns()`` accumulators, one *bucket* per scan
+phase, top-level rung, and subroutine.  Buckets are inclusive: a
+subroutine's time also counts toward the rung that called it, and the
+``logic`` phase covers every main rung.
+
+The board reports the accumulators two ways:
+
+- over serial, as a ``PYRUNG_PROFILE [...]`` line every
+  ``PROFILE_PRINT_S`` seconds;
+- over the generated Modbus server (when configured), as holding
+  registers starting at :data:`PROFILE_REGISTER_BASE`, an address range
+  no Click bank uses.  Writing any value to the base register resets the
+  accumulators.
+
+Register layout (32-bit values are low word first, like Click ``DD``):
+
+====================  =====================================
+offset                value
+====================  =====================================
+0                     layout version (``1``)
+1                     bucket count ``N``
+2-3                   longest scan, microseconds
+4 + 4*i, 5 + 4*i      bucket *i* total time, microseconds
+6 + 4*i, 7 + 4*i      bucket *i* count
+====================  =====================================
+
+Totals wrap at 2**32 microseconds (about 71 minutes of bucket time);
+:meth:`ProfileSample.since` handles the wrap when diffing two reads.
+
+The code generator returns a :class:`ProfileLayout` naming each bucket;
+``write_circuitpy`` saves it as ``pyrung_profile.json`` next to
+``code.py`` so ``pyrung circuitpy-profile`` can map the numbers back to
+source rungs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+from pyrung.core.profiler import ProfileEntry, ProfileReport
+
+if TYPE_CHECKING:
+    from pymodbus.client import ModbusTcpClient
+
+PROFILE_REGISTER_BASE = 32768
+PROFILE_LAYOUT_VERSION = 1
+PROFILE_LAYOUT_FILENAME = "pyrung_profile.json"
+SERIAL_PREFIX = "PYRUNG_PROFILE "
+
+_HEADER_REGISTERS = 4
+_REGISTERS_PER_BUCKET = 4
+_MAX_READ_REGISTERS = 125
+_U32 = 1 << 32
+
+BucketKind = Literal["phase", "rung", "subroutine"]
+
+
+@dataclass(frozen=True)
+class ProfileBucket:
+    """One accumulator slot in the generated code."""
+
+    kind: BucketKind
+    name: str
+
+
+@dataclass(frozen=True)
+class ProfileLayout:
+    """Bucket names, in accumulator order, for one generated ``code.py``."""
+
+    buckets: tuple[ProfileBucket, ...]
+    register_base: int = PROFILE_REGISTER_BASE
+
+    @property
+    def register_count(self) -> int:
+        return _HEADER_REGISTERS + _REGISTERS_PER_BUCKET * len(self.buckets)
+
+    def to_json(self) -> str:
+        payload = {
+            "version": PROFILE_LAYOUT_VERSION,
+            "register_base": self.register_base,
+            "buckets": [[bucket.kind, bucket.name] for bucket in self.buckets],
+        }
+        return json.dumps(payload, indent=2) + "\n"
+
+    @classmethod
+    def from_json(cls, text: str) -> ProfileLayout:
+        payload = json.loads(text)
+        version = payload.get("version")
+        if version != PROFILE_LAYOUT_VERSION:
+            raise ValueError(f"Unsupported profile layout version: {version!r}")
+        buckets = tuple(ProfileBucket(kind, name) for kind, name in payload["buckets"])
+        return cls(buckets=buckets, register_base=int(payload["register_base"]))
+
+
+@dataclass(frozen=True)
+class ProfileSample:
+    """Raw accumulator values read from a board."""
+
+    max_scan_us: int
+    totals_us: tuple[int, ...]
+    counts: tuple[int, ...]
+
+    def since(self, earlier: ProfileSample) -> ProfileSample:
+        """Difference from an earlier read, tolerating 32-bit register wrap.
+
+        ``max_scan_us`` is not windowed; the later value is kept.
+        """
+        if len(earlier.totals_us) != len(self.totals_us):
+            raise ValueError("Samples come from different profile layouts")
+        return ProfileSample(
+            max_scan_us=self.max_scan_us,
+            totals_us=tuple(
+                (now - then) % _U32
+                for now, then in zip(self.totals_us, earlier.totals_us, strict=True)
+            ),
+            counts=tuple(
+                (now - then) % _U32 for now, then in zip(self.counts, earlier.counts, strict=True)
+            ),
+        )
+
+    @classmethod
+    def from_registers(cls, registers: Iterable[int]) -> ProfileSample:
+        regs = list(registers)
+        if len(regs) < _HEADER_REGISTERS or regs[0] != PROFILE_LAYOUT_VERSION:
+            raise ValueError("Registers do not hold a pyrung profile")
+        count = regs[1]
+        if len(regs) < _HEADER_REGISTERS + _REGISTERS_PER_BUCKET * count:
+            raise ValueError(f"Expected {count} profile bucket(s), got a short read")
+
+        def u32(offset: int) -> int:
+            return regs[offset] | (regs[offset + 1] << 16)
+
+        offsets = [_HEADER_REGISTERS + _REGISTERS_PER_BUCKET * i for i in range(count)]
+        return cls(
+            max_scan_us=u32(2),
+            totals_us=tuple(u32(offset) for offset in offsets),
+            counts=tuple(u32(offset + 2) for offset in offsets),
+        )
+
+    @classmethod
+    def from_serial(cls, lines: Iterable[str]) -> ProfileSample:
+        """Parse the last ``PYRUNG_PROFILE`` line from serial console output."""
+        last: str | None = None
+        for line in lines:
+            index = line.find(SERIAL_PREFIX)
+            if index >= 0:
+                last = line[index + len(SERIAL_PREFIX) :]
+        if last is None:
+            raise ValueError(f"No {SERIAL_PREFIX.strip()} line found")
+        max_scan_us, totals_us, counts = json.loads(last)
+        return cls(
+            max_scan_us=int(max_scan_us),
+            totals_us=tuple(int(value) for value in totals_us),
+            counts=tuple(int(value) for value in counts),
+        )
+
+
+@dataclass(frozen=True)
+class BoardProfile:
+    """A :class:`ProfileSample` mapped onto its :class:`ProfileLayout`.
+
+    ``logic`` reuses the host profiler's :class:`ProfileReport`, so rung
+    and subroutine tables read the same as ``plc.debug.profile()``.
+    """
+
+    scans: int
+    max_scan_us: int
+    phases: list[ProfileEntry]
+    logic: ProfileReport
+
+    @classmethod
+    def from_sample(cls, layout: ProfileLayout, sample: ProfileSample) -> BoardProfile:
+        if len(layout.buckets) != len(sample.totals_us):
+            raise ValueError(
+                f"Profile layout has {len(layout.buckets)} bucket(s), "
+                f"board reported {len(sample.totals_us)}"
+            )
+        grouped: dict[str, list[ProfileEntry]] = {"phase": [], "rung": [], "subroutine": []}
+        for bucket, total_us, calls in zip(
+            layout.buckets, sample.totals_us, sample.counts, strict=True
+        ):
+            grouped[bucket.kind].append(
+                ProfileEntry(name=bucket.name, calls=calls, total_ns=total_us * 1000)
+            )
+        phases = {entry.name: entry for entry in grouped["phase"]}
+        scan = phases.get("scan")
+        logic = phases.get("logic")
+        for kind in ("rung", "subroutine"):
+            grouped[kind].sort(key=lambda entry: (-entry.total_ns, entry.name))
+        return cls(
+            scans=scan.calls if scan is not None else 0,
+            max_scan_us=sample.max_scan_us,
+            phases=grouped["phase"],
+            logic=ProfileReport(
+                scans=logic.calls if logic is not None else 0,
+                total_ns=logic.total_ns if logic is not None else 0,
+                rungs=grouped["rung"],
+                subroutines=grouped["subroutine"],
+            ),
+        )
+
+    def format(self, limit: int | None = 10) -> str:
+        """Render the phase table followed by the rung and subroutine tables."""
+        scan = next((entry for entry in self.phases if entry.name == "scan"), None)
+        mean = scan.mean_us if scan is not None else 0.0
+        lines = [f"{self.scans} scan(s), {mean:.1f} us/scan mean, {self.max_scan_us} us max"]
+        lines.append("")
+        lines.append(f"{'Phases':<32} {'calls':>10} {'total ms':>10} {'mean us':>10} {'%':>6}")
+        total_ns = scan.total_ns if scan is not None else 0
+        for entry in self.phases:
+            share = 100.0 * entry.total_ns / total_ns if total_ns else 0.0
+            lines.append(
+                f"{entry.name:<32} {entry.calls:>10} {entry.total_ns / 1e6:>10.3f} "
+                f"{entry.mean_us:>10.2f} {share:>6.1f}"
+            )
+        lines.append("")
+        lines.append(self.logic.format(limit))
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.format()
+
+
+def read_profile_registers(
+    host: str, layout: ProfileLayout, *, port: int = 502, unit_id: int = 1, timeout: int = 2
+) -> ProfileSample:
+    """Read the profile registers from a board's generated Modbus TCP server."""
+    registers: list[int] = []
+    with _modbus_client(host, port, timeout) as client:
+        offset = 0
+        total = layout.register_count
+        while offset < total:
+            start = layout.register_base + offset
+            count = min(_MAX_READ_REGISTERS, total - offset)
+            response = client.read_holding_registers(start, count=count, device_id=unit_id)
+            if response.isError():
+                raise OSError(
+                    f"Modbus exception {getattr(response, 'exception_code', 0)} "
+                    f"reading registers {start}..{start + count - 1}"
+                )
+            registers.extend(response.registers[:count])
+            offset += count
+    return ProfileSample.from_registers(registers)
+
+
+def reset_profile_registers(
+    host: str, layout: ProfileLayout, *, port: int = 502, unit_id: int = 1, timeout: int = 2
+) -> None:
+    """Clear the board's accumulators by writing the profile base register."""
+    with _modbus_client(host, port, timeout) as client:
+        response = client.write_register(layout.register_base, 0, device_id=unit_id)
+        if response.isError():
+            raise OSError(
+                f"Modbus exception {getattr(response, 'exception_code', 0)} "
+                "resetting profile counters"
+            )
+
+
+@contextmanager
+def _modbus_client(host: str, port: int, timeout: int) -> Iterator[ModbusTcpClient]:
+    """Yield a connected pymodbus client for the board's generated server.
+
+    The profile registers sit outside every Click bank, so they are read
+    with plain holding-register calls (function codes 3 and 6) rather
+    than through a pyclickplc ``ClickClient`` bank accessor, like the
+    raw send/receive backend.  pymodbus errors surface as ``OSError``.
+    """
+    from pymodbus.client import ModbusTcpClient
+    from pymodbus.exceptions import ModbusException
+
+    client = ModbusTcpClient(host, port=port, timeout=timeout)
+    try:
+        if not client.connect():
+            raise ConnectionError(f"Could not connect to Modbus server at {host}:{port}")
+        yield client
+    except ModbusException as exc:
+        raise OSError(str(exc)) from exc
+    finally:
+        client.close()
+
+
+def _parse_host(value: str) -> tuple[str, int]:
+    host, _, port = value.partition(":")
+    return host, int(port) if port else 502
+
+
+def main() -> None:
+    """``pyrung circuitpy-profile`` command-line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="pyrung circuitpy-profile",
+        description="Read on-board scan profile counters and map them to source rungs",
+    )
+    parser.add_argument(
+        "--layout",
+        default=PROFILE_LAYOUT_FILENAME,
+        help=f"Profile layout written by write_circuitpy (default: {PROFILE_LAYOUT_FILENAME})",
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--modbus", metavar="HOST[:PORT]", help="Read over Modbus TCP")
+    source.add_argument(
+        "--serial-log", metavar="FILE", help="Parse captured serial output ('-' for stdin)"
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        help="With --modbus, report only the activity during this many seconds",
+    )
+    parser.add_argument("--reset", action="store_true", help="With --modbus, reset the counters")
+    parser.add_argument("--limit", type=int, default=10, help="Rows per table (default: 10)")
+    args = parser.parse_args()
+
+    try:
+        layout = ProfileLayout.from_json(Path(args.layout).read_text(encoding="utf-8"))
+    except (OSError, ValueError, KeyError) as exc:
+        parser.error(f"cannot read profile layout {args.layout}: {exc}")
+
+    try:
+        if args.modbus:
+            host, port = _parse_host(args.modbus)
+            if args.reset:
+                reset_profile_registers(host, layout, port=port)
+                print("Profile counters reset")
+                return
+            sample = read_profile_registers(host, layout, port=port)
+            if args.interval:
+                time.sleep(args.interval)
+                sample = read_profile_registers(host, layout, port=port).since(sample)
+        else:
+            if args.reset or args.interval:
+                parser.error("--reset and --interval require --modbus")
+            if args.serial_log == "-":
+                sample = ProfileSample.from_serial(sys.stdin)
+            else:
+                with open(args.serial_log, encoding="utf-8", errors="replace") as f:
+                    sample = ProfileSample.from_serial(f)
+        print(BoardProfile.from_sample(layout, sample).format(args.limit))
+    except (OSError, ValueError) as exc:
+        print(f"pyrung circuitpy-profile: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+
+__all__ = [
+    "PROFILE_LAYOUT_FILENAME",
+    "PROFILE_REGISTER_BASE",
+    "BoardProfile",
+    "ProfileBucket",
+    "ProfileLayout",
+    "ProfileSample",
+    "read_profile_registers",
+    "reset_profile_registers",
+]
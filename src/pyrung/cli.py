@@ -7,6 +7,7 @@ import importlib
 import sys
 from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 
 def _find_program(module_path: str) -> tuple:
@@ -155,6 +156,68 @@ def _apply_lock_config(
     return sorted(tags), joint_inputs, exclusive_inputs
 
 
+def _find_instance(mod: object, cls: type, *, required: bool = False) -> Any:
+    """Return the single module-level instance of *cls* in *mod*, or ``None``."""
+    found = [
+        (attr, getattr(mod, attr))
+        for attr in sorted(dir(mod))
+        if isinstance(getattr(mod, attr), cls)
+    ]
+    if len(found) > 1:
+        names = ", ".join(name for name, _ in found)
+        raise SystemExit(f"Multiple {cls.__name__} instances in module: {names}")
+    if not found:
+        if required:
+            raise SystemExit(f"No {cls.__name__} instance found in module")
+        return None
+    return found[0][1]
+
+
+def _parse_bytes(value: str) -> int:
+    """Parse a byte count with an optional ``k``/``m`` (KiB/MiB) suffix."""
+    text = value.strip().lower()
+    scale = {"k": 1024, "m": 1024 * 1024}.get(text[-1:], 1)
+    if scale != 1:
+        text = text[:-1]
+    try:
+        return int(float(text) * scale)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid byte count: {value!r}") from None
+
+
+def _cmd_build_circuitpy(args: argparse.Namespace) -> None:
+    from pyrung.circuitpy import P1AM, ModbusClientConfig, ModbusServerConfig
+    from pyrung.circuitpy.build import BuildBudget, BuildBudgetError, build_circuitpy
+    from pyrung.click import TagMap
+
+    program, mod = _find_program(args.module)
+    modbus_server = _find_instance(mod, ModbusServerConfig)
+    modbus_client = _find_instance(mod, ModbusClientConfig)
+    try:
+        report = build_circuitpy(
+            program,
+            _find_instance(mod, P1AM, required=True),
+            output_dir=args.output_dir,
+            target_scan_ms=args.target_scan_ms,
+            watchdog_ms=args.watchdog_ms,
+            modbus_server=modbus_server,
+            modbus_client=modbus_client,
+            tag_map=_find_instance(mod, TagMap),
+            profile=args.profile_scan,
+            budget=BuildBudget(flash_bytes=args.flash_budget, ram_bytes=args.ram_budget),
+            mpy_cross=args.mpy_cross,
+        )
+    except BuildBudgetError as exc:
+        print(exc.report.format(), file=sys.stderr)
+        for message in exc.report.violations:
+            print(f"Over budget: {message}", file=sys.stderr)
+        raise SystemExit(1) from None
+    except (FileNotFoundError, RuntimeError, ValueError) as exc:
+        raise SystemExit(str(exc)) from None
+    print(report.format())
+    print(f"Wrote {args.output_dir}", file=sys.stderr)
+
+
 def _cmd_dap(_args: argparse.Namespace) -> None:
     from pyrung.dap import main as dap_main
 
@@ -168,6 +231,20 @@ def _cmd_live(_args: argparse.Namespace) -> None:
     live_main()
 
 
+def _cmd_telemetry(_args: argparse.Namespace) -> None:
+    from pyrung.dap.telemetry import main as telemetry_main
+
+    sys.argv = ["pyrung telemetry", *_args.rest]
+    telemetry_main()
+
+
+def _cmd_circuitpy_profile(_args: argparse.Namespace) -> None:
+    from pyrung.circuitpy.profile import main as profile_main
+
+    sys.argv = ["pyrung circuitpy-profile", *_args.rest]
+    profile_main()
+
+
 def _run_with_optional_profile(
     args: argparse.Namespace, func: Callable[[argparse.Namespace], None]
 ) -> None:
@@ -234,6 +311,33 @@ def main() -> None:
     )
     check_p.set_defaults(func=_cmd_check)
 
+    # -- build-circuitpy --
+    build_p = sub.add_parser(
+        "build-circuitpy",
+        help="Compile a program to .mpy for the P1AM-200 and check size budgets",
+    )
+    build_p.add_argument("module", help="Python module containing the Program and P1AM")
+    build_p.add_argument(
+        "-o", "--output-dir", default="circuitpy_build", help="Output directory (drive layout)"
+    )
+    build_p.add_argument("--target-scan-ms", type=float, default=10.0)
+    build_p.add_argument("--watchdog-ms", type=int)
+    build_p.add_argument(
+        "--flash-budget", type=_parse_bytes, help="Fail if written files exceed this (e.g. 512k)"
+    )
+    build_p.add_argument(
+        "--ram-budget", type=_parse_bytes, help="Fail if the import heap estimate exceeds this"
+    )
+    build_p.add_argument("--mpy-cross", help="mpy-cross binary (default: $MPY_CROSS, then PATH)")
+    build_p.add_argument(
+        "--profile-scan", action="store_true", help="Build with on-target scan profiling"
+    )
+    build_p.add_argument(
+        "--profile",
+        help="Write cProfile stats to FILE; dumped even if interrupted",
+    )
+    build_p.set_defaults(func=_cmd_build_circuitpy)
+
     # -- dap --
     dap_p = sub.add_parser("dap", help="Run the DAP debug adapter")
     dap_p.set_defaults(func=_cmd_dap)
@@ -243,6 +347,18 @@ def main() -> None:
     live_p.add_argument("rest", nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
     live_p.set_defaults(func=_cmd_live)
 
+    # -- telemetry --
+    telemetry_p = sub.add_parser("telemetry", help="Tail a session's per-scan telemetry stream")
+    telemetry_p.add_argument("rest", nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+    telemetry_p.set_defaults(func=_cmd_telemetry)
+
+    # -- circuitpy-profile --
+    circuitpy_profile_p = sub.add_parser(
+        "circuitpy-profile", help="Read on-board scan profile counters from a P1AM-200"
+    )
+    circuitpy_profile_p.add_argument("rest", nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+    circuitpy_profile_p.set_defaults(func=_cmd_circuitpy_profile)
+
     args = parser.parse_args()
     if not args.command:
         parser.print_help()
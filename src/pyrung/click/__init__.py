@@ -53,10 +53,12 @@ hardware-agnostic ``pyrung`` core:
 
 - :class:`TagMap` — maps logical Tags/Blocks to Click hardware addresses.
 - :func:`validate_click_program` — checks a Program against Click hardware restrictions.
+- :class:`ClickValidationCache` — reuses findings for unchanged rungs across validations.
 
 **Soft PLC adapter:**
 
 - :class:`ClickDataProvider` — bridges ``SystemState`` to pyclickplc's Modbus server.
+- :func:`replay_hil` — replays a recorded session against a soft PLC or a Click over Modbus and diffs outputs.
 
 **Communication instructions:**
 
@@ -183,13 +185,26 @@ ctd: Block = _block_from_bank_config(BANKS["CTD"])
 sd: Block = _block_from_bank_config(BANKS["SD"])
 txt: Block = _block_from_bank_config(BANKS["TXT"])
 
-from pyrung.click.codegen import ladder_to_pyrung, ladder_to_pyrung_project
+from pyrung.click.codegen import iter_ladder_to_pyrung, ladder_to_pyrung, ladder_to_pyrung_project
 from pyrung.click.data_provider import ClickDataProvider
-from pyrung.click.ladder import LadderBundle, LadderExportError, pyrung_to_ladder
+from pyrung.click.hil import (
+    HilMismatch,
+    HilReport,
+    ModbusReplayTarget,
+    SoftPlcTarget,
+    replay_hil,
+)
+from pyrung.click.ladder import (
+    LadderBundle,
+    LadderExportCache,
+    LadderExportError,
+    pyrung_to_ladder,
+)
 from pyrung.click.nop import NopInstruction, nop
 from pyrung.click.raw import RawInstruction, raw
 from pyrung.click.tag_map import TagMap
 from pyrung.click.validation import (
+    ClickValidationCache,
     ValidationMode,
     validate_click_program,
 )
@@ -246,8 +261,15 @@ __all__ = [
     "txt",
     "TagMap",
     "LadderBundle",
+    "LadderExportCache",
+    "ClickValidationCache",
     "LadderExportError",
     "ClickDataProvider",
+    "HilMismatch",
+    "HilReport",
+    "ModbusReplayTarget",
+    "SoftPlcTarget",
+    "replay_hil",
     "ModbusAddress",
     "ModbusReceiveInstruction",
     "ModbusRtuTarget",
@@ -261,6 +283,7 @@ __all__ = [
     "nop",
     "RawInstruction",
     "raw",
+    "iter_ladder_to_pyrung",
     "ladder_to_pyrung",
     "ladder_to_pyrung_project",
     "pyrung_to_ladder",
@@ -0,0 +1,255 @@
+"""Structural rung fingerprints shared by the Click export and validation caches.
+
+A fingerprint covers everything about a rung that can change exported rows
+or validation findings: conditions, instructions, comments, and the
+hardware addresses the rung's tags and blocks map to.  Source locations and
+per-build bookkeeping are ignored, so rebuilding an unchanged program (for
+example re-running the module on save) reproduces the same keys.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import uuid
+from enum import Enum
+from types import BuiltinFunctionType, CodeType, FunctionType, MethodType
+from typing import TYPE_CHECKING, Any
+
+from pyrung.core.memory_block import Block
+from pyrung.core.rung import Rung
+from pyrung.core.tag import Tag
+
+if TYPE_CHECKING:
+    from pyrung.click.tag_map import TagMap
+
+# Source locations only feed error messages, and inserting a line above a
+# rung must not invalidate every rung below it.  Instruction state keys are
+# numbered program-wide when the Program closes, so they shift the same way.
+_IGNORED_ATTRS = frozenset(
+    {
+        "source_file",
+        "source_line",
+        "end_line",
+        "_state_key",
+        "_memory_keys",
+        "_condition_fn",
+        "_local_condition_fn",
+    }
+)
+
+
+def _digest(parts: list[str]) -> str:
+    return hashlib.blake2b("\x1f".join(parts).encode("utf-8"), digest_size=20).hexdigest()
+
+
+class _RungFingerprinter:
+    """Hash rungs by everything that reaches the rendered CSV rows.
+
+    Tags contribute their name, type, and mapped address; blocks their
+    shape and hardware mapping.  Everything else (conditions, instructions,
+    expressions, literals) is walked structurally, so a new instruction
+    field is picked up without changes here.
+    """
+
+    def __init__(self, tag_map: TagMap) -> None:
+        self._tag_map = tag_map
+        self._tag_keys: dict[int, str] = {}
+        self._block_keys: dict[int, str] = {}
+        self._rung_keys: dict[int, tuple[Rung, str]] = {}
+        self._active: set[int] = set()
+
+    def rung_key(self, rung: Rung) -> str:
+        """Return the digest of one top-level rung (memoized per instance)."""
+        cached = self._rung_keys.get(id(rung))
+        if cached is not None and cached[0] is rung:
+            return cached[1]
+        parts: list[str] = []
+        self._rung(rung, parts)
+        key = _digest(parts)
+        self._rung_keys[id(rung)] = (rung, key)
+        return key
+
+    def unit_key(self, scope: str, rungs: list[Rung]) -> str:
+        """Return the digest of a run of rungs exported together in *scope*."""
+        return _digest([scope, *(self.rung_key(rung) for rung in rungs)])
+
+    def _rung(self, rung: Rung, out: list[str]) -> None:
+        out.append(
+            f"Rung({rung._branch_condition_start},{rung._use_prior_snapshot},{rung.comment!r})"
+        )
+        self._value(rung._conditions, out)
+        self._value(rung._execution_items, out)
+        out.append("/Rung")
+
+    def _tag_key(self, tag: Tag) -> str:
+        key = self._tag_keys.get(id(tag))
+        if key is None:
+            try:
+                address = self._tag_map.resolve(tag)
+            except Exception:
+                address = "-"
+            key = f"Tag:{type(tag).__name__}:{tag.name}:{tag.type.name}:{address}"
+            self._tag_keys[id(tag)] = key
+        return key
+
+    def _block_key(self, block: Block) -> str:
+        key = self._block_keys.get(id(block))
+        if key is None:
+            entry = self._tag_map._block_entry_by_name(block.name)
+            mapping = (
+                None
+                if entry is None
+                else (entry.hardware.block.name, sorted(entry.logical_to_hardware.items()))
+            )
+            key = (
+                f"Block:{type(block).__name__}:{block.name}:{block.type.name}:"
+                f"{block.start}:{block.end}:{block.valid_ranges}:{mapping}"
+            )
+            self._block_keys[id(block)] = key
+        return key
+
+    def _value(self, value: Any, out: list[str]) -> None:
+        cls = type(value)
+        kind = _KINDS.get(cls)
+        if kind is None:
+            kind = _KINDS[cls] = _classify(cls)
+        if kind == "scalar":
+            out.append(f"{cls.__name__}:{value!r}")
+        elif kind == "tag":
+            out.append(self._tag_key(value))
+        elif kind == "object":
+            self._object(value, out)
+        elif kind == "sequence":
+            out.append("(")
+            for item in value:
+                self._value(item, out)
+            out.append(")")
+        elif kind == "rung":
+            self._rung(value, out)
+        elif kind == "block":
+            out.append(self._block_key(value))
+        elif kind == "enum":
+            out.append(f"{cls.__qualname__}.{value.name}")
+        elif kind == "mapping":
+            out.append("{")
+            for item_key, item in value.items():
+                self._value(item_key, out)
+                self._value(item, out)
+            out.append("}")
+        elif kind == "set":
+            items: list[str] = []
+            for item in value:
+                item_parts: list[str] = []
+                self._value(item, item_parts)
+                items.append("\x1f".join(item_parts))
+            out.append("set(" + "\x1e".join(sorted(items)) + ")")
+        elif kind == "callable":
+            self._callable(value, out)
+        else:
+            # CallInstruction keeps a Program back-reference; its target name is hashed.
+            out.append("Program")
+
+    def _callable(self, value: Any, out: list[str]) -> None:
+        out.append(f"fn:{getattr(value, '__module__', '')}.{value.__qualname__}")
+        func = getattr(value, "__func__", value)
+        code = getattr(func, "__code__", None)
+        if not isinstance(code, CodeType):
+            # Builtins and classes are identified by name.
+            return
+        marker = id(func)
+        if marker in self._active:
+            out.append("cycle")
+            return
+        self._active.add(marker)
+        # Globals the body reads are not covered; defaults and closure
+        # cells are, since they tell apart lambdas built in one scope.
+        out.append(_code_key(code))
+        for captured in (func.__defaults__, func.__kwdefaults__):
+            self._captured(captured, out)
+        for cell in func.__closure__ or ():
+            try:
+                contents = cell.cell_contents
+            except ValueError:
+                contents = None
+            self._captured(contents, out)
+        self._active.discard(marker)
+
+    def _captured(self, value: Any, out: list[str]) -> None:
+        """Hash a default or closure value; opaque objects make the rung uncacheable."""
+        cls = type(value)
+        kind = _KINDS.get(cls)
+        if kind is None:
+            kind = _KINDS[cls] = _classify(cls)
+        if kind in ("object", "program"):
+            out.append(f"opaque:{uuid.uuid4().hex}")
+        else:
+            self._value(value, out)
+
+    def _object(self, value: Any, out: list[str]) -> None:
+        marker = id(value)
+        if marker in self._active:
+            out.append("cycle")
+            return
+        self._active.add(marker)
+        out.append(f"{type(value).__module__}.{type(value).__qualname__}[")
+        for name, attr in sorted(_attributes(value).items()):
+            if name in _IGNORED_ATTRS:
+                continue
+            out.append(name)
+            self._value(attr, out)
+        out.append("]")
+        self._active.discard(marker)
+
+
+_KINDS: dict[type, str] = {}
+
+
+def _code_key(code: CodeType) -> str:
+    """Digest a function body; line numbers are left out so moving it is free."""
+    digest = hashlib.blake2b(code.co_code, digest_size=20)
+    digest.update("\x1f".join(code.co_names).encode("utf-8"))
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            digest.update(_code_key(const).encode("ascii"))
+        elif isinstance(const, frozenset):
+            # ``x in {...}`` constants; set order varies with hash seeding.
+            digest.update(repr(sorted(map(repr, const))).encode())
+        else:
+            digest.update(f"{type(const).__name__}:{const!r}".encode())
+    return f"code:{digest.hexdigest()}"
+
+
+def _classify(cls: type) -> str:
+    if cls is type(None) or issubclass(cls, (bool, int, float, str, bytes)):
+        return "scalar"
+    if issubclass(cls, Enum):
+        return "enum"
+    if issubclass(cls, Tag):
+        return "tag"
+    if issubclass(cls, Block):
+        return "block"
+    if issubclass(cls, Rung):
+        return "rung"
+    if issubclass(cls, (list, tuple)):
+        return "sequence"
+    if issubclass(cls, dict):
+        return "mapping"
+    if issubclass(cls, (set, frozenset)):
+        return "set"
+    if issubclass(cls, (FunctionType, BuiltinFunctionType, MethodType, type)):
+        return "callable"
+    if cls.__name__ == "Program":
+        return "program"
+    return "object"
+
+
+def _attributes(value: Any) -> dict[str, Any]:
+    attrs: dict[str, Any] = dict(getattr(value, "__dict__", {}))
+    for cls in type(value).__mro__:
+        slots = getattr(cls, "__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name in ("__dict__", "__weakref__"):
+                continue
+            if name not in attrs and hasattr(value, name):
+                attrs[name] = getattr(value, name)
+    return attrs
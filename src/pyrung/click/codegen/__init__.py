@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
-from pyrung.click.codegen.api import ladder_to_pyrung, ladder_to_pyrung_project
+from pyrung.click.codegen.api import (
+    iter_ladder_to_pyrung,
+    ladder_to_pyrung,
+    ladder_to_pyrung_project,
+)
 
-__all__ = ["ladder_to_pyrung", "ladder_to_pyrung_project"]
+__all__ = ["iter_ladder_to_pyrung", "ladder_to_pyrung", "ladder_to_pyrung_project"]
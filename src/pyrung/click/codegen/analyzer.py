@@ -29,6 +29,7 @@ from __future__ import annotations
 
 import warnings
 from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
 
 from pyrung.click._topology import (
@@ -668,42 +669,74 @@ def _split_continued(rung: _AnalyzedRung) -> list[_AnalyzedRung]:
     return result
 
 
-def _analyze_rungs(raw_rungs: list[_RawRung]) -> list[_AnalyzedRung]:
-    """Analyze topology of each rung."""
-    analyzed: list[_AnalyzedRung] = []
+def _drop_trailing_end(raw_rungs: Iterable[_RawRung]) -> Iterator[_RawRung]:
+    """Yield *raw_rungs* minus a trailing ``end()`` rung, holding one rung back."""
+    pending: _RawRung | None = None
+    for rung in raw_rungs:
+        if pending is not None:
+            yield pending
+        pending = rung
+    if pending is not None:
+        last_af = pending.rows[0][-1] if pending.rows else ""
+        if last_af != "end()":
+            yield pending
+
 
+def _iter_analyzed_rungs(raw_rungs: Iterable[_RawRung]) -> Iterator[_AnalyzedRung]:
+    """Analyze topology of each rung as it arrives."""
     # Strip trailing end() rung (auto-appended by pyrung_to_ladder, not part of user logic).
-    if raw_rungs:
-        last = raw_rungs[-1]
-        last_af = last.rows[0][-1] if last.rows else ""
-        if last_af == "end()":
-            raw_rungs = raw_rungs[:-1]
-
-    # First pass: detect for/next grouping
-    i = 0
-    while i < len(raw_rungs):
-        rung = raw_rungs[i]
+    in_forloop = False
+    for rung in _drop_trailing_end(raw_rungs):
         af0 = rung.rows[0][-1] if rung.rows else ""
 
-        if af0.startswith("for("):
-            # for/next block
-            analyzed.append(_analyze_single_rung(rung, role=RungRole.FORLOOP_START))
-            i += 1
-            # Collect body rungs until next()
-            while i < len(raw_rungs):
-                body_rung = raw_rungs[i]
-                body_af = body_rung.rows[0][-1] if body_rung.rows else ""
-                if body_af == "next()":
-                    analyzed.append(_analyze_single_rung(body_rung, role=RungRole.FORLOOP_NEXT))
-                    i += 1
-                    break
-                analyzed.append(_analyze_single_rung(body_rung, role=RungRole.FORLOOP_BODY))
-                i += 1
+        if in_forloop:
+            # for/next body runs until next()
+            if af0 == "next()":
+                in_forloop = False
+                yield _analyze_single_rung(rung, role=RungRole.FORLOOP_NEXT)
+            else:
+                yield _analyze_single_rung(rung, role=RungRole.FORLOOP_BODY)
+        elif af0.startswith("for("):
+            in_forloop = True
+            yield _analyze_single_rung(rung, role=RungRole.FORLOOP_START)
         else:
-            analyzed.extend(_split_continued(_analyze_single_rung(rung)))
-            i += 1
+            yield from _split_continued(_analyze_single_rung(rung))
+
+
+def _analyze_rungs(raw_rungs: Iterable[_RawRung]) -> list[_AnalyzedRung]:
+    """Analyze topology of each rung."""
+    return list(_iter_analyzed_rungs(raw_rungs))
+
+
+class _RungStream:
+    """Analyzed rungs that are re-read from their source on every iteration.
+
+    Codegen walks a program more than once (operand collection, per-file
+    reference scans, emission); re-analyzing each time keeps only the rung
+    in hand alive instead of the whole program.  *open_raw* must return a
+    fresh raw-rung iterator per call.  Analysis warnings are raised by the
+    first pass only, or never when *warn* is false because the caller has
+    already analyzed the source once.
+    """
 
-    return analyzed
+    def __init__(self, open_raw: Callable[[], Iterable[_RawRung]], *, warn: bool = True) -> None:
+        self._open_raw = open_raw
+        self._warned = not warn
+
+    def __iter__(self) -> Iterator[_AnalyzedRung]:
+        rungs = _iter_analyzed_rungs(self._open_raw())
+        if not self._warned:
+            self._warned = True
+            yield from rungs
+            return
+        while True:
+            # Scoped per rung so the filter never stays installed across a yield.
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                rung = next(rungs, None)
+            if rung is None:
+                return
+            yield rung
 
 
 def _analyze_single_rung(
@@ -1,20 +1,27 @@
 from __future__ import annotations
 
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from pyrung.click.codegen.analyzer import _analyze_rungs
-from pyrung.click.codegen.collector import _collect_operands
-from pyrung.click.codegen.emitter import _generate_code
+from pyrung.click.codegen.analyzer import _iter_analyzed_rungs, _RungStream
+from pyrung.click.codegen.collector import (
+    _collect_rung_operands,
+    _enrich_with_ownership,
+)
+from pyrung.click.codegen.emitter import _iter_code_chunks
+from pyrung.click.codegen.models import _OperandCollection
 from pyrung.click.codegen.parser import (
-    _find_call_names,
-    _parse_csv,
-    _parse_rows,
+    _iter_csv,
+    _iter_raw_rungs,
     _parse_subroutines,
+    _record_call_names,
 )
 
 if TYPE_CHECKING:
-    from pyrung.click.codegen.models import _AnalyzedRung, _OperandCollection, _SubroutineInfo
+    from collections.abc import Callable, Iterable, Iterator
+
+    from pyrung.click.codegen.models import _RawRung, _SubroutineInfo
     from pyrung.click.ladder.types import LadderBundle
     from pyrung.click.tag_map import TagMap
 
@@ -24,8 +31,9 @@ def _prepare_codegen(
     *,
     nickname_csv: str | Path | None = None,
     nicknames: dict[str, str] | None = None,
+    workers: int | None = None,
 ) -> tuple[
-    list[_AnalyzedRung],
+    _RungStream,
     _OperandCollection,
     dict[str, str] | None,
     list[_SubroutineInfo],
@@ -33,6 +41,13 @@ def _prepare_codegen(
 ]:
     """Shared pipeline: parse, analyze, collect operands.
 
+    This is the first of two streaming passes: each rung is parsed,
+    analyzed, and scanned for operands before the next is read, and is
+    then dropped.  The main program and in-process subroutines come back
+    as :class:`_RungStream` objects that re-read their source for the
+    emit pass.  Subroutines analyzed in *workers* processes are returned
+    as lists.
+
     Returns (main_rungs, collection, nick_map, subroutines, structured_map).
     """
     if nickname_csv is not None and nicknames is not None:
@@ -46,18 +61,18 @@ def _prepare_codegen(
         structured_map = _TagMap.from_nickname_file(Path(nickname_csv))
         nick_map = {
             slot.hardware_address: slot.logical_name
-            for slot in structured_map.mapped_slots()
-            if slot.source == "user"
+            for slot in structured_map.iter_mapped_slots("user")
         }
     elif nicknames is not None:
         nick_map = nicknames
 
     from pyrung.click.ladder.types import LadderBundle as _LadderBundle
 
+    call_names: dict[str, str] = {}
+    dir_path: Path | None = None
+    open_raw: Callable[[], Iterable[_RawRung]]
     if isinstance(source, _LadderBundle):
-        raw_rungs = _parse_rows(source.main_rows)
-        call_names = _find_call_names(raw_rungs)
-        subroutines = _parse_subroutines_from_bundle(source, call_names)
+        open_raw = partial(_iter_raw_rungs, source.main_rows)
     elif isinstance(source, (str, Path)):
         csv_path = Path(source)
         if csv_path.is_dir():
@@ -68,26 +83,72 @@ def _prepare_codegen(
         else:
             main_path = csv_path
             dir_path = csv_path.parent
-
-        raw_rungs = _parse_csv(main_path)
-        call_names = _find_call_names(raw_rungs)
-        subroutines = _parse_subroutines(dir_path, call_names) if call_names else []
+        open_raw = partial(_iter_csv, main_path)
     else:
         raise TypeError(
             f"source must be a path (str/Path) or LadderBundle, got {type(source).__name__}"
         )
 
-    analyzed = _analyze_rungs(raw_rungs)
+    collection = _OperandCollection()
+    for rung in _iter_analyzed_rungs(_recording_call_names(open_raw(), call_names)):
+        _collect_rung_operands(rung, collection, nick_map)
+    main_rungs = _RungStream(open_raw, warn=False)
+
+    if isinstance(source, _LadderBundle):
+        subroutines = _parse_subroutines_from_bundle(source, call_names)
+    elif call_names:
+        assert dir_path is not None
+        subroutines = _parse_subroutines(dir_path, call_names, workers=workers)
+    else:
+        subroutines = []
 
-    all_analyzed = list(analyzed)
     for sub in subroutines:
-        all_analyzed.extend(sub.analyzed)
-    collection = _collect_operands(all_analyzed, nick_map, structured_map=structured_map)
+        for rung in sub.analyzed:
+            _collect_rung_operands(rung, collection, nick_map)
+    if structured_map is not None:
+        _enrich_with_ownership(collection, structured_map)
 
     if subroutines:
         collection.has_subroutine = True
 
-    return analyzed, collection, nick_map, subroutines, structured_map
+    return main_rungs, collection, nick_map, subroutines, structured_map
+
+
+def _recording_call_names(
+    raw_rungs: Iterable[_RawRung], call_names: dict[str, str]
+) -> Iterator[_RawRung]:
+    """Pass raw rungs through, noting their call("name") targets on the way."""
+    for rung in raw_rungs:
+        _record_call_names(rung, call_names)
+        yield rung
+
+
+def iter_ladder_to_pyrung(
+    source: str | Path | LadderBundle,
+    *,
+    nickname_csv: str | Path | None = None,
+    nicknames: dict[str, str] | None = None,
+    workers: int | None = None,
+) -> Iterator[str]:
+    """Convert Click ladder data to pyrung Python source code, piece by piece.
+
+    Same output as :func:`ladder_to_pyrung`, but the program is read twice
+    (once to collect operands, once to emit) and each rung's source is
+    yielded as soon as it is rendered, so memory stays bounded by the
+    largest rung rather than the size of the program::
+
+        with open("main.py", "w", encoding="utf-8") as f:
+            f.writelines(iter_ladder_to_pyrung("main.csv"))
+
+    The operand pass runs on the first ``next()``.  Arguments and errors
+    are as for :func:`ladder_to_pyrung`.
+    """
+    main_rungs, collection, nick_map, subroutines, structured_map = _prepare_codegen(
+        source, nickname_csv=nickname_csv, nicknames=nicknames, workers=workers
+    )
+    yield from _iter_code_chunks(
+        main_rungs, collection, nick_map, subroutines=subroutines, structured_map=structured_map
+    )
 
 
 def ladder_to_pyrung(
@@ -96,6 +157,7 @@ def ladder_to_pyrung(
     nickname_csv: str | Path | None = None,
     nicknames: dict[str, str] | None = None,
     output_path: str | Path | None = None,
+    workers: int | None = None,
 ) -> str:
     """Convert Click ladder data to pyrung Python source code.
 
@@ -110,9 +172,14 @@ def ladder_to_pyrung(
             to ``nickname_csv``; useful when the caller already has the map.
         output_path: Optional path to write the generated Python file.
             If ``None``, the code is returned as a string only.
+        workers: Optional process count for analyzing ``subroutines/*.csv``
+            files in parallel.  ``None`` (the default) analyzes them in this
+            process.
 
     Returns:
-        The generated Python source code as a string.
+        The generated Python source code as a string.  Use
+        :func:`iter_ladder_to_pyrung` to write a large program without
+        building the whole string.
 
     Raises:
         ValueError: If both ``nickname_csv`` and ``nicknames`` are provided,
@@ -120,12 +187,10 @@ def ladder_to_pyrung(
             format is invalid.
         TypeError: If ``source`` is not a supported type.
     """
-    analyzed, collection, nick_map, subroutines, structured_map = _prepare_codegen(
-        source, nickname_csv=nickname_csv, nicknames=nicknames
-    )
-
-    code = _generate_code(
-        analyzed, collection, nick_map, subroutines=subroutines, structured_map=structured_map
+    code = "".join(
+        iter_ladder_to_pyrung(
+            source, nickname_csv=nickname_csv, nicknames=nicknames, workers=workers
+        )
     )
 
     if output_path is not None:
@@ -148,8 +213,7 @@ def _parse_subroutines_from_bundle(
     for subroutine_name, rows in bundle.subroutine_rows:
         slug = _slugify(subroutine_name)
         name = call_names.get(slug, subroutine_name)
-        raw = _parse_rows(rows)
-        analyzed = _analyze_rungs(raw)
+        analyzed = _RungStream(partial(_iter_raw_rungs, rows))
         subs.append(_SubroutineInfo(name=name, analyzed=analyzed))
     return subs
 
@@ -160,6 +224,7 @@ def ladder_to_pyrung_project(
     nickname_csv: str | Path | None = None,
     nicknames: dict[str, str] | None = None,
     output_dir: str | Path | None = None,
+    workers: int | None = None,
 ) -> dict[str, str]:
     """Convert Click ladder data to a multi-file pyrung project.
 
@@ -174,6 +239,8 @@ def ladder_to_pyrung_project(
         nicknames: Optional pre-parsed ``{operand: nickname}`` dict.
         output_dir: Optional directory to write the project files into.
             If ``None``, files are returned as strings only.
+        workers: Optional process count for analyzing ``subroutines/*.csv``
+            files in parallel.
 
     Returns:
         A dict mapping relative file paths to their content, e.g.
@@ -181,12 +248,12 @@ def ladder_to_pyrung_project(
     """
     from pyrung.click.codegen.project_emitter import _generate_project
 
-    analyzed, collection, nick_map, subroutines, structured_map = _prepare_codegen(
-        source, nickname_csv=nickname_csv, nicknames=nicknames
+    main_rungs, collection, nick_map, subroutines, structured_map = _prepare_codegen(
+        source, nickname_csv=nickname_csv, nicknames=nicknames, workers=workers
     )
 
     files = _generate_project(
-        analyzed,
+        main_rungs,
         collection,
         nick_map,
         subroutines,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING, Any, cast
 
 from pyclickplc.addresses import format_address_display
@@ -33,6 +33,10 @@ from pyrung.click.codegen.models import (
     _TimerCounterCloneDecl,
 )
 from pyrung.click.codegen.utils import (
+    _CLICK_FUNC_RE,
+    _CLICK_FUNC_TO_PYTHON,
+    _CLICK_PI_RE,
+    _EXPR_FUNC_IMPORT_NAMES,
     _POINTER_RE,
     _PREFIX_TO_BLOCK,
     _make_safe_identifier,
@@ -94,7 +98,7 @@ def _tree_has_And(node: SPNode | None) -> bool:
 
 
 def _collect_operands(
-    rungs: list[_AnalyzedRung],
+    rungs: Iterable[_AnalyzedRung],
     nicknames: dict[str, str] | None,
     *,
     structured_map: TagMap | None = None,
@@ -103,44 +107,7 @@ def _collect_operands(
     collection = _OperandCollection()
 
     for rung in rungs:
-        if _tree_uses_Or(rung.condition_tree):
-            collection.has_Or = True
-        if _tree_has_And(rung.condition_tree):
-            collection.has_And = True
-
-        if rung.comment:
-            collection.has_comment = True
-        if rung.role is RungRole.FORLOOP_START:
-            collection.has_forloop = True
-
-        # Scan conditions from tree
-        for cond in _walk_tree_labels(rung.condition_tree):
-            _scan_token_for_operands(cond, collection, nicknames)
-
-        # Scan instructions
-        for instr in rung.instructions:
-            _scan_af_token(instr.af_token, collection, nicknames)
-            for cond in _walk_tree_labels(instr.branch_tree):
-                _scan_token_for_operands(cond, collection, nicknames)
-            if _tree_uses_Or(instr.branch_tree):
-                collection.has_Or = True
-            if _tree_has_And(instr.branch_tree):
-                collection.has_And = True
-            if instr.branch_tree is not None:
-                collection.has_branch = True
-            for pin in instr.pins:
-                if pin.condition_tree is not None:
-                    for cond in _walk_tree_labels(pin.condition_tree):
-                        _scan_token_for_operands(cond, collection, nicknames)
-                    if _tree_uses_Or(pin.condition_tree):
-                        collection.has_Or = True
-                    if _tree_has_And(pin.condition_tree):
-                        collection.has_And = True
-                else:
-                    for cond in pin.conditions:
-                        _scan_token_for_operands(cond, collection, nicknames)
-                if pin.arg:
-                    _scan_token_for_operands(pin.arg, collection, nicknames)
+        _collect_rung_operands(rung, collection, nicknames)
 
     # Enrich with semantic ownership metadata if available
     if structured_map is not None:
@@ -149,6 +116,64 @@ def _collect_operands(
     return collection
 
 
+def _collect_rung_operands(
+    rung: _AnalyzedRung,
+    collection: _OperandCollection,
+    nicknames: dict[str, str] | None,
+) -> None:
+    """Add the operands and feature flags of one rung to *collection*."""
+    if _tree_uses_Or(rung.condition_tree):
+        collection.has_Or = True
+    if _tree_has_And(rung.condition_tree):
+        collection.has_And = True
+
+    if rung.comment:
+        collection.has_comment = True
+    if rung.role is RungRole.FORLOOP_START:
+        collection.has_forloop = True
+
+    # Scan conditions from tree
+    for cond in _walk_tree_labels(rung.condition_tree):
+        _scan_token_for_operands(cond, collection, nicknames)
+
+    # Scan instructions
+    for instr in rung.instructions:
+        _scan_af_token(instr.af_token, collection, nicknames)
+        if instr.af_token:
+            _scan_expr_funcs(instr.af_token, collection)
+        for cond in _walk_tree_labels(instr.branch_tree):
+            _scan_token_for_operands(cond, collection, nicknames)
+        if _tree_uses_Or(instr.branch_tree):
+            collection.has_Or = True
+        if _tree_has_And(instr.branch_tree):
+            collection.has_And = True
+        if instr.branch_tree is not None:
+            collection.has_branch = True
+        for pin in instr.pins:
+            if pin.condition_tree is not None:
+                for cond in _walk_tree_labels(pin.condition_tree):
+                    _scan_token_for_operands(cond, collection, nicknames)
+                if _tree_uses_Or(pin.condition_tree):
+                    collection.has_Or = True
+                if _tree_has_And(pin.condition_tree):
+                    collection.has_And = True
+            else:
+                for cond in pin.conditions:
+                    _scan_token_for_operands(cond, collection, nicknames)
+            if pin.arg:
+                _scan_token_for_operands(pin.arg, collection, nicknames)
+
+
+def _scan_expr_funcs(token: str, collection: _OperandCollection) -> None:
+    """Record Click expression functions (SQRT, LSH, PI, ...) so imports are complete."""
+    for m in _CLICK_FUNC_RE.finditer(token):
+        py_name = _CLICK_FUNC_TO_PYTHON[m.group(1)]
+        if py_name in _EXPR_FUNC_IMPORT_NAMES:
+            collection.used_expr_funcs.add(py_name)
+    if _CLICK_PI_RE.search(token):
+        collection.used_expr_funcs.add("PI")
+
+
 def _enrich_with_ownership(
     collection: _OperandCollection,
     structured_map: TagMap,
@@ -860,7 +885,7 @@ def _register_operands_from_text(
 
 
 def _scan_file_refs(
-    rungs: list[_AnalyzedRung],
+    rungs: Iterable[_AnalyzedRung],
     collection: _OperandCollection,
     nicknames: dict[str, str] | None,
     *,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING
 
 from pyrung.click._topology import Leaf, Parallel, Series, SPNode, factor_outputs, make_compound
@@ -36,10 +37,6 @@ from pyrung.click.codegen.models import (
     _TagMetadata,
 )
 from pyrung.click.codegen.utils import (
-    _CLICK_FUNC_RE,
-    _CLICK_FUNC_TO_PYTHON,
-    _CLICK_PI_RE,
-    _EXPR_FUNC_IMPORT_NAMES,
     _parse_af_args,
     _sub_operand,
     _sub_operand_kwarg,
@@ -65,32 +62,15 @@ def _is_trailing_return(rung: _AnalyzedRung) -> bool:
     )
 
 
-def _prescan_expr_funcs(
-    rungs: list[_AnalyzedRung],
-    collection: _OperandCollection,
-    subroutines: list[_SubroutineInfo] | None,
-) -> None:
-    """Scan AF tokens for Click expression function names before emitting."""
-
-    def _scan_token(token: str) -> None:
-        # Check for Click-uppercase function names (SQRT, LSH, etc.)
-        for m in _CLICK_FUNC_RE.finditer(token):
-            py_name = _CLICK_FUNC_TO_PYTHON[m.group(1)]
-            if py_name in _EXPR_FUNC_IMPORT_NAMES:
-                collection.used_expr_funcs.add(py_name)
-        if _CLICK_PI_RE.search(token):
-            collection.used_expr_funcs.add("PI")
-
+def _without_trailing_return(rungs: Iterable[_AnalyzedRung]) -> Iterator[_AnalyzedRung]:
+    """Yield *rungs*, dropping a final :func:`_is_trailing_return` rung."""
+    pending: _AnalyzedRung | None = None
     for rung in rungs:
-        for instr in rung.instructions:
-            if instr.af_token:
-                _scan_token(instr.af_token)
-    if subroutines:
-        for sub in subroutines:
-            for rung in sub.analyzed:
-                for instr in rung.instructions:
-                    if instr.af_token:
-                        _scan_token(instr.af_token)
+        if pending is not None:
+            yield pending
+        pending = rung
+    if pending is not None and not _is_trailing_return(pending):
+        yield pending
 
 
 def _has_metadata(meta: _TagMetadata | None) -> bool:
@@ -185,7 +165,7 @@ def _emit_physical_declarations(lines: list[str], collection: _OperandCollection
 
 
 def _generate_code(
-    rungs: list[_AnalyzedRung],
+    rungs: Iterable[_AnalyzedRung],
     collection: _OperandCollection,
     nicknames: dict[str, str] | None,
     *,
@@ -193,9 +173,31 @@ def _generate_code(
     structured_map: TagMap | None = None,
 ) -> str:
     """Generate the complete Python source file."""
-    # Pre-scan AF tokens for expression function names so imports are complete.
-    _prescan_expr_funcs(rungs, collection, subroutines)
+    return "".join(
+        _iter_code_chunks(
+            rungs,
+            collection,
+            nicknames,
+            subroutines=subroutines,
+            structured_map=structured_map,
+        )
+    )
 
+
+def _iter_code_chunks(
+    rungs: Iterable[_AnalyzedRung],
+    collection: _OperandCollection,
+    nicknames: dict[str, str] | None,
+    *,
+    subroutines: list[_SubroutineInfo] | None = None,
+    structured_map: TagMap | None = None,
+) -> Iterator[str]:
+    """Generate the Python source file piece by piece.
+
+    *collection* must already hold every operand (imports are emitted
+    first); *rungs* and each subroutine's rungs are then read once, and a
+    chunk is yielded per top-level rung or for/next block.
+    """
     lines: list[str] = []
 
     # Module docstring
@@ -236,22 +238,26 @@ def _generate_code(
 
     # Program body
     lines.append("# --- Program ---")
-    _emit_program(
-        lines,
+    yield _join_lines(lines)
+
+    for chunk in _iter_program(
         rungs,
         collection,
         nicknames,
         subroutines=subroutines,
         structured_map=structured_map,
-    )
-    lines.append("")
+    ):
+        yield _join_lines(chunk)
 
     # Tag map
-    lines.append("# --- Tag Map ---")
+    lines = ["", "# --- Tag Map ---"]
     _emit_tag_map(lines, collection)
     lines.append("")
+    yield _join_lines(lines)
 
-    return "\n".join(lines) + "\n"
+
+def _join_lines(lines: list[str]) -> str:
+    return "".join(f"{line}\n" for line in lines)
 
 
 def _emit_imports(lines: list[str], collection: _OperandCollection) -> None:
@@ -558,7 +564,7 @@ def _format_literal(default: object) -> str:
 
 def _emit_program(
     lines: list[str],
-    rungs: list[_AnalyzedRung],
+    rungs: Iterable[_AnalyzedRung],
     collection: _OperandCollection,
     nicknames: dict[str, str] | None,
     *,
@@ -567,14 +573,29 @@ def _emit_program(
     call_func_map: dict[str, str] | None = None,
 ) -> None:
     """Emit the program body."""
-    lines.append("with Program() as logic:")
+    for chunk in _iter_program(
+        rungs,
+        collection,
+        nicknames,
+        subroutines=subroutines,
+        structured_map=structured_map,
+        call_func_map=call_func_map,
+    ):
+        lines.extend(chunk)
 
-    if not rungs and not subroutines:
-        lines.append("    pass")
-        return
 
-    _emit_rung_sequence(
-        lines,
+def _iter_program(
+    rungs: Iterable[_AnalyzedRung],
+    collection: _OperandCollection,
+    nicknames: dict[str, str] | None,
+    *,
+    subroutines: list[_SubroutineInfo] | None = None,
+    structured_map: TagMap | None = None,
+    call_func_map: dict[str, str] | None = None,
+) -> Iterator[list[str]]:
+    """Yield the program body as line chunks, one per rung or for/next block."""
+    yield ["with Program() as logic:"]
+    yield from _iter_rung_sequence(
         rungs,
         collection,
         nicknames,
@@ -584,30 +605,21 @@ def _emit_program(
     )
 
     # Emit subroutine blocks
-    if subroutines:
-        for sub in subroutines:
-            sub_rungs = sub.analyzed
-            if sub_rungs and _is_trailing_return(sub_rungs[-1]):
-                sub_rungs = sub_rungs[:-1]
-            lines.append("")
-            lines.append(f'    with subroutine("{sub.name}"):')
-            if sub_rungs:
-                _emit_rung_sequence(
-                    lines,
-                    sub_rungs,
-                    collection,
-                    nicknames,
-                    indent=2,
-                    structured_map=structured_map,
-                    call_func_map=call_func_map,
-                )
-            else:
-                lines.append("        pass")
+    for sub in subroutines or ():
+        yield ["", f'    with subroutine("{sub.name}"):']
+        yield from _iter_rung_sequence(
+            _without_trailing_return(sub.analyzed),
+            collection,
+            nicknames,
+            indent=2,
+            structured_map=structured_map,
+            call_func_map=call_func_map,
+        )
 
 
 def _emit_rung_sequence(
     lines: list[str],
-    rungs: list[_AnalyzedRung],
+    rungs: Iterable[_AnalyzedRung],
     collection: _OperandCollection,
     nicknames: dict[str, str] | None,
     indent: int,
@@ -615,61 +627,85 @@ def _emit_rung_sequence(
     call_func_map: dict[str, str] | None = None,
 ) -> None:
     """Emit a sequence of rungs (main program or subroutine body)."""
-    if not rungs:
-        pad = "    " * indent
-        lines.append(f"{pad}pass")
-        return
+    for chunk in _iter_rung_sequence(
+        rungs,
+        collection,
+        nicknames,
+        indent,
+        structured_map=structured_map,
+        call_func_map=call_func_map,
+    ):
+        lines.extend(chunk)
 
-    i = 0
-    first = True
-    while i < len(rungs):
-        rung = rungs[i]
 
-        if rung.role is RungRole.FORLOOP_START:
+def _iter_rung_sequence(
+    rungs: Iterable[_AnalyzedRung],
+    collection: _OperandCollection,
+    nicknames: dict[str, str] | None,
+    indent: int,
+    structured_map: TagMap | None = None,
+    call_func_map: dict[str, str] | None = None,
+) -> Iterator[list[str]]:
+    """Yield a rung sequence as line chunks, one per rung or for/next block."""
+    first = True
+    for group in _iter_rung_groups(rungs):
+        lines: list[str] = []
+        if isinstance(group, list):
             if not first:
                 lines.append("")
-            first = False
             _emit_forloop(
                 lines,
-                rungs,
-                i,
+                group,
                 collection,
                 nicknames,
                 indent=indent,
                 structured_map=structured_map,
                 call_func_map=call_func_map,
             )
-            # Skip to after next()
-            i += 1
-            while i < len(rungs) and rungs[i].role is not RungRole.FORLOOP_NEXT:
-                i += 1
-            i += 1  # skip the next() rung
-            continue
+        else:
+            if not first and not group.is_continued:
+                lines.append("")
+            _emit_rung(
+                lines,
+                group,
+                collection,
+                nicknames,
+                indent=indent,
+                structured_map=structured_map,
+                call_func_map=call_func_map,
+            )
+        first = False
+        yield lines
 
-        if rung.role is RungRole.FORLOOP_NEXT:
-            # Should have been consumed by forloop handler
-            i += 1
-            continue
+    if first:
+        pad = "    " * indent
+        yield [f"{pad}pass"]
 
-        if not first and not rung.is_continued:
-            lines.append("")
-        first = False
-        _emit_rung(
-            lines,
-            rung,
-            collection,
-            nicknames,
-            indent=indent,
-            structured_map=structured_map,
-            call_func_map=call_func_map,
-        )
-        i += 1
+
+def _iter_rung_groups(
+    rungs: Iterable[_AnalyzedRung],
+) -> Iterator[_AnalyzedRung | list[_AnalyzedRung]]:
+    """Yield single rungs, or a ``[for, *body]`` list for each for/next block."""
+    block: list[_AnalyzedRung] | None = None
+    for rung in rungs:
+        if block is not None:
+            if rung.role is RungRole.FORLOOP_NEXT:
+                yield block
+                block = None
+            else:
+                block.append(rung)
+        elif rung.role is RungRole.FORLOOP_START:
+            block = [rung]
+        elif rung.role is not RungRole.FORLOOP_NEXT:
+            # A stray next() has no for() to close.
+            yield rung
+    if block is not None:
+        yield block
 
 
 def _emit_forloop(
     lines: list[str],
-    rungs: list[_AnalyzedRung],
-    start_idx: int,
+    block: list[_AnalyzedRung],
     collection: _OperandCollection,
     nicknames: dict[str, str] | None,
     indent: int,
@@ -678,7 +714,7 @@ def _emit_forloop(
 ) -> None:
     """Emit a for/next block."""
     pad = "    " * indent
-    for_rung = rungs[start_idx]
+    for_rung = block[0]
 
     # Build the rung conditions
     conditions_str = _build_conditions_str(for_rung, collection, nicknames, structured_map)
@@ -708,18 +744,13 @@ def _emit_forloop(
 
     # Body rungs — forloop body instructions are bare (not wrapped in Rung)
     body_pad = "    " * (indent + 2)
-    body_count = 0
-    for j in range(start_idx + 1, len(rungs)):
-        if rungs[j].role is RungRole.FORLOOP_NEXT:
-            break
-        body_rung = rungs[j]
+    for body_rung in block[1:]:
         for instr in body_rung.instructions:
             _emit_instruction(
                 lines, instr, collection, nicknames, indent + 2, structured_map, call_func_map
             )
-        body_count += 1
 
-    if body_count == 0:
+    if len(block) == 1:
         lines.append(f"{body_pad}pass")
 
 
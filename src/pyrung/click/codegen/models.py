@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum, auto
 
@@ -21,7 +22,7 @@ class _SubroutineInfo:
     """A subroutine parsed from a subroutine CSV file."""
 
     name: str  # original subroutine name (from call() match or slug)
-    analyzed: list[_AnalyzedRung]
+    analyzed: Iterable[_AnalyzedRung]  # re-iterable; see analyzer._RungStream
 
 
 # ---------------------------------------------------------------------------
@@ -2,12 +2,16 @@ from __future__ import annotations
 
 import csv
 import re
-from collections.abc import Iterable
+import warnings
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 from pathlib import Path
 
-from pyrung.click.codegen.analyzer import _analyze_rungs
+from pyrung.click.codegen.analyzer import _iter_analyzed_rungs, _RungStream
 from pyrung.click.codegen.constants import _HEADER_WIDTH
-from pyrung.click.codegen.models import _RawRung, _SubroutineInfo
+from pyrung.click.codegen.models import _AnalyzedRung, _RawRung, _SubroutineInfo
 from pyrung.click.codegen.utils import _slugify
 
 # ---------------------------------------------------------------------------
@@ -15,26 +19,27 @@ from pyrung.click.codegen.utils import _slugify
 # ---------------------------------------------------------------------------
 
 
-def _parse_rows(all_rows: Iterable[Iterable[str]]) -> list[_RawRung]:
-    """Segment header+data rows (strings) into raw rungs.
+def _iter_raw_rungs(all_rows: Iterable[Iterable[str]]) -> Iterator[_RawRung]:
+    """Segment header+data rows (strings) into raw rungs, one rung at a time.
 
     Accepts any iterable of string sequences — CSV reader output,
     ``LadderBundle.main_rows``, or ``LadderBundle.subroutine_rows`` entries.
+    Only the rung being assembled is held in memory.
     """
-    rows_list = [list(row) for row in all_rows]
-
-    if not rows_list:
-        return []
+    rows_iter = iter(all_rows)
+    first = next(rows_iter, None)
+    if first is None:
+        return
 
-    header = rows_list[0]
+    header = list(first)
     if len(header) != _HEADER_WIDTH:
         raise ValueError(f"Expected {_HEADER_WIDTH}-column header, got {len(header)} columns.")
 
-    rungs: list[_RawRung] = []
     pending_comments: list[str] = []
     current_rung: _RawRung | None = None
 
-    for row in rows_list[1:]:
+    for raw_row in rows_iter:
+        row = list(raw_row)
         while len(row) < _HEADER_WIDTH:
             row.append("")
 
@@ -46,7 +51,7 @@ def _parse_rows(all_rows: Iterable[Iterable[str]]) -> list[_RawRung]:
 
         if marker == "R":
             if current_rung is not None:
-                rungs.append(current_rung)
+                yield current_rung
             current_rung = _RawRung(
                 comment_lines=pending_comments,
                 rows=[row],
@@ -58,17 +63,23 @@ def _parse_rows(all_rows: Iterable[Iterable[str]]) -> list[_RawRung]:
             current_rung.rows.append(row)
 
     if current_rung is not None:
-        rungs.append(current_rung)
+        yield current_rung
+
+
+def _parse_rows(all_rows: Iterable[Iterable[str]]) -> list[_RawRung]:
+    """Segment header+data rows (strings) into raw rungs."""
+    return list(_iter_raw_rungs(all_rows))
+
 
-    return rungs
+def _iter_csv(csv_path: Path) -> Iterator[_RawRung]:
+    """Stream raw rungs from a laddercodec CSV file."""
+    with csv_path.open("r", encoding="utf-8", newline="") as f:
+        yield from _iter_raw_rungs(csv.reader(f))
 
 
 def _parse_csv(csv_path: Path) -> list[_RawRung]:
     """Read a laddercodec CSV file and segment into raw rungs."""
-    with csv_path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.reader(f)
-        all_rows = list(reader)
-    return _parse_rows(all_rows)
+    return list(_iter_csv(csv_path))
 
 
 # ---------------------------------------------------------------------------
@@ -93,25 +104,74 @@ def _load_nicknames_from_csv(csv_path: Path) -> dict[str, str]:
 # ---------------------------------------------------------------------------
 
 
-def _find_call_names(raw_rungs: list[_RawRung]) -> dict[str, str]:
+_CALL_RE = re.compile(r'^call\("(.*)"\)$')
+
+
+def _record_call_names(rung: _RawRung, call_names: dict[str, str]) -> None:
+    """Add the call("name") tokens of one raw rung to *call_names*."""
+    for row in rung.rows:
+        af = row[-1] if row else ""
+        m = _CALL_RE.match(af)
+        if m:
+            name = m.group(1)
+            call_names[_slugify(name)] = name
+
+
+def _find_call_names(raw_rungs: Iterable[_RawRung]) -> dict[str, str]:
     """Scan main rungs for call("name") tokens → {slug: original_name}."""
     call_names: dict[str, str] = {}
-    call_re = re.compile(r'^call\("(.*)"\)$')
     for rung in raw_rungs:
-        for row in rung.rows:
-            af = row[-1] if row else ""
-            m = call_re.match(af)
-            if m:
-                name = m.group(1)
-                call_names[_slugify(name)] = name
+        _record_call_names(rung, call_names)
     return call_names
 
 
+def _analyze_csv(csv_path: Path) -> list[_AnalyzedRung]:
+    """Stream a laddercodec CSV file through analysis; raw rows are not kept."""
+    return list(_iter_analyzed_rungs(_iter_csv(csv_path)))
+
+
+def _analyze_csv_in_worker(
+    csv_path: Path,
+) -> tuple[list[_AnalyzedRung], list[tuple[str, type[Warning]]]]:
+    """Process-pool entry point: analyze one file and hand its warnings back."""
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        analyzed = _analyze_csv(csv_path)
+    return analyzed, [(str(w.message), w.category) for w in caught]
+
+
+def _analyze_csvs(paths: list[Path], workers: int | None) -> list[Iterable[_AnalyzedRung]]:
+    """Analyze several CSV files, in *workers* processes when that is worthwhile.
+
+    In-process, each file becomes a :class:`_RungStream` that re-reads it on
+    demand.  Worker results have to cross the process boundary, so those
+    come back as lists held for the rest of the run.
+    """
+    if workers is None or workers <= 1 or len(paths) <= 1:
+        return [_RungStream(partial(_iter_csv, path)) for path in paths]
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+            results = list(pool.map(_analyze_csv_in_worker, paths))
+    except BrokenProcessPool:
+        return [_RungStream(partial(_iter_csv, path)) for path in paths]
+    analyzed_files: list[Iterable[_AnalyzedRung]] = []
+    for analyzed, caught in results:
+        for message, category in caught:
+            warnings.warn(message, category, stacklevel=2)
+        analyzed_files.append(analyzed)
+    return analyzed_files
+
+
 def _parse_subroutines(
     dir_path: Path,
     call_names: dict[str, str],
+    *,
+    workers: int | None = None,
 ) -> list[_SubroutineInfo]:
-    """Parse ``subroutines/{slug}.csv`` files and match them to call() names."""
+    """Parse ``subroutines/{slug}.csv`` files and match them to call() names.
+
+    With *workers* > 1 the files are analyzed in separate processes.
+    """
     subroutine_dir = dir_path / "subroutines"
     if not subroutine_dir.is_dir():
         raise ValueError(
@@ -132,11 +192,8 @@ def _parse_subroutines(
         expected = ", ".join(f"{slug}.csv" for slug in missing)
         raise ValueError(f"Missing subroutine CSV file(s) in {subroutine_dir}: {expected}")
 
-    subs: list[_SubroutineInfo] = []
-    for sub_path, stem in sub_entries:
-        name = call_names.get(_slugify(stem), stem)
-        raw = _parse_csv(sub_path)
-        analyzed = _analyze_rungs(raw)
-        subs.append(_SubroutineInfo(name=name, analyzed=analyzed))
-
-    return subs
+    analyzed_files = _analyze_csvs([p for p, _ in sub_entries], workers)
+    return [
+        _SubroutineInfo(name=call_names.get(_slugify(stem), stem), analyzed=analyzed)
+        for (_, stem), analyzed in zip(sub_entries, analyzed_files, strict=True)
+    ]
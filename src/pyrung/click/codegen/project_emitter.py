@@ -23,8 +23,7 @@ from pyrung.click.codegen.emitter import (
     _emit_tag_declarations,
     _emit_tag_map,
     _emit_tc_clone_declarations,
-    _is_trailing_return,
-    _prescan_expr_funcs,
+    _without_trailing_return,
 )
 from pyrung.click.codegen.models import (
     _AnalyzedRung,
@@ -35,6 +34,8 @@ from pyrung.click.codegen.models import (
 from pyrung.click.codegen.utils import _build_sub_name_map, _slugify
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from pyrung.click.tag_map import TagMap
 
 
@@ -47,7 +48,7 @@ _GENERATED_HEADER = "# Generated by pyrung from Click ladder CSV"
 
 
 def _generate_project(
-    rungs: list[_AnalyzedRung],
+    rungs: Iterable[_AnalyzedRung],
     collection: _OperandCollection,
     nicknames: dict[str, str] | None,
     subroutines: list[_SubroutineInfo],
@@ -58,9 +59,6 @@ def _generate_project(
 
     Returns ``{relative_path: content}`` — ready to write to disk or inspect.
     """
-    # Pre-scan expression functions so imports are complete.
-    _prescan_expr_funcs(rungs, collection, subroutines or None)
-
     sub_name_map = _build_sub_name_map(subroutines)
     # call_func_map: subroutine display name → Python function identifier
     call_func_map = sub_name_map
@@ -355,11 +353,12 @@ def _generate_subroutine_file(
     """Generate a single subroutine file with @subroutine decorator."""
     func_name = call_func_map[sub.name] if call_func_map else _slugify(sub.name)
 
-    sub_rungs = sub.analyzed
-    if sub_rungs and _is_trailing_return(sub_rungs[-1]):
-        sub_rungs = sub_rungs[:-1]
-
-    refs = _scan_file_refs(sub_rungs, collection, nicknames, call_func_map=call_func_map)
+    refs = _scan_file_refs(
+        _without_trailing_return(sub.analyzed),
+        collection,
+        nicknames,
+        call_func_map=call_func_map,
+    )
 
     lines: list[str] = [_GENERATED_HEADER, ""]
 
@@ -379,18 +378,15 @@ def _generate_subroutine_file(
     # @subroutine("name") decorator + function
     lines.append(f'@subroutine("{sub.name}")')
     lines.append(f"def {func_name}():")
-    if sub_rungs:
-        _emit_rung_sequence(
-            lines,
-            sub_rungs,
-            collection,
-            nicknames,
-            indent=1,
-            structured_map=structured_map,
-            call_func_map=call_func_map,
-        )
-    else:
-        lines.append("    pass")
+    _emit_rung_sequence(
+        lines,
+        _without_trailing_return(sub.analyzed),
+        collection,
+        nicknames,
+        indent=1,
+        structured_map=structured_map,
+        call_func_map=call_func_map,
+    )
     lines.append("")
 
     return "\n".join(lines) + "\n"
@@ -402,7 +398,7 @@ def _generate_subroutine_file(
 
 
 def _generate_main_file(
-    rungs: list[_AnalyzedRung],
+    rungs: Iterable[_AnalyzedRung],
     collection: _OperandCollection,
     nicknames: dict[str, str] | None,
     subroutines: list[_SubroutineInfo],
@@ -439,18 +435,15 @@ def _generate_main_file(
 
     # Program body (main rungs only, no subroutine definitions)
     lines.append("with Program() as logic:")
-    if rungs:
-        _emit_rung_sequence(
-            lines,
-            rungs,
-            collection,
-            nicknames,
-            indent=1,
-            structured_map=structured_map,
-            call_func_map=call_func_map,
-        )
-    else:
-        lines.append("    pass")
+    _emit_rung_sequence(
+        lines,
+        rungs,
+        collection,
+        nicknames,
+        indent=1,
+        structured_map=structured_map,
+        call_func_map=call_func_map,
+    )
     lines.append("")
 
     return "\n".join(lines) + "\n"
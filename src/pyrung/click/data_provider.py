@@ -91,7 +91,7 @@ class ClickDataProvider:
     @staticmethod
     def _build_reverse_index(tag_map: TagMap) -> dict[str, _MappedRuntimeSlot]:
         reverse: dict[str, _MappedRuntimeSlot] = {}
-        for slot in tag_map.mapped_slots():
+        for slot in tag_map.iter_mapped_slots():
             # XD/YD are mirrored views over X/Y at runtime.
             if slot.memory_type in ("XD", "YD"):
                 continue
@@ -0,0 +1,507 @@
+"""Hardware-in-the-loop replay of a recorded session over Click addresses.
+
+A recorded ``PLC`` session holds every input stimulus in its ``ScanLog``
+(drained patches and force changes, keyed by scan) and every committed
+state in its history.  `replay_hil` streams that stimulus to a *target*
+— a deployed Click over Modbus TCP, or a second soft PLC — at the
+recorded scan timing, samples the target's outputs after each scan, and
+diffs them against the recorded run.
+
+Targets speak hardware addresses; the ``TagMap`` translates between the
+recording's logical tag names and the target's addresses.  Two targets
+are provided:
+
+- `SoftPlcTarget` drives a ``PLC`` through ``ClickDataProvider`` and
+  steps it once per recorded scan by that scan's recorded ``dt``, with
+  the recording's RTC changes applied, so outputs compare scan for scan
+  even for a REALTIME recording.
+- `ModbusReplayTarget` holds one ``pyclickplc.ClickClient`` connection
+  open for the whole replay.  A real controller scans on its own clock,
+  so pass ``tolerance_scans`` to accept outputs that lag by a few scans.
+  Click ``X`` inputs are read-only over Modbus: give ``replay_hil`` a
+  ``TagMap`` that routes stimulus tags to writable addresses (for example
+  ``C`` bits that a test rung copies onto the inputs).
+
+Stimulus tags without a hardware mapping are skipped and reported.
+Forced values are written when the recorded force map changes; the
+target does not hold them against its own logic.  Recorded send/receive
+results are not replayed — the target performs its own communication.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Protocol
+
+from pyclickplc.addresses import format_address_display, parse_address
+
+from pyrung.click.data_provider import ClickDataProvider
+from pyrung.core.tag import Tag
+
+if TYPE_CHECKING:
+    from pyclickplc import ClickClient
+
+    from pyrung.click.tag_map import TagMap
+    from pyrung.core.runner import PLC
+    from pyrung.core.scan_log import ScanLogSnapshot
+    from pyrung.core.state import SystemState
+
+_DEFAULT_TIMEOUT_SECONDS = 1
+# Banks whose display addresses do not round-trip through a range read.
+_UNBATCHED_BANKS = frozenset({"XD", "YD"})
+
+
+class ReplayTarget(Protocol):
+    """Device that receives replayed stimulus and reports its outputs."""
+
+    def write(self, values: Mapping[str, Any]) -> None:
+        """Write ``{hardware_address: value}`` to the target."""
+        ...
+
+    def advance(self, dt: float) -> None:
+        """Let one recorded scan of ``dt`` seconds elapse on the target."""
+        ...
+
+    def set_rtc(self, value: datetime) -> None:
+        """Set the target's real-time clock to read ``value`` now."""
+        ...
+
+    def read(self, addresses: Sequence[str]) -> dict[str, Any]:
+        """Return the current value of each hardware address."""
+        ...
+
+
+class SoftPlcTarget:
+    """Replay target backed by a soft PLC, stepped once per recorded scan.
+
+    Writes go through ``ClickDataProvider`` exactly as Modbus writes from a
+    ``ClickServer`` would, so they take effect at the start of the next
+    scan.  The PLC should start in the state the recording had just before
+    the first replayed scan — for a whole-session replay, a fresh PLC
+    running the same program.
+
+    Each scan runs with the ``dt`` passed to `advance`, whatever the
+    runner's own time mode.  A ``FIXED_STEP`` runner's scan log does not
+    record per-scan ``dt``, so to ``replay_to()`` the target's own history
+    afterwards, give it a ``realtime=True`` runner.
+
+    Args:
+        runner: The PLC to drive.
+        tag_map: Mapping from its logical tags to Click hardware addresses.
+    """
+
+    def __init__(self, runner: PLC, tag_map: TagMap) -> None:
+        self._runner = runner
+        self._provider = ClickDataProvider(runner, tag_map)
+
+    @property
+    def runner(self) -> PLC:
+        return self._runner
+
+    def write(self, values: Mapping[str, Any]) -> None:
+        for address, value in values.items():
+            self._provider.write(address, value)
+
+    def advance(self, dt: float) -> None:
+        self._runner._dt_override_for_next_scan = float(dt)
+        self._runner.step()
+
+    def set_rtc(self, value: datetime) -> None:
+        self._runner.set_rtc(value)
+
+    def read(self, addresses: Sequence[str]) -> dict[str, Any]:
+        return {address: self._provider.read(address) for address in addresses}
+
+
+class ModbusReplayTarget:
+    """Replay target reached over Modbus TCP (a Click or a ``ClickServer``).
+
+    One connection is opened on first use and kept for the whole replay;
+    reads of consecutive addresses in the same bank are batched into one
+    range request.  Use as a context manager, or call `close()`.
+
+    Args:
+        host: Target hostname or IP.
+        port: Modbus TCP port.
+        device_id: Modbus unit ID.
+        timeout: Per-request timeout in seconds.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 502,
+        *,
+        device_id: int = 1,
+        timeout: int = _DEFAULT_TIMEOUT_SECONDS,
+    ) -> None:
+        self._host = host
+        self._port = port
+        self._device_id = device_id
+        self._timeout = timeout
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._client: ClickClient | None = None
+
+    def __enter__(self) -> ModbusReplayTarget:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _connected(self) -> tuple[asyncio.AbstractEventLoop, ClickClient]:
+        if self._loop is None or self._client is None:
+            from pyclickplc import ClickClient
+
+            async def _open() -> ClickClient:
+                # The pymodbus transport binds to the running loop on construction.
+                client = ClickClient(
+                    self._host,
+                    self._port,
+                    timeout=self._timeout,
+                    device_id=self._device_id,
+                )
+                return await client.__aenter__()
+
+            loop = asyncio.new_event_loop()
+            try:
+                client = loop.run_until_complete(_open())
+            except BaseException:
+                loop.close()
+                raise
+            self._loop, self._client = loop, client
+        return self._loop, self._client
+
+    def close(self) -> None:
+        """Close the connection (idempotent)."""
+        loop, client = self._loop, self._client
+        self._loop = self._client = None
+        if loop is None:
+            return
+        try:
+            if client is not None:
+                loop.run_until_complete(client.__aexit__(None, None, None))
+        finally:
+            loop.close()
+
+    def write(self, values: Mapping[str, Any]) -> None:
+        if not values:
+            return
+        loop, client = self._connected()
+
+        async def _write() -> None:
+            for address, value in values.items():
+                await client.addr.write(address, value)
+
+        loop.run_until_complete(_write())
+
+    def advance(self, dt: float) -> None:
+        # The controller scans on its own clock; replay_hil paces wall time.
+        return None
+
+    def set_rtc(self, value: datetime) -> None:
+        # The controller keeps its own real-time clock; set it on the device.
+        return None
+
+    def read(self, addresses: Sequence[str]) -> dict[str, Any]:
+        if not addresses:
+            return {}
+        loop, client = self._connected()
+
+        async def _read() -> dict[str, Any]:
+            values: dict[str, Any] = {}
+            for bank, start, end in _address_runs(addresses):
+                first = format_address_display(bank, start)
+                request = first if start == end else f"{first}-{format_address_display(bank, end)}"
+                response = await client.addr.read(request)
+                for index in range(start, end + 1):
+                    address = format_address_display(bank, index)
+                    values[address] = response[address]
+            return values
+
+        found = loop.run_until_complete(_read())
+        return {address: found[_normalize(address)] for address in addresses}
+
+
+def _normalize(address: str) -> str:
+    return format_address_display(*parse_address(address))
+
+
+def _address_runs(addresses: Iterable[str]) -> list[tuple[str, int, int]]:
+    """Group addresses into ``(bank, start, end)`` runs of consecutive indices."""
+    parsed = sorted({parse_address(address) for address in addresses})
+    runs: list[tuple[str, int, int]] = []
+    for bank, index in parsed:
+        if runs and bank not in _UNBATCHED_BANKS:
+            last_bank, start, end = runs[-1]
+            if last_bank == bank and index == end + 1:
+                runs[-1] = (bank, start, index)
+                continue
+        runs.append((bank, index, index))
+    return runs
+
+
+@dataclass(frozen=True)
+class HilMismatch:
+    """One output that disagreed with the recording after a replayed scan."""
+
+    scan_id: int
+    tag: str
+    address: str
+    expected: Any
+    actual: Any
+
+
+@dataclass(frozen=True)
+class HilReport:
+    """Result of `replay_hil`.
+
+    Attributes:
+        start_scan_id: First replayed scan.
+        end_scan_id: Last replayed scan (inclusive).
+        scans: Number of scans replayed.
+        writes: Hardware writes sent to the target.
+        skipped: Stimulus tags with no hardware mapping (not replayed).
+        mismatches: Output disagreements, in scan order.
+        late_scans: Scans whose stimulus was written after the recorded
+            end of that scan had already passed (paced replay only).
+        elapsed: Wall-clock seconds spent replaying.
+    """
+
+    start_scan_id: int
+    end_scan_id: int
+    scans: int
+    writes: int
+    skipped: tuple[str, ...]
+    mismatches: tuple[HilMismatch, ...]
+    late_scans: int
+    elapsed: float
+
+    @property
+    def ok(self) -> bool:
+        """True when every sampled output matched the recording."""
+        return not self.mismatches
+
+    def summary(self) -> str:
+        status = "ok" if self.ok else f"{len(self.mismatches)} mismatch(es)"
+        text = (
+            f"HIL replay scans {self.start_scan_id}-{self.end_scan_id}: {status}; "
+            f"{self.scans} scans, {self.writes} writes in {self.elapsed:.3f}s"
+        )
+        if self.late_scans:
+            text += f", {self.late_scans} late"
+        if self.skipped:
+            text += f"; unmapped stimulus: {', '.join(self.skipped)}"
+        return text
+
+
+def _values_match(expected: Any, actual: Any) -> bool:
+    if isinstance(expected, float) or isinstance(actual, float):
+        if not isinstance(expected, int | float) or not isinstance(actual, int | float):
+            return False
+        # REAL registers carry float32 precision.
+        return math.isclose(expected, actual, rel_tol=1e-6, abs_tol=1e-9)
+    return expected == actual
+
+
+def _recorded_rtc(recorded: PLC, log: ScanLogSnapshot, state: SystemState) -> datetime | None:
+    """RTC reading of the recording at ``state``, or ``None`` if it is not known.
+
+    The clock a runner starts with is not logged, so before its first
+    logged ``set_rtc`` the reading is only known when there was none.
+    """
+    earlier = [scan_id for scan_id in log.rtc_base_changes if scan_id <= state.scan_id]
+    if earlier:
+        base, base_sim_time = log.rtc_base_changes[max(earlier)]
+        return base + timedelta(seconds=state.timestamp - base_sim_time)
+    if log.rtc_base_changes:
+        return None
+    return recorded._rtc_at_sim_time(state.timestamp)
+
+
+def _default_outputs(tag_map: TagMap) -> list[str]:
+    return [
+        slot.logical_name for slot in tag_map.iter_mapped_slots("user") if slot.memory_type == "Y"
+    ]
+
+
+def replay_hil(
+    recorded: PLC,
+    tag_map: TagMap,
+    target: ReplayTarget,
+    *,
+    start: int | None = None,
+    end: int | None = None,
+    outputs: Iterable[Tag | str] | None = None,
+    speed: float | None = 1.0,
+    tolerance_scans: int = 0,
+    prime: bool = True,
+) -> HilReport:
+    """Replay a recorded session's stimulus against ``target`` and diff its outputs.
+
+    For each scan ``N`` in ``start..end``: the patches drained on scan ``N``
+    (and the force map, when it changed) are written to the target, any
+    RTC change logged for scan ``N`` is applied, the target advances one
+    scan by the recorded ``dt`` (the per-scan ``dt`` log of a REALTIME
+    recording, else the timestamp step), and each output is read and
+    compared with the recorded state after scan ``N``.
+
+    Args:
+        recorded: The PLC whose history and scan log hold the session.
+        tag_map: Mapping from the recording's tags to hardware addresses.
+        target: Where to replay — `SoftPlcTarget`, `ModbusReplayTarget`,
+            or any `ReplayTarget`.
+        start: First scan to replay (default: first recorded scan).
+        end: Last scan to replay, inclusive (default: current scan).
+        outputs: Tags to compare (default: every user tag mapped to ``Y``).
+        speed: Pace scans at ``speed`` times recorded time (``2.0`` is
+            twice as fast); ``None`` replays as fast as the target allows.
+        tolerance_scans: Also accept an output that matches the recording
+            up to this many scans earlier, for targets that lag.
+        prime: Before the first scan, write the recorded value of every
+            replayed stimulus tag as it stood before ``start``, and set
+            the target's RTC to the recorded clock when it is known.
+
+    Returns:
+        HilReport with mismatches and timing.
+
+    Raises:
+        ValueError: The scan range is empty or outside the recording, or
+            ``speed``/``tolerance_scans`` is out of range.
+        KeyError: An entry in ``outputs`` has no hardware mapping.
+    """
+    if speed is not None and speed <= 0:
+        raise ValueError(f"speed must be positive or None, got {speed}")
+    if tolerance_scans < 0:
+        raise ValueError(f"tolerance_scans must be >= 0, got {tolerance_scans}")
+
+    history = recorded.history
+    log = recorded._scan_log.snapshot()
+    first = max(history.oldest_scan_id, log.base_scan) + 1
+    start = first if start is None else start
+    end = history.newest_scan_id if end is None else end
+    if start < first or end > history.newest_scan_id or start > end:
+        raise ValueError(
+            f"scan range {start}..{end} is outside the replayable recording "
+            f"{first}..{history.newest_scan_id}"
+        )
+
+    addresses = tag_map._tag_addresses
+    defaults = {slot.logical_name: slot.default for slot in tag_map.iter_mapped_slots()}
+    output_names = (
+        _default_outputs(tag_map)
+        if outputs is None
+        else [item.name if isinstance(item, Tag) else item for item in outputs]
+    )
+    output_addresses: list[str] = []
+    for name in output_names:
+        address = addresses.get(name)
+        if address is None:
+            raise KeyError(f"No mapping for output tag {name!r}.")
+        output_addresses.append(address)
+
+    # State N-1 anchors the timing (and priming) of scan N.
+    states: list[SystemState] = history.range(start - 1, end + 1)
+    stimulus: dict[int, dict[str, Any]] = {}
+    for scan_id in range(start, end + 1):
+        values: dict[str, Any] = {}
+        if scan_id in log.force_changes_by_scan:
+            values.update(log.force_changes_by_scan[scan_id])
+        values.update(log.patches_by_scan.get(scan_id, {}))
+        if values:
+            stimulus[scan_id] = values
+
+    skipped = sorted({name for values in stimulus.values() for name in values} - addresses.keys())
+
+    def hardware(values: Mapping[str, Any]) -> dict[str, Any]:
+        return {addresses[name]: value for name, value in values.items() if name in addresses}
+
+    def expected(state: SystemState, name: str) -> Any:
+        return state.tags.get(name, defaults.get(name))
+
+    writes = 0
+    late_scans = 0
+    mismatches: list[HilMismatch] = []
+    base_time = states[0].timestamp
+    began = time.perf_counter()
+
+    def deadline(sim_time: float) -> float:
+        assert speed is not None
+        return began + (sim_time - base_time) / speed
+
+    def wait_until(sim_time: float) -> None:
+        if speed is not None:
+            remaining = deadline(sim_time) - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+
+    if prime:
+        names = sorted({name for values in stimulus.values() for name in values})
+        primed = hardware({name: expected(states[0], name) for name in names})
+        target.write(primed)
+        writes += len(primed)
+        rtc = _recorded_rtc(recorded, log, states[0])
+        if rtc is not None:
+            target.set_rtc(rtc)
+
+    for offset in range(1, len(states)):
+        previous, state = states[offset - 1], states[offset]
+        scan_id = state.scan_id
+        wait_until(previous.timestamp)
+        if speed is not None and time.perf_counter() > deadline(state.timestamp):
+            # A whole recorded scan behind: the target is slower than the pace.
+            late_scans += 1
+        values = hardware(stimulus.get(scan_id, {}))
+        if values:
+            target.write(values)
+            writes += len(values)
+        if scan_id in log.rtc_base_changes:
+            base, base_sim_time = log.rtc_base_changes[scan_id]
+            target.set_rtc(base + timedelta(seconds=previous.timestamp - base_sim_time))
+        if log.dts is not None:
+            dt = log.dts[scan_id - log.base_scan]
+        else:
+            dt = state.timestamp - previous.timestamp
+        target.advance(dt)
+        wait_until(state.timestamp)
+
+        actual = target.read(output_addresses)
+        window = states[max(0, offset - tolerance_scans) : offset + 1]
+        for name, address in zip(output_names, output_addresses, strict=True):
+            value = actual[address]
+            if any(_values_match(expected(past, name), value) for past in window):
+                continue
+            mismatches.append(
+                HilMismatch(
+                    scan_id=scan_id,
+                    tag=name,
+                    address=address,
+                    expected=expected(state, name),
+                    actual=value,
+                )
+            )
+
+    return HilReport(
+        start_scan_id=start,
+        end_scan_id=end,
+        scans=len(states) - 1,
+        writes=writes,
+        skipped=tuple(skipped),
+        mismatches=tuple(mismatches),
+        late_scans=late_scans,
+        elapsed=time.perf_counter() - began,
+    )
+
+
+__all__ = [
+    "HilMismatch",
+    "HilReport",
+    "ModbusReplayTarget",
+    "ReplayTarget",
+    "SoftPlcTarget",
+    "replay_hil",
+]
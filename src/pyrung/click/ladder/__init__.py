@@ -5,23 +5,39 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from ._exporter import LadderBundle, LadderExportError, build_ladder_bundle
+from .cache import LadderExportCache
 
 if TYPE_CHECKING:
     from pyrung.click.tag_map import TagMap
     from pyrung.core.program import Program
 
 
-def pyrung_to_ladder(program: Program, tag_map: TagMap) -> LadderBundle:
+def pyrung_to_ladder(
+    program: Program,
+    tag_map: TagMap,
+    *,
+    cache: LadderExportCache | None = None,
+    workers: int | None = None,
+) -> LadderBundle:
     """Render a Program into Click ladder CSV row matrices.
 
     Args:
         program: The Program to export.
         tag_map: TagMap mapping logical tags to Click hardware addresses.
+        cache: Reuse rows for rungs unchanged since the last export that
+            used this cache.
+        workers: Render rungs across this many processes (large programs).
 
     Returns:
         A LadderBundle containing main and subroutine row matrices.
     """
-    return build_ladder_bundle(tag_map, program)
+    return build_ladder_bundle(tag_map, program, cache=cache, workers=workers)
 
 
-__all__ = ["LadderBundle", "LadderExportError", "build_ladder_bundle", "pyrung_to_ladder"]
+__all__ = [
+    "LadderBundle",
+    "LadderExportCache",
+    "LadderExportError",
+    "build_ladder_bundle",
+    "pyrung_to_ladder",
+]
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, NoReturn
 
+from pyrung.click._fingerprint import _RungFingerprinter
 from pyrung.click._topology import Leaf, Series, SPNode, factor_outputs, make_compound
 from pyrung.core.condition import AllCondition, AnyCondition, Condition
 from pyrung.core.rung import Rung
 
+from .cache import LadderExportCache, _CachedUnit
 from .instructions import _InstructionMixin
 from .layout import _HEADER, _LayoutMixin
 from .translator import _TranslatorMixin
@@ -28,10 +33,54 @@ class _ConditionLeafKey:
     signature: str
 
 
+@dataclass(frozen=True)
+class _ExportUnit:
+    """One rung plus the ``.continued()`` rungs that follow it.
+
+    The CSV parser folds continued rows into the rung before them, so a unit
+    is the smallest slice of a scope that renders and round-trips alone.
+    """
+
+    scope: str
+    subroutine_name: str | None
+    start: int
+    stop: int
+
+
+# Below this many rungs to render, worker start-up costs more than it saves.
+_MIN_PARALLEL_UNITS = 64
+
+
 # ---- Public entrypoint ----
-def build_ladder_bundle(tag_map: TagMap, program: Program) -> LadderBundle:
-    """Render a `Program` into deterministic Click ladder CSV row matrices."""
-    return _LadderExporter(tag_map=tag_map, program=program).export()
+def build_ladder_bundle(
+    tag_map: TagMap,
+    program: Program,
+    *,
+    cache: LadderExportCache | None = None,
+    workers: int | None = None,
+) -> LadderBundle:
+    """Render a `Program` into deterministic Click ladder CSV row matrices.
+
+    With *cache*, rungs unchanged since the previous export reuse their
+    rendered rows.  With *workers* > 1, rungs that do need rendering are
+    split across that many processes.
+    """
+    return _LadderExporter(tag_map=tag_map, program=program, cache=cache, workers=workers).export()
+
+
+def _render_units_in_worker(
+    tag_map: TagMap, program: Program, units: list[_ExportUnit]
+) -> list[_CachedUnit | None]:
+    exporter = _LadderExporter(tag_map=tag_map, program=program)
+    results: list[_CachedUnit | None] = []
+    for unit in units:
+        try:
+            results.append(exporter._render_unit(unit, output_offset=0))
+        except _RenderError:
+            # The parent re-renders this unit in order, so the issue gets
+            # scope-accurate paths.
+            results.append(None)
+    return results
 
 
 # ---- Orchestrator ----
@@ -52,48 +101,80 @@ class _LadderExporter(
         ("ForLoopInstruction", "forloop", "for"),
     )
 
-    def __init__(self, *, tag_map: TagMap, program: Program) -> None:
+    def __init__(
+        self,
+        *,
+        tag_map: TagMap,
+        program: Program,
+        cache: LadderExportCache | None = None,
+        workers: int | None = None,
+    ) -> None:
         self._tag_map = tag_map
         self._program = program
+        self._cache = cache
+        self._workers = workers
         self._forloop_count = 0
         self._added_return_count = 0
 
     def export(self) -> LadderBundle:
         try:
-            self._run_precheck()
+            fingerprinter = _RungFingerprinter(self._tag_map) if self._cache is not None else None
+            self._run_precheck(fingerprinter)
 
-            # Main scope always ends with an explicit end() rung.
-            rendered_main_rows = self._render_scope(
-                self._program.rungs, scope="main", subroutine_name=None
-            )
-            self._validate_scope_roundtrip(
-                source_rungs=self._program.rungs,
-                rendered_rows=rendered_main_rows,
-                scope="main",
-                subroutine_name=None,
+            scopes: list[tuple[str, str | None, list[Rung]]] = [("main", None, self._program.rungs)]
+            scopes.extend(
+                ("subroutine", name, self._program.subroutines[name])
+                for name in sorted(self._program.subroutines)
             )
+            scope_units = [
+                self._scope_units(rungs, scope=scope, subroutine_name=name)
+                for scope, name, rungs in scopes
+            ]
+            units = [unit for units in scope_units for unit in units]
+
+            rendered: dict[_ExportUnit, _CachedUnit] = {}
+            keys: dict[_ExportUnit, str] = {}
+            if self._cache is not None and fingerprinter is not None:
+                for unit in units:
+                    key = fingerprinter.unit_key(unit.scope, self._unit_rungs(unit))
+                    keys[unit] = key
+                    entry = self._cache._get(key)
+                    if entry is not None:
+                        rendered[unit] = entry
+            if self._workers is not None and self._workers > 1:
+                rendered.update(
+                    self._render_in_workers([unit for unit in units if unit not in rendered])
+                )
+
+            scope_rows: list[list[tuple[str, ...]]] = []
+            for units_in_scope in scope_units:
+                rows: list[tuple[str, ...]] = []
+                output_count = 0
+                for unit in units_in_scope:
+                    entry = rendered.get(unit)
+                    if entry is None:
+                        entry = self._render_unit(unit, output_offset=output_count)
+                        rendered[unit] = entry
+                    rows.extend(entry.rows)
+                    output_count += entry.outputs
+                    self._forloop_count += entry.forloops
+                scope_rows.append(rows)
+
+            if self._cache is not None:
+                self._cache._replace({keys[unit]: rendered[unit] for unit in units})
 
+            # Main scope always ends with an explicit end() rung.
             main_rows: list[tuple[str, ...]] = [tuple(_HEADER)]
-            main_rows.extend(rendered_main_rows)
+            main_rows.extend(scope_rows[0])
             main_rows.extend(self._end_rung())
 
             # Each subroutine matrix gets a deterministic return() tail.
             subroutine_rows: list[tuple[str, tuple[tuple[str, ...], ...]]] = []
-            for subroutine_name in sorted(self._program.subroutines):
-                rendered_sub_rows = self._render_scope(
-                    self._program.subroutines[subroutine_name],
-                    scope="subroutine",
-                    subroutine_name=subroutine_name,
-                )
-                self._validate_scope_roundtrip(
-                    source_rungs=self._program.subroutines[subroutine_name],
-                    rendered_rows=rendered_sub_rows,
-                    scope="subroutine",
-                    subroutine_name=subroutine_name,
-                )
-
-                rows: list[tuple[str, ...]] = [tuple(_HEADER)]
-                rows.extend(rendered_sub_rows)
+            for (_scope, subroutine_name, _rungs), rendered_sub_rows in zip(
+                scopes[1:], scope_rows[1:], strict=True
+            ):
+                assert subroutine_name is not None
+                rows = [tuple(_HEADER), *rendered_sub_rows]
                 rows = self._ensure_subroutine_return_tail(rows, subroutine_name=subroutine_name)
                 subroutine_rows.append((subroutine_name, tuple(rows)))
 
@@ -106,15 +187,79 @@ class _LadderExporter(
         except _RenderError as exc:
             raise LadderExportError([exc.issue]) from None
 
+    @staticmethod
+    def _scope_units(
+        rungs: list[Rung], *, scope: str, subroutine_name: str | None
+    ) -> list[_ExportUnit]:
+        units: list[_ExportUnit] = []
+        start = 0
+        for index in range(1, len(rungs)):
+            if not rungs[index]._use_prior_snapshot:
+                units.append(_ExportUnit(scope, subroutine_name, start, index))
+                start = index
+        if rungs:
+            units.append(_ExportUnit(scope, subroutine_name, start, len(rungs)))
+        return units
+
+    def _unit_rungs(self, unit: _ExportUnit) -> list[Rung]:
+        if unit.subroutine_name is None:
+            return self._program.rungs[unit.start : unit.stop]
+        return self._program.subroutines[unit.subroutine_name][unit.start : unit.stop]
+
+    def _render_unit(self, unit: _ExportUnit, *, output_offset: int) -> _CachedUnit:
+        """Render and round-trip-validate one unit; for-loops are counted by the caller."""
+        rungs = self._unit_rungs(unit)
+        forloops_before = self._forloop_count
+        rows = self._render_scope(
+            rungs,
+            scope=unit.scope,
+            subroutine_name=unit.subroutine_name,
+            rung_offset=unit.start,
+        )
+        outputs = self._validate_scope_roundtrip(
+            source_rungs=rungs,
+            rendered_rows=rows,
+            scope=unit.scope,
+            subroutine_name=unit.subroutine_name,
+            rung_offset=unit.start,
+            output_offset=output_offset,
+        )
+        forloops = self._forloop_count - forloops_before
+        self._forloop_count = forloops_before
+        return _CachedUnit(rows=tuple(rows), forloops=forloops, outputs=outputs)
+
+    def _render_in_workers(self, units: list[_ExportUnit]) -> dict[_ExportUnit, _CachedUnit]:
+        assert self._workers is not None
+        if len(units) < _MIN_PARALLEL_UNITS:
+            return {}
+        size = -(-len(units) // self._workers)
+        chunks = [units[index : index + size] for index in range(0, len(units), size)]
+        rendered: dict[_ExportUnit, _CachedUnit] = {}
+        try:
+            with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+                futures = [
+                    pool.submit(_render_units_in_worker, self._tag_map, self._program, chunk)
+                    for chunk in chunks
+                ]
+                for chunk, future in zip(chunks, futures, strict=True):
+                    for unit, entry in zip(chunk, future.result(), strict=True):
+                        if entry is not None:
+                            rendered[unit] = entry
+        except (pickle.PicklingError, AttributeError, TypeError, BrokenProcessPool):
+            # Programs that cannot cross a process boundary render serially.
+            return {}
+        return rendered
+
     def _render_scope(
         self,
         rungs: list[Rung],
         *,
         scope: str,
         subroutine_name: str | None,
+        rung_offset: int = 0,
     ) -> list[tuple[str, ...]]:
         rows: list[tuple[str, ...]] = []
-        for rung_index, rung in enumerate(rungs):
+        for rung_index, rung in enumerate(rungs, start=rung_offset):
             base_path = (
                 f"subroutine[{subroutine_name}].rung[{rung_index}]"
                 if scope == "subroutine"
@@ -402,4 +547,4 @@ class _LadderExporter(
         )
 
 
-__all__ = ["LadderBundle", "LadderExportError", "build_ladder_bundle"]
+__all__ = ["LadderBundle", "LadderExportCache", "LadderExportError", "build_ladder_bundle"]
@@ -0,0 +1,114 @@
+"""Incremental ladder export cache."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from importlib import metadata
+from pathlib import Path
+
+from pyrung.click.validation.cache import ClickValidationCache
+
+# Bump when rendering or fingerprinting changes in a way that invalidates saved rows.
+_CACHE_FORMAT = 2
+
+
+def _versions() -> dict[str, str]:
+    """Installed pyrung and pyclickplc versions; rows rendered by others are stale."""
+    versions: dict[str, str] = {}
+    for dist in ("pyrung", "pyclickplc"):
+        try:
+            versions[dist] = metadata.version(dist)
+        except metadata.PackageNotFoundError:
+            versions[dist] = "unknown"
+    return versions
+
+
+@dataclass(frozen=True)
+class _CachedUnit:
+    """Rendered, round-trip-validated rows for one export unit."""
+
+    rows: tuple[tuple[str, ...], ...]
+    forloops: int
+    outputs: int
+
+
+class LadderExportCache:
+    """Reuse rendered rows for rungs that have not changed since the last export.
+
+    Pass one cache to successive ``pyrung_to_ladder(..., cache=cache)`` calls
+    for the same program.  Each rung (with any ``.continued()`` rungs that
+    follow it) is fingerprinted from its conditions, instructions, comment,
+    and the hardware addresses its tags map to; unchanged rungs skip
+    rendering and CSV round-trip validation.  Strict prevalidation reuses
+    the findings of unchanged rungs through ``validation``, an in-memory
+    `ClickValidationCache` that is not saved.
+
+    Entries not used by the most recent export are dropped, so the cache
+    tracks one program.  ``save()``/``load()`` persist it between processes.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, _CachedUnit] = {}
+        self.validation = ClickValidationCache()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the hit/miss counters."""
+        self._entries.clear()
+        self.validation.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def save(self, path: str | Path) -> None:
+        """Write the cache to *path* as JSON."""
+        payload = {
+            "format": _CACHE_FORMAT,
+            "versions": _versions(),
+            "entries": {
+                key: {"rows": entry.rows, "forloops": entry.forloops, "outputs": entry.outputs}
+                for key, entry in self._entries.items()
+            },
+        }
+        Path(path).write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> LadderExportCache:
+        """Read a cache written by `save()`; a missing or stale file gives an empty cache.
+
+        A file saved by a different pyrung or pyclickplc version is stale.
+        """
+        cache = cls()
+        try:
+            payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cache
+        if not isinstance(payload, dict) or payload.get("format") != _CACHE_FORMAT:
+            return cache
+        if payload.get("versions") != _versions():
+            return cache
+        for key, entry in payload.get("entries", {}).items():
+            cache._entries[key] = _CachedUnit(
+                rows=tuple(tuple(row) for row in entry["rows"]),
+                forloops=int(entry["forloops"]),
+                outputs=int(entry["outputs"]),
+            )
+        return cache
+
+    def _get(self, key: str) -> _CachedUnit | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def _replace(self, entries: dict[str, _CachedUnit]) -> None:
+        self._entries = entries
+
+
+__all__ = ["LadderExportCache"]
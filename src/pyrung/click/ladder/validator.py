@@ -5,15 +5,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, NoReturn
 
+from pyrung.click._fingerprint import _RungFingerprinter
 from pyrung.click._topology import Leaf, Parallel, Series, SPNode, make_compound, trees_equal
 from pyrung.click.codegen.analyzer import _analyze_rungs
 from pyrung.click.codegen.constants import _PIN_RE
 from pyrung.click.codegen.models import _AnalyzedRung, _PinInfo
 from pyrung.click.codegen.parser import _parse_rows
+from pyrung.click.validation import _validate_click_program
 from pyrung.core.condition import AllCondition, AnyCondition, Condition
 from pyrung.core.instruction import ForLoopInstruction
 from pyrung.core.rung import Rung
 
+from .cache import LadderExportCache
 from .layout import _HEADER
 from .types import Issue, LadderExportError
 
@@ -35,13 +38,24 @@ class _ValidationMixin:
 
     _tag_map: TagMap
     _program: Program
+    _cache: LadderExportCache | None
 
     if TYPE_CHECKING:
 
         def _raise_issue(self, *, path: str, message: str, source: Any) -> NoReturn: ...
 
-    def _run_precheck(self) -> None:
-        report = self._tag_map.validate(self._program, mode="strict")
+    def _run_precheck(self, fingerprinter: _RungFingerprinter | None = None) -> None:
+        if self._cache is None:
+            report = self._tag_map.validate(self._program, mode="strict")
+        else:
+            report = _validate_click_program(
+                self._program,
+                self._tag_map,
+                "strict",
+                None,
+                cache=self._cache.validation,
+                fingerprinter=fingerprinter,
+            )
         # We intentionally fail on warnings and hints to keep export deterministic.
         findings = [*report.errors, *report.warnings, *report.hints]
         if findings:
@@ -138,8 +152,15 @@ class _RoundTripValidationMixin:
         rendered_rows: list[tuple[str, ...]],
         scope: str,
         subroutine_name: str | None,
-    ) -> None:
-        """Fail loudly when emitted CSV rows lose rung semantics."""
+        rung_offset: int = 0,
+        output_offset: int = 0,
+    ) -> int:
+        """Fail loudly when emitted CSV rows lose rung semantics.
+
+        *source_rungs* may be a slice of the scope starting at *rung_offset*
+        (with *output_offset* outputs before it) so issue paths stay
+        scope-absolute.  Returns the number of outputs checked.
+        """
         actual_rungs = _analyze_rungs(_parse_rows([tuple(_HEADER), *rendered_rows]))
         expected_comments = [rung.comment for rung in source_rungs if rung.comment is not None]
         actual_comments = [rung.comment for rung in actual_rungs if rung.comment is not None]
@@ -159,6 +180,7 @@ class _RoundTripValidationMixin:
             source_rungs,
             scope=scope,
             subroutine_name=subroutine_name,
+            rung_offset=rung_offset,
         )
         actual = self._flatten_analyzed_outputs(actual_rungs)
 
@@ -182,9 +204,9 @@ class _RoundTripValidationMixin:
             zip(expected, actual, strict=True)
         ):
             output_path = (
-                f"subroutine[{subroutine_name}].output[{output_index}]"
+                f"subroutine[{subroutine_name}].output[{output_offset + output_index}]"
                 if scope == "subroutine"
-                else f"main.output[{output_index}]"
+                else f"main.output[{output_offset + output_index}]"
             )
             source = (
                 source_rungs[min(output_index, len(source_rungs) - 1)] if source_rungs else None
@@ -195,6 +217,7 @@ class _RoundTripValidationMixin:
                 path=output_path,
                 source=source,
             )
+        return len(expected)
 
     def _expected_scope_outputs(
         self,
@@ -202,9 +225,10 @@ class _RoundTripValidationMixin:
         *,
         scope: str,
         subroutine_name: str | None,
+        rung_offset: int = 0,
     ) -> list[_ScopeOutput]:
         outputs: list[_ScopeOutput] = []
-        for rung_index, rung in enumerate(rungs):
+        for rung_index, rung in enumerate(rungs, start=rung_offset):
             base_path = (
                 f"subroutine[{subroutine_name}].rung[{rung_index}]"
                 if scope == "subroutine"
@@ -0,0 +1,227 @@
+"""Content-hashed cache for TagMaps built from nickname CSV files.
+
+Parsing a large nickname CSV (row parsing, ``parse_tag_meta``, block
+inference, name validation) dominates the cost of
+``TagMap.from_nickname_file``.  The finished map is pickled once per
+distinct file content and every later load unpickles a fresh,
+independent copy, so callers never share mutable Tag or Block objects.
+
+Shared singletons are pickled by reference rather than by value: the
+hardware bank blocks from ``_hardware_block_for`` (and their cached slot
+tags) and the built-in system slots.  A loaded map therefore points at
+the same hardware objects as one built from scratch.
+
+The cache has two levels:
+
+- in memory, per process (always on);
+- on disk, when a cache directory is given or ``$PYRUNG_TAGMAP_CACHE_DIR``
+  is set.  Useful when many processes (for example pytest-xdist workers)
+  load the same file.
+
+Keys cover the file bytes, the import mode, the pyrung, pyclickplc and
+Python versions, and the source of the modules that build and pickle the
+map, so neither an upgrade nor an edit under an editable install reads a
+stale entry.  Only point the
+disk cache at a directory you trust: entries are pickles.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import hashlib
+import importlib
+import io
+import os
+import pickle
+import sys
+import tempfile
+from collections import OrderedDict
+from collections.abc import Callable
+from importlib import metadata
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pyrung.click.system_mappings import SYSTEM_CLICK_SLOTS
+from pyrung.core import memory_block, structure, system_points
+
+from ._parsers import _HARDWARE_BLOCK_CACHE, _hardware_block_for
+
+if TYPE_CHECKING:
+    from ._map import TagMap
+
+CACHE_DIR_ENV = "PYRUNG_TAGMAP_CACHE_DIR"
+
+# Identity-compared ``object()`` sentinels that must survive a round trip.
+_SENTINELS: dict[str, object] = {
+    "memory_block.UNSET": memory_block.UNSET,
+    "structure.UNSET": structure.UNSET,
+    "system_points._UNSET": system_points._UNSET,
+}
+
+_CACHE_FORMAT = 1
+# Modules whose code shapes the pickled map: the builder and the classes it holds.
+_SOURCE_MODULES = (
+    "pyrung.click.tag_map._cache",
+    "pyrung.click.tag_map._map",
+    "pyrung.click.tag_map._nickname_io",
+    "pyrung.click.tag_map._parsers",
+    "pyrung.click.tag_map._types",
+    "pyrung.click.system_mappings",
+    "pyrung.core.memory_block",
+    "pyrung.core.structure",
+    "pyrung.core.tag",
+)
+_MEMORY_LIMIT = 8
+_memory: OrderedDict[str, bytes] = OrderedDict()
+
+
+def _version(dist: str) -> str:
+    try:
+        return metadata.version(dist)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+@functools.cache
+def _source_digest() -> str:
+    """Hash the source of `_SOURCE_MODULES` once per process."""
+    digest = hashlib.sha256()
+    for name in _SOURCE_MODULES:
+        digest.update(name.encode("utf-8"))
+        filename = getattr(importlib.import_module(name), "__file__", None)
+        try:
+            digest.update(Path(filename).read_bytes() if filename else b"?")
+        except OSError:
+            digest.update(b"?")
+    return digest.hexdigest()
+
+
+def cache_key(data: bytes, mode: str) -> str:
+    """Return the cache key for nickname CSV *data* imported with *mode*."""
+    digest = hashlib.sha256()
+    header = (
+        f"{_CACHE_FORMAT}|{_version('pyrung')}|{_version('pyclickplc')}|"
+        f"{sys.version_info.major}.{sys.version_info.minor}|{_source_digest()}|{mode}|"
+    )
+    digest.update(header.encode("utf-8"))
+    digest.update(data)
+    return digest.hexdigest()
+
+
+def _shared_objects() -> dict[int, tuple[Any, ...]]:
+    """Map ``id()`` of every shared singleton to its persistent id."""
+    shared: dict[int, tuple[Any, ...]] = {}
+    for memory_type, block in _HARDWARE_BLOCK_CACHE.items():
+        shared[id(block)] = ("bank", memory_type)
+        for addr, tag in block._tag_cache.items():
+            shared[id(tag)] = ("bank_tag", memory_type, addr)
+    for name, sentinel in _SENTINELS.items():
+        shared[id(sentinel)] = ("sentinel", name)
+    for index, slot in enumerate(SYSTEM_CLICK_SLOTS):
+        shared[id(slot.logical)] = ("system", index, "logical")
+        shared[id(slot.hardware)] = ("system", index, "hardware")
+    return shared
+
+
+class _Pickler(pickle.Pickler):
+    def __init__(self, file: io.BytesIO) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._shared = _shared_objects()
+
+    def persistent_id(self, obj: Any) -> tuple[Any, ...] | None:
+        return self._shared.get(id(obj))
+
+
+class _Unpickler(pickle.Unpickler):
+    def persistent_load(self, pid: Any) -> Any:
+        kind = pid[0]
+        if kind == "bank":
+            return _hardware_block_for(pid[1])
+        if kind == "bank_tag":
+            return _hardware_block_for(pid[1])[pid[2]]
+        if kind == "sentinel":
+            return _SENTINELS[pid[1]]
+        if kind == "system":
+            return getattr(SYSTEM_CLICK_SLOTS[pid[1]], pid[2])
+        raise pickle.UnpicklingError(f"Unknown persistent id {pid!r}")
+
+
+def dumps(tag_map: TagMap) -> bytes:
+    buffer = io.BytesIO()
+    _Pickler(buffer).dump(tag_map)
+    return buffer.getvalue()
+
+
+def loads(blob: bytes) -> TagMap:
+    return _Unpickler(io.BytesIO(blob)).load()
+
+
+def _remember(key: str, blob: bytes) -> None:
+    _memory[key] = blob
+    _memory.move_to_end(key)
+    while len(_memory) > _MEMORY_LIMIT:
+        _memory.popitem(last=False)
+
+
+def _read_disk(path: Path) -> TagMap | None:
+    try:
+        blob = path.read_bytes()
+        tag_map = loads(blob)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # A truncated, foreign, or outdated entry is just a miss.
+        return None
+    _remember(path.stem.removeprefix("tagmap-"), blob)
+    return tag_map
+
+
+def _write_disk(path: Path, blob: bytes) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tagmap-", suffix=".tmp")
+    except OSError:
+        # The disk cache is an optimization; an unwritable directory is not an error.
+        return
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(blob)
+        os.replace(tmp, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+
+
+def load_cached(
+    path: str | Path,
+    mode: str,
+    build: Callable[[], TagMap],
+    *,
+    cache_dir: str | Path | None = None,
+) -> TagMap:
+    """Return a fresh TagMap for *path*, building it with *build* on a miss."""
+    key = cache_key(Path(path).read_bytes(), mode)
+    blob = _memory.get(key)
+    if blob is not None:
+        _memory.move_to_end(key)
+        return loads(blob)
+
+    directory = cache_dir if cache_dir is not None else os.environ.get(CACHE_DIR_ENV)
+    disk_path = Path(directory) / f"tagmap-{key}.pickle" if directory else None
+    if disk_path is not None:
+        cached = _read_disk(disk_path)
+        if cached is not None:
+            return cached
+
+    tag_map = build()
+    blob = dumps(tag_map)
+    _remember(key, blob)
+    if disk_path is not None:
+        _write_disk(disk_path, blob)
+    return tag_map
+
+
+def clear_cache() -> None:
+    """Drop every in-memory entry (disk entries are left in place)."""
+    _memory.clear()
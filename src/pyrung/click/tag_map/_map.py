@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import re
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Iterator, Mapping
+from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, cast
 
@@ -19,6 +20,7 @@ from pyrung.core import Block, BlockRange, Tag
 from pyrung.core.system_points import SYSTEM_TAGS_BY_NAME
 from pyrung.core.tag import MappingEntry
 
+from ._cache import load_cached
 from ._nickname_io import tag_map_from_nickname_file, write_tag_map_to_nickname_file
 from ._parsers import (
     _tag_type_for_memory_type,
@@ -33,13 +35,25 @@ from ._types import (
 
 if TYPE_CHECKING:
     from pyrung.click.profile import HardwareProfile
-    from pyrung.click.validation import ClickValidationReport, ValidationMode
+    from pyrung.click.validation import (
+        ClickValidationCache,
+        ClickValidationReport,
+        ValidationMode,
+    )
     from pyrung.core.program import Program
 
 _RESERVED_SYSTEM_HARDWARE_KEYS: frozenset[int] = frozenset(
     get_addr_key(*parse_address(slot.hardware.name)) for slot in SYSTEM_CLICK_SLOTS
 )
 
+
+@cache
+def _parse_hardware_name(name: str) -> tuple[str, int, str]:
+    """Parse a hardware tag name into ``(memory_type, address, display)``."""
+    memory_type, address = parse_address(name)
+    return memory_type, address, format_address_display(memory_type, address)
+
+
 _BLOCK_SLOT_OWNER_RE = re.compile(r"^block slot (?P<block_name>.+)\[(?P<addr>[0-9]+)\]$")
 
 
@@ -227,6 +241,7 @@ class TagMap:
         self._stamp_output_locks()
         self._populate_programmatic_structures()
         self._freeze_entries()
+        self._build_resolution_tables()
         self._refresh_nickname_validation()
 
     @classmethod
@@ -235,14 +250,28 @@ class TagMap:
         path: str | Path,
         *,
         mode: Literal["warn", "strict"] = "warn",
+        cache: bool = True,
+        cache_dir: str | Path | None = None,
     ) -> TagMap:
-        """Build a `TagMap` from a Click nickname CSV file."""
-        return tag_map_from_nickname_file(
-            cls,
-            path,
-            mode=mode,
-            reserved_system_hardware_keys=_RESERVED_SYSTEM_HARDWARE_KEYS,
-        )
+        """Build a `TagMap` from a Click nickname CSV file.
+
+        Results are cached by file content: loading the same CSV again
+        returns an independent copy without re-parsing it.  Pass
+        ``cache_dir`` (or set ``$PYRUNG_TAGMAP_CACHE_DIR``) to share the
+        cache between processes on disk; ``cache=False`` always parses.
+        """
+
+        def build() -> TagMap:
+            return tag_map_from_nickname_file(
+                cls,
+                path,
+                mode=mode,
+                reserved_system_hardware_keys=_RESERVED_SYSTEM_HARDWARE_KEYS,
+            )
+
+        if not cache or cls is not TagMap or mode not in {"warn", "strict"}:
+            return build()
+        return load_cached(path, mode, build, cache_dir=cache_dir)
 
     def to_nickname_file(self, path: str | Path) -> int:
         """Write this mapping to a Click nickname CSV file."""
@@ -253,30 +282,18 @@ class TagMap:
         if isinstance(source, str):
             if index is not None:
                 raise TypeError("Standalone tag resolution does not accept index.")
-            entry = self._tag_forward.get(source)
-            if entry is None:
-                entry = self._system_tag_forward.get(source)
-            if entry is None:
-                entry = self._system_alias_forward.get(source)
-            if entry is None:
+            address = self._str_addresses.get(source)
+            if address is None:
                 raise KeyError(f"No mapping for standalone tag {source!r}.")
-            return entry.hardware.name
+            return address
 
         if isinstance(source, Tag):
             if index is not None:
                 raise TypeError("Standalone tag resolution does not accept index.")
-            entry = self._tag_forward.get(source.name)
-            if entry is None:
-                entry = self._system_tag_forward.get(source.name)
-            if entry is None:
-                hardware = self._block_slot_forward_by_id.get(id(source))
-                if hardware is not None:
-                    return hardware.name
-                hardware = self._block_slot_forward_by_name.get(source.name)
-                if hardware is not None:
-                    return hardware.name
+            address = self._tag_addresses.get(source.name)
+            if address is None:
                 raise KeyError(f"No mapping for standalone tag {source.name!r}.")
-            return entry.hardware.name
+            return address
 
         if isinstance(source, Block):
             if index is None:
@@ -284,16 +301,57 @@ class TagMap:
             if not isinstance(index, int):
                 raise TypeError("Block index must be int.")
 
-            entry = self._block_lookup.get(id(source))
-            if entry is None:
+            table = self._block_addresses.get(id(source))
+            if table is None:
                 raise KeyError(f"No mapping for block {source.name!r}.")
-            hardware_addr = entry.logical_to_hardware.get(index)
-            if hardware_addr is None:
+            start, addresses = table
+            offset = index - start
+            address = addresses[offset] if 0 <= offset < len(addresses) else None
+            if address is None:
                 raise IndexError(f"Logical index {index} out of range for block {source.name!r}.")
-            return entry.hardware.block[hardware_addr].name
+            return address
 
         raise TypeError("resolve source must be Tag, Block, or str.")
 
+    def resolve_many(self, sources: Iterable[Tag | str | tuple[Block, int]]) -> list[str]:
+        """Resolve many logical sources to hardware address strings, in order.
+
+        Each item is a `Tag`, a tag name, or a ``(block, index)`` pair, and
+        resolves exactly as `resolve()` would (including the exceptions it
+        raises).  Lookups go straight to the precomputed tables, so this is
+        the cheap way to resolve every operand of a large program::
+
+            mapping.resolve_many([Speed, "Valve", (Alarms, 5)])  # ["DS1", "C3", "C5"]
+        """
+        tag_addresses = self._tag_addresses
+        str_addresses = self._str_addresses
+        block_addresses = self._block_addresses
+        resolved: list[str] = []
+        append = resolved.append
+        for source in sources:
+            address: str | None = None
+            if isinstance(source, tuple):
+                block, index = source
+                table = block_addresses.get(id(block))
+                if table is not None and isinstance(index, int):
+                    start, addresses = table
+                    offset = index - start
+                    if 0 <= offset < len(addresses):
+                        address = addresses[offset]
+                if address is None:
+                    address = self.resolve(block, index)
+            elif isinstance(source, str):
+                address = str_addresses.get(source)
+                if address is None:
+                    address = self.resolve(source)
+            else:
+                if isinstance(source, Tag):
+                    address = tag_addresses.get(source.name)
+                if address is None:
+                    address = self.resolve(source)
+            append(address)
+        return resolved
+
     def _offset_for(self, block: Block) -> int:
         """Return affine offset for a mapped block."""
         entry = self._block_lookup.get(id(block))
@@ -327,6 +385,8 @@ class TagMap:
         program: Program,
         mode: ValidationMode = "warn",
         profile: HardwareProfile | None = None,
+        *,
+        cache: ClickValidationCache | None = None,
     ) -> ClickValidationReport:
         """Validate a Program against Click portability rules.
 
@@ -334,43 +394,55 @@ class TagMap:
             program: The Program to validate.
             mode: "warn" (findings as hints) or "strict" (findings as errors).
             profile: Optional hardware capability profile override.
+            cache: Optional ClickValidationCache; unchanged rungs reuse earlier findings.
 
         Returns:
             ClickValidationReport with categorized findings.
         """
         from pyrung.click.validation import validate_click_program
 
-        return validate_click_program(program, self, mode=mode, profile=profile)
+        return validate_click_program(program, self, mode=mode, profile=profile, cache=cache)
 
     def mapped_slots(self) -> tuple[MappedSlot, ...]:
         """Return all mapped slots for runtime hardware-facing consumers."""
-        slots: list[MappedSlot] = []
+        return tuple(self.iter_mapped_slots())
 
-        for entry in self._entries_tuple:
-            if isinstance(entry, _TagEntry):
-                slots.append(
-                    self._mapped_slot(entry.logical, entry.hardware, read_only=False, source="user")
-                )
-                continue
+    def iter_mapped_slots(
+        self, source: Literal["user", "system"] | None = None
+    ) -> Iterator[MappedSlot]:
+        """Yield mapped slots lazily, optionally only those from *source*.
 
-            for logical_addr, hardware_addr in zip(
-                entry.logical_addresses, entry.hardware_addresses, strict=True
-            ):
-                logical_slot = entry.logical[logical_addr]
-                hardware_slot = entry.hardware.block[hardware_addr]
-                slots.append(
-                    self._mapped_slot(logical_slot, hardware_slot, read_only=False, source="user")
-                )
+        Same order as `mapped_slots()`; use this when scanning or filtering
+        so a large map is not materialized as a tuple first.
+        """
+        if source != "system":
+            for entry in self._entries_tuple:
+                if isinstance(entry, _TagEntry):
+                    yield self._mapped_slot(
+                        entry.logical, entry.hardware, read_only=False, source="user"
+                    )
+                    continue
+
+                block = entry.logical
+                hardware_block = entry.hardware.block
+                for logical_addr, hardware_addr in zip(
+                    entry.logical_addresses, entry.hardware_addresses, strict=True
+                ):
+                    yield self._mapped_slot(
+                        block[logical_addr],
+                        hardware_block[hardware_addr],
+                        read_only=False,
+                        source="user",
+                    )
 
-        for entry in self._system_tag_entries_tuple:
-            read_only = self._system_read_only[entry.logical.name]
-            slots.append(
-                self._mapped_slot(
-                    entry.logical, entry.hardware, read_only=read_only, source="system"
+        if source != "user":
+            for entry in self._system_tag_entries_tuple:
+                yield self._mapped_slot(
+                    entry.logical,
+                    entry.hardware,
+                    read_only=self._system_read_only[entry.logical.name],
+                    source="system",
                 )
-            )
-
-        return tuple(slots)
 
     def tags_from_plc_data(
         self,
@@ -400,7 +472,7 @@ class TagMap:
             that appear in both *data* and this TagMap.
         """
         reverse: dict[str, str] = {}
-        for slot in self.mapped_slots():
+        for slot in self.iter_mapped_slots():
             if slot.memory_type in ("XD", "YD"):
                 continue
             reverse[slot.hardware_address] = slot.logical_name
@@ -519,6 +591,27 @@ class TagMap:
     def __len__(self) -> int:
         return len(self._entries_tuple)
 
+    def __getstate__(self) -> dict[str, Any]:
+        # id()-keyed indices do not survive pickling; __setstate__ rebuilds them.
+        state = self.__dict__.copy()
+        del state["_block_lookup"]
+        del state["_block_slot_forward_by_id"]
+        del state["_block_addresses"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._block_lookup = {}
+        self._block_slot_forward_by_id = {}
+        for block_entry in self._block_entries_tuple:
+            source = block_entry.logical
+            self._block_lookup[id(source)] = block_entry
+            for logical_addr, hardware_addr in block_entry.logical_to_hardware.items():
+                self._block_slot_forward_by_id[id(source[logical_addr])] = (
+                    block_entry.hardware.block[hardware_addr]
+                )
+        self._build_resolution_tables()
+
     def __repr__(self) -> str:
         return (
             f"TagMap(tags={len(self._tag_entries_tuple)}, blocks={len(self._block_entries_tuple)})"
@@ -570,7 +663,7 @@ class TagMap:
     @staticmethod
     def _parse_hardware_tag(tag: Tag) -> tuple[str, int]:
         try:
-            memory_type, address = parse_address(tag.name)
+            memory_type, address, _ = _parse_hardware_name(tag.name)
         except ValueError as exc:
             raise ValueError(
                 f"Hardware tag name {tag.name!r} is not a valid Click address."
@@ -763,6 +856,41 @@ class TagMap:
         del self._entries
         del self._system_tag_entries
 
+    def _build_resolution_tables(self) -> None:
+        """Precompute flat lookup tables behind `resolve()` and `resolve_many()`.
+
+        ``_tag_addresses`` resolves `Tag` sources by name (standalone tags,
+        then system points, then block slots); ``_str_addresses`` resolves
+        names (standalone tags, then system points, then Click nicknames of
+        system points).  ``_block_addresses`` maps ``id(block)`` to
+        ``(start, addresses)``, where ``addresses[i]`` is the hardware address
+        of logical index ``start + i`` (``None`` for unmapped gaps).
+        """
+        tag_addresses: dict[str, str] = {}
+        block_addresses: dict[int, tuple[int, tuple[str | None, ...]]] = {}
+        for entry in self._block_entries_tuple:
+            hardware_block = entry.hardware.block
+            logical_to_hardware = entry.logical_to_hardware
+            start = entry.logical.start
+            addresses: list[str | None] = [None] * (entry.logical.end - start + 1)
+            for logical_addr, hardware_addr in logical_to_hardware.items():
+                address = hardware_block[hardware_addr].name
+                addresses[logical_addr - start] = address
+                tag_addresses[entry.logical[logical_addr].name] = address
+            block_addresses[id(entry.logical)] = (start, tuple(addresses))
+
+        str_addresses = {
+            alias: entry.hardware.name for alias, entry in self._system_alias_forward.items()
+        }
+        for name, entry in self._system_tag_forward.items():
+            tag_addresses[name] = str_addresses[name] = entry.hardware.name
+        for name, entry in self._tag_forward.items():
+            tag_addresses[name] = str_addresses[name] = entry.hardware.name
+
+        self._tag_addresses = tag_addresses
+        self._str_addresses = str_addresses
+        self._block_addresses = block_addresses
+
     def _mapped_slot(
         self,
         logical_slot: Tag,
@@ -773,7 +901,7 @@ class TagMap:
     ) -> MappedSlot:
         memory_type, address = self._parse_hardware_tag(hardware_slot)
         return MappedSlot(
-            hardware_address=format_address_display(memory_type, address),
+            hardware_address=_parse_hardware_name(hardware_slot.name)[2],
             logical_name=logical_slot.name,
             default=logical_slot.default,
             memory_type=memory_type,
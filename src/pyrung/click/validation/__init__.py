@@ -6,10 +6,18 @@ profile data for Stage 3 (R6-R8).
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any
 
-from pyrung.core.validation.walker import ProgramLocation, walk_program
+from pyrung.click._fingerprint import _RungFingerprinter
+from pyrung.core.validation.walker import (
+    FactScope,
+    OperandFact,
+    ProgramLocation,
+    walk_program,
+    walk_rung,
+)
 
+from .cache import ClickValidationCache, _RungFindings
 from .findings import (
     CLK_BANK_NOT_WRITABLE,
     CLK_BANK_UNRESOLVED,
@@ -65,22 +73,35 @@ if TYPE_CHECKING:
     from pyrung.click.profile import HardwareProfile
     from pyrung.click.tag_map import TagMap
     from pyrung.core.program import Program
+    from pyrung.core.rung import Rung
 
 # Compatibility hook for tests that monkeypatch pyrung.click.validation._load_default_profile.
 _load_default_profile = _hardware_load_default_profile
 
 
-def _iter_instruction_sites(program: Program) -> list[tuple[Any, ProgramLocation]]:
+def _top_level_rungs(program: Program) -> list[tuple[FactScope, str | None, int, Rung]]:
+    """Top-level rungs in walker order: main, then subroutines by name."""
+    rungs: list[tuple[FactScope, str | None, int, Rung]] = [
+        ("main", None, rung_index, rung) for rung_index, rung in enumerate(program.rungs)
+    ]
+    for subroutine_name in sorted(program.subroutines):
+        rungs.extend(
+            ("subroutine", subroutine_name, rung_index, rung)
+            for rung_index, rung in enumerate(program.subroutines[subroutine_name])
+        )
+    return rungs
+
+
+def _rung_instruction_sites(
+    rung: Rung,
+    *,
+    scope: FactScope,
+    subroutine: str | None,
+    rung_index: int,
+) -> list[tuple[Any, ProgramLocation]]:
     sites: list[tuple[Any, ProgramLocation]] = []
 
-    def walk_rung(
-        rung: Any,
-        *,
-        scope: Literal["main", "subroutine"],
-        subroutine: str | None,
-        rung_index: int,
-        branch_path: tuple[int, ...],
-    ) -> None:
+    def walk_rung(rung: Any, branch_path: tuple[int, ...]) -> None:
         def walk_instruction(instruction: Any, instruction_index: int) -> None:
             sites.append(
                 (
@@ -106,51 +127,151 @@ def _iter_instruction_sites(program: Program) -> list[tuple[Any, ProgramLocation
             walk_instruction(instruction, instruction_index)
 
         for branch_index, branch in enumerate(rung._branches):
-            walk_rung(
-                branch,
-                scope=scope,
-                subroutine=subroutine,
-                rung_index=rung_index,
-                branch_path=branch_path + (branch_index,),
-            )
+            walk_rung(branch, branch_path + (branch_index,))
 
-    for rung_index, rung in enumerate(program.rungs):
-        walk_rung(rung, scope="main", subroutine=None, rung_index=rung_index, branch_path=())
+    walk_rung(rung, ())
+    return sites
 
-    for subroutine_name in sorted(program.subroutines):
-        for rung_index, rung in enumerate(program.subroutines[subroutine_name]):
-            walk_rung(
-                rung,
-                scope="subroutine",
-                subroutine=subroutine_name,
-                rung_index=rung_index,
-                branch_path=(),
-            )
 
+def _iter_instruction_sites(program: Program) -> list[tuple[Any, ProgramLocation]]:
+    sites: list[tuple[Any, ProgramLocation]] = []
+    for scope, subroutine, rung_index, rung in _top_level_rungs(program):
+        sites.extend(
+            _rung_instruction_sites(rung, scope=scope, subroutine=subroutine, rung_index=rung_index)
+        )
     return sites
 
 
+def _validate_rung(
+    facts: tuple[OperandFact, ...],
+    instruction_sites: list[tuple[Any, ProgramLocation]],
+    tag_map: TagMap,
+    mode: ValidationMode,
+    profile: HardwareProfile | None,
+    rung_index: int,
+) -> _RungFindings:
+    """Run every Click rule over one top-level rung's facts and instructions."""
+    operand_findings: list[ClickFinding] = []
+    for fact in facts:
+        operand_findings.extend(_evaluate_fact(fact, tag_map, mode))
+
+    instruction_findings: list[ClickFinding] = []
+    for instruction, base_location in instruction_sites:
+        instruction_findings.extend(
+            _evaluate_instruction_portability(instruction, base_location, mode)
+        )
+        instruction_findings.extend(
+            _evaluate_timer_preset_overflow(instruction, base_location, tag_map, mode)
+        )
+
+    hardware_findings: list[ClickFinding] = []
+    if profile is not None:
+        for instruction, base_location in instruction_sites:
+            hardware_findings.extend(
+                _evaluate_write_targets(instruction, base_location, tag_map, profile, mode)
+            )
+            hardware_findings.extend(
+                _evaluate_role_assignments(instruction, base_location, tag_map, profile, mode)
+            )
+            hardware_findings.extend(
+                _evaluate_copy_compatibility(instruction, base_location, tag_map, profile, mode)
+            )
+            hardware_findings.extend(_evaluate_pack_text(instruction, base_location, tag_map, mode))
+            hardware_findings.extend(
+                _evaluate_drums(instruction, base_location, tag_map, profile, mode)
+            )
+
+    return _RungFindings(
+        operands=tuple(operand_findings),
+        immediate=tuple(_evaluate_immediate_usage(facts, instruction_sites, tag_map, mode)),
+        instructions=tuple(instruction_findings),
+        hardware=tuple(hardware_findings),
+        rung_index=rung_index,
+    )
+
+
 def validate_click_program(
     program: Program,
     tag_map: TagMap,
     mode: ValidationMode = "warn",
     profile: HardwareProfile | None = None,
+    *,
+    cache: ClickValidationCache | None = None,
 ) -> ClickValidationReport:
-    """Validate a Program against Click portability rules."""
-    facts = walk_program(program)
-    instruction_sites = _iter_instruction_sites(program)
+    """Validate a Program against Click portability rules.
 
-    findings: list[ClickFinding] = []
-    for fact in facts.operands:
-        findings.extend(_evaluate_fact(fact, tag_map, mode))
+    Pass a `ClickValidationCache` to re-check only rungs that changed since
+    the previous call with the same cache.
+    """
+    return _validate_click_program(program, tag_map, mode, profile, cache=cache)
 
-    findings.extend(_evaluate_immediate_usage(facts.operands, instruction_sites, tag_map, mode))
-
-    for instruction, base_location in instruction_sites:
-        findings.extend(_evaluate_instruction_portability(instruction, base_location, mode))
-        findings.extend(_evaluate_timer_preset_overflow(instruction, base_location, tag_map, mode))
 
+def _validate_click_program(
+    program: Program,
+    tag_map: TagMap,
+    mode: ValidationMode,
+    profile: HardwareProfile | None,
+    *,
+    cache: ClickValidationCache | None,
+    fingerprinter: _RungFingerprinter | None = None,
+) -> ClickValidationReport:
     active_profile = profile if profile is not None else _load_default_profile()
+    top_level = _top_level_rungs(program)
+
+    rung_findings: list[_RungFindings] = []
+    if cache is None:
+        # Share the program's fact table with any other validator that walked it.
+        facts_by_rung: dict[tuple[str, str | None, int], list[OperandFact]] = {}
+        for fact in walk_program(program).operands:
+            loc = fact.location
+            facts_by_rung.setdefault((loc.scope, loc.subroutine, loc.rung_index), []).append(fact)
+        for scope, subroutine, rung_index, rung in top_level:
+            rung_findings.append(
+                _validate_rung(
+                    tuple(facts_by_rung.get((scope, subroutine, rung_index), ())),
+                    _rung_instruction_sites(
+                        rung, scope=scope, subroutine=subroutine, rung_index=rung_index
+                    ),
+                    tag_map,
+                    mode,
+                    active_profile,
+                    rung_index,
+                )
+            )
+    else:
+        cache._use_context(mode, active_profile)
+        if fingerprinter is None:
+            fingerprinter = _RungFingerprinter(tag_map)
+        entries: dict[str, _RungFindings] = {}
+        for scope, subroutine, rung_index, rung in top_level:
+            # The index is left out of the key so that inserting or deleting
+            # a rung does not invalidate every rung after it.
+            key = f"{scope}|{subroutine}|{fingerprinter.rung_key(rung)}"
+            entry = cache._get(key)
+            if entry is None:
+                entry = _validate_rung(
+                    walk_rung(rung, scope=scope, subroutine=subroutine, rung_index=rung_index),
+                    _rung_instruction_sites(
+                        rung, scope=scope, subroutine=subroutine, rung_index=rung_index
+                    ),
+                    tag_map,
+                    mode,
+                    active_profile,
+                    rung_index,
+                )
+            else:
+                entry = entry.at_rung(scope, subroutine, rung_index)
+            entries[key] = entry
+            rung_findings.append(entry)
+        cache._replace(entries)
+
+    findings: list[ClickFinding] = []
+    for entry in rung_findings:
+        findings.extend(entry.operands)
+    for entry in rung_findings:
+        findings.extend(entry.immediate)
+    for entry in rung_findings:
+        findings.extend(entry.instructions)
 
     if active_profile is None:
         findings.append(
@@ -162,24 +283,8 @@ def validate_click_program(
             )
         )
     else:
-        for instruction, base_location in instruction_sites:
-            findings.extend(
-                _evaluate_write_targets(instruction, base_location, tag_map, active_profile, mode)
-            )
-            findings.extend(
-                _evaluate_role_assignments(
-                    instruction, base_location, tag_map, active_profile, mode
-                )
-            )
-            findings.extend(
-                _evaluate_copy_compatibility(
-                    instruction, base_location, tag_map, active_profile, mode
-                )
-            )
-            findings.extend(_evaluate_pack_text(instruction, base_location, tag_map, mode))
-            findings.extend(
-                _evaluate_drums(instruction, base_location, tag_map, active_profile, mode)
-            )
+        for entry in rung_findings:
+            findings.extend(entry.hardware)
 
     errors: list[ClickFinding] = []
     warnings: list[ClickFinding] = []
@@ -231,5 +336,6 @@ __all__ = [
     "CLK_IMMEDIATE_RANGE_MUST_BE_CONTIGUOUS",
     "CLK_TIMER_PRESET_OVERFLOW",
     "ClickFinding",
+    "ClickValidationCache",
     "ClickValidationReport",
 ]
@@ -0,0 +1,116 @@
+"""Per-rung cache for incremental Click validation."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING
+
+from .findings import ClickFinding, ValidationMode
+from .resolve import _rung_location_prefix
+
+if TYPE_CHECKING:
+    from pyrung.click.profile import HardwareProfile
+
+
+@dataclass(frozen=True)
+class _RungFindings:
+    """Findings for one top-level rung, split by validation phase.
+
+    Reports list findings phase by phase across the program, so each phase
+    is kept separately and concatenated in rung order.  ``rung_index`` is
+    the position the findings were computed at; `at_rung` moves them.
+    """
+
+    operands: tuple[ClickFinding, ...]
+    immediate: tuple[ClickFinding, ...]
+    instructions: tuple[ClickFinding, ...]
+    hardware: tuple[ClickFinding, ...]
+    rung_index: int
+
+    def at_rung(self, scope: str, subroutine: str | None, rung_index: int) -> _RungFindings:
+        """Return these findings with their locations rewritten to ``rung_index``."""
+        if rung_index == self.rung_index:
+            return self
+        # Messages quote the location too; the trailing "." keeps rung[1]
+        # from matching rung[10].
+        old = _rung_location_prefix(scope, subroutine, self.rung_index) + "."
+        new = _rung_location_prefix(scope, subroutine, rung_index) + "."
+
+        def move(findings: tuple[ClickFinding, ...]) -> tuple[ClickFinding, ...]:
+            return tuple(
+                replace(
+                    finding,
+                    location=new + finding.location[len(old) :],
+                    message=finding.message.replace(old, new),
+                    suggestion=(
+                        finding.suggestion.replace(old, new)
+                        if finding.suggestion is not None
+                        else None
+                    ),
+                )
+                if finding.location.startswith(old)
+                else finding
+                for finding in findings
+            )
+
+        return _RungFindings(
+            operands=move(self.operands),
+            immediate=move(self.immediate),
+            instructions=move(self.instructions),
+            hardware=move(self.hardware),
+            rung_index=rung_index,
+        )
+
+
+class ClickValidationCache:
+    """Reuse Click validation findings for rungs that have not changed.
+
+    Pass one cache to successive ``validate_click_program(...)`` (or
+    ``tag_map.validate(..., cache=cache)``) calls for the same program, for
+    example from an editor that validates on save.  Each top-level rung is
+    fingerprinted from its conditions, instructions, comment, and the
+    hardware addresses its tags map to, within its main or subroutine
+    scope; only new or changed rungs are walked and checked again.
+    Rebuilding the program from source, or inserting and deleting rungs
+    around it, does not invalidate an unchanged rung — its findings are
+    reused with their locations moved to its new index.
+
+    Entries not used by the most recent validation are dropped, and a
+    change of ``mode`` or hardware profile clears the cache.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, _RungFindings] = {}
+        self._context: tuple[ValidationMode, HardwareProfile | None] | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the hit/miss counters."""
+        self._entries.clear()
+        self._context = None
+        self.hits = 0
+        self.misses = 0
+
+    def _use_context(self, mode: ValidationMode, profile: HardwareProfile | None) -> None:
+        context = self._context
+        if context is None or context[0] != mode or context[1] is not profile:
+            self._entries.clear()
+            self._context = (mode, profile)
+
+    def _get(self, key: str) -> _RungFindings | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def _replace(self, entries: dict[str, _RungFindings]) -> None:
+        self._entries = entries
+
+
+__all__ = ["ClickValidationCache"]
@@ -51,12 +51,16 @@ class _OperandResolution:
     unresolved: bool = False
 
 
+def _rung_location_prefix(scope: str, subroutine: str | None, rung_index: int) -> str:
+    """Leading part of every formatted location inside one top-level rung."""
+    if scope == "subroutine":
+        return f"subroutine[{subroutine}].rung[{rung_index}]"
+    return f"main.rung[{rung_index}]"
+
+
 def _format_location(loc: ProgramLocation) -> str:
     """Convert a ProgramLocation into a deterministic human-readable string."""
-    if loc.scope == "subroutine":
-        prefix = f"subroutine[{loc.subroutine}].rung[{loc.rung_index}]"
-    else:
-        prefix = f"main.rung[{loc.rung_index}]"
+    prefix = _rung_location_prefix(loc.scope, loc.subroutine, loc.rung_index)
 
     for branch_idx in loc.branch_path:
         prefix += f".branch[{branch_idx}]"
@@ -80,15 +84,15 @@ def _instruction_location(base: ProgramLocation, arg_path: str) -> ProgramLocati
 
 
 def _resolve_pointer_memory_type(pointer_name: str, tag_map: TagMap) -> str | None:
-    """Resolve a pointer tag name to its memory_type via mapped_slots()."""
-    found_types: set[str] = set()
-    for slot in tag_map.mapped_slots():
-        if slot.logical_name == pointer_name:
-            found_types.add(slot.memory_type)
-
-    if len(found_types) == 1:
-        return next(iter(found_types))
-    return None
+    """Resolve a pointer tag name to the memory_type of its mapped slot."""
+    mapped_address = tag_map._tag_addresses.get(pointer_name)
+    if mapped_address is None:
+        return None
+    try:
+        memory_type, _ = parse_address(mapped_address)
+    except ValueError:
+        return None
+    return memory_type
 
 
 def _resolve_direct_tag(tag: Tag, tag_map: TagMap) -> _ResolvedSlot | None:
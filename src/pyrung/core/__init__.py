@@ -5,10 +5,18 @@ Redux-style architecture where logic is a pure function:
 
 Uses ScanContext for batched updates within a scan cycle,
 reducing object allocation from O(instructions) to O(1) per scan.
+
+The analysis package, the autoharness, and the Modbus send/receive
+instructions are imported on first attribute access (see
+``_LAZY_EXPORTS``), so ``import pyrung`` stays cheap for CLI commands,
+debug-adapter launches, and test workers.
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from pyrung.core._naming import PyrungNameError, PyrungNameWarning
-from pyrung.core.analysis import DataView, ProgramGraph, TagRole, TagVersion, build_program_graph
+from pyrung.core.batch_plc import BatchPLC
 from pyrung.core.compiled_plc import CompiledPLC
 from pyrung.core.context import ScanContext
 from pyrung.core.copy_converters import to_ascii, to_binary, to_text, to_value
@@ -32,16 +40,7 @@ from pyrung.core.expression import (
     sqrt,
     tan,
 )
-from pyrung.core.harness import Coupling, Harness, profile
-from pyrung.core.instruction.send_receive import (
-    ModbusAddress,
-    ModbusRtuTarget,
-    ModbusTcpTarget,
-    RegisterType,
-    WordOrder,
-    receive,
-    send,
-)
+from pyrung.core.image import ProgramImage
 from pyrung.core.memory_block import (
     Block,
     BlockRange,
@@ -136,9 +135,63 @@ from pyrung.core.time_mode import (  # noqa: F401 (TimeMode importable but not i
     normalize_unit,
 )
 
+if TYPE_CHECKING:
+    from pyrung.core.analysis import (
+        DataView,
+        ProgramGraph,
+        TagRole,
+        TagVersion,
+        build_program_graph,
+    )
+    from pyrung.core.harness import Coupling, Harness, profile
+    from pyrung.core.instruction.send_receive import (
+        ModbusAddress,
+        ModbusRtuTarget,
+        ModbusTcpTarget,
+        RegisterType,
+        WordOrder,
+        receive,
+        send,
+    )
+
+# Public name -> defining module, imported on first access.
+_LAZY_EXPORTS: dict[str, str] = {
+    "DataView": "pyrung.core.analysis",
+    "ProgramGraph": "pyrung.core.analysis",
+    "TagRole": "pyrung.core.analysis",
+    "TagVersion": "pyrung.core.analysis",
+    "build_program_graph": "pyrung.core.analysis",
+    "Coupling": "pyrung.core.harness",
+    "Harness": "pyrung.core.harness",
+    "profile": "pyrung.core.harness",
+    "ModbusAddress": "pyrung.core.instruction.send_receive",
+    "ModbusRtuTarget": "pyrung.core.instruction.send_receive",
+    "ModbusTcpTarget": "pyrung.core.instruction.send_receive",
+    "RegisterType": "pyrung.core.instruction.send_receive",
+    "WordOrder": "pyrung.core.instruction.send_receive",
+    "receive": "pyrung.core.instruction.send_receive",
+    "send": "pyrung.core.instruction.send_receive",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
 __all__ = [
     "PLC",
     "CompiledPLC",
+    "BatchPLC",
+    "ProgramImage",
     "ScanContext",
     "SystemState",
     "DataView",
@@ -62,13 +62,20 @@ def _resolve_name(
     frame: FrameType,
     *,
     stacklevel: int = 2,
+    internal: bool = False,
 ) -> str:
     """Resolve the tag/block name from an explicit string and/or inference.
 
     Returns the resolved name.  Raises `PyrungNameError` when neither an
     explicit name nor inference succeeds.  Emits `PyrungNameWarning` when
     both are present and disagree (explicit wins).
+
+    *internal* marks pyrung's own definitions (e.g. the ``system`` points),
+    which always pass an explicit name; the mismatch check is skipped for
+    them rather than parsing library source at import.
     """
+    if internal and explicit_name is not None:
+        return explicit_name
     inferred = _infer_assignment_name(frame)
     if explicit_name is None:
         if inferred is None:
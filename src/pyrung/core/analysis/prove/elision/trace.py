@@ -118,6 +118,11 @@ class TracingScanContext(ScanContext):
         for name in updates:
             self._record_access(name, "tag", _ACCESS_WRITE, False)
 
+    def set_tag_pair(self, name_a: str, value_a: Any, name_b: str, value_b: Any) -> None:
+        super().set_tag_pair(name_a, value_a, name_b, value_b)
+        self._record_access(name_a, "tag", _ACCESS_WRITE, False)
+        self._record_access(name_b, "tag", _ACCESS_WRITE, False)
+
     def get_memory(self, key: str, default: Any = None) -> Any:
         from_entry = key not in self._memory_pending
         result = super().get_memory(key, default)
@@ -5,10 +5,13 @@ that aggregate dynamic history across retained scans:
 
 - ``cold_rungs()`` — rungs that never fired
 - ``hot_rungs()`` — rungs that fired every scan
+- ``coverage_matrix()`` — per-rung fire counts, first/last fire, duty cycle
 - ``stranded_bits()`` — persistent bits with no reachable clear path
 
 These are compositions over the causal chain primitives (``cause``/``effect``)
-and the per-scan ``rung_firings`` data.
+and the range-encoded ``RungFiringTimelines``.  Rung coverage is computed
+by interval arithmetic over each rung's firing ranges, so its cost scales
+with the number of ranges, not the number of scans in the window.
 
 Limitations
 -----------
@@ -22,6 +25,9 @@ practice despite being structurally self-clearing.
 
 from __future__ import annotations
 
+import json
+import zlib
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -88,6 +94,42 @@ def _persistent_bits(logic: list[Rung]) -> list[Tag]:
     return result
 
 
+ScanWindow = tuple[int, int]
+
+
+@dataclass(frozen=True)
+class RungCoverage:
+    """Firing statistics for one rung over an inclusive scan window."""
+
+    rung_index: int
+    window: ScanWindow
+    fire_count: int
+    first_fired: int | None
+    last_fired: int | None
+
+    @property
+    def scans(self) -> int:
+        """Number of scans in the window."""
+        start, end = self.window
+        return max(0, end - start + 1)
+
+    @property
+    def duty_cycle(self) -> float:
+        """Fraction of the window's scans on which the rung fired."""
+        scans = self.scans
+        return self.fire_count / scans if scans else 0.0
+
+    @property
+    def hot(self) -> bool:
+        """True if the rung fired on every scan of a non-empty window."""
+        return self.scans > 0 and self.fire_count == self.scans
+
+    @property
+    def cold(self) -> bool:
+        """True if the rung never fired in the window."""
+        return self.fire_count == 0
+
+
 class QueryNamespace:
     """Survey namespace for whole-program dynamic analysis.
 
@@ -98,37 +140,63 @@ class QueryNamespace:
     def __init__(self, plc: PLC) -> None:
         self._plc = plc
 
-    def cold_rungs(self) -> list[int]:
+    def _default_window(self) -> ScanWindow:
+        """Retained scans, excluding the initial scan (no rung evaluation)."""
+        plc = self._plc
+        return (plc._initial_scan_id + 1, plc._state.scan_id)
+
+    def coverage_matrix(self, window: ScanWindow | None = None) -> list[RungCoverage]:
+        """Per-rung coverage over ``window`` (inclusive ``(start, end)`` scan ids).
+
+        Defaults to every retained scan after the initial one.  Returns one
+        :class:`RungCoverage` per top-level rung, indexed by rung index.
+        """
+        if window is None:
+            window = self._default_window()
+        start, end = window
+        timelines = self._plc._rung_firing_timelines
+        rows: list[RungCoverage] = []
+        for rung_index in range(len(self._plc._logic)):
+            fired, first, last = timelines.window_coverage(rung_index, start, end)
+            rows.append(
+                RungCoverage(
+                    rung_index=rung_index,
+                    window=(start, end),
+                    fire_count=fired,
+                    first_fired=first,
+                    last_fired=last,
+                )
+            )
+        return rows
+
+    def fire_counts(self, window: ScanWindow | None = None) -> dict[int, int]:
+        """Number of scans in ``window`` on which each rung fired."""
+        return {row.rung_index: row.fire_count for row in self.coverage_matrix(window)}
+
+    def cold_rungs(self, window: ScanWindow | None = None) -> list[int]:
         """Rung indices that never fired across retained history.
 
         Backed by :class:`RungFiringTimelines` — a rung with no
-        timeline (or an empty timeline) is cold.
+        timeline (or an empty timeline) is cold.  Pass ``window`` to
+        restrict the question to an inclusive ``(start, end)`` scan range.
         """
+        if window is not None:
+            return [row.rung_index for row in self.coverage_matrix(window) if row.cold]
         plc = self._plc
         total_rungs = set(range(len(plc._logic)))
         ever_fired = plc._rung_firing_timelines.ever_fired()
         return sorted(total_rungs - ever_fired)
 
-    def hot_rungs(self) -> list[int]:
+    def hot_rungs(self, window: ScanWindow | None = None) -> list[int]:
         """Rung indices that fired every scan across retained history.
 
-        A rung is "hot" if :meth:`RungFiringTimelines.fired_on` returns
-        True for every retained scan_id (excluding the initial scan,
-        which predates any rung evaluation).
+        A rung is "hot" if its firing ranges cover every retained scan_id
+        (excluding the initial scan, which predates any rung evaluation),
+        or every scan of ``window`` when given.
         """
-        plc = self._plc
-        initial_scan_id = plc._initial_scan_id
-        scan_ids = [sid for sid in plc._history.scan_ids() if sid != initial_scan_id]
-        if not scan_ids:
-            return []
-        hot = set(range(len(plc._logic)))
-        for scan_id in scan_ids:
-            hot &= plc._rung_firing_timelines.fired_on(scan_id)
-            if not hot:
-                break
-        return sorted(hot)
-
-    def stranded_bits(self) -> list[CausalChain]:
+        return [row.rung_index for row in self.coverage_matrix(window) if row.hot]
+
+    def stranded_bits(self, tags: Iterable[str] | None = None) -> list[CausalChain]:
         """Persistent bits with no reachable clear path from current state.
 
         Returns a list of ``CausalChain`` objects with ``mode='unreachable'``,
@@ -136,22 +204,36 @@ class QueryNamespace:
         *why* each bit is stranded.
 
         Only considers ``latch()``-written tags (see module docstring for
-        limitations).
+        limitations).  Pass ``tags`` to analyze only those tag names.
         """
         persistent = _persistent_bits(self._plc._logic)
+        if tags is not None:
+            wanted = set(tags)
+            persistent = [tag for tag in persistent if tag.name in wanted]
+        current = self._plc.current_state.tags
         stranded: list[CausalChain] = []
         for tag in persistent:
+            # A bit already at its default projects trivially; skip the PDG walk.
+            if current.get(tag.name) == tag.default:
+                continue
             chain = self._plc.cause(tag, to=tag.default)
             if chain is not None and chain.mode == "unreachable":
                 stranded.append(chain)
         return stranded
 
-    def report(self) -> CoverageReport:
-        """Emit a per-test coverage report for merge across a test suite."""
+    def report(self, *, stranded_tags: Iterable[str] | None = None) -> CoverageReport:
+        """Emit a per-test coverage report for merge across a test suite.
+
+        ``stranded_tags`` limits stranded-bit analysis to those tag names —
+        used by collectors that already know the merged result cannot
+        contain any other tag.
+        """
         return CoverageReport(
             cold_rungs=frozenset(self.cold_rungs()),
             hot_rungs=frozenset(self.hot_rungs()),
-            stranded_chains=frozenset(_chain_identity(c) for c in self.stranded_bits()),
+            stranded_chains=frozenset(
+                _chain_identity(c) for c in self.stranded_bits(stranded_tags)
+            ),
         )
 
 
@@ -175,6 +257,21 @@ def _chain_identity(chain: CausalChain) -> tuple[str, tuple[Any, ...]]:
     return (effect_tag, blocker_sig)
 
 
+_REPORT_FORMAT = 1
+
+
+def _rung_mask(rungs: frozenset[int]) -> str:
+    mask = 0
+    for rung_index in rungs:
+        mask |= 1 << rung_index
+    return format(mask, "x")
+
+
+def _mask_rungs(encoded: str) -> frozenset[int]:
+    mask = int(encoded, 16)
+    return frozenset(index for index in range(mask.bit_length()) if mask >> index & 1)
+
+
 @dataclass(frozen=True)
 class CoverageReport:
     """Aggregated coverage findings from one test (or merged across tests).
@@ -203,12 +300,48 @@ class CoverageReport:
             stranded_chains=self.stranded_chains & other.stranded_chains,
         )
 
+    def to_bytes(self) -> bytes:
+        """Serialize compactly for transfer between processes (e.g. xdist workers).
+
+        Rung sets are encoded as bitmasks and the payload is zlib-compressed
+        JSON, so a report stays small regardless of program size.
+        """
+        payload = {
+            "v": _REPORT_FORMAT,
+            "cold": _rung_mask(self.cold_rungs),
+            "hot": _rung_mask(self.hot_rungs),
+            "stranded": sorted(
+                (
+                    [tag, [list(blocker) for blocker in blockers]]
+                    for tag, blockers in self.stranded_chains
+                ),
+                key=repr,
+            ),
+        }
+        return zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> CoverageReport:
+        """Rebuild a report serialized by :meth:`to_bytes`."""
+        payload = json.loads(zlib.decompress(data).decode("utf-8"))
+        if payload.get("v") != _REPORT_FORMAT:
+            raise ValueError(f"Unsupported coverage report format: {payload.get('v')!r}")
+        return cls(
+            cold_rungs=_mask_rungs(payload["cold"]),
+            hot_rungs=_mask_rungs(payload["hot"]),
+            stranded_chains=frozenset(
+                (tag, tuple(tuple(blocker) for blocker in blockers))
+                for tag, blockers in payload["stranded"]
+            ),
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize for JSON output."""
         return {
             "cold_rungs": sorted(self.cold_rungs),
             "hot_rungs": sorted(self.hot_rungs),
-            "stranded_chains": sorted(
-                {"tag": tag, "blockers": list(blockers)} for tag, blockers in self.stranded_chains
-            ),
+            "stranded_chains": [
+                {"tag": tag, "blockers": list(blockers)}
+                for tag, blockers in sorted(self.stranded_chains, key=repr)
+            ],
         }
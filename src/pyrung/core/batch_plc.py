@@ -0,0 +1,236 @@
+"""Lockstep runner for many independent scenarios over one compiled program.
+
+``BatchPLC`` compiles a program once and drives N lanes -- each a
+``CompiledPLC`` sharing the same ``CompiledKernel`` -- through the same
+scans.  Lanes have their own tags, memory, patches, and forces, so a
+Monte-Carlo input sweep or a timer-preset study is one runner and one
+``run()`` call instead of N ``PLC`` instances each interpreting the
+rung tree.  Scans use the replay fast path (no ``SystemState`` per
+scan); values are read back per tag across all lanes with ``column()``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+from pyrung.core.compiled_plc import CompiledPLC
+from pyrung.core.tag import Tag
+
+if TYPE_CHECKING:
+    from pyrung.core.image import ProgramImage
+    from pyrung.core.kernel import CompiledKernel
+    from pyrung.core.program import Program
+    from pyrung.core.state import SystemState
+
+_Value = bool | int | float | str
+
+
+class BatchPLC:
+    """Run one program over many independent state vectors in lockstep.
+
+    Example::
+
+        batch = BatchPLC(logic, lanes=1000, dt=0.01)
+        batch.patch({Preset: [random.randint(50, 150) for _ in range(1000)]})
+        batch.force(Start, True)
+        batch.run_for(2.0)
+        done = batch.column(Done)          # one value per lane
+
+    Values passed to `patch()` and `force()` broadcast: a scalar goes to
+    every selected lane, a list or tuple gives one value per selected
+    lane.  ``lanes=`` restricts an update to a subset of lane indices.
+
+    Args:
+        logic: A Program, or a `ProgramImage` whose cached compiled
+            kernel is reused.
+        lanes: Number of independent scenarios.
+        dt: Fixed scan step in seconds, shared by every lane.
+        initial_state: Optional state every lane starts from.
+
+    Raises:
+        TypeError: If *logic* is neither a Program nor a ProgramImage.
+        ValueError: If *lanes* is less than 1, or the image's program
+            cannot be compiled.
+    """
+
+    def __init__(
+        self,
+        logic: Program | ProgramImage,
+        *,
+        lanes: int,
+        dt: float = 0.010,
+        initial_state: SystemState | None = None,
+    ) -> None:
+        from pyrung.core.image import ProgramImage
+        from pyrung.core.program import Program
+
+        if lanes < 1:
+            raise ValueError(f"BatchPLC requires at least one lane, got {lanes}")
+        compiled: CompiledKernel | None
+        if isinstance(logic, ProgramImage):
+            program = logic.program
+            compiled = logic.compiled_kernel()
+            if program is None or compiled is None:
+                raise ValueError("BatchPLC requires a ProgramImage whose program compiles")
+        elif isinstance(logic, Program):
+            from pyrung.circuitpy.codegen.render_kernel import compile_kernel
+
+            program = logic
+            compiled = compile_kernel(logic)
+        else:
+            raise TypeError("BatchPLC requires a Program or ProgramImage")
+
+        self._program = program
+        self._compiled = compiled
+        self._dt = float(dt)
+        self._lanes: tuple[CompiledPLC, ...] = tuple(
+            CompiledPLC(program, initial_state, dt=self._dt, compiled=compiled)
+            for _ in range(lanes)
+        )
+
+    def __len__(self) -> int:
+        return len(self._lanes)
+
+    @property
+    def lanes(self) -> int:
+        """Number of lanes."""
+        return len(self._lanes)
+
+    @property
+    def program(self) -> Program:
+        return self._program
+
+    @property
+    def compiled(self) -> CompiledKernel:
+        """Compiled kernel shared by every lane."""
+        return self._compiled
+
+    @property
+    def scan_id(self) -> int:
+        return self._lanes[0]._kernel.scan_id
+
+    @property
+    def simulation_time(self) -> float:
+        return self._lanes[0]._kernel.timestamp
+
+    def lane(self, index: int) -> CompiledPLC:
+        """Return the runner for one lane (patches, forces, and reads apply to it alone)."""
+        return self._lanes[index]
+
+    def state(self, index: int) -> SystemState:
+        """Materialize one lane's current state as a `SystemState`."""
+        return self._lanes[index]._materialize_replay_state()
+
+    # ------------------------------------------------------------------
+    # Inputs
+    # ------------------------------------------------------------------
+
+    def patch(
+        self,
+        tags: Mapping[str, _Value | Sequence[_Value]]
+        | Mapping[Tag, _Value | Sequence[_Value]]
+        | Mapping[str | Tag, _Value | Sequence[_Value]],
+        *,
+        lanes: Iterable[int] | None = None,
+    ) -> None:
+        """Queue one-shot tag values for the next scan of the selected lanes."""
+        selected = self._select(lanes)
+        per_lane: list[dict[str | Tag, _Value]] = [{} for _ in selected]
+        for key, value in tags.items():
+            for slot, lane_value in enumerate(self._broadcast(key, value, len(selected))):
+                per_lane[slot][key] = lane_value
+        for runner, updates in zip(selected, per_lane, strict=True):
+            runner.patch(updates)
+
+    def force(
+        self,
+        tag: str | Tag,
+        value: _Value | Sequence[_Value],
+        *,
+        lanes: Iterable[int] | None = None,
+    ) -> None:
+        """Hold *tag* at *value* on the selected lanes until unforced."""
+        selected = self._select(lanes)
+        for runner, lane_value in zip(
+            selected, self._broadcast(tag, value, len(selected)), strict=True
+        ):
+            runner.force(tag, lane_value)
+
+    def unforce(self, tag: str | Tag, *, lanes: Iterable[int] | None = None) -> None:
+        for runner in self._select(lanes):
+            runner.unforce(tag)
+
+    def clear_forces(self, *, lanes: Iterable[int] | None = None) -> None:
+        for runner in self._select(lanes):
+            runner.clear_forces()
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def step(self) -> None:
+        """Execute one scan on every lane."""
+        for runner in self._lanes:
+            runner.step_replay()
+
+    def run(self, cycles: int) -> None:
+        """Execute *cycles* scans on every lane."""
+        lanes = self._lanes
+        for _ in range(cycles):
+            for runner in lanes:
+                runner.step_replay()
+
+    def run_for(self, seconds: float) -> None:
+        """Advance every lane by at least *seconds* of simulation time."""
+        target_time = self.simulation_time + seconds
+        lanes = self._lanes
+        lead = lanes[0]._kernel
+        while lead.timestamp < target_time:
+            for runner in lanes:
+                runner.step_replay()
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def column(self, tag: str | Tag) -> list[_Value]:
+        """Current value of *tag* in every lane, in lane order."""
+        name = tag.name if isinstance(tag, Tag) else tag
+        default = self._default_for(name)
+        return [runner._kernel.tags.get(name, default) for runner in self._lanes]
+
+    def columns(self, *tags: str | Tag) -> dict[str, list[_Value]]:
+        """`column()` for several tags, keyed by tag name."""
+        return {(tag.name if isinstance(tag, Tag) else tag): self.column(tag) for tag in tags}
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _select(self, lanes: Iterable[int] | None) -> tuple[CompiledPLC, ...]:
+        if lanes is None:
+            return self._lanes
+        return tuple(self._lanes[index] for index in lanes)
+
+    def _broadcast(self, key: str | Tag, value: Any, count: int) -> Sequence[_Value]:
+        if isinstance(value, list | tuple):
+            if len(value) != count:
+                name = key.name if isinstance(key, Tag) else key
+                raise ValueError(
+                    f"Per-lane values for {name!r} have length {len(value)}, expected {count}"
+                )
+            return value
+        return [value] * count
+
+    def _default_for(self, name: str) -> _Value | None:
+        tag = self._compiled.referenced_tags.get(name)
+        if tag is not None:
+            return tag.default
+        for spec in self._compiled.block_specs.values():
+            if name in spec.tag_names:
+                return spec.default
+        return None
+
+
+__all__ = ["BatchPLC"]
@@ -171,7 +171,12 @@ class CompiledPLC:
             fixed_step_dt_getter=lambda: self._dt,
             rtc_now_getter=self._rtc_at_sim_time,
             rtc_setter=self._set_rtc_internal,
+            scan_exec_sampler=lambda _ctx: self._this_scan_exec_sample,
         )
+        # Replay hands in the ``sys.scan_exec_*`` sample the live scan read;
+        # this runner never measures its own.
+        self._scan_exec_for_next_scan: tuple[int, ...] | None = None
+        self._this_scan_exec_sample: tuple[int, ...] | None = None
         self._input_overrides = InputOverrideManager(is_read_only=self._system_runtime.is_read_only)
         self._pending_patches = self._input_overrides.pending_patches
         self._forces = self._input_overrides.forces_mutable
@@ -286,6 +291,8 @@ class CompiledPLC:
 
     def step(self) -> SystemState:
         self._ensure_running()
+        self._this_scan_exec_sample = self._scan_exec_for_next_scan
+        self._scan_exec_for_next_scan = None
 
         scan_id = self._kernel.scan_id
         timestamp = self._kernel.timestamp
@@ -346,6 +353,8 @@ class CompiledPLC:
     def step_replay(self) -> None:
         """Lightweight step for replay — no SystemState construction."""
         self._ensure_running()
+        self._this_scan_exec_sample = self._scan_exec_for_next_scan
+        self._scan_exec_for_next_scan = None
 
         ctx = _KernelRuntimeContext(
             tags=self._kernel.tags,
@@ -503,3 +503,107 @@ def _normalize_and_condition(
     if len(normalized) == 1:
         return normalized[0]
     return AllCondition(*normalized)
+
+
+# =============================================================================
+# Compiled evaluation
+# =============================================================================
+
+_COMPARE_OPS: dict[type[Condition], str] = {
+    CompareEq: "==",
+    CompareNe: "!=",
+    CompareLt: "<",
+    CompareLe: "<=",
+    CompareGt: ">",
+    CompareGe: ">=",
+}
+
+
+class _ConditionCompiler:
+    """Emit one Python expression for a condition tree.
+
+    Leaves read through ``view.get_tag`` / ``view.get_memory`` exactly as
+    their ``evaluate()`` does, with tag names and literals baked in.
+    Condition types without a rule here (indirect compares, derived
+    system edges, subclasses) are called through their own ``evaluate``.
+    """
+
+    def __init__(self) -> None:
+        self.namespace: dict[str, Any] = {}
+        self.uses_memory = False
+
+    def const(self, value: Any) -> str:
+        if value is None or type(value) in (bool, int, str):
+            return repr(value)
+        symbol = f"_k{len(self.namespace)}"
+        self.namespace[symbol] = value
+        return symbol
+
+    def tag(self, tag: Tag, default: Any) -> str:
+        return f"_get({tag.name!r}, {self.const(default)})"
+
+    def operand(self, value: Any, kind: int) -> str:
+        if kind == _VALUE_TAG:
+            return self.tag(value, value.default)
+        if kind == _VALUE_EXPR:
+            return f"{self.const(value)}.evaluate(view)"
+        return self.const(value)
+
+    def emit(self, cond: Condition) -> tuple[str, bool]:
+        """Return ``(expression, always_bool)`` for *cond*."""
+        kind = type(cond)
+        if kind is BitCondition:
+            return f"bool({self.tag(cond._resolved_tag, False)})", True
+        if kind is NormallyClosedCondition:
+            return f"(not {self.tag(cond._resolved_tag, False)})", True
+        if kind is IntTruthyCondition:
+            return f"(int({self.tag(cond.tag, cond.tag.default)}) != 0)", True
+        if kind is CompareEq or kind is CompareNe:
+            value_kind = _VALUE_TAG if cond._value_is_tag else _VALUE_LITERAL
+            left = self.tag(cond.tag, cond.tag.default)
+            right = self.operand(cond.value, value_kind)
+            return f"({left} {_COMPARE_OPS[kind]} {right})", False
+        if kind in _COMPARE_OPS:
+            left = self.tag(cond.tag, cond.tag.default)
+            right = self.operand(cond.value, cond._value_kind)
+            return f"({left} {_COMPARE_OPS[kind]} {right})", False
+        if kind is RisingEdgeCondition and cond._edge_fn is None:
+            self.uses_memory = True
+            current = self.tag(cond._resolved_tag, False)
+            return f"(bool({current}) and not _mem({cond._prev_key!r}, False))", True
+        if kind is FallingEdgeCondition and cond._edge_fn is None:
+            self.uses_memory = True
+            current = self.tag(cond._resolved_tag, False)
+            return f"(not {current} and bool(_mem({cond._prev_key!r}, False)))", True
+        if kind is AllCondition or kind is AnyCondition:
+            joiner = " and " if kind is AllCondition else " or "
+            parts = [self.emit(child) for child in cond.conditions]
+            expr = "(" + joiner.join(part for part, _ in parts) + ")"
+            return expr, all(is_bool for _, is_bool in parts)
+        return f"{self.const(cond)}.evaluate(view)", False
+
+
+def _compile_conditions(
+    conditions: list[Condition],
+) -> Callable[[ScanContext | ConditionView], bool]:
+    """Compile ANDed *conditions* into a single function of the condition view.
+
+    The result matches evaluating each condition in order and stopping at
+    the first false one, without a method call per tree node.  The
+    condition objects stay the source of truth for tracing and debugging.
+    """
+    compiler = _ConditionCompiler()
+    if conditions:
+        parts = [compiler.emit(cond) for cond in conditions]
+        expr = " and ".join(part for part, _ in parts)
+        if not all(is_bool for _, is_bool in parts):
+            expr = f"bool({expr})"
+    else:
+        expr = "True"
+    lines = ["def _conditions(view):", "    _get = view.get_tag"]
+    if compiler.uses_memory:
+        lines.append("    _mem = view.get_memory")
+    lines.append(f"    return {expr}")
+    namespace = compiler.namespace
+    exec("\n".join(lines), namespace)
+    return namespace["_conditions"]
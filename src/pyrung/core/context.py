@@ -19,6 +19,8 @@ if TYPE_CHECKING:
 
 TagResolver = Callable[[str, Any], tuple[bool, Any]]
 
+_MISSING = object()
+
 
 class ConditionView:
     """Frozen read-only view of tag/memory state for condition evaluation.
@@ -40,8 +42,9 @@ class ConditionView:
     def get_tag(self, name: str, default: Any = None) -> Any:
         if name in self._tags_snapshot:
             return self._tags_snapshot[name]
-        if name in self._state.tags:
-            return self._state.tags[name]
+        value = self._state.tags.get(name, _MISSING)
+        if value is not _MISSING:
+            return value
         if self._resolver is not None:
             resolved, value = self._resolver(name, self)
             if resolved:
@@ -118,6 +121,7 @@ class ScanContext:
         "_replay_io_submits",
         "_replay_io_drains",
         "_is_replay_io",
+        "_scan_dt",
     )
 
     def __init__(
@@ -159,6 +163,7 @@ class ScanContext:
         self._io_submit_staging: dict[str, IoSubmitRecord] = {}
         self._io_drain_staging: dict[str, IoResultRecord] = {}
         self._is_replay_io: bool = replay_io is not None
+        self._scan_dt: float | None = None
         self._replay_io_submits: Mapping[str, IoSubmitRecord] = (
             replay_io[0] if replay_io is not None else {}
         )
@@ -184,8 +189,9 @@ class ScanContext:
         """
         if name in self._tags_pending:
             return self._tags_pending[name]
-        if name in self._state.tags:
-            return self._state.tags[name]
+        value = self._state.tags.get(name, _MISSING)
+        if value is not _MISSING:
+            return value
         if self._resolver is not None:
             resolved, value = self._resolver(name, self)
             if resolved:
@@ -237,6 +243,23 @@ class ScanContext:
         for name, value in updates.items():
             self._tags_evolver[name] = value
 
+    def set_tag_pair(self, name_a: str, value_a: Any, name_b: str, value_b: Any) -> None:
+        """Set two tag values without building an update dict.
+
+        Timers, counters, and drums write a done/step bit and an
+        accumulator every scan; this is `set_tags` for that fixed shape.
+        """
+        read_only = self._read_only_tags
+        if read_only and (name_a in read_only or name_b in read_only):
+            name = name_a if name_a in read_only else name_b
+            raise ValueError(f"Tag '{name}' is read-only system point and cannot be written")
+        pending = self._tags_pending
+        evolver = self._tags_evolver
+        pending[name_a] = value_a
+        pending[name_b] = value_b
+        evolver[name_a] = value_a
+        evolver[name_b] = value_b
+
     def _set_tag_internal(self, name: str, value: Any) -> None:
         """Set a tag while bypassing read-only guards (runtime-only use)."""
         self._tags_pending[name] = value
@@ -302,6 +325,18 @@ class ScanContext:
         """Current timestamp from the original state."""
         return self._state.timestamp
 
+    @property
+    def dt(self) -> float:
+        """Scan time step in seconds.
+
+        The runner sets this once per scan; contexts built directly (unit
+        tests, tooling) fall back to the ``_dt`` memory value.
+        """
+        dt = self._scan_dt
+        if dt is None:
+            return self.get_memory("_dt", 0.0)
+        return dt
+
     @property
     def original_state(self) -> SystemState:
         """Access to the original (unmodified) state.
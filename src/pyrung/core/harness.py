@@ -13,11 +13,13 @@ from pyrung.core.tag import TagType
 
 if TYPE_CHECKING:
     from pyrung.core.runner import PLC
+    from pyrung.core.state import SystemState
 
 _profile_registry: dict[str, Callable[..., Any]] = {}
+_vectorized_profiles: set[str] = set()
 
 
-def profile(name: str) -> Callable[..., Any]:
+def profile(name: str, *, vectorized: bool = False) -> Callable[..., Any]:
     """Register an analog feedback profile function.
 
     The decorated function is called once per scan tick for each active
@@ -28,28 +30,28 @@ def profile(name: str) -> Callable[..., Any]:
             if en:
                 return cur + 0.5 * dt
             return cur
+
+    With ``vectorized=True`` it is called once per scan tick for all
+    active couplings using the profile, with parallel lists of current
+    values and enable states, and returns the new values in the same
+    order::
+
+        @profile("generic_thermal", vectorized=True)
+        def generic_thermal(cur, en, dt):
+            return [c + 0.5 * dt if e else c for c, e in zip(cur, en)]
     """
 
     def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
         _profile_registry[name] = fn
+        if vectorized:
+            _vectorized_profiles.add(name)
+        else:
+            _vectorized_profiles.discard(name)
         return fn
 
     return decorator
 
 
-@dataclass
-class _ScheduledPatch:
-    target_scan: int
-    tag_name: str
-    value: bool | int | float | str
-    _seq: int = 0
-
-    def __lt__(self, other: _ScheduledPatch) -> bool:
-        if self.target_scan != other.target_scan:
-            return self.target_scan < other.target_scan
-        return self._seq < other._seq
-
-
 @dataclass(frozen=True)
 class Coupling:
     """Public view of one enable→feedback coupling discovered by the harness."""
@@ -80,6 +82,20 @@ class _ProfileCoupling:
     trigger_value: int | str | None = None
 
 
+@dataclass
+class _EnableGroup:
+    """Couplings driven by one enable tag, with delays pre-converted to scans.
+
+    Bool entries are ``(fb_name, on_scans, off_scans)``; trigger entries
+    prepend the trigger value.
+    """
+
+    plain_bool: list[tuple[str, int, int]] = field(default_factory=list)
+    trigger_bool: list[tuple[int | str, str, int, int]] = field(default_factory=list)
+    plain_analog: list[_ProfileCoupling] = field(default_factory=list)
+    trigger_analog: list[_ProfileCoupling] = field(default_factory=list)
+
+
 def _parse_link_spec(link: str) -> tuple[str, str | None]:
     name, _, trigger = link.partition(":")
     return (name, trigger or None)
@@ -112,9 +128,10 @@ def _resolve_trigger_value(trigger_raw: str, en_tag: Any) -> int | str:
 class Harness:
     """Automatic feedback harness driven by Physical + link= declarations.
 
-    Walks all known tags to find link= couplings, installs edge monitors
-    on En tags, and schedules Fb patches using declared timing (bool) or
-    profile functions (analog).
+    Walks all known tags to find link= couplings, indexes them by En tag,
+    and schedules Fb patches using declared timing (bool) or profile
+    functions (analog).  En edges are read from each committed scan's
+    changed-tag set, so idle couplings cost nothing per scan.
 
     Usage::
 
@@ -125,20 +142,24 @@ class Harness:
     """
 
     _plc: PLC = field(repr=False)
-    _heap: list[_ScheduledPatch] = field(default_factory=list, init=False)
+    _heap: list[tuple[int, int, str, Any]] = field(default_factory=list, init=False)
     _seq: int = field(default=0, init=False)
     _bool_couplings: list[_BoolCoupling] = field(default_factory=list, init=False)
     _profile_couplings: list[_ProfileCoupling] = field(default_factory=list, init=False)
-    _monitors: list[Any] = field(default_factory=list, init=False)
+    _enable_groups: dict[str, _EnableGroup] = field(default_factory=dict, init=False)
+    _active_profiles: dict[str, list[_ProfileCoupling]] = field(default_factory=dict, init=False)
     _installed: bool = field(default=False, init=False)
 
     def __init__(self, plc: PLC) -> None:
         self._plc = plc
-        self._heap: list[_ScheduledPatch] = []
+        # Entries are ``(target_scan, seq, fb_name, value)``; ``seq`` keeps
+        # same-scan patches in scheduling order.
+        self._heap: list[tuple[int, int, str, Any]] = []
         self._seq = 0
         self._bool_couplings: list[_BoolCoupling] = []
         self._profile_couplings: list[_ProfileCoupling] = []
-        self._monitors: list[Any] = []
+        self._enable_groups: dict[str, _EnableGroup] = {}
+        self._active_profiles: dict[str, list[_ProfileCoupling]] = {}
         self._installed = False
         self.on_patches_applied: Callable[[list[tuple[str, Any, str]]], None] | None = None
 
@@ -147,23 +168,27 @@ class Harness:
             return
         self._installed = True
         self._discover_couplings()
-        self._install_monitors()
+        self._build_enable_groups()
         self._plc._pre_scan_callbacks.append(self._on_pre_scan)
+        self._plc._post_commit_callbacks.append(self._on_commit)
 
     def uninstall(self) -> None:
         if not self._installed:
             return
         self._installed = False
-        for handle in self._monitors:
-            handle.remove()
-        self._monitors.clear()
-        try:
-            self._plc._pre_scan_callbacks.remove(self._on_pre_scan)
-        except ValueError:
-            pass
+        for callbacks, callback in (
+            (self._plc._pre_scan_callbacks, self._on_pre_scan),
+            (self._plc._post_commit_callbacks, self._on_commit),
+        ):
+            try:
+                callbacks.remove(callback)
+            except ValueError:
+                pass
         self._heap.clear()
         self._bool_couplings.clear()
         self._profile_couplings.clear()
+        self._enable_groups.clear()
+        self._active_profiles.clear()
 
     @property
     def pending_count(self) -> int:
@@ -177,21 +202,23 @@ class Harness:
             yield Coupling(c.en_name, c.fb_name, c.physical, c.trigger_value)
 
     def _schedule(self, target_scan: int, tag_name: str, value: Any) -> None:
-        entry = _ScheduledPatch(target_scan, tag_name, value, self._seq)
+        heapq.heappush(self._heap, (target_scan, self._seq, tag_name, value))
         self._seq += 1
-        heapq.heappush(self._heap, entry)
 
     def _drain_due(self) -> dict[str, Any]:
+        heap = self._heap
+        if not heap:
+            return {}
         next_scan = self._plc.current_state.scan_id + 1
         patches: dict[str, Any] = {}
-        while self._heap and self._heap[0].target_scan <= next_scan:
-            entry = heapq.heappop(self._heap)
-            patches[entry.tag_name] = entry.value
+        while heap and heap[0][0] <= next_scan:
+            _target, _seq, tag_name, value = heapq.heappop(heap)
+            patches[tag_name] = value
         return patches
 
     def _on_pre_scan(self) -> None:
         bool_patches = self._drain_due()
-        analog_details = self._tick_analog_with_provenance()
+        analog_details = self._tick_analog_with_provenance() if self._active_profiles else []
 
         all_patches = dict(bool_patches)
         for tag_name, value, _profile in analog_details:
@@ -208,24 +235,36 @@ class Harness:
             self.on_patches_applied(notifications)
 
     def _tick_analog_with_provenance(self) -> list[tuple[str, Any, str]]:
+        state = self._plc.current_state
+        tags = state.tags
+        dt = state.memory.get("_dt", self._plc._dt)
         results: list[tuple[str, Any, str]] = []
-        for coupling in self._profile_couplings:
-            if not coupling.active:
-                continue
-            fn = _profile_registry.get(coupling.profile_name)
+        for profile_name, couplings in self._active_profiles.items():
+            fn = _profile_registry.get(profile_name)
             if fn is None:
                 continue
-            state = self._plc.current_state
-            cur = state.tags.get(coupling.fb_name, 0.0)
-            en_raw = state.tags.get(coupling.en_name, False)
-            if coupling.trigger_value is not None:
-                en = en_raw == coupling.trigger_value
+            cur = [tags.get(c.fb_name, 0.0) for c in couplings]
+            en = [
+                tags.get(c.en_name, False) == c.trigger_value
+                if c.trigger_value is not None
+                else bool(tags.get(c.en_name, False))
+                for c in couplings
+            ]
+            if profile_name in _vectorized_profiles:
+                values = fn(cur, en, dt)
             else:
-                en = bool(en_raw)
-            dt = state.memory.get("_dt", self._plc._dt)
-            results.append((coupling.fb_name, fn(cur, en, dt), coupling.profile_name))
+                values = [fn(c, e, dt) for c, e in zip(cur, en, strict=True)]
+            results.extend(
+                (c.fb_name, value, profile_name) for c, value in zip(couplings, values, strict=True)
+            )
         return results
 
+    def _activate(self, coupling: _ProfileCoupling) -> None:
+        if coupling.active:
+            return
+        coupling.active = True
+        self._active_profiles.setdefault(coupling.profile_name, []).append(coupling)
+
     def _discover_couplings(self) -> None:
         seen_runtimes: set[int] = set()
         for tag in list(self._plc._known_tags_by_name.values()):
@@ -301,70 +340,62 @@ class Harness:
                 )
             )
 
-    def _install_monitors(self) -> None:
-        en_to_bool: dict[str, list[_BoolCoupling]] = {}
+    def _build_enable_groups(self) -> None:
+        groups = self._enable_groups
         for coupling in self._bool_couplings:
-            en_to_bool.setdefault(coupling.en_name, []).append(coupling)
-
-        en_to_analog: dict[str, list[_ProfileCoupling]] = {}
+            group = groups.setdefault(coupling.en_name, _EnableGroup())
+            on_scans = self._delay_scans(coupling.on_delay_ms)
+            off_scans = self._delay_scans(coupling.off_delay_ms)
+            if coupling.trigger_value is None:
+                group.plain_bool.append((coupling.fb_name, on_scans, off_scans))
+            else:
+                group.trigger_bool.append(
+                    (coupling.trigger_value, coupling.fb_name, on_scans, off_scans)
+                )
         for coupling in self._profile_couplings:
-            en_to_analog.setdefault(coupling.en_name, []).append(coupling)
-
-        all_en_names = set(en_to_bool) | set(en_to_analog)
-        for en_name in all_en_names:
-            bool_couplings = en_to_bool.get(en_name, [])
-            analog_couplings = en_to_analog.get(en_name, [])
-            handle = self._plc.monitor(
-                en_name,
-                self._make_en_callback(bool_couplings, analog_couplings),
-            )
-            self._monitors.append(handle)
+            group = groups.setdefault(coupling.en_name, _EnableGroup())
+            if coupling.trigger_value is None:
+                group.plain_analog.append(coupling)
+            else:
+                group.trigger_analog.append(coupling)
 
-    def _make_en_callback(
+    def _on_commit(
         self,
-        bool_couplings: list[_BoolCoupling],
-        analog_couplings: list[_ProfileCoupling],
-    ) -> Callable[[Any, Any], None]:
-        dt_ms = self._plc._dt * 1000
-        plain_bool = [c for c in bool_couplings if c.trigger_value is None]
-        trigger_bool = [c for c in bool_couplings if c.trigger_value is not None]
-        plain_analog = [c for c in analog_couplings if c.trigger_value is None]
-        trigger_analog = [c for c in analog_couplings if c.trigger_value is not None]
-
-        def on_en_change(current: Any, previous: Any) -> None:
-            scan_id = self._plc.current_state.scan_id
-
-            cur_bool = bool(current)
-            prev_bool = bool(previous)
-            if cur_bool != prev_bool:
-                rising = cur_bool and not prev_bool
-                for coupling in plain_bool:
-                    delay_ms = coupling.on_delay_ms if rising else coupling.off_delay_ms
-                    delay_scans = max(1, ceil(delay_ms / dt_ms))
-                    target = scan_id + delay_scans
-                    self._schedule(target, coupling.fb_name, rising)
-                for coupling in plain_analog:
-                    coupling.active = True
-
-            for coupling in trigger_bool:
-                was_match = previous == coupling.trigger_value
-                is_match = current == coupling.trigger_value
-                if was_match == is_match:
-                    continue
-                on_edge = is_match
-                delay_ms = coupling.on_delay_ms if on_edge else coupling.off_delay_ms
-                delay_scans = max(1, ceil(delay_ms / dt_ms))
-                target = scan_id + delay_scans
-                self._schedule(target, coupling.fb_name, on_edge)
-
-            for coupling in trigger_analog:
-                was_match = previous == coupling.trigger_value
-                is_match = current == coupling.trigger_value
-                if was_match == is_match:
-                    continue
-                coupling.active = True
+        previous_state: SystemState,
+        current_state: SystemState,
+        changed_tags: frozenset[str],
+        _firings: Any,
+    ) -> None:
+        groups = self._enable_groups
+        if not changed_tags or not groups:
+            return
+        if len(changed_tags) <= len(groups):
+            en_names = [name for name in changed_tags if name in groups]
+        else:
+            en_names = [name for name in groups if name in changed_tags]
+        for en_name in en_names:
+            previous = previous_state.tags.get(en_name)
+            current = current_state.tags.get(en_name)
+            if current != previous:
+                self._on_en_change(groups[en_name], current, previous, current_state.scan_id)
+
+    def _on_en_change(self, group: _EnableGroup, current: Any, previous: Any, scan_id: int) -> None:
+        cur_bool = bool(current)
+        if cur_bool != bool(previous):
+            for fb_name, on_scans, off_scans in group.plain_bool:
+                self._schedule(scan_id + (on_scans if cur_bool else off_scans), fb_name, cur_bool)
+            for coupling in group.plain_analog:
+                self._activate(coupling)
+
+        for trigger, fb_name, on_scans, off_scans in group.trigger_bool:
+            is_match = current == trigger
+            if (previous == trigger) == is_match:
+                continue
+            self._schedule(scan_id + (on_scans if is_match else off_scans), fb_name, is_match)
 
-        return on_en_change
+        for coupling in group.trigger_analog:
+            if (previous == coupling.trigger_value) != (current == coupling.trigger_value):
+                self._activate(coupling)
 
     def _delay_scans(self, delay_ms: int) -> int:
         dt_ms = self._plc._dt * 1000
@@ -15,7 +15,7 @@ through its back-reference to the owning ``PLC``.  Labels remain on
 from __future__ import annotations
 
 from collections import deque
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
@@ -35,6 +35,57 @@ class LabeledSnapshot:
     rtc_offset_seconds: float | None = None
 
 
+@dataclass(frozen=True)
+class HistoryColumns:
+    """Column-oriented tag values over a contiguous scan range.
+
+    ``values[tag][i]`` is the committed value of ``tag`` at scan
+    ``start_scan_id + i``; tags absent from a state read as ``None``.
+    Built by :meth:`History.columns` so analyses that sweep many scans
+    index plain lists instead of materializing one ``SystemState`` per
+    lookup.
+    """
+
+    start_scan_id: int
+    values: dict[str, list[Any]]
+    length: int
+
+    @property
+    def scan_ids(self) -> range:
+        """Scan ids covered by the columns (oldest -> newest)."""
+        return range(self.start_scan_id, self.start_scan_id + self.length)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __contains__(self, scan_id: object) -> bool:
+        return isinstance(scan_id, int) and 0 <= scan_id - self.start_scan_id < self.length
+
+    def value_at(self, tag: str, scan_id: int) -> Any:
+        """Return ``tag``'s value at ``scan_id`` (must be covered)."""
+        return self.values[tag][scan_id - self.start_scan_id]
+
+    def edges(self, tag: str) -> list[tuple[int, Any, Any]]:
+        """Return ``(scan_id, old, new)`` for every scan where ``tag`` changed."""
+        column = self.values[tag]
+        start = self.start_scan_id
+        return [
+            (start + i, previous, current)
+            for i, (previous, current) in enumerate(zip(column, column[1:], strict=False), 1)
+            if previous != current
+        ]
+
+    def true_mask(self, tag: str) -> int:
+        """Return a bitmask with bit ``i`` set where the value is exactly ``True``.
+
+        Bool analyses combine masks with ``&`` / ``~`` and ``int.bit_count``
+        so whole-range set algebra runs at C speed.
+        """
+        column = self.values[tag]
+        bits = "".join("1" if value is True else "0" for value in reversed(column))
+        return int(bits, 2) if bits else 0
+
+
 class History:
     """Read-only query surface for historical ``SystemState``.
 
@@ -59,7 +110,8 @@ class History:
         and scan-log checkpoints return live snapshots.  Older scans
         are reconstructed via ``plc.replay_to(scan_id).current_state``;
         each reconstruction forks from the nearest checkpoint and
-        walks the scan log forward.
+        walks the scan log forward.  On a runner created by ``fork()``,
+        scans before the fork point are read from the parent's history.
 
         Raises:
             KeyError: ``scan_id`` falls outside the addressable range
@@ -92,6 +144,34 @@ class History:
         cached = [state for sid, (state, _) in cache.items() if window_lo <= sid <= hi]
         return replayed + cached
 
+    def columns(self, tags: Iterable[str], start_scan_id: int, end_scan_id: int) -> HistoryColumns:
+        """Export tag values for ``start <= scan_id < end`` as per-tag columns.
+
+        States come from a single :meth:`range` call, so scans older than
+        the recent-state cache cost one forward replay rather than one
+        reconstruction per scan.  Consecutive scans that share the same
+        tag map (idle scans) reuse the previous row.
+        """
+        names = list(dict.fromkeys(tags))
+        states = self.range(start_scan_id, end_scan_id)
+        values: dict[str, list[Any]] = {name: [] for name in names}
+        if not states:
+            return HistoryColumns(
+                start_scan_id=max(start_scan_id, self.oldest_scan_id), values=values, length=0
+            )
+
+        columns = [values[name] for name in names]
+        previous_tags = None
+        row: list[Any] = []
+        for state in states:
+            tags_map = state.tags
+            if tags_map is not previous_tags:
+                row = [tags_map.get(name) for name in names]
+                previous_tags = tags_map
+            for column, value in zip(columns, row, strict=True):
+                column.append(value)
+        return HistoryColumns(start_scan_id=states[0].scan_id, values=values, length=len(states))
+
     def latest(self, n: int) -> list[SystemState]:
         """Return up to the latest ``n`` states (oldest -> newest)."""
         if n <= 0:
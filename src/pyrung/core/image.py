@@ -0,0 +1,296 @@
+"""Precomputed program images shared by many runners.
+
+Building a ``PLC`` walks the logic to register every referenced tag,
+indexes tag constraints, and seeds an initial state with tag defaults;
+the first captured scan then builds the program dependency graph, and
+the first replay compiles a kernel.  None of that depends on the
+runner, so a `ProgramImage` does it once and any number of runners --
+``PLC(image)``, ``plc.reset_to(image)``, or ``fork()`` -- share it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from pyrung.core.bounds import build_constraint_index
+from pyrung.core.kernel import CompiledKernel
+from pyrung.core.state import SystemState
+from pyrung.core.system_points import (
+    _BATTERY_PRESENT_KEY,
+    _MODE_RUN_KEY,
+    READ_ONLY_SYSTEM_TAG_NAMES,
+    SYSTEM_TAGS_BY_NAME,
+)
+
+if TYPE_CHECKING:
+    from pyrung.core.analysis.pdg import ProgramGraph
+    from pyrung.core.rung import Rung
+    from pyrung.core.tag import Tag
+
+
+def _iter_referenced_tags(root: Any) -> tuple[Tag, ...]:
+    """Collect Tag objects reachable from a logic object graph."""
+    from pyrung.core.tag import Tag as TagClass
+
+    found_by_name: dict[str, TagClass] = {}
+    visited: set[int] = set()
+    queue: list[Any] = [root]
+
+    while queue:
+        current = queue.pop()
+        if current is None:
+            continue
+        if isinstance(current, TagClass):
+            found_by_name[current.name] = current
+            continue
+        if isinstance(current, (str, bytes, bytearray, int, float, bool)):
+            continue
+
+        current_id = id(current)
+        if current_id in visited:
+            continue
+        visited.add(current_id)
+
+        if isinstance(current, Mapping):
+            queue.extend(current.keys())
+            queue.extend(current.values())
+            continue
+        if isinstance(current, tuple | list | set | frozenset):
+            queue.extend(current)
+            continue
+
+        if hasattr(current, "__dict__"):
+            queue.extend(vars(current).values())
+            continue
+        if hasattr(current, "__slots__"):
+            for slot in current.__slots__:
+                if slot in {"__weakref__", "__dict__"}:
+                    continue
+                if hasattr(current, slot):
+                    queue.append(getattr(current, slot))
+
+    return tuple(found_by_name.values())
+
+
+def _register_known_tag(known: dict[str, Tag], tag: Tag) -> None:
+    """Add *tag* to *known*, rejecting a same-named tag with other metadata."""
+    if tag.name in SYSTEM_TAGS_BY_NAME:
+        return
+    existing = known.get(tag.name)
+    if existing is None:
+        known[tag.name] = tag
+        return
+    if (
+        existing.type != tag.type
+        or existing.retentive != tag.retentive
+        or existing.default != tag.default
+    ):
+        raise ValueError(
+            f"Conflicting tag metadata for {tag.name!r}: existing "
+            f"(type={existing.type.name}, retentive={existing.retentive}, "
+            f"default={existing.default!r}) vs new "
+            f"(type={tag.type.name}, retentive={tag.retentive}, default={tag.default!r})."
+        )
+
+
+def _program_writes_read_only_system_tags(program: Any) -> bool:
+    from pyrung.core.program import Program
+    from pyrung.core.validation._common import _collect_write_sites
+    from pyrung.core.validation.readonly_write import _any_write_targets
+
+    if not isinstance(program, Program):
+        return False
+    for site in _collect_write_sites(program, target_extractor=_any_write_targets):
+        if site.target_name in READ_ONLY_SYSTEM_TAG_NAMES:
+            return True
+    return False
+
+
+def _looks_like_compiled_replay_gap(exc: Exception) -> bool:
+    if isinstance(exc, NotImplementedError):
+        return True
+    if not isinstance(exc, ValueError | TypeError):
+        return False
+    message = str(exc)
+    return any(
+        needle in message
+        for needle in (
+            "requires generate_circuitpy",
+            "Could not inspect source for callable",
+            "Unsupported",
+        )
+    )
+
+
+class ProgramImage:
+    """Runner-independent setup for one program, built once and shared.
+
+    Holds the tag registry, constraint index, and default-seeded initial
+    state eagerly, and builds the program dependency graph, the set of
+    tags the firing capture keeps, and the compiled replay kernel on
+    first use.  Everything is read-only once built, so one image can back
+    every runner in a test session::
+
+        image = ProgramImage(logic)
+        plc = PLC(image, dt=0.01)
+        ...
+        plc.reset_to(image)   # fresh runner state, no logic walk
+
+    Args:
+        logic: Program, list of rungs, or None -- anything ``PLC()`` accepts.
+        compile: Build the dependency graph and compiled replay kernel now
+            instead of on first use.
+
+    Editing the program after building an image is not detected; build a
+    new image instead.
+    """
+
+    __slots__ = (
+        "program",
+        "logic",
+        "_known_tags",
+        "_constrained_tags",
+        "_initial_state",
+        "_pdg",
+        "_consumed_tags",
+        "_kernel",
+    )
+
+    def __init__(self, logic: list[Any] | Any = None, *, compile: bool = False) -> None:
+        from pyrung.core.program import Program
+
+        self.program: Program | None = None
+        self.logic: list[Rung]
+        if logic is None:
+            self.logic = []
+        elif isinstance(logic, Program):
+            self.logic = logic.rungs
+            self.program = logic
+        elif isinstance(logic, list):
+            self.logic = logic
+        else:
+            self.logic = [logic]
+
+        known: dict[str, Tag] = {}
+        for rung in self.logic:
+            for tag in _iter_referenced_tags(rung):
+                _register_known_tag(known, tag)
+        if self.program is not None:
+            for subroutine_rungs in self.program.subroutines.values():
+                for rung in subroutine_rungs:
+                    for tag in _iter_referenced_tags(rung):
+                        _register_known_tag(known, tag)
+        self._known_tags = known
+        self._constrained_tags = build_constraint_index(known)
+
+        state = SystemState()
+        memory = state.memory.set(_MODE_RUN_KEY, True).set(_BATTERY_PRESENT_KEY, True)
+        self._initial_state = state.set(memory=memory).with_tags(
+            {tag.name: tag.default for tag in known.values()}
+        )
+
+        self._pdg: ProgramGraph | None = None
+        # ``None`` = not built yet, ``False`` = not available for this logic.
+        self._consumed_tags: frozenset[str] | bool | None = None
+        self._kernel: CompiledKernel | bool | None = None
+        if compile:
+            self.consumed_tags  # noqa: B018 - builds the PDG as a side effect
+            self.compiled_kernel()
+
+    @property
+    def tags(self) -> MappingProxyType[str, Tag]:
+        """Read-only mapping of tag name to Tag for every tag the logic references."""
+        return MappingProxyType(self._known_tags)
+
+    @property
+    def initial_state(self) -> SystemState:
+        """Scan-0 state in RUN mode with every known tag at its default."""
+        return self._initial_state
+
+    @property
+    def pdg(self) -> ProgramGraph:
+        """Static program dependency graph, built on first access."""
+        if self._pdg is None:
+            from pyrung.core.analysis.pdg import build_program_graph
+            from pyrung.core.program import Program
+
+            program = self.program
+            if program is None:
+                program = Program.__new__(Program)
+                program.rungs = list(self.logic)
+                program.subroutines = {}
+            self._pdg = build_program_graph(program)
+        return self._pdg
+
+    @property
+    def consumed_tags(self) -> frozenset[str] | None:
+        """Tags the rung-firing capture keeps, or None when it cannot filter.
+
+        Every tag any rung reads (per the PDG's ``readers_of``) unioned
+        with every Bool-typed tag the PDG knows about.  The capture keeps
+        all Bools regardless of read/write role: they're low-cardinality
+        and usually the tags users ask ``cause()`` about, so the
+        direct-log path stays cheap for them.  Non-Bool churn
+        (Timer.acc et al.) still gets filtered.
+
+        None for logic-less programs (no rung = no consumer, the filter
+        would silently drop every write) and for programs with rungs the
+        PDG cannot model (synthetic test rungs that only implement
+        ``evaluate(ctx)``).
+        """
+        cached = self._consumed_tags
+        if isinstance(cached, frozenset):
+            return cached
+        if cached is False:
+            return None
+        from pyrung.core.rung import Rung as RungClass
+        from pyrung.core.tag import TagType
+
+        if not self.logic or not all(isinstance(rung, RungClass) for rung in self.logic):
+            self._consumed_tags = False
+            return None
+        graph = self.pdg
+        consumed = set(graph.readers_of.keys())
+        # Union in every Bool-typed tag the PDG observed.  A mixed
+        # rung (e.g. ``out(BoolFlag) + Timer.acc``) keeps the Bool
+        # write intact while the counter acc still drops — the
+        # intern pool stays small (only Bool patterns) so the rung
+        # never hits the fired-only threshold and causal chains on
+        # the Bool flag remain intact indefinitely.
+        for name, tag in graph.tags.items():
+            if getattr(tag, "type", None) == TagType.BOOL:
+                consumed.add(name)
+        consumed_tags = frozenset(consumed)
+        self._consumed_tags = consumed_tags
+        return consumed_tags
+
+    def compiled_kernel(self) -> CompiledKernel | None:
+        """Compiled scan kernel used for replay, or None when the program needs the interpreter."""
+        cached = self._kernel
+        if isinstance(cached, CompiledKernel):
+            return cached
+        if cached is False:
+            return None
+        kernel = self._compile_kernel()
+        self._kernel = kernel if kernel is not None else False
+        return kernel
+
+    def _compile_kernel(self) -> CompiledKernel | None:
+        from pyrung.circuitpy.codegen import compile_kernel
+
+        if self.program is None or _program_writes_read_only_system_tags(self.program):
+            return None
+        try:
+            kernel = compile_kernel(self.program)
+        except Exception as exc:
+            if _looks_like_compiled_replay_gap(exc):
+                return None
+            raise
+        if kernel.has_io_gaps:
+            return None
+        return kernel
+
+
+__all__ = ["ProgramImage"]
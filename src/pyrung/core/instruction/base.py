@@ -34,6 +34,7 @@ class Instruction(ABC):
     end_line: int | None = None
     debug_substeps: tuple[DebugInstructionSubStep, ...] | None = None
     _state_key: str | None = None
+    _memory_keys: tuple[str, dict[str, str]] | None = None
     ALWAYS_EXECUTES: bool = False
     INERT_WHEN_DISABLED: bool = True
     _reads: tuple[str, ...] = ()
@@ -90,7 +91,19 @@ class Instruction(ABC):
         return str(id(self))
 
     def memory_key(self, prefix: str) -> str:
-        return f"{prefix}:{self.state_key}"
+        state_key = self._state_key
+        if state_key is None:
+            return f"{prefix}:{id(self)}"
+        # Keys are built once per (state key, prefix); the program assigns
+        # state keys when it closes, which invalidates the cache.
+        cached = self._memory_keys
+        if cached is None or cached[0] is not state_key:
+            cached = self._memory_keys = (state_key, {})
+        keys = cached[1]
+        key = keys.get(prefix)
+        if key is None:
+            key = keys[prefix] = f"{prefix}:{state_key}"
+        return key
 
     def is_terminal(self) -> bool:
         """Whether this instruction must be the last execution item in its flow."""
@@ -70,29 +70,28 @@ class CountUpInstruction(Instruction):
         self.reset_condition = to_condition(reset_condition)
         self.down_condition = to_condition(down_condition)
 
+        # Names read and written every scan
+        self._done_name = done_bit.name
+        self._acc_name = accumulator.name
+
     def execute(self, ctx: ScanContext, enabled: bool) -> None:
         condition_view = instruction_condition_view(ctx)
 
         reset_active = self.reset_condition is not None and self.reset_condition.evaluate(
             condition_view
         )
+        if reset_active:
+            ctx.set_tag_pair(self._done_name, False, self._acc_name, 0)
+            return
+
         down_active = self.down_condition is not None and self.down_condition.evaluate(
             condition_view
         )
-        acc_value = ctx.get_tag(self.accumulator.name, 0)
+        acc_value = ctx.get_tag(self._acc_name, 0)
         sp = resolve_preset_ctx(self.preset, ctx)
-
-        if reset_active:
-            ctx.set_tags({self.done_bit.name: False, self.accumulator.name: 0})
-        else:
-            delta = (1 if enabled else 0) - (1 if down_active else 0)
-            acc_value = _clamp_dint(acc_value + delta)
-            ctx.set_tags(
-                {
-                    self.done_bit.name: acc_value >= sp,
-                    self.accumulator.name: acc_value,
-                }
-            )
+        delta = (1 if enabled else 0) - (1 if down_active else 0)
+        acc_value = _clamp_dint(acc_value + delta)
+        ctx.set_tag_pair(self._done_name, acc_value >= sp, self._acc_name, acc_value)
 
     def is_terminal(self) -> bool:
         return True
@@ -144,27 +143,24 @@ class CountDownInstruction(Instruction):
         self.down_condition = to_condition(down_condition)
         self.reset_condition = to_condition(reset_condition)
 
-    def execute(self, ctx: ScanContext, enabled: bool) -> None:
-        condition_view = instruction_condition_view(ctx)
+        # Names read and written every scan
+        self._done_name = done_bit.name
+        self._acc_name = accumulator.name
 
+    def execute(self, ctx: ScanContext, enabled: bool) -> None:
         reset_active = self.reset_condition is not None and self.reset_condition.evaluate(
-            condition_view
+            instruction_condition_view(ctx)
         )
-        acc_value = ctx.get_tag(self.accumulator.name, 0)
-        sp = resolve_preset_ctx(self.preset, ctx)
-
         if reset_active:
-            ctx.set_tags({self.done_bit.name: False, self.accumulator.name: 0})
-        else:
-            if enabled:
-                acc_value -= 1
-            acc_value = _clamp_dint(acc_value)
-            ctx.set_tags(
-                {
-                    self.done_bit.name: acc_value <= -sp,
-                    self.accumulator.name: acc_value,
-                }
-            )
+            ctx.set_tag_pair(self._done_name, False, self._acc_name, 0)
+            return
+
+        acc_value = ctx.get_tag(self._acc_name, 0)
+        sp = resolve_preset_ctx(self.preset, ctx)
+        if enabled:
+            acc_value -= 1
+        acc_value = _clamp_dint(acc_value)
+        ctx.set_tag_pair(self._done_name, acc_value <= -sp, self._acc_name, acc_value)
 
     def is_terminal(self) -> bool:
         return True
@@ -148,6 +148,14 @@ class _DrumBaseInstruction(Instruction):
         if self.jump_condition is not None and self.jump_step is None:
             raise ValueError("drum jump requires step when condition is provided")
 
+        # Per-step output writes and names, built once instead of every scan
+        output_names = tuple(tag.name for tag in self.outputs)
+        self._step_outputs = tuple(
+            dict(zip(output_names, row, strict=True)) for row in self.pattern
+        )
+        self._step_name = self.current_step.name
+        self._completion_name = self.completion_flag.name
+
     def is_terminal(self) -> bool:
         return True
 
@@ -162,8 +170,7 @@ class _DrumBaseInstruction(Instruction):
         return 1 <= step <= self.step_count
 
     def _apply_outputs(self, ctx: ScanContext, step: int) -> None:
-        row = self.pattern[step - 1]
-        ctx.set_tags({tag.name: bool(row[idx]) for idx, tag in enumerate(self.outputs)})
+        ctx.set_tags(self._step_outputs[step - 1])
 
     def _resolve_jump_edge(self, ctx: ScanContext, condition_view: Any) -> tuple[bool, bool]:
         if self.jump_condition is None:
@@ -264,12 +271,7 @@ class EventDrumInstruction(_DrumBaseInstruction):
         if reset_active:
             step = 1
             step_changed = True
-            ctx.set_tags(
-                {
-                    self.current_step.name: 1,
-                    self.completion_flag.name: False,
-                }
-            )
+            ctx.set_tag_pair(self._step_name, 1, self._completion_name, False)
 
         if enabled and jump_edge:
             target = _resolve_step_value(self.jump_step, ctx)
@@ -354,6 +356,8 @@ class TimeDrumInstruction(_DrumBaseInstruction):
             )
         self.accumulator = accumulator
         self.unit = _parse_time_unit(unit)
+        self._acc_name = accumulator.name
+        self._frac_key = f"_frac:{accumulator.name}"
 
     def _acc_max(self) -> int:
         return _INT_MAX if self.accumulator.type == TagType.INT else _DINT_MAX
@@ -374,7 +378,7 @@ class TimeDrumInstruction(_DrumBaseInstruction):
             step = 1
 
         acc_value = _read_step_tag_value(ctx, self.accumulator, fallback=0)
-        frac_key = f"_frac:{self.accumulator.name}"
+        frac_key = self._frac_key
         frac = float(ctx.get_memory(frac_key, 0.0))
 
         jump_curr, jump_edge = self._resolve_jump_edge(ctx, condition_view)
@@ -382,8 +386,7 @@ class TimeDrumInstruction(_DrumBaseInstruction):
         reset_active = bool(self.reset_condition.evaluate(condition_view))
 
         if enabled:
-            dt = float(ctx.get_memory("_dt", 0.0))
-            dt_units = self.unit.dt_to_units(dt) + frac
+            dt_units = self.unit.dt_to_units(float(ctx.dt)) + frac
             int_units = int(dt_units)
             frac = dt_units - int_units
             acc_value = min(acc_value + int_units, self._acc_max())
@@ -401,12 +404,7 @@ class TimeDrumInstruction(_DrumBaseInstruction):
             step = 1
             step_changed = True
             reset_step_data = True
-            ctx.set_tags(
-                {
-                    self.current_step.name: 1,
-                    self.completion_flag.name: False,
-                }
-            )
+            ctx.set_tag_pair(self._step_name, 1, self._completion_name, False)
 
         if enabled and jump_edge:
             target = _resolve_step_value(self.jump_step, ctx)
@@ -430,7 +428,7 @@ class TimeDrumInstruction(_DrumBaseInstruction):
             self._apply_outputs(ctx, step)
 
         if enabled or reset_active or step_changed or reset_step_data:
-            ctx.set_tags({self.accumulator.name: acc_value, self.current_step.name: step})
+            ctx.set_tag_pair(self._acc_name, acc_value, self._step_name, step)
             ctx.set_memory(frac_key, frac)
 
         self._write_control_prev_state(ctx, jump_curr=jump_curr, jog_curr=jog_curr)
@@ -13,12 +13,9 @@ during simulation and exists only for code generation.
 
 from __future__ import annotations
 
-from concurrent.futures import Future
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
-from pyclickplc.addresses import parse_address
-
 from pyrung.core._source import _capture_source
 from pyrung.core.memory_block import BlockRange
 from pyrung.core.program.context import _require_rung_context
@@ -48,9 +45,10 @@ from .types import (
 )
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from pyrung.core.context import ScanContext
 
-ClickClient = _backends.ClickClient
 _PendingRequest = _backends._PendingRequest
 _RequestResult = _backends._RequestResult
 _create_raw_client = _backends._create_raw_client
@@ -68,7 +66,7 @@ def _submit_click_send_request(
     addresses: tuple[int, ...],
     values: tuple[Any, ...],
 ) -> Future[_RequestResult]:
-    _backends.ClickClient = ClickClient
+    _backends.ClickClient = globals().get("ClickClient")
     return _backends._submit_click_send_request(
         host=host,
         port=port,
@@ -88,7 +86,7 @@ def _submit_click_receive_request(
     start: int,
     end: int,
 ) -> Future[_RequestResult]:
-    _backends.ClickClient = ClickClient
+    _backends.ClickClient = globals().get("ClickClient")
     return _backends._submit_click_receive_request(
         host=host,
         port=port,
@@ -107,7 +105,7 @@ def _run_click_send_request(
     addresses: tuple[int, ...],
     values: tuple[Any, ...],
 ) -> _RequestResult:
-    _backends.ClickClient = ClickClient
+    _backends.ClickClient = globals().get("ClickClient")
     return _backends._run_click_send_request(
         host,
         port,
@@ -126,7 +124,7 @@ def _run_click_receive_request(
     start: int,
     end: int,
 ) -> _RequestResult:
-    _backends.ClickClient = ClickClient
+    _backends.ClickClient = globals().get("ClickClient")
     return _backends._run_click_receive_request(
         host,
         port,
@@ -583,6 +581,8 @@ def _resolve_remote_start(
     effective_count = _normalize_operand_count(operand, count)
 
     if isinstance(remote_start, str):
+        from pyclickplc.addresses import parse_address
+
         bank, start_addr = parse_address(remote_start)
         addresses = _addresses_for_count(bank, start_addr, effective_count)
         return (bank, start_addr, addresses, None, 0)
@@ -734,3 +734,13 @@ __all__ = [
     "receive",
     "send",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # ``ClickClient`` is imported on first use; assigning the module
+    # attribute (e.g. a test double) overrides it for live requests.
+    if name == "ClickClient":
+        from pyclickplc import ClickClient
+
+        return ClickClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
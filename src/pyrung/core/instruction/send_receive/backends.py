@@ -1,25 +1,48 @@
-"""Automatically generated module split."""
+"""Automatically generated module split.
+
+Live I/O backends.  ``pyclickplc``, ``pymodbus``, ``asyncio``, and the
+worker pool are only loaded once a send/receive actually submits a
+request, so importing pyrung (or simulating a program that never talks
+to a device) does not pay for them.
+"""
 
 from __future__ import annotations
 
-import asyncio
 import re
-from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any
-
-from pyclickplc import ClickClient
-from pyclickplc.addresses import format_address_display
-from pyclickplc.banks import BANKS
+from typing import TYPE_CHECKING, Any
 
 from pyrung.core.tag import Tag
 
 from .helpers import _contiguous_runs
 from .types import ModbusRtuTarget, ModbusTcpTarget, RegisterType
 
-_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pyrung-modbus")
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+# ``pyclickplc.ClickClient`` unless overridden (``_core`` forwards test doubles here).
+ClickClient: Any = None
+_EXECUTOR: ThreadPoolExecutor | None = None
 _DEFAULT_TIMEOUT_SECONDS = 1
 
+
+def _executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        _EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pyrung-modbus")
+    return _EXECUTOR
+
+
+def _click_client() -> Any:
+    if ClickClient is not None:
+        return ClickClient
+    from pyclickplc import ClickClient as client_cls
+
+    return client_cls
+
+
 # ---------------------------------------------------------------------------
 # Async Modbus backend — Click path
 # ---------------------------------------------------------------------------
@@ -47,7 +70,7 @@ def _submit_click_send_request(
     addresses: tuple[int, ...],
     values: tuple[Any, ...],
 ) -> Future[_RequestResult]:
-    return _EXECUTOR.submit(
+    return _executor().submit(
         _run_click_send_request,
         host,
         port,
@@ -67,7 +90,7 @@ def _submit_click_receive_request(
     start: int,
     end: int,
 ) -> Future[_RequestResult]:
-    return _EXECUTOR.submit(
+    return _executor().submit(
         _run_click_receive_request,
         host,
         port,
@@ -90,10 +113,16 @@ def _run_click_send_request(
         return _RequestResult(ok=False, exception_code=0)
     if len(addresses) != len(values):
         return _RequestResult(ok=False, exception_code=0)
+    import asyncio
+
+    from pyclickplc.addresses import format_address_display
+    from pyclickplc.banks import BANKS
+
+    client_cls = _click_client()
 
     async def _run() -> _RequestResult:
         try:
-            async with ClickClient(
+            async with client_cls(
                 host,
                 port,
                 timeout=_DEFAULT_TIMEOUT_SECONDS,
@@ -128,9 +157,15 @@ def _run_click_receive_request(
     start: int,
     end: int,
 ) -> _RequestResult:
+    import asyncio
+
+    from pyclickplc.addresses import format_address_display
+
+    client_cls = _click_client()
+
     async def _run() -> _RequestResult:
         try:
-            async with ClickClient(
+            async with client_cls(
                 host,
                 port,
                 timeout=_DEFAULT_TIMEOUT_SECONDS,
@@ -182,7 +217,7 @@ def _submit_raw_send_request(
     registers: list[Any],
     device_id: int,
 ) -> Future[_RequestResult]:
-    return _EXECUTOR.submit(
+    return _executor().submit(
         _run_raw_send_request,
         target,
         address,
@@ -234,7 +269,7 @@ def _submit_raw_receive_request(
     count: int,
     device_id: int,
 ) -> Future[_RequestResult]:
-    return _EXECUTOR.submit(
+    return _executor().submit(
         _run_raw_receive_request,
         target,
         address,
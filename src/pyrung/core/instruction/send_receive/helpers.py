@@ -5,8 +5,6 @@ from __future__ import annotations
 import struct
 from typing import TYPE_CHECKING, Any
 
-from pyclickplc.banks import BANKS
-
 from pyrung.core.memory_block import BlockRange
 from pyrung.core.tag import Tag, TagType
 
@@ -22,6 +20,8 @@ if TYPE_CHECKING:
 
 
 def _is_valid_index(bank: str, index: int) -> bool:
+    from pyclickplc.banks import BANKS
+
     cfg = BANKS[bank]
     if cfg.valid_ranges is None:
         return cfg.min_addr <= index <= cfg.max_addr
@@ -39,6 +39,8 @@ def _addresses_for_count(bank: str, start: int, count: int) -> tuple[int, ...]:
     if not _is_valid_index(bank, start):
         raise ValueError(f"{bank} address {start} is out of range")
 
+    from pyclickplc.banks import BANKS
+
     cfg = BANKS[bank]
     if cfg.valid_ranges is None:
         end = start + count - 1
@@ -70,36 +70,32 @@ class OnDelayInstruction(Instruction):
         self.enable_condition = to_condition(enable_condition)
         self.reset_condition = to_condition(reset_condition)
 
-    def execute(self, ctx: ScanContext, enabled: bool) -> None:
-        frac_key = f"_frac:{self.accumulator.name}"
-        condition_view = instruction_condition_view(ctx)
+        # Names and memory keys read every scan
+        self._done_name = done_bit.name
+        self._acc_name = accumulator.name
+        self._frac_key = f"_frac:{accumulator.name}"
 
+    def execute(self, ctx: ScanContext, enabled: bool) -> None:
+        frac_key = self._frac_key
         reset_active = self.reset_condition is not None and self.reset_condition.evaluate(
-            condition_view
+            instruction_condition_view(ctx)
         )
-        acc_value = ctx.get_tag(self.accumulator.name, 0)
-        frac = ctx.get_memory(frac_key, 0.0)
-        dt = ctx.get_memory("_dt", 0.0)
-        sp = resolve_preset_ctx(self.preset, ctx)
 
         if reset_active:
             ctx.set_memory(frac_key, 0.0)
-            ctx.set_tags({self.done_bit.name: False, self.accumulator.name: 0})
+            ctx.set_tag_pair(self._done_name, False, self._acc_name, 0)
         elif enabled:
-            dt_units = self.unit.dt_to_units(dt) + frac
+            acc_value = ctx.get_tag(self._acc_name, 0)
+            sp = resolve_preset_ctx(self.preset, ctx)
+            dt_units = self.unit.dt_to_units(ctx.dt) + ctx.get_memory(frac_key, 0.0)
             int_units = int(dt_units)
             new_frac = dt_units - int_units
             acc_value = min(acc_value + int_units, 32767)
             ctx.set_memory(frac_key, new_frac)
-            ctx.set_tags(
-                {
-                    self.done_bit.name: acc_value >= sp,
-                    self.accumulator.name: acc_value,
-                }
-            )
+            ctx.set_tag_pair(self._done_name, acc_value >= sp, self._acc_name, acc_value)
         elif not self.has_reset:
             ctx.set_memory(frac_key, 0.0)
-            ctx.set_tags({self.done_bit.name: False, self.accumulator.name: 0})
+            ctx.set_tag_pair(self._done_name, False, self._acc_name, 0)
 
     def is_terminal(self) -> bool:
         return self.has_reset
@@ -149,29 +145,33 @@ class OffDelayInstruction(Instruction):
         # Convert Tags to Conditions if needed
         self.enable_condition = to_condition(enable_condition)
 
+        # Names and memory keys read every scan
+        self._done_name = done_bit.name
+        self._acc_name = accumulator.name
+        self._frac_key = f"_frac:{accumulator.name}"
+
     def execute(self, ctx: ScanContext, enabled: bool) -> None:
-        frac_key = f"_frac:{self.accumulator.name}"
+        frac_key = self._frac_key
 
         if enabled:
             # While enabled: done = True, acc = 0
             ctx.set_memory(frac_key, 0.0)
-            ctx.set_tags({self.done_bit.name: True, self.accumulator.name: 0})
+            ctx.set_tag_pair(self._done_name, True, self._acc_name, 0)
         else:
-            acc_value = ctx.get_tag(self.accumulator.name, 0)
+            acc_value = ctx.get_tag(self._acc_name, 0)
 
             # Never-enabled: Done=False, Acc=0 is the resting state.
             # The enabled branch always sets Done=True before Acc=0,
             # so (False, 0) uniquely identifies a timer that was never enabled.
-            if not ctx.get_tag(self.done_bit.name, False) and acc_value == 0:
+            if not ctx.get_tag(self._done_name, False) and acc_value == 0:
                 return
 
             sp = resolve_preset_ctx(self.preset, ctx)
 
             # Always count while disabled (accumulator continues to max int)
-            dt = ctx.get_memory("_dt", 0.0)
             frac = ctx.get_memory(frac_key, 0.0)
 
-            dt_units = self.unit.dt_to_units(dt) + frac
+            dt_units = self.unit.dt_to_units(ctx.dt) + frac
             int_units = int(dt_units)
             new_frac = dt_units - int_units
 
@@ -182,4 +182,4 @@ class OffDelayInstruction(Instruction):
             done = acc_value < sp
 
             ctx.set_memory(frac_key, new_frac)
-            ctx.set_tags({self.done_bit.name: done, self.accumulator.name: acc_value})
+            ctx.set_tag_pair(self._done_name, done, self._acc_name, acc_value)
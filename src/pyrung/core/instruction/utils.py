@@ -77,6 +77,8 @@ def instruction_condition_view(ctx: ScanContext) -> ConditionView:
 
 def resolve_preset_ctx(preset: Tag | int, ctx: ScanContext) -> int:
     """Resolve preset to int value (supports Tag or literal)."""
+    if type(preset) is int:
+        return preset
     from pyrung.core.tag import Tag as TagClass
 
     if isinstance(preset, TagClass):
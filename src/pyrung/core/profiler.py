@@ -0,0 +1,293 @@
+"""Ladder-structured scan profiler.
+
+``ScanProfiler`` implements the ``ExecutionObserver`` protocol from
+``pyrung.core.executor``.  The protocol only has ``begin_*`` hooks, so
+time is charged to whatever was running between consecutive events:
+the time from one hook to the next belongs to the rung, branches,
+subroutines, and instruction that were current when the first fired.
+The last span of a scan is closed by :meth:`ScanProfiler.end_scan`.
+
+Buckets:
+
+- top-level rungs and subroutines are inclusive (a subroutine's time
+  also counts toward the rung that called it);
+- branches are inclusive of their nested branches and calls;
+- instruction types are self time (a ``CallInstruction`` or
+  ``ForLoopInstruction`` does not include its body).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from time import perf_counter_ns
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pyrung.core.context import ScanContext
+    from pyrung.core.executor import ExecutionKind
+    from pyrung.core.instruction import CallInstruction, ForLoopInstruction, Instruction
+    from pyrung.core.rung import Rung
+
+
+@dataclass(frozen=True)
+class ProfileEntry:
+    """Accumulated wall time and call count for one profile bucket."""
+
+    name: str
+    calls: int
+    total_ns: int
+
+    @property
+    def total_seconds(self) -> float:
+        return self.total_ns / 1e9
+
+    @property
+    def mean_us(self) -> float:
+        return self.total_ns / self.calls / 1e3 if self.calls else 0.0
+
+
+@dataclass(frozen=True)
+class ProfileReport:
+    """Snapshot of a ``PLC(profile=True)`` run, returned by ``plc.debug.profile()``.
+
+    Each list is sorted by total time, slowest first.
+    """
+
+    scans: int
+    total_ns: int
+    rungs: list[ProfileEntry] = field(default_factory=list)
+    branches: list[ProfileEntry] = field(default_factory=list)
+    subroutines: list[ProfileEntry] = field(default_factory=list)
+    instructions: list[ProfileEntry] = field(default_factory=list)
+
+    @property
+    def total_seconds(self) -> float:
+        return self.total_ns / 1e9
+
+    def format(self, limit: int | None = 10) -> str:
+        """Render the report as fixed-width text tables."""
+        mean = self.total_ns / self.scans / 1e3 if self.scans else 0.0
+        lines = [
+            f"{self.scans} scan(s), {self.total_seconds * 1e3:.3f} ms logic, {mean:.1f} us/scan"
+        ]
+        for title, entries in (
+            ("Rungs", self.rungs),
+            ("Branches", self.branches),
+            ("Subroutines", self.subroutines),
+            ("Instructions", self.instructions),
+        ):
+            if not entries:
+                continue
+            lines.append("")
+            lines.append(f"{title:<32} {'calls':>10} {'total ms':>10} {'mean us':>10} {'%':>6}")
+            for entry in entries[:limit]:
+                share = 100.0 * entry.total_ns / self.total_ns if self.total_ns else 0.0
+                lines.append(
+                    f"{entry.name:<32} {entry.calls:>10} {entry.total_ns / 1e6:>10.3f} "
+                    f"{entry.mean_us:>10.2f} {share:>6.1f}"
+                )
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.format()
+
+
+def _rung_label(prefix: str, rung: Rung) -> str:
+    source_line = getattr(rung, "source_line", None)
+    if source_line is not None:
+        return f"{prefix} (line {source_line})"
+    return prefix
+
+
+class ScanProfiler:
+    """Execution observer that accumulates per-rung and per-instruction wall time."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self._scans = 0
+        self._total_ns = 0
+        self._time: dict[tuple[str, object], int] = {}
+        self._calls: dict[tuple[str, object], int] = {}
+        self._labels: dict[tuple[str, object], str] = {}
+        self._last_ns: int | None = None
+        self._scan_start_ns = 0
+        self._current: tuple[tuple[str, object], ...] = ()
+        self._rung_key: tuple[str, object] | None = None
+        self._branches: list[tuple[int, tuple[str, object]]] = []
+        self._call_stack: tuple[str, ...] = ()
+        self._call_stack_keys: tuple[tuple[str, object], ...] = ()
+
+    # -- scan boundaries -------------------------------------------------------
+
+    def begin_scan(self) -> None:
+        now = perf_counter_ns()
+        self._scan_start_ns = now
+        self._last_ns = now
+        self._current = ()
+        self._rung_key = None
+        self._branches.clear()
+        self._call_stack = ()
+        self._call_stack_keys = ()
+
+    def end_scan(self) -> None:
+        now = perf_counter_ns()
+        self._charge(now)
+        self._last_ns = None
+        self._current = ()
+        self._scans += 1
+        self._total_ns += now - self._scan_start_ns
+
+    # -- accounting ------------------------------------------------------------
+
+    def _charge(self, now: int) -> None:
+        last = self._last_ns
+        if last is None:
+            return
+        elapsed = now - last
+        times = self._time
+        for key in self._current:
+            times[key] = times.get(key, 0) + elapsed
+        self._last_ns = now
+
+    def _count(self, key: tuple[str, object], label: str) -> None:
+        calls = self._calls
+        if key not in calls:
+            calls[key] = 0
+            self._labels[key] = label
+        calls[key] += 1
+
+    def _enter(
+        self,
+        depth: int,
+        call_stack: tuple[str, ...],
+        instruction_key: tuple[str, object] | None = None,
+    ) -> None:
+        now = perf_counter_ns()
+        self._charge(now)
+        branches = self._branches
+        while branches and branches[-1][0] > depth:
+            branches.pop()
+        if call_stack != self._call_stack:
+            self._call_stack = call_stack
+            self._call_stack_keys = tuple(("subroutine", name) for name in call_stack)
+        current: list[tuple[str, object]] = []
+        if self._rung_key is not None:
+            current.append(self._rung_key)
+        current.extend(key for _depth, key in branches)
+        current.extend(self._call_stack_keys)
+        if instruction_key is not None:
+            current.append(instruction_key)
+        self._current = tuple(current)
+
+    # -- ExecutionObserver -----------------------------------------------------
+
+    def begin_rung(
+        self,
+        ctx: ScanContext,
+        rung_index: int,
+        rung: Rung,
+        kind: ExecutionKind,
+        depth: int,
+        subroutine_name: str | None,
+        call_stack: tuple[str, ...],
+    ) -> None:
+        if kind == "rung":
+            key = ("rung", rung_index)
+            self._rung_key = key
+            self._branches.clear()
+            self._count(key, _rung_label(f"rung {rung_index}", rung))
+        elif kind == "branch":
+            branches = self._branches
+            while branches and branches[-1][0] >= depth:
+                branches.pop()
+            key = ("branch", id(rung))
+            branches.append((depth, key))
+            self._count(key, _rung_label(f"rung {rung_index} branch", rung))
+        self._enter(depth, call_stack)
+
+    def begin_condition(
+        self,
+        ctx: ScanContext,
+        rung_index: int,
+        rung: Rung,
+        kind: ExecutionKind,
+        depth: int,
+        subroutine_name: str | None,
+        call_stack: tuple[str, ...],
+    ) -> None:
+        pass
+
+    def begin_branch(
+        self,
+        ctx: ScanContext,
+        rung_index: int,
+        branch: Rung,
+        depth: int,
+        enabled: bool,
+        call_stack: tuple[str, ...],
+    ) -> None:
+        pass
+
+    def begin_instruction(
+        self,
+        ctx: ScanContext,
+        rung_index: int,
+        rung: Rung,
+        instruction: Instruction,
+        depth: int,
+        enabled: bool,
+        call_stack: tuple[str, ...],
+    ) -> None:
+        cls = type(instruction)
+        key = ("instruction", cls)
+        self._count(key, cls.__name__)
+        self._enter(depth, call_stack, key)
+
+    def begin_subroutine_call(
+        self,
+        ctx: ScanContext,
+        rung_index: int,
+        instruction: CallInstruction,
+        depth: int,
+        call_stack: tuple[str, ...],
+    ) -> None:
+        name = instruction.subroutine_name
+        self._count(("subroutine", name), name)
+        self._enter(depth, (*call_stack, name))
+
+    def begin_loop_iteration(
+        self,
+        ctx: ScanContext,
+        rung_index: int,
+        instruction: ForLoopInstruction,
+        iteration: int,
+        depth: int,
+        call_stack: tuple[str, ...],
+    ) -> None:
+        pass
+
+    # -- reporting -------------------------------------------------------------
+
+    def report(self) -> ProfileReport:
+        grouped: dict[str, list[ProfileEntry]] = {
+            "rung": [],
+            "branch": [],
+            "subroutine": [],
+            "instruction": [],
+        }
+        for key, calls in self._calls.items():
+            grouped[key[0]].append(
+                ProfileEntry(name=self._labels[key], calls=calls, total_ns=self._time.get(key, 0))
+            )
+        for entries in grouped.values():
+            entries.sort(key=lambda entry: (-entry.total_ns, entry.name))
+        return ProfileReport(
+            scans=self._scans,
+            total_ns=self._total_ns,
+            rungs=grouped["rung"],
+            branches=grouped["branch"],
+            subroutines=grouped["subroutine"],
+            instructions=grouped["instruction"],
+        )
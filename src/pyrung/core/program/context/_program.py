@@ -17,6 +17,7 @@ if TYPE_CHECKING:
     from pyrung.core.context import ScanContext
 
     from ..validation import DialectValidator
+    from ..validation.walker import ProgramFacts
 
 
 def _validate_subroutine_name(name: str) -> str:
@@ -47,6 +48,7 @@ class Program:
         self._current_subroutine: str | None = None  # Track if we're in a subroutine
         self._pending_comment: str | None = None
         self._cached_graph: ProgramGraph | None = None
+        self._cached_facts: ProgramFacts | None = None
 
     def __enter__(self) -> Program:
         if self._strict:
@@ -68,6 +70,7 @@ class Program:
 
     def _invalidate_graph_cache(self) -> None:
         self._cached_graph = None
+        self._cached_facts = None
 
     def _assign_state_keys(self) -> None:
         from pyrung.core.instruction.base import Instruction
@@ -6,13 +6,15 @@ They evaluate within a ScanContext for batched updates.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
 from pyrung.core._source import _capture_call_end_line
 from pyrung.core.condition import (
     Condition,
     ConditionTerm,
     _as_condition,
+    _compile_conditions,
 )
 
 if TYPE_CHECKING:
@@ -54,6 +56,10 @@ class Rung:
         # This index marks where this rung's own local branch conditions begin.
         self._branch_condition_start = 0
         self._use_prior_snapshot = False
+        # Compiled forms of the full and branch-local condition lists, built
+        # on first evaluation.  ``_conditions`` stays the source of truth.
+        self._condition_fn: Callable[[ScanContext | ConditionView], bool] | None = None
+        self._local_condition_fn: Callable[[ScanContext | ConditionView], bool] | None = None
         self.source_file = source_file
         self.source_line = source_line
         self.end_line = end_line
@@ -62,6 +68,13 @@ class Rung:
         for cond in conditions:
             self._conditions.append(_as_condition(cond))
 
+    def __getstate__(self) -> dict[str, Any]:
+        # Compiled condition functions are rebuilt on demand and can't be pickled.
+        state = self.__dict__.copy()
+        state["_condition_fn"] = None
+        state["_local_condition_fn"] = None
+        return state
+
     def add_instruction(self, instruction: Instruction) -> None:
         """Add an instruction to execute when conditions are true."""
         if self._terminal_instruction is not None:
@@ -173,13 +186,10 @@ class Rung:
         Returns True if all conditions are true, or if there are no conditions.
         Accepts either a live ScanContext or a frozen ConditionView.
         """
-        if not self._conditions:
-            return True
-
-        for cond in self._conditions:
-            if not cond.evaluate(ctx):
-                return False
-        return True
+        fn = self._condition_fn
+        if fn is None:
+            fn = self._condition_fn = _compile_conditions(self._conditions)
+        return fn(ctx)
 
     def _execute_instructions(self, ctx: ScanContext) -> None:
         """Execute instructions/branches in source order."""
@@ -187,14 +197,12 @@ class Rung:
 
     def _evaluate_local_conditions(self, ctx: ScanContext | ConditionView) -> bool:
         """Evaluate only this branch's local conditions (not inherited parent conditions)."""
-        conditions = self._conditions
-        start = self._branch_condition_start
-        if start >= len(conditions):
-            return True
-        for i in range(start, len(conditions)):
-            if not conditions[i].evaluate(ctx):
-                return False
-        return True
+        fn = self._local_condition_fn
+        if fn is None:
+            fn = self._local_condition_fn = _compile_conditions(
+                self._conditions[self._branch_condition_start :]
+            )
+        return fn(ctx)
 
     def _compute_branch_enable_map(
         self,
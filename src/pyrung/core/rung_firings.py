@@ -352,6 +352,41 @@ class RungFiringTimelines:
                 fired.add(rung_index)
         return fired
 
+    def window_coverage(
+        self, rung_index: int, start_scan_id: int, end_scan_id: int
+    ) -> tuple[int, int | None, int | None]:
+        """Return ``(fired_scans, first_fired, last_fired)`` within a window.
+
+        The window is inclusive on both ends.  Answered by interval
+        arithmetic over the rung's ranges — O(log S + k) for the k
+        ranges overlapping the window — so cost is independent of the
+        number of scans covered.
+        """
+        timeline = self._timelines.get(rung_index)
+        if not timeline or end_scan_id < start_scan_id:
+            return (0, None, None)
+        # First range that ends at or after the window start.
+        lo, hi = 0, len(timeline)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if timeline[mid].end_scan_id < start_scan_id:
+                lo = mid + 1
+            else:
+                hi = mid
+        fired = 0
+        first: int | None = None
+        last: int | None = None
+        for range_ in timeline[lo:]:
+            if range_.start_scan_id > end_scan_id:
+                break
+            overlap_start = max(range_.start_scan_id, start_scan_id)
+            overlap_end = min(range_.end_scan_id, end_scan_id)
+            fired += overlap_end - overlap_start + 1
+            if first is None:
+                first = overlap_start
+            last = overlap_end
+        return (fired, first, last)
+
     def ever_fired(self) -> set[int]:
         """Rung indices with at least one range in their timeline."""
         return {idx for idx, tl in self._timelines.items() if tl}
@@ -10,6 +10,7 @@ reducing object allocation from O(instructions) to O(1) per scan.
 
 from __future__ import annotations
 
+import itertools
 import time
 import warnings
 from collections import OrderedDict
@@ -23,7 +24,7 @@ from typing import TYPE_CHECKING, Any, Literal, TypeGuard
 
 from pyrsistent import PMap
 
-from pyrung.core.bounds import BoundsViolation, build_constraint_index, check_bounds
+from pyrung.core.bounds import BoundsViolation, check_bounds
 from pyrung.core.compiled_plc import CompiledPLC
 from pyrung.core.condition_trace import ConditionTraceEngine
 from pyrung.core.context import ConditionView, ScanContext
@@ -31,23 +32,23 @@ from pyrung.core.debug_trace import RungTrace, RungTraceEvent, TraceEvent
 from pyrung.core.debugger import PLCDebugger
 from pyrung.core.executor import execute_program
 from pyrung.core.history import History
+from pyrung.core.image import ProgramImage, _register_known_tag
 from pyrung.core.input_overrides import InputOverrideManager
 from pyrung.core.kernel import CompiledKernel
 from pyrung.core.live_binding import reset_active_runner, set_active_runner
+from pyrung.core.profiler import ProfileReport, ScanProfiler
 from pyrung.core.rung_firings import RungFiringTimelines
 from pyrung.core.scan_log import LifecycleEvent, LifecycleKind, ScanLog, ScanLogSnapshot
+from pyrung.core.scan_stats import ScanStats, ScanWatchdogError
 from pyrung.core.state import SystemState
 from pyrung.core.system_points import (
     _BATTERY_PRESENT_KEY,
     _MODE_RUN_KEY,
-    READ_ONLY_SYSTEM_TAG_NAMES,
-    SYSTEM_TAGS_BY_NAME,
     SystemPointRuntime,
+    sample_scan_exec,
 )
 from pyrung.core.time_mode import TimeMode
 from pyrung.core.trace_formatter import TraceFormatter
-from pyrung.core.validation._common import _collect_write_sites
-from pyrung.core.validation.readonly_write import _any_write_targets
 
 if TYPE_CHECKING:
     from collections.abc import Generator, Iterator
@@ -69,6 +70,10 @@ _HISTORY_BUDGET_BYTES_DEFAULT = 100 * 1024 * 1024  # 100 MB
 # present; the recent-state cache floor must not regress under budget pressure.
 _RECENT_STATE_CACHE_MIN_ENTRIES = 20
 
+# Number of committed scans whose changed-tag sets stay queryable through
+# ``changed_tags_since``.  Live consumers drain far more often than this.
+_CHANGED_TAGS_WINDOW = 1024
+
 
 def _parse_retention(value: str | int | None, dt_seconds: float) -> int | None:
     """Convert a retention parameter to a scan count.
@@ -87,6 +92,21 @@ def _parse_retention(value: str | int | None, dt_seconds: float) -> int | None:
     return max(1, int(ms / dt_ms))
 
 
+def _parse_watchdog(value: float | str | None) -> int | None:
+    """Convert a watchdog budget (seconds or duration string) to nanoseconds."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        from pyrung.core.physical import parse_duration
+
+        nanos = parse_duration(value) * 1_000_000
+    else:
+        nanos = int(value * 1e9)
+    if nanos <= 0:
+        raise ValueError("watchdog must be > 0")
+    return nanos
+
+
 # Conservative per-entry byte estimate for PMap HAMT nodes.
 _PER_PMAP_ENTRY_BYTES = 200
 
@@ -209,50 +229,6 @@ class _BreakpointBuilder:
         )
 
 
-def _iter_referenced_tags(root: Any) -> tuple[Tag, ...]:
-    """Collect Tag objects reachable from a logic object graph."""
-    from pyrung.core.tag import Tag as TagClass
-
-    found_by_name: dict[str, TagClass] = {}
-    visited: set[int] = set()
-    queue: list[Any] = [root]
-
-    while queue:
-        current = queue.pop()
-        if current is None:
-            continue
-        if isinstance(current, TagClass):
-            found_by_name[current.name] = current
-            continue
-        if isinstance(current, (str, bytes, bytearray, int, float, bool)):
-            continue
-
-        current_id = id(current)
-        if current_id in visited:
-            continue
-        visited.add(current_id)
-
-        if isinstance(current, Mapping):
-            queue.extend(current.keys())
-            queue.extend(current.values())
-            continue
-        if isinstance(current, tuple | list | set | frozenset):
-            queue.extend(current)
-            continue
-
-        if hasattr(current, "__dict__"):
-            queue.extend(vars(current).values())
-            continue
-        if hasattr(current, "__slots__"):
-            for slot in current.__slots__:
-                if slot in {"__weakref__", "__dict__"}:
-                    continue
-                if hasattr(current, slot):
-                    queue.append(getattr(current, slot))
-
-    return tuple(found_by_name.values())
-
-
 def _apply_lifecycle_to_replay(replay: Any, event: LifecycleEvent) -> None:
     """Apply a captured lifecycle event to a replay PLC.
 
@@ -275,33 +251,6 @@ def _apply_lifecycle_to_replay(replay: Any, event: LifecycleEvent) -> None:
         raise AssertionError(f"unknown lifecycle kind: {event.kind!r}")
 
 
-def _program_writes_read_only_system_tags(program: Any) -> bool:
-    from pyrung.core.program import Program
-
-    if not isinstance(program, Program):
-        return False
-    for site in _collect_write_sites(program, target_extractor=_any_write_targets):
-        if site.target_name in READ_ONLY_SYSTEM_TAG_NAMES:
-            return True
-    return False
-
-
-def _looks_like_compiled_replay_gap(exc: Exception) -> bool:
-    if isinstance(exc, NotImplementedError):
-        return True
-    if not isinstance(exc, ValueError | TypeError):
-        return False
-    message = str(exc)
-    return any(
-        needle in message
-        for needle in (
-            "requires generate_circuitpy",
-            "Could not inspect source for callable",
-            "Unsupported",
-        )
-    )
-
-
 class _DebugNamespace:
     """Namespace exposing debugger-facing methods on ``plc.debug``."""
 
@@ -370,6 +319,23 @@ class _DebugNamespace:
         """System point runtime component."""
         return self._plc._system_runtime
 
+    def profile(self, *, reset: bool = False) -> ProfileReport:
+        """Return the per-rung/per-instruction profile of a ``PLC(profile=True)`` run.
+
+        Args:
+            reset: Clear the accumulated counters after taking the report.
+
+        Raises:
+            RuntimeError: If the PLC was created without ``profile=True``.
+        """
+        profiler = self._plc._profiler
+        if profiler is None:
+            raise RuntimeError("Profiling is disabled; create the PLC with profile=True")
+        report = profiler.report()
+        if reset:
+            profiler.reset()
+        return report
+
 
 class PLC:
     """Generator-driven PLC execution engine.
@@ -399,11 +365,17 @@ class PLC:
         history_budget: int | None = None,
         checkpoint_interval: int | None = None,
         record_all_tags: bool = False,
+        profile: bool = False,
+        watchdog: float | str | None = None,
+        watchdog_action: Literal["warn", "raise", "stop"] = "warn",
     ) -> None:
         """Create a new PLC.
 
         Args:
-            logic: Program, list of rungs, or None for empty logic.
+            logic: Program, list of rungs, `ProgramImage`, or None for
+                empty logic.  An image skips walking the logic for tags
+                and shares its dependency graph and compiled replay
+                kernel with every runner built from it.
             initial_state: Starting state. Defaults to SystemState().
             dt: Time delta per scan in seconds (default 0.010).
                 Only used in fixed-step mode.
@@ -425,6 +397,17 @@ class PLC:
                 don't need them.  Set this to True when a diagnostic
                 session needs the unfiltered firing history (e.g. when
                 the PDG is suspected of misclassifying a consumer).
+            profile: Record wall time and call counts per rung, branch,
+                subroutine, and instruction type on ``step()`` / ``run*()``
+                scans.  Read the report with ``plc.debug.profile()``.
+            watchdog: Budget for the measured host execution time of one
+                scan.  Seconds (float) or a duration string (``"5ms"``).
+                ``None`` disables the watchdog; timing is still recorded
+                in ``plc.scan_stats``.
+            watchdog_action: What to do when a scan overruns the budget:
+                ``"warn"`` emits a ``RuntimeWarning``, ``"raise"`` raises
+                ``ScanWatchdogError`` after the scan commits, ``"stop"``
+                transitions the PLC to STOP.
         """
         if realtime and dt is not None:
             raise ValueError("Cannot specify dt= with realtime=True")
@@ -439,6 +422,12 @@ class PLC:
         if history_budget < 1_048_576:
             raise ValueError("history_budget must be >= 1 MB (1048576)")
 
+        if watchdog_action not in ("warn", "raise", "stop"):
+            raise ValueError(
+                f"watchdog_action must be 'warn', 'raise', or 'stop', got {watchdog_action!r}"
+            )
+        watchdog_ns = _parse_watchdog(watchdog)
+
         history_scans = _parse_retention(history, dt)
         cache_scans = _parse_retention(cache, dt)
         history_floor = checkpoint_interval * 2
@@ -451,30 +440,22 @@ class PLC:
         self._history_retention_scans: int | None = history_scans
         self._cache_retention_scans: int | None = cache_scans
 
-        self._logic: list[Rung]
-        self._program: Any = None
-        # Handle different logic types
-        # Import Program here to avoid circular import at module level
-        from pyrung.core.program import Program
-
-        if logic is None:
-            self._logic = []
-        elif isinstance(logic, Program):
-            self._logic = logic.rungs
-            self._program = logic
-        elif isinstance(logic, list):
-            self._logic = logic
-        else:
-            self._logic = [logic]
+        image = logic if isinstance(logic, ProgramImage) else ProgramImage(logic)
+        self._image = image
+        self._logic: list[Rung] = image.logic
+        self._program: Any = image.program
 
-        self._state = initial_state if initial_state is not None else SystemState()
         self._running = True
         self._battery_present = True
-        self._state = self._apply_runtime_memory_flags(
-            self._state,
-            mode_run=self._running,
-            battery_present=self._battery_present,
-        )
+        if initial_state is None:
+            # Already in RUN with the battery present and every tag seeded.
+            self._state = image.initial_state
+        else:
+            self._state = self._apply_runtime_memory_flags(
+                initial_state,
+                mode_run=self._running,
+                battery_present=self._battery_present,
+            )
         # Byte-bounded recent-state cache feeding ``History.at()`` on
         # the hot path.  ``History`` itself is a stateless facade.
         # Keyed by scan_id → (SystemState, estimated_bytes).
@@ -488,6 +469,9 @@ class PLC:
         # after the recent-state window rotates past the initial scan.
         self._initial_scan_id: int = self._state.scan_id
         self._initial_state: SystemState = self._state
+        # Set by ``fork()``: the parent runner and the fork scan id.  Scans
+        # before the fork point are read through the parent's history.
+        self._history_parent: tuple[PLC, int] | None = None
         self._history = History(self)
         self._current_rung_traces: dict[int, RungTrace] = {}
         self._current_rung_traces_scan_id: int | None = None
@@ -497,6 +481,18 @@ class PLC:
         # regardless of how long it fires, and a period-2 alternator
         # collapses into a single ``AlternatingRun``.
         self._rung_firing_timelines = RungFiringTimelines()
+        # Per-scan changed-tag journal feeding ``changed_tags_since``.
+        # Idle scans share the empty frozenset, so a quiet program pays
+        # one dict slot per scan.  ``_changed_tags_floor`` is the oldest
+        # scan id a since-query can still be answered from.
+        self._changed_tags_by_scan: OrderedDict[int, frozenset[str]] = OrderedDict()
+        self._changed_tags_floor: int = self._state.scan_id
+        # ``_prev:*`` capture bookkeeping: the state this runner last
+        # committed and the tag writes of that scan (see
+        # ``_capture_previous_states``), plus interned ``_prev:`` keys.
+        self._prev_synced_state: SystemState | None = None
+        self._prev_synced_writes: Mapping[str, Any] = {}
+        self._prev_keys: dict[str, str] = {}
         self._inflight_scan_id: int | None = None
         self._inflight_rung_events: dict[int, list[RungTraceEvent]] = {}
         self._latest_inflight_trace_event: tuple[int, int, RungTraceEvent] | None = None
@@ -516,20 +512,22 @@ class PLC:
         self._this_scan_drained_patches: dict[str, bool | int | float | str] = {}
         # Replay plumbing. ``_dt_override_for_next_scan`` lets
         # ``replay_to`` inject the recorded dt for each replayed scan in
-        # REALTIME mode; ``_replay_mode`` suppresses user monitors,
-        # breakpoint labels, and the RTC setter during a replay walk.
+        # REALTIME mode; ``_scan_exec_for_next_scan`` does the same for the
+        # ``sys.scan_exec_*`` sample a scan read; ``_replay_mode`` suppresses
+        # user monitors, breakpoint labels, and the RTC setter during a
+        # replay walk.
         self._dt_override_for_next_scan: float | None = None
+        self._scan_exec_for_next_scan: tuple[int, ...] | None = None
+        self._this_scan_exec_sample: tuple[int, ...] | None = None
         self._replay_mode: bool = False
         self._compiled_replay_kernel: CompiledKernel | None | bool = None
         # PDG-filtered rung-firing capture.  When the filter is active
         # (``record_all_tags=False``), ``capturing_rung`` drops writes to
         # tags that no rung reads — the firing log is consumed only by
         # ``cause``/``effect``/``query`` which never ask about an unread
-        # tag.  Populated lazily alongside ``_pdg_cache`` the first time
-        # a scan captures; rebuilt atomically whenever the PDG is
-        # invalidated.
+        # tag.  The consumed-tag set lives on the image, built the first
+        # time any runner sharing it captures a scan.
         self._record_all_tags: bool = record_all_tags
-        self._pdg_consumed_tags: frozenset[str] | None = None
         # One-slot cache for ``replay_trace_at``.  Reconstructing rung
         # traces for a historical scan costs one fork + up to K plain
         # scans + one debug scan; caching a back-to-back repeat query
@@ -539,11 +537,17 @@ class PLC:
         self._cached_replay_trace: tuple[int, dict[int, RungTrace]] | None = None
         self._rtc_base = self._normalize_rtc_datetime(datetime.now())
         self._rtc_base_sim_time = float(self._state.timestamp)
+        self._scan_stats = ScanStats(budget_ns=watchdog_ns)
+        self._watchdog_action = watchdog_action
+        # Set by ``_commit_scan`` right after ``ctx.commit`` so the scan
+        # timing can split the commit from the history bookkeeping.
+        self._commit_done_ns = 0
         self._system_runtime = SystemPointRuntime(
             time_mode_getter=lambda: self._time_mode,
             fixed_step_dt_getter=lambda: self._dt,
             rtc_now_getter=self._rtc_at_sim_time,
             rtc_setter=self._set_rtc_and_record,
+            scan_exec_sampler=self._sample_scan_exec,
         )
         self._input_overrides = InputOverrideManager(is_read_only=self._system_runtime.is_read_only)
         # Preserve direct access used in tests/live-tag helpers.
@@ -557,21 +561,28 @@ class PLC:
         self._breakpoints_by_id: dict[int, _BreakpointRegistration] = {}
         self._pause_requested_this_scan = False
         self._active_tokens: list[Token[PLC | None]] = []
+        self._profiler: ScanProfiler | None = ScanProfiler() if profile else None
         self._pre_scan_callbacks: list[Any] = []
-        self._known_tags_by_name: dict[str, Tag] = {}
-        self._refresh_known_tags_from_logic()
-        self._constrained_tags = build_constraint_index(self._known_tags_by_name)
+        # Called as ``cb(previous_state, state, changed_tags, rung_firings)``
+        # after each live (non-replay) commit.
+        self._post_commit_callbacks: list[Any] = []
+        # Shared with the image until this runner registers a tag of its
+        # own (patches and harness couplings can); see _register_known_tag.
+        self._known_tags_by_name: dict[str, Tag] = image._known_tags
+        self._owns_known_tags = False
+        self._constrained_tags = image._constrained_tags
         self._bounds_violations: dict[str, BoundsViolation] = {}
-        # Seed initial state with tag defaults (skip tags already in state).
-        seed = {
-            t.name: t.default
-            for t in self._known_tags_by_name.values()
-            if t.name not in self._state.tags
-        }
-        if seed:
-            self._state = self._state.with_tags(seed)
-            self._reset_cache(self._state)
-            self._initial_state = self._state
+        # Seed a caller-supplied state with tag defaults (skip tags already in state).
+        if initial_state is not None:
+            seed = {
+                t.name: t.default
+                for t in self._known_tags_by_name.values()
+                if t.name not in self._state.tags
+            }
+            if seed:
+                self._state = self._state.with_tags(seed)
+                self._reset_cache(self._state)
+                self._initial_state = self._state
 
     @property
     def program(self) -> Any:
@@ -598,6 +609,11 @@ class PLC:
         """Read-only history query surface."""
         return self._history
 
+    @property
+    def scan_stats(self) -> ScanStats:
+        """Measured host execution time of ``step()`` / ``run*()`` scans."""
+        return self._scan_stats
+
     @property
     def playhead(self) -> int:
         """Current scan id used for inspection/time-travel queries."""
@@ -663,43 +679,49 @@ class PLC:
                 changed[key] = (old_value, new_value)
         return changed
 
-    def _ensure_pdg(self) -> Any:
-        """Lazily build and cache the static program dependency graph.
-
-        Also populates ``_pdg_consumed_tags`` — every tag any rung
-        reads, combining condition-reads and data-reads via
-        ``readers_of`` — unioned with every Bool-typed tag the PDG
-        knows about.  The capture-layer filter keeps all Bools regardless
-        of read/write role: they're low-cardinality and usually the
-        tags users ask ``cause()`` about, so the direct-log path stays
-        cheap for them.  Non-Bool churn (Timer.acc et al.) still gets
-        filtered.  Any future site that invalidates ``_pdg_cache`` must
-        clear ``_pdg_consumed_tags`` together — the two caches share a
-        lifetime.
+    def changed_tags_since(self, scan_id: int) -> frozenset[str] | None:
+        """Return tag names whose committed value changed after ``scan_id``.
+
+        Unions the per-scan change sets recorded at commit time for every
+        scan in ``(scan_id, tip]``, so the cost is proportional to the
+        number of changes rather than the number of tags.  A tag that
+        changed and then changed back is still reported; callers that
+        want net changes compare the two endpoint values.
+
+        Returns ``None`` when ``scan_id`` predates the retained change
+        journal (or a reboot / stop-to-run reset) — fall back to
+        :meth:`diff` or a full comparison in that case.
         """
-        if not hasattr(self, "_pdg_cache") or self._pdg_cache is None:
-            from pyrung.core.analysis.pdg import build_program_graph
-            from pyrung.core.program import Program
-            from pyrung.core.tag import TagType
-
-            program = self._program
-            if program is None:
-                program = Program.__new__(Program)
-                program.rungs = list(self._logic)
-                program.subroutines = {}
-            self._pdg_cache = build_program_graph(program)
-            consumed = set(self._pdg_cache.readers_of.keys())
-            # Union in every Bool-typed tag the PDG observed.  A mixed
-            # rung (e.g. ``out(BoolFlag) + Timer.acc``) keeps the Bool
-            # write intact while the counter acc still drops — the
-            # intern pool stays small (only Bool patterns) so the rung
-            # never hits the fired-only threshold and causal chains on
-            # the Bool flag remain intact indefinitely.
-            for name, tag in self._pdg_cache.tags.items():
-                if getattr(tag, "type", None) == TagType.BOOL:
-                    consumed.add(name)
-            self._pdg_consumed_tags = frozenset(consumed)
-        return self._pdg_cache
+        if scan_id < self._changed_tags_floor or scan_id > self._state.scan_id:
+            return None
+        changed: set[str] = set()
+        for sid in range(scan_id + 1, self._state.scan_id + 1):
+            names = self._changed_tags_by_scan.get(sid)
+            if names:
+                changed.update(names)
+        return frozenset(changed)
+
+    def _record_changed_tags(
+        self, scan_id: int, previous_tags: PMap, pending: Mapping[str, Any]
+    ) -> frozenset[str]:
+        """Journal the tags whose value changed in the scan just committed."""
+        changed = frozenset(
+            name for name, value in pending.items() if previous_tags.get(name, _SENTINEL) != value
+        )
+        journal = self._changed_tags_by_scan
+        journal[scan_id] = changed
+        while len(journal) > _CHANGED_TAGS_WINDOW:
+            evicted_sid, _ = journal.popitem(last=False)
+            self._changed_tags_floor = evicted_sid
+        return changed
+
+    def _reset_changed_tags(self) -> None:
+        self._changed_tags_by_scan.clear()
+        self._changed_tags_floor = self._state.scan_id
+
+    def _ensure_pdg(self) -> Any:
+        """Return the static program dependency graph, built once per image."""
+        return self._image.pdg
 
     def _consumed_tags_for_capture(self) -> frozenset[str] | None:
         """Capture-worthy tag set for ``ScanContext.capturing_rung``
@@ -707,24 +729,15 @@ class PLC:
         bypassed.
 
         The set is consumed-tags (per PDG ``readers_of``) unioned with
-        every Bool-typed tag — see :meth:`_ensure_pdg`.  ``None``
-        bypasses the filter entirely — used for the
-        ``record_all_tags=True`` escape hatch, for logic-less PLCs (no
-        rung = no consumer, filter would silently drop every write),
-        and for programs with rungs the PDG cannot model (synthetic
-        test rungs that only implement ``evaluate(ctx)``).  Otherwise
-        the PDG is built lazily on first call; every subsequent
-        invocation is a single attribute read.
+        every Bool-typed tag — see `ProgramImage.consumed_tags`.
+        ``None`` bypasses the filter entirely — used for the
+        ``record_all_tags=True`` escape hatch and for logic the PDG
+        cannot model.  The set is built once per image; every
+        subsequent invocation is two attribute reads.
         """
-        if self._record_all_tags or not self._logic:
+        if self._record_all_tags:
             return None
-        if self._pdg_consumed_tags is None:
-            from pyrung.core.rung import Rung as RungClass
-
-            if not all(isinstance(rung, RungClass) for rung in self._logic):
-                return None
-            self._ensure_pdg()
-        return self._pdg_consumed_tags
+        return self._image.consumed_tags
 
     def cause(
         self,
@@ -982,20 +995,19 @@ class PLC:
     def fork(self, scan_id: int | None = None) -> PLC:
         """Create an independent runner from retained historical state.
 
+        The fork keeps a read-only reference to this runner's history:
+        ``fork.history.at()`` and ``fork.replay_to()`` for scans before the
+        fork point are answered by this runner, as long as it still retains
+        them.  The fork's ``history.range()``, ``scan_ids()`` and
+        ``oldest_scan_id`` cover only the fork's own scans.
+
         Args:
             scan_id: Snapshot to fork from. Defaults to current committed tip state.
         """
         target_scan_id = self._state.scan_id if scan_id is None else scan_id
         historical_state = self._state_at(target_scan_id)
-        fork = PLC(
-            logic=self._program if self._program is not None else list(self._logic),
-            initial_state=historical_state,
-            history=self._history_retention_scans,
-            cache=self._cache_retention_scans,
-            history_budget=self._recent_state_cache_budget,
-            checkpoint_interval=self._checkpoint_interval,
-            record_all_tags=self._record_all_tags,
-        )
+        fork = self._spawn(historical_state)
+        fork._history_parent = (self, historical_state.scan_id)
         fork._set_time_mode(self._time_mode, dt=self._dt)
         parent_rtc_at_fork_point = self._system_runtime._rtc_now(historical_state)
         fork._set_rtc_internal(parent_rtc_at_fork_point, fork.current_state.timestamp)
@@ -1027,6 +1039,9 @@ class PLC:
             return self._initial_state
         if self._initial_scan_id <= scan_id <= self._state.scan_id:
             return self.replay_to(scan_id).current_state
+        parent = self._history_parent
+        if parent is not None and scan_id < min(parent[1], self._initial_scan_id):
+            return parent[0]._state_at(scan_id)
         raise KeyError(scan_id)
 
     def _cache_state(self, state: SystemState) -> None:
@@ -1096,32 +1111,46 @@ class PLC:
                 self._recent_state_cache_bytes -= evicted_est
 
     def _compiled_replay_supported_kernel(self) -> CompiledKernel | None:
-        from pyrung.circuitpy.codegen import compile_kernel
-
         cached = self._compiled_replay_kernel
         if isinstance(cached, CompiledKernel):
             return cached
         if cached is False:
             return None
-        if self._time_mode != TimeMode.FIXED_STEP or self._program is None:
-            self._compiled_replay_kernel = False
-            return None
-        if _program_writes_read_only_system_tags(self._program):
-            self._compiled_replay_kernel = False
-            return None
-        try:
-            kernel = compile_kernel(self._program)
-        except Exception as exc:
-            if _looks_like_compiled_replay_gap(exc):
-                self._compiled_replay_kernel = False
-                return None
-            raise
-        if kernel.has_io_gaps:
+        if self._time_mode != TimeMode.FIXED_STEP:
             self._compiled_replay_kernel = False
             return None
-        self._compiled_replay_kernel = kernel
+        kernel = self._image.compiled_kernel()
+        self._compiled_replay_kernel = kernel if kernel is not None else False
         return kernel
 
+    def _spawn(self, state: SystemState, *, apply_memory_flags: bool = True) -> PLC:
+        """Build a runner on this runner's image positioned at *state*.
+
+        Every state a runner holds already carries each tag of its image
+        (construction seeds them and no scan removes them), so the child
+        skips the per-tag seeding ``PLC(initial_state=...)`` does, starts
+        from the same ``SystemState`` object, and shares the image's tag
+        registry until it registers a tag of its own.
+        """
+        child = PLC(
+            logic=self._image,
+            history=self._history_retention_scans,
+            cache=self._cache_retention_scans,
+            history_budget=self._recent_state_cache_budget,
+            checkpoint_interval=self._checkpoint_interval,
+            record_all_tags=self._record_all_tags,
+        )
+        if apply_memory_flags:
+            state = self._apply_runtime_memory_flags(state, mode_run=True, battery_present=True)
+        child._state = state
+        child._reset_cache(state)
+        child._initial_scan_id = state.scan_id
+        child._initial_state = state
+        child._playhead = state.scan_id
+        child._changed_tags_floor = state.scan_id
+        child._rtc_base_sim_time = float(state.timestamp)
+        return child
+
     def _fork_from_reconstructed_state(
         self,
         state: SystemState,
@@ -1130,20 +1159,7 @@ class PLC:
         forces: Mapping[str, bool | int | float | str],
         replay_mode: bool,
     ) -> PLC:
-        fork = PLC(
-            logic=self._program if self._program is not None else list(self._logic),
-            initial_state=state,
-            history=self._history_retention_scans,
-            cache=self._cache_retention_scans,
-            history_budget=self._recent_state_cache_budget,
-            checkpoint_interval=self._checkpoint_interval,
-            record_all_tags=self._record_all_tags,
-        )
-        fork._state = state
-        fork._reset_cache(state)
-        fork._initial_scan_id = state.scan_id
-        fork._initial_state = state
-        fork._playhead = state.scan_id
+        fork = self._spawn(state, apply_memory_flags=False)
         fork._set_time_mode(TimeMode.FIXED_STEP, dt=self._dt)
         fork._set_rtc_internal(rtc_at_state, state.timestamp)
         fork._input_overrides._forces.clear()
@@ -1205,6 +1221,7 @@ class PLC:
             replay.patch(log.patches_by_scan[scan_id])
         if log.dts is not None:
             replay._dt_override_for_next_scan = float(log.dts[scan_id - log.base_scan])
+        replay._scan_exec_for_next_scan = log.scan_exec_by_scan.get(scan_id)
         submits = log.io_submits_by_scan.get(scan_id, {})
         drains = log.io_drains_by_scan.get(scan_id, {})
         if submits or drains:
@@ -1286,6 +1303,7 @@ class PLC:
                 replay._set_rtc_internal(base, base_sim_time)
             if scan_id in log.patches_by_scan:
                 replay.patch(log.patches_by_scan[scan_id])
+            replay._scan_exec_for_next_scan = log.scan_exec_by_scan.get(scan_id)
             replay.step_replay()
             for record in log.io_submits_by_scan.get(scan_id, {}).values():
                 for tag_name, value in record.tag_writes:
@@ -1307,6 +1325,9 @@ class PLC:
 
     def replay_to(self, target_scan_id: int) -> PLC:
         """Reconstruct historical state, preferring compiled replay when supported."""
+        parent = self._history_parent
+        if parent is not None and target_scan_id < min(parent[1], self._initial_scan_id):
+            return parent[0].replay_to(target_scan_id)
         if target_scan_id < self._initial_scan_id:
             raise ValueError(
                 f"target_scan_id must be >= {self._initial_scan_id}, got {target_scan_id}"
@@ -1460,6 +1481,7 @@ class PLC:
                 replay._set_rtc_internal(base, base_sim_time)
             if scan_id in log.patches_by_scan:
                 replay.patch(log.patches_by_scan[scan_id])
+            replay._scan_exec_for_next_scan = log.scan_exec_by_scan.get(scan_id)
             if scan_id >= start_scan_id:
                 replay.step()
                 results.append(replay.current_state)
@@ -1548,6 +1570,68 @@ class PLC:
         self._this_scan_drained_patches = {}
         return self._state
 
+    def reset_to(self, image: ProgramImage) -> SystemState:
+        """Reinitialize this runner as if freshly built from *image*.
+
+        Equivalent to ``PLC(image, ...)`` with this runner's construction
+        options (time mode and ``dt``, retention, ``record_all_tags``,
+        profiling, watchdog) but without allocating a new runner: the
+        initial state is the image's shared snapshot, and history,
+        firing timelines, patches, forces, monitors, breakpoints, and
+        scan hooks are cleared.  Nothing is walked, so the cost does not
+        grow with program size.  Meant for test suites that reuse one
+        runner per image.
+
+        Returns:
+            The reset state.
+        """
+        self._image = image
+        self._logic = image.logic
+        self._program = image.program
+        self._known_tags_by_name = image._known_tags
+        self._owns_known_tags = False
+        self._constrained_tags = image._constrained_tags
+        self._bounds_violations = {}
+        self._compiled_replay_kernel = None
+
+        self._running = True
+        self._battery_present = True
+        self._state = image.initial_state
+        self._reset_cache(self._state)
+        self._initial_scan_id = self._state.scan_id
+        self._initial_state = self._state
+        self._history_parent = None
+        self._history._reset_labels()
+        self._playhead = self._state.scan_id
+        self._set_rtc_internal(self._normalize_rtc_datetime(datetime.now()), self._state.timestamp)
+
+        self._pending_patches.clear()
+        self._forces.clear()
+        self._pause_requested_this_scan = False
+        self._clear_retained_debug_trace_caches()
+        self._rung_firing_timelines.reset()
+        self._reset_changed_tags()
+        self._scan_stats.reset()
+        if self._profiler is not None:
+            self._profiler.reset()
+        self._monitors_by_id.clear()
+        self._breakpoints_by_id.clear()
+        self._pre_scan_callbacks.clear()
+        self._post_commit_callbacks.clear()
+
+        self._scan_log = ScanLog(time_mode=self._time_mode, base_scan=self._state.scan_id)
+        self._checkpoints = {}
+        self._forces_last_recorded = {}
+        self._this_scan_drained_patches = {}
+        self._dt_override_for_next_scan = None
+        self._scan_exec_for_next_scan = None
+        self._replay_mode = False
+        if self._time_mode == TimeMode.REALTIME:
+            self._last_step_time = time.perf_counter()
+        else:
+            self._last_step_time = None
+        return self._state
+
     def set_rtc(self, value: datetime) -> None:
         """Set the current RTC value for the runner."""
         self._set_rtc_and_record(self._normalize_rtc_datetime(value), self._state.timestamp)
@@ -1572,40 +1656,24 @@ class PLC:
         mode_run: bool,
         battery_present: bool,
     ) -> SystemState:
-        memory = state.memory.set(_MODE_RUN_KEY, bool(mode_run)).set(
+        memory = state.memory
+        if memory.get(_MODE_RUN_KEY) is bool(mode_run) and memory.get(_BATTERY_PRESENT_KEY) is bool(
+            battery_present
+        ):
+            return state
+        memory = memory.set(_MODE_RUN_KEY, bool(mode_run)).set(
             _BATTERY_PRESENT_KEY, bool(battery_present)
         )
         return state.set(memory=memory)
 
-    def _refresh_known_tags_from_logic(self) -> None:
-        for rung in self._logic:
-            for tag in _iter_referenced_tags(rung):
-                self._register_known_tag(tag)
-        if self._program is None:
-            return
-        for subroutine_rungs in self._program.subroutines.values():
-            for rung in subroutine_rungs:
-                for tag in _iter_referenced_tags(rung):
-                    self._register_known_tag(tag)
-
     def _register_known_tag(self, tag: Tag) -> None:
-        if tag.name in SYSTEM_TAGS_BY_NAME:
-            return
-        existing = self._known_tags_by_name.get(tag.name)
-        if existing is None:
-            self._known_tags_by_name[tag.name] = tag
+        known = self._known_tags_by_name
+        if known.get(tag.name) is tag:
             return
-        if (
-            existing.type != tag.type
-            or existing.retentive != tag.retentive
-            or existing.default != tag.default
-        ):
-            raise ValueError(
-                f"Conflicting tag metadata for {tag.name!r}: existing "
-                f"(type={existing.type.name}, retentive={existing.retentive}, "
-                f"default={existing.default!r}) vs new "
-                f"(type={tag.type.name}, retentive={tag.retentive}, default={tag.default!r})."
-            )
+        if not self._owns_known_tags:
+            known = self._known_tags_by_name = dict(known)
+            self._owns_known_tags = True
+        _register_known_tag(known, tag)
 
     def _register_known_tags_from_mapping_keys(
         self,
@@ -1718,6 +1786,8 @@ class PLC:
         # and checkpoints — Option B treats reboot like a fresh session
         # (see stage-4 notes in the design doc).
         self._rung_firing_timelines.reset()
+        self._reset_changed_tags()
+        self._scan_stats.reset()
 
         if self._time_mode == TimeMode.REALTIME:
             self._last_step_time = time.perf_counter()
@@ -2023,6 +2093,20 @@ class PLC:
 
         return self._state.tags.get(name, default)
 
+    def _sample_scan_exec(self, ctx_or_state: ScanContext | SystemState) -> tuple[int, ...]:
+        """``sys.scan_exec_*`` values, frozen per scan for replay.
+
+        Logic sees one sample per scan, taken on first read (or handed in
+        by replay) and recorded in the scan log at commit.  Reads against
+        a committed state report the live statistics.
+        """
+        if isinstance(ctx_or_state, SystemState):
+            return sample_scan_exec(self._scan_stats)
+        sample = self._this_scan_exec_sample
+        if sample is None:
+            sample = self._this_scan_exec_sample = sample_scan_exec(self._scan_stats)
+        return sample
+
     def _calculate_dt(self) -> float:
         """Calculate scan delta time based on current time mode."""
         if self._dt_override_for_next_scan is not None:
@@ -2042,6 +2126,8 @@ class PLC:
         """Create and initialize scan context before logic evaluation."""
         replay_io = getattr(self, "_next_scan_replay_io", None)
         self._next_scan_replay_io = None
+        self._this_scan_exec_sample = self._scan_exec_for_next_scan
+        self._scan_exec_for_next_scan = None
         ctx = ScanContext(
             self._state,
             resolver=self._system_runtime.resolve,
@@ -2058,6 +2144,7 @@ class PLC:
         dt = self._calculate_dt()
         if self._state.memory.get("_dt", _SENTINEL) != dt:
             ctx.set_memory("_dt", dt)
+        ctx._scan_dt = dt
         return ctx, dt
 
     def _capture_previous_states(self, ctx: ScanContext) -> None:
@@ -2066,17 +2153,28 @@ class PLC:
         Skips writes when the stored ``_prev:{name}`` already equals the
         current tag value — so idle scans (nothing changed) leave the
         memory PMap untouched and structurally shared with the prior scan.
+
+        When the scan starts from the state this runner last committed,
+        every tag outside this scan's writes and the last scan's writes
+        already has an up-to-date ``_prev`` entry, so only those names
+        are visited.  Any other starting state gets a full pass.
         """
-        state_memory = self._state.memory
-        for name in self._state.tags:
-            prev_key = f"_prev:{name}"
-            current = ctx.get_tag(name)
-            if state_memory.get(prev_key, _SENTINEL) != current:
-                ctx.set_memory(prev_key, current)
-        for name in ctx._tags_pending:
-            if name in self._state.tags:
-                continue
-            prev_key = f"_prev:{name}"
+        state = self._state
+        state_memory = state.memory
+        state_tags = state.tags
+        pending = ctx._tags_pending
+        names: Iterable[str]
+        if state is self._prev_synced_state:
+            names = itertools.chain(pending, self._prev_synced_writes)
+        else:
+            names = itertools.chain(
+                state_tags, (name for name in pending if name not in state_tags)
+            )
+        prev_keys = self._prev_keys
+        for name in names:
+            prev_key = prev_keys.get(name)
+            if prev_key is None:
+                prev_key = prev_keys[name] = f"_prev:{name}"
             current = ctx.get_tag(name)
             if state_memory.get(prev_key, _SENTINEL) != current:
                 ctx.set_memory(prev_key, current)
@@ -2102,8 +2200,14 @@ class PLC:
         else:
             self._bounds_violations = {}
         self._state = ctx.commit(dt=dt)
+        self._prev_synced_state = self._state
+        self._prev_synced_writes = ctx._tags_pending
+        self._commit_done_ns = time.perf_counter_ns()
         # Replay recorder: capture nondeterminism for this scan.
         new_scan_id = self._state.scan_id
+        changed_tags = self._record_changed_tags(
+            new_scan_id, previous_state.tags, ctx._tags_pending
+        )
         # Checkpoint bypass: the force-map write at checkpoint boundaries
         # is unconditional — replay reads force state from the checkpoint
         # scan's log entry, so diff-eliding it would strand reconstruction.
@@ -2119,6 +2223,9 @@ class PLC:
             self._checkpoints[new_scan_id] = self._state
         if self._scan_log.records_dt:
             self._scan_log.record_dt(new_scan_id, dt)
+        if self._this_scan_exec_sample is not None:
+            self._scan_log.record_scan_exec(new_scan_id, self._this_scan_exec_sample)
+            self._this_scan_exec_sample = None
         if ctx._io_submit_staging:
             for key, record in ctx._io_submit_staging.items():
                 self._scan_log.record_io_submit(new_scan_id, key, record)
@@ -2170,6 +2277,8 @@ class PLC:
         if not self._replay_mode:
             self._evaluate_monitors(previous_state=previous_state, current_state=self._state)
             self._evaluate_breakpoints(state=self._state)
+            for cb in self._post_commit_callbacks:
+                cb(previous_state, self._state, changed_tags, new_firings)
         self._sync_runtime_flags_from_state()
 
     def _evaluate_monitors(
@@ -2340,19 +2449,63 @@ class PLC:
 
     def _run_single_scan(self, *, consume_pause_request: bool) -> SystemState:
         self._cached_replay_trace = None
+        t0 = time.perf_counter_ns()
         ctx, dt = self._prepare_scan()
-        if self._program is not None:
+        t1 = time.perf_counter_ns()
+        if self._profiler is not None:
+            self._run_profiled_logic(ctx, self._profiler)
+        elif self._program is not None:
             execute_program(self._program, ctx, capture_rungs=True)
         else:
             for i, rung in enumerate(self._logic):
                 with ctx.capturing_rung(i):
                     rung.evaluate(ctx)
+        t2 = time.perf_counter_ns()
         self._commit_scan(ctx, dt)
+        t3 = time.perf_counter_ns()
+        if self._scan_stats.record(
+            self._state.scan_id,
+            t1 - t0,
+            t2 - t1,
+            self._commit_done_ns - t2,
+            t3 - self._commit_done_ns,
+        ):
+            self._on_watchdog_overrun()
 
         if consume_pause_request:
             self._consume_pause_request()
         return self._state
 
+    def _on_watchdog_overrun(self) -> None:
+        budget_ns = self._scan_stats.budget_ns
+        timing = self._scan_stats.last
+        assert budget_ns is not None and timing is not None
+        if self._watchdog_action == "raise":
+            raise ScanWatchdogError(timing, budget_ns)
+        if self._watchdog_action == "stop":
+            self.stop()
+            # End run()/run_for()/run_until() loops like a pause breakpoint;
+            # otherwise the next iteration would restart the PLC.
+            self._pause_requested_this_scan = True
+            return
+        warnings.warn(str(ScanWatchdogError(timing, budget_ns)), RuntimeWarning, stacklevel=3)
+
+    def _run_profiled_logic(self, ctx: ScanContext, profiler: ScanProfiler) -> None:
+        """Evaluate logic with the profiler observing execution boundaries.
+
+        A bare rung list has no executor walk, so only top-level rung
+        times are recorded for it.
+        """
+        profiler.begin_scan()
+        if self._program is not None:
+            execute_program(self._program, ctx, observer=profiler, capture_rungs=True)
+        else:
+            for i, rung in enumerate(self._logic):
+                profiler.begin_rung(ctx, i, rung, "rung", 0, None, ())
+                with ctx.capturing_rung(i):
+                    rung.evaluate(ctx)
+        profiler.end_scan()
+
     def run(self, cycles: int) -> SystemState:
         """Execute up to ``cycles`` scans, stopping early on pause breakpoints.
 
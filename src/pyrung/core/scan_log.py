@@ -18,6 +18,8 @@ those channels need to be recorded.
   and replay reads it from config).
 - ``lifecycle_events`` — ``stop``/``reboot``/``battery_present``/
   ``clear_forces`` operations that happen between scans.
+- ``scan_exec_by_scan`` — scans whose logic read a ``sys.scan_exec_*``
+  point, with the measured-timing sample it saw.
 
 Idle scans contribute **zero bytes**: if nothing happened on scan N,
 no key lands in any sparse dict and (in FIXED_STEP) no array slot is
@@ -95,6 +97,7 @@ class ScanLogSnapshot:
     lifecycle_events: tuple[LifecycleEvent, ...]
     io_submits_by_scan: Mapping[int, Mapping[str, IoSubmitRecord]]
     io_drains_by_scan: Mapping[int, Mapping[str, IoResultRecord]]
+    scan_exec_by_scan: Mapping[int, tuple[int, ...]]
 
 
 class ScanLog:
@@ -113,6 +116,7 @@ class ScanLog:
         self._lifecycle_events: list[LifecycleEvent] = []
         self._io_submits_by_scan: dict[int, dict[str, IoSubmitRecord]] = {}
         self._io_drains_by_scan: dict[int, dict[str, IoResultRecord]] = {}
+        self._scan_exec_by_scan: dict[int, tuple[int, ...]] = {}
 
     @property
     def base_scan(self) -> int:
@@ -160,6 +164,13 @@ class ScanLog:
     def record_io_drain(self, scan_id: int, key: str, record: IoResultRecord) -> None:
         self._io_drains_by_scan.setdefault(scan_id, {})[key] = record
 
+    def record_scan_exec(self, scan_id: int, sample: tuple[int, ...]) -> None:
+        """Record the ``sys.scan_exec_*`` sample logic read on ``scan_id``."""
+        self._scan_exec_by_scan[scan_id] = sample
+
+    def scan_exec_sample(self, scan_id: int) -> tuple[int, ...] | None:
+        return self._scan_exec_by_scan.get(scan_id)
+
     def snapshot(self) -> ScanLogSnapshot:
         """Return a frozen view of the log, safe to outlive further writes."""
         return ScanLogSnapshot(
@@ -171,6 +182,7 @@ class ScanLog:
             lifecycle_events=tuple(self._lifecycle_events),
             io_submits_by_scan=dict(self._io_submits_by_scan),
             io_drains_by_scan=dict(self._io_drains_by_scan),
+            scan_exec_by_scan=dict(self._scan_exec_by_scan),
         )
 
     def trim_before(self, scan_id: int) -> None:
@@ -191,6 +203,7 @@ class ScanLog:
             self._rtc_base_changes,
             self._io_submits_by_scan,
             self._io_drains_by_scan,
+            self._scan_exec_by_scan,
         ):
             for k in [k for k in d if k < scan_id]:
                 del d[k]
@@ -222,4 +235,5 @@ class ScanLog:
             size += 80 + 80 * len(submits)
         for drains in self._io_drains_by_scan.values():
             size += 80 + 120 * len(drains)
+        size += 120 * len(self._scan_exec_by_scan)
         return size
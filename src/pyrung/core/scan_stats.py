@@ -0,0 +1,185 @@
+"""Measured scan-time statistics and watchdog budget.
+
+``sys.scan_time_*_ms`` report the *simulated* scan period (``dt``), the
+way a Click PLC reports its cycle time.  ``ScanStats`` records what the
+host actually spent executing each scan, split into phases:
+
+- ``prepare``: context creation, patches, forces, system-point setup;
+- ``logic``: rung evaluation;
+- ``commit``: post-logic forces, edge-detection snapshots, state commit;
+- ``history``: scan log, checkpoints, firing timelines, state cache,
+  retention trim, monitors and breakpoints.
+
+Totals feed the ``sys.scan_exec_*`` read-only system points and an
+optional watchdog budget.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ScanTiming:
+    """Wall-clock execution time of one committed scan, in nanoseconds."""
+
+    scan_id: int
+    prepare_ns: int
+    logic_ns: int
+    commit_ns: int
+    history_ns: int
+
+    @property
+    def total_ns(self) -> int:
+        return self.prepare_ns + self.logic_ns + self.commit_ns + self.history_ns
+
+
+class ScanWatchdogError(RuntimeError):
+    """Raised when a scan exceeds the watchdog budget with ``watchdog_action="raise"``."""
+
+    def __init__(self, timing: ScanTiming, budget_ns: int) -> None:
+        self.timing = timing
+        self.budget_ns = budget_ns
+        super().__init__(
+            f"Scan {timing.scan_id} took {timing.total_ns / 1e6:.3f} ms, "
+            f"over the {budget_ns / 1e6:.3f} ms watchdog budget"
+        )
+
+
+class ScanStats:
+    """Running min/max/mean plus a rolling window of recent scan timings.
+
+    The window lives in preallocated ``array`` rings, so recording a scan
+    allocates nothing; :class:`ScanTiming` objects are built only when
+    read back through :attr:`last` or :meth:`recent`.
+
+    Args:
+        window: Number of recent scans kept for :meth:`recent`,
+            :meth:`histogram`, and :meth:`percentile`.
+        budget_ns: Watchdog budget; scans whose total exceeds it are
+            counted in :attr:`overruns`.  ``None`` disables the check.
+    """
+
+    def __init__(self, *, window: int = 1024, budget_ns: int | None = None) -> None:
+        if window < 1:
+            raise ValueError("window must be >= 1")
+        if budget_ns is not None and budget_ns <= 0:
+            raise ValueError("watchdog budget must be > 0")
+        self.budget_ns = budget_ns
+        self._window = window
+        self._scan_ids = array("q", bytes(8 * window))
+        self._prepare = array("q", bytes(8 * window))
+        self._logic = array("q", bytes(8 * window))
+        self._commit = array("q", bytes(8 * window))
+        self._history = array("q", bytes(8 * window))
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all counters and the rolling window."""
+        self._next = 0
+        self._filled = 0
+        self.count = 0
+        self.overruns = 0
+        self.min_ns: int | None = None
+        self.max_ns: int | None = None
+        self._sum_ns = 0
+
+    def _timing_at(self, slot: int) -> ScanTiming:
+        return ScanTiming(
+            scan_id=self._scan_ids[slot],
+            prepare_ns=self._prepare[slot],
+            logic_ns=self._logic[slot],
+            commit_ns=self._commit[slot],
+            history_ns=self._history[slot],
+        )
+
+    def _slots(self) -> range:
+        """Ring slots in the window, oldest first (indices modulo ``window``)."""
+        return range(self._next - self._filled, self._next)
+
+    @property
+    def last(self) -> ScanTiming | None:
+        """Timing of the most recent recorded scan."""
+        if not self._filled:
+            return None
+        return self._timing_at(self._next - 1)
+
+    def last_ns(self) -> tuple[int, int, int, int]:
+        """``(prepare, logic, commit, history)`` of the most recent scan, or zeros."""
+        if not self._filled:
+            return (0, 0, 0, 0)
+        slot = self._next - 1
+        return (self._prepare[slot], self._logic[slot], self._commit[slot], self._history[slot])
+
+    @property
+    def mean_ns(self) -> float:
+        return self._sum_ns / self.count if self.count else 0.0
+
+    def record(
+        self, scan_id: int, prepare_ns: int, logic_ns: int, commit_ns: int, history_ns: int
+    ) -> bool:
+        """Add one scan; return ``True`` if it overran the watchdog budget."""
+        slot = self._next
+        self._scan_ids[slot] = scan_id
+        self._prepare[slot] = prepare_ns
+        self._logic[slot] = logic_ns
+        self._commit[slot] = commit_ns
+        self._history[slot] = history_ns
+        self._next = 0 if slot + 1 == self._window else slot + 1
+        if self._filled < self._window:
+            self._filled += 1
+        total = prepare_ns + logic_ns + commit_ns + history_ns
+        self.count += 1
+        self._sum_ns += total
+        if self.min_ns is None or total < self.min_ns:
+            self.min_ns = total
+        if self.max_ns is None or total > self.max_ns:
+            self.max_ns = total
+        if self.budget_ns is not None and total > self.budget_ns:
+            self.overruns += 1
+            return True
+        return False
+
+    def recent(self) -> list[ScanTiming]:
+        """Timings in the rolling window (oldest -> newest)."""
+        return [self._timing_at(slot) for slot in self._slots()]
+
+    def _totals(self) -> list[int]:
+        return [
+            self._prepare[slot] + self._logic[slot] + self._commit[slot] + self._history[slot]
+            for slot in self._slots()
+        ]
+
+    def percentile(self, pct: float) -> int:
+        """Nearest-rank percentile of total scan time over the window, in ns."""
+        if not 0 <= pct <= 100:
+            raise ValueError("pct must be between 0 and 100")
+        totals = sorted(self._totals())
+        if not totals:
+            return 0
+        rank = max(1, -(-len(totals) * pct // 100))
+        return totals[int(rank) - 1]
+
+    def histogram(self) -> list[tuple[int, int]]:
+        """Power-of-two microsecond buckets over the window.
+
+        Returns ``(upper_bound_us, count)`` pairs in ascending order, where
+        a bucket holds scans with ``upper_bound_us / 2 < total <= upper_bound_us``
+        (the first bucket, ``1``, holds everything up to 1 us).  Empty
+        buckets between the smallest and largest are included.
+        """
+        counts: dict[int, int] = {}
+        for total_ns in self._totals():
+            total_us = -(-total_ns // 1000)
+            bound = 1 << max(0, (total_us - 1).bit_length())
+            counts[bound] = counts.get(bound, 0) + 1
+        if not counts:
+            return []
+        lo, hi = min(counts), max(counts)
+        buckets: list[tuple[int, int]] = []
+        bound = lo
+        while bound <= hi:
+            buckets.append((bound, counts.get(bound, 0)))
+            bound <<= 1
+        return buckets
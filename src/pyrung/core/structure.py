@@ -10,6 +10,7 @@ import builtins
 from collections.abc import Callable, Iterable, Sized
 from dataclasses import dataclass
 from enum import IntEnum
+from functools import partial
 from typing import Any, ClassVar, Literal, Protocol, get_origin
 
 from pyrung.core.memory_block import Block, BlockRange
@@ -195,6 +196,8 @@ class InstanceView:
         self._tag_cache: dict[str, Tag] = {}
 
     def __getattr__(self, field_name: str) -> Tag:
+        if "_owner" not in self.__dict__:
+            raise AttributeError(field_name)
         cached = self._tag_cache.get(field_name)
         if cached is not None:
             return cached
@@ -400,7 +403,9 @@ class _StructRuntime:
         return InstanceView(self, index)
 
     def __getattr__(self, field_name: str) -> Block | LiveTag:
-        block = self._blocks.get(field_name)
+        # Read through __dict__ so lookups during unpickling (before state is
+        # restored) raise AttributeError instead of recursing.
+        block = self.__dict__.get("_blocks", {}).get(field_name)
         if block is None:
             raise AttributeError(f"{type(self).__name__} has no field {field_name!r}.")
         if self.count == 1:
@@ -890,25 +895,26 @@ def _resolve_annotation(annotation: object, field_name: str) -> TagType:
     )
 
 
+# Factories return partials of module-level functions (not closures) so
+# structure blocks stay picklable, e.g. for the nickname TagMap cache.
 def _make_default_factory(default_spec: object):
-    def _factory(index: int) -> object:
-        return resolve_default(default_spec, index)
+    return partial(resolve_default, default_spec)
 
-    return _factory
 
+def _field_address(struct_name: str, field_name: str, _: str, addr: int) -> str:
+    return f"{struct_name}{addr}_{field_name}"
 
-def _make_formatter(struct_name: str, field_name: str):
-    def _formatter(_: str, addr: int) -> str:
-        return f"{struct_name}{addr}_{field_name}"
 
-    return _formatter
+def _compact_field_address(struct_name: str, field_name: str, _: str, __: int) -> str:
+    return f"{struct_name}_{field_name}"
 
 
-def _make_compact_formatter(struct_name: str, field_name: str):
-    def _formatter(_: str, __: int) -> str:
-        return f"{struct_name}_{field_name}"
+def _make_formatter(struct_name: str, field_name: str):
+    return partial(_field_address, struct_name, field_name)
 
-    return _formatter
+
+def _make_compact_formatter(struct_name: str, field_name: str):
+    return partial(_compact_field_address, struct_name, field_name)
 
 
 def _validate_name(name: str) -> None:
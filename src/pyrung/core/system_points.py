@@ -7,10 +7,11 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, cast
 
-from pyrung.core.tag import Bool, Int, Tag
+from pyrung.core.tag import Bool, Dint, Int, Tag
 
 if TYPE_CHECKING:
     from pyrung.core.context import ScanContext
+    from pyrung.core.scan_stats import ScanStats
     from pyrung.core.state import SystemState
     from pyrung.core.time_mode import TimeMode
 
@@ -38,6 +39,15 @@ class SysNamespace:
     scan_time_max_ms: Tag
     scan_time_fixed_setup_ms: Tag
     interrupt_scan_time_ms: Tag
+    scan_exec_us: Tag
+    scan_exec_min_us: Tag
+    scan_exec_max_us: Tag
+    scan_exec_avg_us: Tag
+    scan_prepare_us: Tag
+    scan_logic_us: Tag
+    scan_commit_us: Tag
+    scan_history_us: Tag
+    scan_overrun_count: Tag
 
 
 @dataclass(frozen=True)
@@ -110,70 +120,81 @@ def _iter_namespace_tags(namespace: Any) -> tuple[Tag, ...]:
 
 system = SystemNamespaces(
     sys=SysNamespace(
-        always_on=Bool("sys.always_on"),
-        first_scan=Bool("sys.first_scan"),
-        scan_clock_toggle=Bool("sys.scan_clock_toggle"),
-        clock_10ms=Bool("sys.clock_10ms"),
-        clock_100ms=Bool("sys.clock_100ms"),
-        clock_500ms=Bool("sys.clock_500ms"),
-        clock_1s=Bool("sys.clock_1s"),
-        clock_1m=Bool("sys.clock_1m"),
-        clock_1h=Bool("sys.clock_1h"),
-        mode_switch_run=Bool("sys.mode_switch_run"),
-        mode_run=Bool("sys.mode_run"),
-        cmd_mode_stop=Bool("sys.cmd_mode_stop"),
-        cmd_watchdog_reset=Bool("sys.cmd_watchdog_reset"),
-        fixed_scan_mode=Bool("sys.fixed_scan_mode"),
-        battery_present=Bool("sys.battery_present"),
-        scan_counter=Int("sys.scan_counter", retentive=False),
-        scan_time_current_ms=Int("sys.scan_time_current_ms", retentive=False),
-        scan_time_min_ms=Int("sys.scan_time_min_ms", retentive=False),
-        scan_time_max_ms=Int("sys.scan_time_max_ms", retentive=False),
-        scan_time_fixed_setup_ms=Int("sys.scan_time_fixed_setup_ms", retentive=False),
-        interrupt_scan_time_ms=Int("sys.interrupt_scan_time_ms", retentive=False),
+        always_on=Bool("sys.always_on", _internal=True),
+        first_scan=Bool("sys.first_scan", _internal=True),
+        scan_clock_toggle=Bool("sys.scan_clock_toggle", _internal=True),
+        clock_10ms=Bool("sys.clock_10ms", _internal=True),
+        clock_100ms=Bool("sys.clock_100ms", _internal=True),
+        clock_500ms=Bool("sys.clock_500ms", _internal=True),
+        clock_1s=Bool("sys.clock_1s", _internal=True),
+        clock_1m=Bool("sys.clock_1m", _internal=True),
+        clock_1h=Bool("sys.clock_1h", _internal=True),
+        mode_switch_run=Bool("sys.mode_switch_run", _internal=True),
+        mode_run=Bool("sys.mode_run", _internal=True),
+        cmd_mode_stop=Bool("sys.cmd_mode_stop", _internal=True),
+        cmd_watchdog_reset=Bool("sys.cmd_watchdog_reset", _internal=True),
+        fixed_scan_mode=Bool("sys.fixed_scan_mode", _internal=True),
+        battery_present=Bool("sys.battery_present", _internal=True),
+        scan_counter=Int("sys.scan_counter", retentive=False, _internal=True),
+        scan_time_current_ms=Int("sys.scan_time_current_ms", retentive=False, _internal=True),
+        scan_time_min_ms=Int("sys.scan_time_min_ms", retentive=False, _internal=True),
+        scan_time_max_ms=Int("sys.scan_time_max_ms", retentive=False, _internal=True),
+        scan_time_fixed_setup_ms=Int(
+            "sys.scan_time_fixed_setup_ms", retentive=False, _internal=True
+        ),
+        interrupt_scan_time_ms=Int("sys.interrupt_scan_time_ms", retentive=False, _internal=True),
+        scan_exec_us=Dint("sys.scan_exec_us", retentive=False, _internal=True),
+        scan_exec_min_us=Dint("sys.scan_exec_min_us", retentive=False, _internal=True),
+        scan_exec_max_us=Dint("sys.scan_exec_max_us", retentive=False, _internal=True),
+        scan_exec_avg_us=Dint("sys.scan_exec_avg_us", retentive=False, _internal=True),
+        scan_prepare_us=Dint("sys.scan_prepare_us", retentive=False, _internal=True),
+        scan_logic_us=Dint("sys.scan_logic_us", retentive=False, _internal=True),
+        scan_commit_us=Dint("sys.scan_commit_us", retentive=False, _internal=True),
+        scan_history_us=Dint("sys.scan_history_us", retentive=False, _internal=True),
+        scan_overrun_count=Dint("sys.scan_overrun_count", retentive=False, _internal=True),
     ),
     rtc=RtcNamespace(
-        year4=Int("rtc.year4", retentive=False),
-        year2=Int("rtc.year2", retentive=False),
-        month=Int("rtc.month", retentive=False),
-        day=Int("rtc.day", retentive=False),
-        weekday=Int("rtc.weekday", retentive=False),
-        hour=Int("rtc.hour", retentive=False),
-        minute=Int("rtc.minute", retentive=False),
-        second=Int("rtc.second", retentive=False),
-        new_year4=Int("rtc.new_year4", retentive=False),
-        new_month=Int("rtc.new_month", retentive=False),
-        new_day=Int("rtc.new_day", retentive=False),
-        new_hour=Int("rtc.new_hour", retentive=False),
-        new_minute=Int("rtc.new_minute", retentive=False),
-        new_second=Int("rtc.new_second", retentive=False),
-        apply_date=Bool("rtc.apply_date"),
-        apply_date_error=Bool("rtc.apply_date_error"),
-        apply_time=Bool("rtc.apply_time"),
-        apply_time_error=Bool("rtc.apply_time_error"),
+        year4=Int("rtc.year4", retentive=False, _internal=True),
+        year2=Int("rtc.year2", retentive=False, _internal=True),
+        month=Int("rtc.month", retentive=False, _internal=True),
+        day=Int("rtc.day", retentive=False, _internal=True),
+        weekday=Int("rtc.weekday", retentive=False, _internal=True),
+        hour=Int("rtc.hour", retentive=False, _internal=True),
+        minute=Int("rtc.minute", retentive=False, _internal=True),
+        second=Int("rtc.second", retentive=False, _internal=True),
+        new_year4=Int("rtc.new_year4", retentive=False, _internal=True),
+        new_month=Int("rtc.new_month", retentive=False, _internal=True),
+        new_day=Int("rtc.new_day", retentive=False, _internal=True),
+        new_hour=Int("rtc.new_hour", retentive=False, _internal=True),
+        new_minute=Int("rtc.new_minute", retentive=False, _internal=True),
+        new_second=Int("rtc.new_second", retentive=False, _internal=True),
+        apply_date=Bool("rtc.apply_date", _internal=True),
+        apply_date_error=Bool("rtc.apply_date_error", _internal=True),
+        apply_time=Bool("rtc.apply_time", _internal=True),
+        apply_time_error=Bool("rtc.apply_time_error", _internal=True),
     ),
     fault=FaultNamespace(
-        plc_error=Bool("fault.plc_error"),
-        division_error=Bool("fault.division_error"),
-        out_of_range=Bool("fault.out_of_range"),
-        address_error=Bool("fault.address_error"),
-        math_operation_error=Bool("fault.math_operation_error"),
-        code=Int("fault.code", retentive=False),
+        plc_error=Bool("fault.plc_error", _internal=True),
+        division_error=Bool("fault.division_error", _internal=True),
+        out_of_range=Bool("fault.out_of_range", _internal=True),
+        address_error=Bool("fault.address_error", _internal=True),
+        math_operation_error=Bool("fault.math_operation_error", _internal=True),
+        code=Int("fault.code", retentive=False, _internal=True),
     ),
     firmware=FirmwareNamespace(
-        main_ver_low=Int("firmware.main_ver_low", retentive=False),
-        main_ver_high=Int("firmware.main_ver_high", retentive=False),
-        sub_ver_low=Int("firmware.sub_ver_low", retentive=False),
-        sub_ver_high=Int("firmware.sub_ver_high", retentive=False),
+        main_ver_low=Int("firmware.main_ver_low", retentive=False, _internal=True),
+        main_ver_high=Int("firmware.main_ver_high", retentive=False, _internal=True),
+        sub_ver_low=Int("firmware.sub_ver_low", retentive=False, _internal=True),
+        sub_ver_high=Int("firmware.sub_ver_high", retentive=False, _internal=True),
     ),
     storage=StorageNamespace(
         sd=StorageSdNamespace(
-            eject_cmd=Bool("storage.sd.eject_cmd"),
-            delete_all_cmd=Bool("storage.sd.delete_all_cmd"),
-            ready=Bool("storage.sd.ready"),
-            write_status=Bool("storage.sd.write_status"),
-            error=Bool("storage.sd.error"),
-            error_code=Int("storage.sd.error_code", retentive=False),
+            eject_cmd=Bool("storage.sd.eject_cmd", _internal=True),
+            delete_all_cmd=Bool("storage.sd.delete_all_cmd", _internal=True),
+            ready=Bool("storage.sd.ready", _internal=True),
+            write_status=Bool("storage.sd.write_status", _internal=True),
+            error=Bool("storage.sd.error", _internal=True),
+            error_code=Int("storage.sd.error_code", retentive=False, _internal=True),
         )
     ),
 )
@@ -226,6 +247,15 @@ _DERIVED_TAG_NAMES = frozenset(
         system.sys.scan_time_current_ms.name,
         system.sys.scan_time_fixed_setup_ms.name,
         system.sys.interrupt_scan_time_ms.name,
+        system.sys.scan_exec_us.name,
+        system.sys.scan_exec_min_us.name,
+        system.sys.scan_exec_max_us.name,
+        system.sys.scan_exec_avg_us.name,
+        system.sys.scan_prepare_us.name,
+        system.sys.scan_logic_us.name,
+        system.sys.scan_commit_us.name,
+        system.sys.scan_history_us.name,
+        system.sys.scan_overrun_count.name,
         system.rtc.year4.name,
         system.rtc.year2.name,
         system.rtc.month.name,
@@ -337,6 +367,41 @@ def _set_memory_if_changed(ctx: ScanContext, key: str, value: Any) -> None:
         ctx.set_memory(key, value)
 
 
+_SCAN_EXEC_TAG_ORDER = (
+    system.sys.scan_exec_us.name,
+    system.sys.scan_exec_min_us.name,
+    system.sys.scan_exec_max_us.name,
+    system.sys.scan_exec_avg_us.name,
+    system.sys.scan_prepare_us.name,
+    system.sys.scan_logic_us.name,
+    system.sys.scan_commit_us.name,
+    system.sys.scan_history_us.name,
+    system.sys.scan_overrun_count.name,
+)
+_SCAN_EXEC_TAG_NAMES = frozenset(_SCAN_EXEC_TAG_ORDER)
+_SCAN_EXEC_INDEX = {name: index for index, name in enumerate(_SCAN_EXEC_TAG_ORDER)}
+
+
+def sample_scan_exec(stats: ScanStats) -> tuple[int, ...]:
+    """Values of the ``sys.scan_exec_*`` points, in ``_SCAN_EXEC_TAG_ORDER``.
+
+    The runner samples these once per scan that reads them and records
+    the tuple in its scan log, so replay feeds logic the same numbers.
+    """
+    prepare_ns, logic_ns, commit_ns, history_ns = stats.last_ns()
+    return (
+        (prepare_ns + logic_ns + commit_ns + history_ns) // 1000,
+        (stats.min_ns or 0) // 1000,
+        (stats.max_ns or 0) // 1000,
+        int(stats.mean_ns) // 1000,
+        prepare_ns // 1000,
+        logic_ns // 1000,
+        commit_ns // 1000,
+        history_ns // 1000,
+        stats.overruns,
+    )
+
+
 class SystemPointRuntime:
     """Runtime resolver and lifecycle hooks for core system points."""
 
@@ -347,11 +412,14 @@ class SystemPointRuntime:
         fixed_step_dt_getter: Callable[[], float],
         rtc_now_getter: Callable[[float], datetime],
         rtc_setter: Callable[[datetime, float], None],
+        scan_exec_sampler: Callable[[ScanContext | SystemState], tuple[int, ...] | None]
+        | None = None,
     ) -> None:
         self._time_mode_getter = time_mode_getter
         self._fixed_step_dt_getter = fixed_step_dt_getter
         self._rtc_now_getter = rtc_now_getter
         self._rtc_setter = rtc_setter
+        self._scan_exec_sampler = scan_exec_sampler
 
     @property
     def read_only_tags(self) -> frozenset[str]:
@@ -403,6 +471,8 @@ class SystemPointRuntime:
             return True, 0
         if name == system.sys.interrupt_scan_time_ms.name:
             return True, 0
+        if name in _SCAN_EXEC_TAG_NAMES:
+            return True, self._scan_exec_value(name, ctx_or_state)
 
         if name == system.storage.sd.ready.name:
             return True, bool(_raw_get_memory(ctx_or_state, _SD_READY_KEY, True))
@@ -571,6 +641,18 @@ class SystemPointRuntime:
             },
         )
 
+    def _scan_exec_value(self, name: str, ctx_or_state: ScanContext | SystemState) -> int:
+        """Measured host execution time, sampled by the runner.
+
+        These are not stored in state: the runner records the sample a
+        scan read in its scan log and hands it back on replay, so
+        wall-clock jitter never makes a replayed scan diverge.
+        """
+        sample = self._scan_exec_sampler(ctx_or_state) if self._scan_exec_sampler else None
+        if sample is None:
+            return 0
+        return sample[_SCAN_EXEC_INDEX[name]]
+
     def _scan_time_current_ms(self, ctx_or_state: ScanContext | SystemState) -> int:
         dt = float(_raw_get_memory(ctx_or_state, "_dt", self._fixed_step_dt_getter()))
         return int(round(dt * 1000))
@@ -671,6 +671,7 @@ class _TagTypeBase(LiveTag):
         max: int | float | None = None,
         uom: str | None = None,
         band: BandMap | None = None,
+        _internal: bool = False,
     ) -> None:
         # __new__ returns LiveTag and bypasses this initializer.
         return None
@@ -694,12 +695,13 @@ class _TagTypeBase(LiveTag):
         max: int | float | None = None,
         uom: str | None = None,
         band: BandMap | None = None,
+        _internal: bool = False,
     ) -> LiveTag:
         import sys
 
         from pyrung.core._naming import _resolve_name
 
-        name = _resolve_name(cls.__name__, name, sys._getframe(1), stacklevel=3)
+        name = _resolve_name(cls.__name__, name, sys._getframe(1), stacklevel=3, internal=_internal)
         if retentive is None:
             retentive = cls._default_retentive
         if not isinstance(name, str):
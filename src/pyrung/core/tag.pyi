@@ -156,6 +156,7 @@ class _TagTypeBase(LiveTag):
         max: int | float | None = None,
         uom: str | None = None,
         band: BandMap | None = None,
+        _internal: bool = False,
     ) -> None: ...
     def __new__(
         cls,
@@ -176,6 +177,7 @@ class _TagTypeBase(LiveTag):
         max: int | float | None = None,
         uom: str | None = None,
         band: BandMap | None = None,
+        _internal: bool = False,
     ) -> LiveTag: ...
 
 class Bool(_TagTypeBase): ...
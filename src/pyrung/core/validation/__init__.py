@@ -73,6 +73,7 @@ from pyrung.core.validation.walker import (
     ProgramLocation,
     ValueKind,
     walk_program,
+    walk_rung,
 )
 
 __all__ = [
@@ -118,4 +119,5 @@ __all__ = [
     "validate_readonly_writes",
     "validate_stuck_bits",
     "walk_program",
+    "walk_rung",
 ]
@@ -367,15 +367,27 @@ class _Walker:
     def walk(self, program: Program) -> ProgramFacts:
         # 1. Main rungs in list order
         for rung_index, rung in enumerate(program.rungs):
-            self._walk_rung(rung, "main", None, rung_index, ())
+            self.walk_top_level_rung(rung, "main", None, rung_index)
 
         # 2. Subroutines in sorted name order
         for sub_name in sorted(program.subroutines):
             for rung_index, rung in enumerate(program.subroutines[sub_name]):
-                self._walk_rung(rung, "subroutine", sub_name, rung_index, ())
+                self.walk_top_level_rung(rung, "subroutine", sub_name, rung_index)
 
         return ProgramFacts(operands=tuple(self._facts))
 
+    def walk_top_level_rung(
+        self,
+        rung: Rung,
+        scope: FactScope,
+        subroutine: str | None,
+        rung_index: int,
+    ) -> None:
+        # The repeat guard is per rung, so each rung's facts depend on that
+        # rung alone and can be extracted (and cached) independently.
+        self._seen.clear()
+        self._walk_rung(rung, scope, subroutine, rung_index, ())
+
     # -- rung traversal ----------------------------------------------------
 
     def _walk_rung(
@@ -644,6 +656,29 @@ def walk_program(program: Program) -> ProgramFacts:
     covering every instruction argument and rung condition in the program.
 
     This function is policy-free: it classifies values but makes no decisions
-    about allowed/disallowed usage.
+    about allowed/disallowed usage.  The result is cached on the Program (and
+    dropped when a rung is added), so every validator consuming facts for
+    the same program shares one extraction pass.
+    """
+    cached_facts = getattr(program, "_cached_facts", None)
+    if cached_facts is not None:
+        return cached_facts
+    facts = _Walker().walk(program)
+    program._cached_facts = facts
+    return facts
+
+
+def walk_rung(
+    rung: Rung,
+    *,
+    scope: FactScope = "main",
+    subroutine: str | None = None,
+    rung_index: int = 0,
+) -> tuple[OperandFact, ...]:
+    """Extract the facts of one top-level rung, located as given.
+
+    Yields exactly the facts `walk_program` reports for that rung.
     """
-    return _Walker().walk(program)
+    walker = _Walker()
+    walker.walk_top_level_rung(rung, scope, subroutine, rung_index)
+    return tuple(walker._facts)
@@ -87,6 +87,7 @@ class DAPAdapter:
 
         self._capture = CaptureBuffer()
         self._live_server: Any = None
+        self._telemetry: Any = None
         self._harness: Any = None
         self._bounds_accumulator: dict[str, Any] = {}
         self._notes: dict[int, list[str]] = {}
@@ -101,6 +102,7 @@ class DAPAdapter:
         import pyrung.dap.miner_console  # noqa: F401
         import pyrung.dap.reload_console  # noqa: F401
         import pyrung.dap.spec_console  # noqa: F401
+        import pyrung.dap.telemetry_console  # noqa: F401
 
     @property
     def _runner(self) -> PLC | None:
@@ -109,6 +111,8 @@ class DAPAdapter:
     @_runner.setter
     def _runner(self, value: PLC | None) -> None:
         self._session.runner = value
+        if self._telemetry is not None:
+            self._telemetry.attach(value)
 
     @property
     def _scan_gen(self) -> Generator[ScanStep, None, None] | None:
@@ -333,6 +337,9 @@ class DAPAdapter:
     def _on_pause(self, _args: dict[str, Any]) -> HandlerResult:
         return execution_flow.on_pause(self, _args)
 
+    def _on_pyrungSubscribeTags(self, args: dict[str, Any]) -> HandlerResult:
+        return execution_flow.on_pyrung_subscribe_tags(self, args)
+
     def _on_setBreakpoints(self, args: dict[str, Any]) -> HandlerResult:
         return breakpoint_requests.on_set_breakpoints(self, args)
 
@@ -8,10 +8,11 @@ from __future__ import annotations
 
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Any
 
 from pyrung.core.runner import ScanStep
+from pyrung.core.state import SystemState
 
 HandlerResult = tuple[dict[str, Any], list[tuple[str, dict[str, Any] | None]]]
 
@@ -117,21 +118,18 @@ def continue_worker(adapter: Any) -> None:
             trace_body = adapter._live_trace_body_locked()
             if trace_body is None and not force:
                 return
-            current_tags = dict(adapter._runner.current_state.tags)
-
-        changes: list[dict[str, Any]] = []
-        prev = buffer.previous_tags
-        for tag_name in set(prev.keys()) | set(current_tags.keys()):
-            old_val = prev.get(tag_name)
-            new_val = current_tags.get(tag_name)
-            if old_val != new_val:
-                changes.append(
-                    {
-                        "tag": tag_name,
-                        "previous": adapter._format_value(old_val),
-                        "current": adapter._format_value(new_val),
-                    }
-                )
+            runner = adapter._runner
+            current = runner.current_state
+            baseline = buffer.baseline
+            changed = runner.changed_tags_since(baseline.scan_id) if baseline is not None else None
+
+        changes = scan_frame_changes(
+            adapter,
+            baseline=baseline,
+            current=current,
+            changed=changed,
+            subscribed=adapter._session.subscribed_tags,
+        )
 
         frame_body: dict[str, Any] = {
             "scanId": trace_body.get("scanId") if trace_body else None,
@@ -148,7 +146,7 @@ def continue_worker(adapter: Any) -> None:
         buffer.monitors = []
         buffer.snapshots = []
         buffer.outputs = []
-        buffer.previous_tags = current_tags
+        buffer.baseline = current
 
     try:
         adapter._pending_predicate_pause = False
@@ -157,7 +155,7 @@ def continue_worker(adapter: Any) -> None:
             if runner is None:
                 return
             adapter._session.scan_frame_buffer = ScanFrameBuffer(
-                previous_tags=dict(runner.current_state.tags),
+                baseline=runner.current_state,
             )
 
         while not adapter._stop_event.is_set():
@@ -209,6 +207,63 @@ def continue_worker(adapter: Any) -> None:
         adapter._pause_event.clear()
 
 
+def scan_frame_changes(
+    adapter: Any,
+    *,
+    baseline: SystemState | None,
+    current: SystemState,
+    changed: frozenset[str] | None,
+    subscribed: frozenset[str] | None,
+) -> list[dict[str, Any]]:
+    """Build the ``changes`` list of a ``pyrungScanFrame`` body.
+
+    ``changed`` is the runner's accumulated changed-tag set since the
+    baseline scan, so the cost tracks what moved rather than the tag
+    count.  ``None`` means the runner could no longer answer (reboot,
+    journal window exceeded) and the full tag maps are compared instead.
+    Only tags in ``subscribed`` are reported when a subscription is set.
+    """
+    previous_tags = baseline.tags if baseline is not None else {}
+    current_tags = current.tags
+    if changed is None:
+        candidates: Iterable[str] = set(previous_tags.keys()) | set(current_tags.keys())
+    else:
+        candidates = changed
+    if subscribed is not None:
+        candidates = [name for name in candidates if name in subscribed]
+
+    changes: list[dict[str, Any]] = []
+    for tag_name in sorted(candidates):
+        old_val = previous_tags.get(tag_name)
+        new_val = current_tags.get(tag_name)
+        if old_val != new_val:
+            changes.append(
+                {
+                    "tag": tag_name,
+                    "previous": adapter._format_value(old_val),
+                    "current": adapter._format_value(new_val),
+                }
+            )
+    return changes
+
+
+def on_pyrung_subscribe_tags(adapter: Any, args: dict[str, Any]) -> HandlerResult:
+    """Limit the ``changes`` list of live scan frames to the tags a client displays.
+
+    ``tags: null`` (or omitted) restores the unfiltered default.
+    """
+    raw_tags = args.get("tags")
+    if raw_tags is None:
+        subscribed = None
+    elif isinstance(raw_tags, list) and all(isinstance(tag, str) for tag in raw_tags):
+        subscribed = frozenset(raw_tags)
+    else:
+        raise adapter.DAPAdapterError("pyrungSubscribeTags.tags must be a list of strings or null")
+    with adapter._state_lock:
+        adapter._session.subscribed_tags = subscribed
+    return {"tags": None if subscribed is None else sorted(subscribed)}, []
+
+
 def invalidate_mid_scan(adapter: Any) -> None:
     """Discard a partially-advanced scan so the next advance starts fresh.
 
@@ -125,6 +125,7 @@ def shutdown(adapter: Any) -> HandlerResult:
     adapter._watch_stop_event = None
 
     _stop_live_server(adapter)
+    _stop_telemetry(adapter)
     _uninstall_harness(adapter)
     with adapter._state_lock:
         adapter._clear_debug_registrations_locked()
@@ -161,6 +162,12 @@ def _stop_live_server(adapter: Any) -> None:
         adapter._live_server = None
 
 
+def _stop_telemetry(adapter: Any) -> None:
+    from pyrung.dap.telemetry_console import stop_telemetry
+
+    stop_telemetry(adapter)
+
+
 def _try_auto_install_harness(adapter: Any) -> None:
     from pyrung.dap.harness_console import try_auto_install
 
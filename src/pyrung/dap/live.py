@@ -188,6 +188,7 @@ def _build_command_epilog() -> str:
     import pyrung.dap.capture  # noqa: F401
     import pyrung.dap.harness_console  # noqa: F401
     import pyrung.dap.reload_console  # noqa: F401
+    import pyrung.dap.telemetry_console  # noqa: F401
     from pyrung.dap.console import _format_grouped_help
 
     return _format_grouped_help()
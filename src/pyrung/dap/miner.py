@@ -7,10 +7,12 @@ suppress via the review console verbs.
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Literal
 
+from pyrung.core.history import HistoryColumns
 from pyrung.dap.capture import CaptureEntry
 
 CandidateKind = Literal["edge_correlation", "steady_implication", "value_temporal"]
@@ -80,12 +82,15 @@ def mine_candidates(
     owned = _instruction_owned_tags(runner)
     relevant -= owned
 
-    edges = _build_edge_map(runner, relevant, scan_start, scan_end)
+    columns = history.columns(relevant, scan_start, scan_end + 1)
+    edges = _build_edge_map(columns)
 
     raw: list[Candidate] = []
-    raw.extend(_mine_edge_correlations(edges, relevant, graph, tag_meta, dt, scan_range, runner))
-    raw.extend(_mine_steady_implications(relevant, graph, tag_meta, dt, scan_range, runner))
-    raw.extend(_mine_value_temporals(edges, relevant, graph, tag_meta, dt, scan_range, runner))
+    raw.extend(_mine_edge_correlations(edges, relevant, graph, tag_meta, dt, scan_range))
+    raw.extend(
+        _mine_steady_implications(columns, edges, relevant, graph, tag_meta, dt, scan_range, runner)
+    )
+    raw.extend(_mine_value_temporals(edges, columns, relevant, graph, tag_meta, dt, scan_range))
 
     filtered = [c for c in raw if c.formula not in suppressed]
 
@@ -379,27 +384,8 @@ def _lock_filter(candidates: list[Candidate], runner: Any) -> list[Candidate]:
 # ---------------------------------------------------------------------------
 
 
-def _build_edge_map(
-    runner: Any,
-    relevant: set[str],
-    scan_start: int,
-    scan_end: int,
-) -> dict[str, list[Edge]]:
-    history = runner.history
-    edges: dict[str, list[Edge]] = {tag: [] for tag in relevant}
-
-    for scan_id in range(scan_start + 1, scan_end + 1):
-        if not history.contains(scan_id - 1) or not history.contains(scan_id):
-            continue
-        before = history.at(scan_id - 1).tags
-        after = history.at(scan_id).tags
-        for tag in relevant:
-            old = before.get(tag)
-            new = after.get(tag)
-            if old != new:
-                edges[tag].append((scan_id, old, new))
-
-    return edges
+def _build_edge_map(columns: HistoryColumns) -> dict[str, list[Edge]]:
+    return {tag: columns.edges(tag) for tag in columns.values}
 
 
 # ---------------------------------------------------------------------------
@@ -456,9 +442,9 @@ def _mine_edge_correlations(
     tag_meta: dict[str, Any],
     dt: float,
     scan_range: tuple[int, int],
-    runner: Any,
 ) -> list[Candidate]:
     candidates: list[Candidate] = []
+    edge_scans = {tag: [edge[0] for edge in tag_edges] for tag, tag_edges in edges.items()}
 
     for a_tag in sorted(relevant):
         a_edges = edges.get(a_tag, [])
@@ -470,27 +456,24 @@ def _mine_edge_correlations(
         if not targets:
             continue
 
+        a_scans = edge_scans[a_tag]
         for b_tag in sorted(targets):
             b_edges = edges.get(b_tag, [])
             if not b_edges:
                 continue
 
-            obs_count = 0
-            viol_count = 0
-            max_delay = 0
-
-            for a_scan, _a_old, _a_new in a_edges:
-                matched = False
-                for b_scan, _b_old, _b_new in b_edges:
-                    delay = b_scan - a_scan
-                    if 0 <= delay <= _MAX_TEMPORAL_WINDOW:
-                        matched = True
-                        max_delay = max(max_delay, delay)
-                        break
-                if matched:
-                    obs_count += 1
-                else:
-                    viol_count += 1
+            # First B edge at or after each A edge; B scans are sorted, so
+            # if that one is outside the window no later one is inside it.
+            b_scans = edge_scans[b_tag]
+            delays = [
+                b_scans[idx] - a_scan
+                for a_scan in a_scans
+                if (idx := bisect_left(b_scans, a_scan)) < len(b_scans)
+            ]
+            matched = [delay for delay in delays if delay <= _MAX_TEMPORAL_WINDOW]
+            obs_count = len(matched)
+            viol_count = len(a_scans) - obs_count
+            max_delay = max(matched, default=0)
 
             if obs_count < _MIN_EDGE_OBSERVATIONS:
                 continue
@@ -587,6 +570,8 @@ def _structurally_provable(
 
 
 def _mine_steady_implications(
+    columns: HistoryColumns,
+    edges: dict[str, list[Edge]],
     relevant: set[str],
     graph: Any,
     tag_meta: dict[str, Any],
@@ -596,7 +581,6 @@ def _mine_steady_implications(
 ) -> list[Candidate]:
     from pyrung.core.tag import TagType
 
-    history = runner.history
     scan_start, scan_end = scan_range
 
     bool_tags = set()
@@ -608,12 +592,7 @@ def _mine_steady_implications(
     if len(bool_tags) < 2:
         return []
 
-    scans: list[dict[str, Any]] = []
-    for sid in range(scan_start, scan_end + 1):
-        if history.contains(sid):
-            scans.append(dict(history.at(sid).tags))
-
-    if len(scans) < _MIN_IMPLICATION_SCANS:
+    if len(columns) < _MIN_IMPLICATION_SCANS:
         return []
 
     noisy = _tags_forced_entire_window(runner, scan_start, scan_end)
@@ -626,8 +605,8 @@ def _mine_steady_implications(
         except Exception:
             pass
 
-    edges = _build_edge_map(runner, bool_tags, scan_start, scan_end)
-    varied = {tag for tag, tag_edges in edges.items() if tag_edges}
+    varied = {tag for tag in bool_tags if edges.get(tag)}
+    true_masks = {tag: columns.true_mask(tag) for tag in bool_tags}
 
     candidates: list[Candidate] = []
 
@@ -635,8 +614,9 @@ def _mine_steady_implications(
         if a_tag in noisy:
             continue
 
-        a_true_scans = [s for s in scans if s.get(a_tag) is True]
-        if len(a_true_scans) < _MIN_IMPLICATION_SCANS:
+        a_mask = true_masks[a_tag]
+        a_true_count = a_mask.bit_count()
+        if a_true_count < _MIN_IMPLICATION_SCANS:
             continue
 
         downstream = _downstream_of(a_tag, graph)
@@ -654,8 +634,8 @@ def _mine_steady_implications(
             if b_tag in noisy:
                 continue
 
-            b_in_a_true = [s.get(b_tag) for s in a_true_scans]
-            if all(v is True for v in b_in_a_true):
+            b_mask = true_masks[b_tag]
+            if a_mask & ~b_mask == 0:
                 structural = _structurally_provable(a_tag, b_tag, False, forms, program)
                 if not structural and b_tag not in varied:
                     continue
@@ -672,12 +652,12 @@ def _mine_steady_implications(
                         observed_delay_scans=0,
                         physics_floor_scans=None,
                         dt_seconds=dt,
-                        observation_count=len(a_true_scans),
+                        observation_count=a_true_count,
                         violation_count=0,
                         scan_range=scan_range,
                     )
                 )
-            elif all(v is not True for v in b_in_a_true):
+            elif a_mask & b_mask == 0:
                 structural = _structurally_provable(a_tag, b_tag, True, forms, program)
                 if not structural and b_tag not in varied:
                     continue
@@ -694,7 +674,7 @@ def _mine_steady_implications(
                         observed_delay_scans=0,
                         physics_floor_scans=None,
                         dt_seconds=dt,
-                        observation_count=len(a_true_scans),
+                        observation_count=a_true_count,
                         violation_count=0,
                         scan_range=scan_range,
                     )
@@ -710,17 +690,17 @@ def _mine_steady_implications(
 
 def _mine_value_temporals(
     edges: dict[str, list[Edge]],
+    columns: HistoryColumns,
     relevant: set[str],
     graph: Any,
     tag_meta: dict[str, Any],
     dt: float,
     scan_range: tuple[int, int],
-    runner: Any,
 ) -> list[Candidate]:
     from pyrung.core.tag import TagType
 
-    history = runner.history
-    scan_start, scan_end = scan_range
+    _scan_start, scan_end = scan_range
+    edge_scans = {tag: [edge[0] for edge in tag_edges] for tag, tag_edges in edges.items()}
 
     non_bool: set[str] = set()
     for tag_name in relevant:
@@ -767,27 +747,32 @@ def _mine_value_temporals(
                 max_delay = 0
                 observed_b_val: Any = None
 
+                b_edges = edges.get(b_tag, [])
+                b_scans = edge_scans.get(b_tag, [])
+
                 for t_scan in trigger_scans:
                     window_end = min(t_scan + _MAX_TEMPORAL_WINDOW, scan_end)
-                    found = False
-                    for sid in range(t_scan, window_end + 1):
-                        if not history.contains(sid):
-                            continue
-                        b_val = history.at(sid).tags.get(b_tag)
-
-                        if observed_b_val is None:
-                            if sid > t_scan and b_val != history.at(t_scan).tags.get(b_tag):
-                                observed_b_val = b_val
-                                found = True
-                                max_delay = max(max_delay, sid - t_scan)
+                    # B only differs from its value at ``t_scan`` on scans
+                    # where it has an edge, so walk B's edges in the window
+                    # instead of every scan.
+                    idx = bisect_right(b_scans, t_scan)
+                    hit: int | None = None
+                    if observed_b_val is None:
+                        if idx < len(b_scans) and b_scans[idx] <= window_end:
+                            hit = b_scans[idx]
+                            observed_b_val = b_edges[idx][2]
+                    elif columns.value_at(b_tag, t_scan) == observed_b_val:
+                        hit = t_scan
+                    else:
+                        end = bisect_right(b_scans, window_end)
+                        for b_scan, _b_old, b_new in b_edges[idx:end]:
+                            if b_new == observed_b_val:
+                                hit = b_scan
                                 break
-                        elif b_val == observed_b_val:
-                            found = True
-                            max_delay = max(max_delay, sid - t_scan)
-                            break
 
-                    if found:
+                    if hit is not None:
                         obs_count += 1
+                        max_delay = max(max_delay, hit - t_scan)
                     else:
                         viol_count += 1
 
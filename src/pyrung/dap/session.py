@@ -10,6 +10,7 @@ from pyrung.core import PLC
 from pyrung.core.context import ScanContext
 from pyrung.core.rung import Rung
 from pyrung.core.runner import ScanStep
+from pyrung.core.state import SystemState
 
 
 @dataclass
@@ -19,7 +20,7 @@ class ScanFrameBuffer:
     monitors: list[dict[str, Any]] = field(default_factory=list)
     snapshots: list[dict[str, Any]] = field(default_factory=list)
     outputs: list[str] = field(default_factory=list)
-    previous_tags: dict[str, Any] = field(default_factory=dict)
+    baseline: SystemState | None = None
 
 
 @dataclass
@@ -36,3 +37,4 @@ class DebugSession:
     configuration_done: bool = False
     scan_frame_buffer: ScanFrameBuffer | None = None
     session_name: str | None = None
+    subscribed_tags: frozenset[str] | None = None
@@ -0,0 +1,595 @@
+"""pyrung telemetry: streaming per-scan deltas to out-of-process readers.
+
+Server side (``TelemetryServer``) hooks a ``PLC`` — DAP-hosted or
+headless — and pushes one compact binary record per committed scan to
+every connected client over a persistent localhost connection.
+Client side (``TelemetryClient``) tails the stream and decodes frames;
+``main()`` is the ``pyrung telemetry`` CLI entry point.
+
+The scan thread only appends ``(scan, changes, firings)`` to a bounded
+ring buffer; encoding and socket writes happen on a sender thread.  When
+a reader falls behind, the oldest scans are dropped and the next frame
+reports how many were lost — the scan loop never blocks on a client.
+
+Wire format (little-endian, one ``send_bytes`` payload per batch of
+records):
+
+  - ``H`` ``<B``      hello: protocol version, first record on a stream.
+  - ``T`` ``<HH``     tag definition: tag id, name length, UTF-8 name.
+  - ``D`` ``<I``      dropped: scans lost before the next ``S`` record.
+  - ``S`` ``<QdIHH``  scan: scan id, timestamp, scan duration (us),
+    rung count, value count; then one ``<H`` per fired rung index and
+    one ``<HB`` (tag id, value code) plus payload per changed tag.
+  - ``F``             full snapshot: same layout as ``S`` but carries every
+    (subscribed) tag of the current state; sent once when a client attaches,
+    before its first ``S`` record.
+
+Value codes: 0 ``None``, 1 ``False``, 2 ``True``, 3 int (``<q``),
+4 float (``<d``), 5 str (``<H`` length + UTF-8).  Tag ids are assigned
+per connection and defined by a ``T`` record before first use; a
+connection can define at most 65536 tags, and the server warns once when
+a stream runs out of ids.
+
+Session discovery mirrors ``pyrung live``:
+  ``<session_dir>/pyrung-<name>.telemetry`` containing the TCP port.
+"""
+
+from __future__ import annotations
+
+import argparse
+import struct
+import sys
+import threading
+import time
+import warnings
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+from typing import Any
+
+from pyrung.dap.live import _SESSION_DIR
+
+_PROTOCOL_VERSION = 1
+_DEFAULT_BUFFER_SCANS = 65536
+
+_HELLO = struct.Struct("<cB")
+_TAG_DEF = struct.Struct("<cHH")
+_DROPPED = struct.Struct("<cI")
+_SCAN = struct.Struct("<cQdIHH")
+_U16 = struct.Struct("<H")
+_VALUE_HEAD = struct.Struct("<HB")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR = range(6)
+_I64_MIN, _I64_MAX = -(2**63), 2**63 - 1
+_U32_MAX = 2**32 - 1
+_MAX_TAG_IDS = 0x10000
+
+
+def _telemetry_file(session_name: str) -> Path:
+    return _SESSION_DIR / f"pyrung-{session_name}.telemetry"
+
+
+@dataclass(frozen=True)
+class TelemetryFrame:
+    """One decoded scan record."""
+
+    scan_id: int
+    timestamp: float
+    duration_us: int
+    rungs: tuple[int, ...]
+    values: dict[str, Any]
+    dropped: int = 0
+    snapshot: bool = False
+
+
+# ---------------------------------------------------------------------------
+# Encoding
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _ScanRecord:
+    seq: int
+    scan_id: int
+    timestamp: float
+    duration_us: int
+    rungs: tuple[int, ...]
+    values: dict[str, Any]
+
+
+def _encode_value(out: bytearray, tag_id: int, value: Any) -> None:
+    if value is None:
+        out += _VALUE_HEAD.pack(tag_id, _NONE)
+    elif value is True:
+        out += _VALUE_HEAD.pack(tag_id, _TRUE)
+    elif value is False:
+        out += _VALUE_HEAD.pack(tag_id, _FALSE)
+    elif isinstance(value, int) and _I64_MIN <= value <= _I64_MAX:
+        out += _VALUE_HEAD.pack(tag_id, _INT)
+        out += _I64.pack(value)
+    elif isinstance(value, float):
+        out += _VALUE_HEAD.pack(tag_id, _FLOAT)
+        out += _F64.pack(value)
+    else:
+        raw = str(value).encode("utf-8")[:0xFFFF]
+        out += _VALUE_HEAD.pack(tag_id, _STR)
+        out += _U16.pack(len(raw))
+        out += raw
+
+
+@dataclass
+class _ClientStream:
+    """Per-connection subscription and tag-id table."""
+
+    conn: Any
+    subscribed: frozenset[str] | None
+    tag_ids: dict[str, int] = field(default_factory=dict)
+    last_seq: int | None = None
+    needs_snapshot: bool = False
+    overflowed: bool = False
+
+    def encode(self, records: list[_ScanRecord]) -> bytes:
+        out = bytearray()
+        for record in records:
+            if self.last_seq is not None and record.seq > self.last_seq + 1:
+                out += _DROPPED.pack(b"D", min(record.seq - self.last_seq - 1, _U32_MAX))
+            self.last_seq = record.seq
+            self._encode_scan(out, b"S", record)
+        return bytes(out)
+
+    def encode_snapshot(self, record: _ScanRecord) -> bytes:
+        """Encode ``record`` as the full-state ``F`` record that opens a stream."""
+        out = bytearray()
+        self._encode_scan(out, b"F", record)
+        self.last_seq = record.seq
+        self.needs_snapshot = False
+        return bytes(out)
+
+    def _encode_scan(self, out: bytearray, kind: bytes, record: _ScanRecord) -> None:
+        values = record.values
+        if self.subscribed is not None:
+            values = {name: v for name, v in values.items() if name in self.subscribed}
+        for name in values:
+            if name not in self.tag_ids:
+                self._define_tag(out, name)
+        values = {name: v for name, v in values.items() if name in self.tag_ids}
+
+        rungs = record.rungs[:0xFFFF]
+        out += _SCAN.pack(
+            kind,
+            record.scan_id,
+            record.timestamp,
+            min(record.duration_us, _U32_MAX),
+            len(rungs),
+            len(values),
+        )
+        for rung_index in rungs:
+            out += _U16.pack(rung_index)
+        for name, value in values.items():
+            _encode_value(out, self.tag_ids[name], value)
+
+    def _define_tag(self, out: bytearray, name: str) -> None:
+        if len(self.tag_ids) >= _MAX_TAG_IDS:
+            if not self.overflowed:
+                self.overflowed = True
+                warnings.warn(
+                    f"Telemetry stream ran out of tag ids ({_MAX_TAG_IDS} tags); "
+                    f"{name!r} and any further new tags are not streamed to this client. "
+                    "Subscribe to fewer tags to stay within the limit.",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+            return
+        tag_id = len(self.tag_ids)
+        self.tag_ids[name] = tag_id
+        raw = name.encode("utf-8")
+        out += _TAG_DEF.pack(b"T", tag_id, len(raw))
+        out += raw
+
+
+def decode_records(payload: bytes, tag_names: dict[int, str]) -> list[TelemetryFrame]:
+    """Decode one payload into frames, updating ``tag_names`` from ``T`` records."""
+    frames: list[TelemetryFrame] = []
+    dropped = 0
+    view = memoryview(payload)
+    pos = 0
+    end = len(payload)
+    while pos < end:
+        kind = bytes(view[pos : pos + 1])
+        if kind == b"H":
+            _kind, version = _HELLO.unpack_from(view, pos)
+            if version != _PROTOCOL_VERSION:
+                raise ValueError(f"Unsupported telemetry protocol version {version}")
+            pos += _HELLO.size
+        elif kind == b"T":
+            _kind, tag_id, length = _TAG_DEF.unpack_from(view, pos)
+            pos += _TAG_DEF.size
+            tag_names[tag_id] = bytes(view[pos : pos + length]).decode("utf-8")
+            pos += length
+        elif kind == b"D":
+            _kind, count = _DROPPED.unpack_from(view, pos)
+            dropped += count
+            pos += _DROPPED.size
+        elif kind in (b"S", b"F"):
+            _kind, scan_id, timestamp, duration_us, n_rungs, n_values = _SCAN.unpack_from(view, pos)
+            pos += _SCAN.size
+            rungs = tuple(_U16.unpack_from(view, pos + 2 * i)[0] for i in range(n_rungs))
+            pos += 2 * n_rungs
+            values: dict[str, Any] = {}
+            for _ in range(n_values):
+                tag_id, code = _VALUE_HEAD.unpack_from(view, pos)
+                pos += _VALUE_HEAD.size
+                value: Any
+                if code == _NONE:
+                    value = None
+                elif code == _FALSE:
+                    value = False
+                elif code == _TRUE:
+                    value = True
+                elif code == _INT:
+                    (value,) = _I64.unpack_from(view, pos)
+                    pos += _I64.size
+                elif code == _FLOAT:
+                    (value,) = _F64.unpack_from(view, pos)
+                    pos += _F64.size
+                elif code == _STR:
+                    (length,) = _U16.unpack_from(view, pos)
+                    pos += _U16.size
+                    value = bytes(view[pos : pos + length]).decode("utf-8")
+                    pos += length
+                else:
+                    raise ValueError(f"Unknown telemetry value code {code}")
+                values[tag_names[tag_id]] = value
+            frames.append(
+                TelemetryFrame(
+                    scan_id=scan_id,
+                    timestamp=timestamp,
+                    duration_us=duration_us,
+                    rungs=rungs,
+                    values=values,
+                    dropped=dropped,
+                    snapshot=kind == b"F",
+                )
+            )
+            dropped = 0
+        else:
+            raise ValueError(f"Unknown telemetry record {kind!r}")
+    return frames
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+
+class TelemetryServer:
+    """Stream per-scan telemetry from a ``PLC`` to localhost clients.
+
+    Usage::
+
+        server = TelemetryServer(plc, "line1")
+        server.start()
+        ...
+        server.stop()
+
+    ``buffer_scans`` bounds the ring buffer between the scan thread and
+    the sender thread; older scans are dropped (and reported to clients)
+    once it is full.  Each new client first receives a full snapshot of
+    the current state, then per-scan deltas.
+    """
+
+    def __init__(
+        self,
+        plc: Any,
+        session_name: str,
+        *,
+        buffer_scans: int = _DEFAULT_BUFFER_SCANS,
+    ) -> None:
+        if buffer_scans < 1:
+            raise ValueError("buffer_scans must be >= 1")
+        self._plc: Any = None
+        self._session_name = session_name
+        self._ring: deque[_ScanRecord] = deque(maxlen=buffer_scans)
+        self._seq = 0
+        self._sent_seq = 0
+        self._scan_started: float | None = None
+        self._clients: list[_ClientStream] = []
+        self._clients_lock = threading.Lock()
+        self._listener: Listener | None = None
+        self._threads: list[threading.Thread] = []
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._port: int | None = None
+        self.attach(plc)
+
+    @property
+    def session_name(self) -> str:
+        return self._session_name
+
+    @property
+    def port(self) -> int | None:
+        return self._port
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    def attach(self, plc: Any) -> None:
+        """Move the scan hooks to ``plc`` (``None`` detaches)."""
+        if self._plc is plc:
+            return
+        if self._plc is not None:
+            try:
+                self._plc._pre_scan_callbacks.remove(self._on_pre_scan)
+            except ValueError:
+                pass
+            try:
+                self._plc._post_commit_callbacks.remove(self._on_commit)
+            except ValueError:
+                pass
+        self._plc = plc
+        self._scan_started = None
+        if plc is not None:
+            plc._pre_scan_callbacks.append(self._on_pre_scan)
+            plc._post_commit_callbacks.append(self._on_commit)
+
+    def start(self) -> None:
+        self._listener = Listener(("localhost", 0), family="AF_INET")
+        self._port = int(self._listener.address[1])
+        _SESSION_DIR.mkdir(parents=True, exist_ok=True)
+        _telemetry_file(self._session_name).write_text(str(self._port), encoding="utf-8")
+        for target, suffix in ((self._accept_loop, "accept"), (self._send_loop, "send")):
+            thread = threading.Thread(
+                target=target,
+                daemon=True,
+                name=f"pyrung-telemetry-{suffix}-{self._session_name}",
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        self.attach(None)
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+        with self._clients_lock:
+            clients, self._clients = self._clients, []
+        for client in clients:
+            client.conn.close()
+        # The accept thread exits once the closed listener raises; only the
+        # sender is joined so no batch is written after ``stop`` returns.
+        for thread in self._threads:
+            if thread.name.startswith("pyrung-telemetry-send"):
+                thread.join(timeout=2.0)
+        self._threads.clear()
+        tf = _telemetry_file(self._session_name)
+        if tf.exists():
+            tf.unlink(missing_ok=True)
+
+    # -- scan thread ---------------------------------------------------------
+
+    def _on_pre_scan(self) -> None:
+        self._scan_started = time.perf_counter()
+
+    def _on_commit(
+        self,
+        _previous_state: Any,
+        state: Any,
+        changed: frozenset[str],
+        firings: Mapping[int, Any],
+    ) -> None:
+        started = self._scan_started
+        self._scan_started = None
+        if not self._clients:
+            return
+        duration_us = int((time.perf_counter() - started) * 1e6) if started is not None else 0
+        tags = state.tags
+        self._seq += 1
+        self._ring.append(
+            _ScanRecord(
+                seq=self._seq,
+                scan_id=state.scan_id,
+                timestamp=state.timestamp,
+                duration_us=duration_us,
+                rungs=tuple(sorted(firings)),
+                values={name: tags.get(name) for name in changed},
+            )
+        )
+        self._wake.set()
+
+    # -- background threads --------------------------------------------------
+
+    def _snapshot_record(self) -> _ScanRecord | None:
+        plc = self._plc
+        if plc is None:
+            return None
+        state = plc.current_state
+        return _ScanRecord(
+            seq=self._sent_seq,
+            scan_id=state.scan_id,
+            timestamp=state.timestamp,
+            duration_us=0,
+            rungs=(),
+            values=dict(state.tags),
+        )
+
+    def _accept_loop(self) -> None:
+        listener = self._listener
+        assert listener is not None
+        while not self._stop.is_set():
+            try:
+                conn = listener.accept()
+            except OSError:
+                break
+            try:
+                raw = conn.recv_bytes().decode("utf-8")
+                names = frozenset(name for name in raw.split("\n") if name)
+                conn.send_bytes(_HELLO.pack(b"H", _PROTOCOL_VERSION))
+            except (OSError, EOFError, UnicodeDecodeError):
+                conn.close()
+                continue
+            client = _ClientStream(conn=conn, subscribed=names or None, needs_snapshot=True)
+            with self._clients_lock:
+                self._clients.append(client)
+            self._wake.set()
+
+    def _send_loop(self) -> None:
+        ring = self._ring
+        while not self._stop.is_set():
+            self._wake.wait(timeout=0.1)
+            self._wake.clear()
+            records: list[_ScanRecord] = []
+            while ring:
+                records.append(ring.popleft())
+            if records:
+                self._sent_seq = records[-1].seq
+            with self._clients_lock:
+                clients = list(self._clients)
+            # Read after draining the ring so the snapshot already holds every
+            # popped record; new clients skip those and start from the snapshot.
+            snapshot = self._snapshot_record() if any(c.needs_snapshot for c in clients) else None
+            if not records and snapshot is None:
+                continue
+            dead: list[_ClientStream] = []
+            for client in clients:
+                try:
+                    if client.needs_snapshot:
+                        if snapshot is None:
+                            continue
+                        client.conn.send_bytes(client.encode_snapshot(snapshot))
+                    elif records:
+                        client.conn.send_bytes(client.encode(records))
+                except OSError:
+                    dead.append(client)
+            if dead:
+                with self._clients_lock:
+                    self._clients = [c for c in self._clients if c not in dead]
+                for client in dead:
+                    client.conn.close()
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+
+def list_telemetry_sessions() -> list[str]:
+    """Return names of sessions that published a telemetry port file."""
+    if not _SESSION_DIR.is_dir():
+        return []
+    prefix = "pyrung-"
+    suffix = ".telemetry"
+    return sorted(
+        p.name[len(prefix) : -len(suffix)]
+        for p in _SESSION_DIR.glob(f"{prefix}*{suffix}")
+        if p.is_file()
+    )
+
+
+class TelemetryClient:
+    """Tail a ``TelemetryServer`` stream.
+
+    Iterating yields ``TelemetryFrame`` objects until the server closes
+    the connection.  ``tags`` limits the stream to those tag names;
+    ``None`` subscribes to every changed tag.
+    """
+
+    def __init__(self, session_name: str, *, tags: Iterable[str] | None = None) -> None:
+        tf = _telemetry_file(session_name)
+        if not tf.exists():
+            raise FileNotFoundError(f"Session '{session_name}' has no telemetry stream")
+        port = int(tf.read_text(encoding="utf-8").strip())
+        self._conn = Client(("localhost", port), family="AF_INET")
+        self._conn.send_bytes("\n".join(tags or ()).encode("utf-8"))
+        self._tag_names: dict[int, str] = {}
+
+    def __enter__(self) -> TelemetryClient:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def read(self, timeout: float | None = None) -> list[TelemetryFrame]:
+        """Return the frames of the next batch, or ``[]`` after ``timeout`` seconds.
+
+        Raises ``EOFError`` once the server has closed the stream.
+        """
+        if timeout is not None and not self._conn.poll(timeout):
+            return []
+        try:
+            payload = self._conn.recv_bytes()
+        except OSError as exc:
+            raise EOFError("telemetry stream closed") from exc
+        return decode_records(payload, self._tag_names)
+
+    def __iter__(self) -> Iterator[TelemetryFrame]:
+        while True:
+            try:
+                frames = self.read()
+            except EOFError:
+                return
+            yield from frames
+
+
+# ---------------------------------------------------------------------------
+# CLI entry point
+# ---------------------------------------------------------------------------
+
+
+def _format_frame(frame: TelemetryFrame) -> str:
+    parts = [f"scan {frame.scan_id}", f"t={frame.timestamp:.3f}", f"{frame.duration_us}us"]
+    if frame.dropped:
+        parts.append(f"(dropped {frame.dropped})")
+    if frame.rungs:
+        parts.append("rungs=" + ",".join(str(r) for r in frame.rungs))
+    parts.extend(f"{name}={value!r}" for name, value in frame.values.items())
+    return " ".join(parts)
+
+
+def main() -> None:
+    """``pyrung telemetry`` command-line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="pyrung telemetry",
+        description="Tail the per-scan telemetry stream of a running pyrung session",
+    )
+    parser.add_argument("--session", "-s", help="Session name to connect to")
+    parser.add_argument("--count", "-n", type=int, help="Exit after N frames")
+    parser.add_argument("tags", nargs="*", help="Tags to subscribe to (default: all)")
+    args = parser.parse_args()
+
+    if not args.session:
+        sessions = list_telemetry_sessions()
+        if len(sessions) == 1:
+            args.session = sessions[0]
+        elif not sessions:
+            parser.error("no telemetry streams")
+        else:
+            parser.error(
+                f"multiple telemetry streams ({', '.join(sessions)}), use --session to pick one"
+            )
+
+    try:
+        client = TelemetryClient(args.session, tags=args.tags or None)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"Cannot connect to telemetry for session '{args.session}'", file=sys.stderr)
+        sys.exit(1)
+
+    seen = 0
+    with client:
+        try:
+            for frame in client:
+                print(_format_frame(frame), flush=True)
+                seen += 1
+                if args.count is not None and seen >= args.count:
+                    break
+        except KeyboardInterrupt:
+            pass
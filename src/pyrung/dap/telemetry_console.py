@@ -0,0 +1,60 @@
+"""Telemetry stream control for the DAP debug session.
+
+Console verbs: ``telemetry start``, ``telemetry stop``, ``telemetry status``.
+The stream follows the session's runner across reloads and forks.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pyrung.dap.console import ConsoleResult, register
+
+
+def stop_telemetry(adapter: Any) -> None:
+    """Stop the telemetry server if present."""
+    server = adapter._telemetry
+    if server is not None:
+        server.stop()
+        adapter._telemetry = None
+
+
+@register("telemetry", usage="telemetry <start|stop|status>", group="capture")
+def _cmd_telemetry(adapter: Any, expression: str) -> ConsoleResult:
+    parts = expression.strip().split()
+    if len(parts) < 2:
+        raise adapter.DAPAdapterError("Usage: telemetry start | telemetry stop | telemetry status")
+
+    sub = parts[1].lower()
+    server = adapter._telemetry
+
+    if sub == "status":
+        if server is None:
+            return ConsoleResult("Telemetry: off")
+        return ConsoleResult(
+            f"Telemetry: streaming on port {server.port} ({server.client_count} client(s))"
+        )
+    if sub == "start":
+        if server is not None:
+            return ConsoleResult(f"Telemetry already streaming on port {server.port}")
+        from pyrung.dap.telemetry import TelemetryServer
+
+        session_name = adapter._session.session_name or "default"
+        server = TelemetryServer(adapter._require_runner_locked(), session_name)
+        try:
+            server.start()
+        except OSError as exc:
+            server.stop()
+            raise adapter.DAPAdapterError(f"Could not start telemetry: {exc}") from exc
+        adapter._telemetry = server
+        return ConsoleResult(
+            f"Telemetry streaming on port {server.port} — "
+            f"`pyrung telemetry -s {session_name}` to tail"
+        )
+    if sub == "stop":
+        if server is None:
+            return ConsoleResult("Telemetry: off")
+        stop_telemetry(adapter)
+        return ConsoleResult("Telemetry stopped")
+
+    raise adapter.DAPAdapterError(f"Unknown telemetry subcommand '{sub}'. Use: start, stop, status")
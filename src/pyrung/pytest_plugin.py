@@ -2,7 +2,9 @@
 
 Provides a ``pyrung_coverage`` fixture that collects per-test
 ``CoverageReport`` objects and merges them at session end.  Optionally
-emits ``pyrung_coverage.json`` and gates CI on a TOML whitelist.
+emits ``pyrung_coverage.json`` and gates CI on a TOML whitelist.  A
+``pyrung_images`` fixture builds each program's ``ProgramImage`` once
+per session and hands out reused runners.
 
 Usage
 -----
@@ -20,6 +22,17 @@ reports::
         yield p
         pyrung_coverage.collect(p)
 
+With thousands of short tests, building ``PLC(logic)`` per test is the
+largest fixed cost.  ``pyrung_images.plc(logic)`` returns a runner reset
+from a session-wide image instead; runners go back to the pool when the
+test finishes::
+
+    @pytest.fixture
+    def program(pyrung_images, pyrung_coverage):
+        p = pyrung_images.plc(logic, dt=0.01)
+        yield p
+        pyrung_coverage.collect(p)
+
 Command-line options
 --------------------
 ``--pyrung-coverage-json=PATH``
@@ -29,13 +42,22 @@ Command-line options
 ``--pyrung-whitelist=PATH``
     TOML whitelist file.  New findings not in the whitelist cause a test
     failure.  See :class:`Whitelist` for the file format.
+
+pytest-xdist
+------------
+Under ``-n``, each worker merges its own reports and ships the result to
+the controller as a compact binary ``CoverageReport``; the controller
+merges the worker reports and alone writes JSON and applies the
+whitelist.  Because merged stranded chains are an intersection, a
+collector only analyzes latched bits that are still stranded in every
+report it has seen, so most tests skip ``cause()`` entirely.
 """
 
 from __future__ import annotations
 
 import json
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from functools import reduce
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -43,8 +65,12 @@ import pytest
 
 if TYPE_CHECKING:
     from pyrung.core.analysis.query import CoverageReport
+    from pyrung.core.image import ProgramImage
     from pyrung.core.runner import PLC
 
+# Key under which xdist workers hand their merged report to the controller.
+_WORKER_OUTPUT_KEY = "pyrung_coverage"
+
 
 # ---------------------------------------------------------------------------
 # Whitelist (TOML)
@@ -103,18 +129,31 @@ def check_whitelist(report: CoverageReport, whitelist: Whitelist) -> tuple[set[i
 
 
 class CoverageCollector:
-    """Accumulates per-test ``CoverageReport`` objects for session-end merge."""
+    """Accumulates per-test ``CoverageReport`` objects for session-end merge.
+
+    The merged report is kept up to date as reports arrive.  Since
+    stranded chains merge by intersection, :meth:`collect` restricts
+    stranded-bit analysis to tags still stranded in the running merge:
+    after the first report, a test only pays for ``cause()`` on bits no
+    earlier test has cleared.  Reports from :meth:`collect` therefore omit
+    stranded chains that could not survive the merge.
+    """
 
     def __init__(self) -> None:
         self._reports: list[CoverageReport] = []
+        self._merged: CoverageReport | None = None
 
     def collect(self, plc: PLC) -> None:
         """Collect a coverage report from a PLC instance after a test run."""
-        self._reports.append(plc.query.report())
+        stranded_tags = None
+        if self._merged is not None:
+            stranded_tags = {tag for tag, _blockers in self._merged.stranded_chains}
+        self.collect_report(plc.query.report(stranded_tags=stranded_tags))
 
     def collect_report(self, report: CoverageReport) -> None:
         """Collect a pre-built coverage report directly."""
         self._reports.append(report)
+        self._merged = report if self._merged is None else self._merged.merge(report)
 
     @property
     def reports(self) -> list[CoverageReport]:
@@ -122,9 +161,99 @@ class CoverageCollector:
 
     def merge(self) -> CoverageReport | None:
         """Merge all collected reports.  Returns None if no reports."""
-        if not self._reports:
-            return None
-        return reduce(lambda a, b: a.merge(b), self._reports)
+        return self._merged
+
+
+# ---------------------------------------------------------------------------
+# Program images
+# ---------------------------------------------------------------------------
+
+
+def _hashable_option(value: Any) -> Any:
+    """Map a ``PLC`` option value onto an equal-for-equal hashable form."""
+    if isinstance(value, Mapping):
+        return (
+            type(value).__name__,
+            frozenset((key, _hashable_option(item)) for key, item in value.items()),
+        )
+    if isinstance(value, list | tuple):
+        return (type(value).__name__, tuple(_hashable_option(item) for item in value))
+    if isinstance(value, set | frozenset):
+        return (type(value).__name__, frozenset(_hashable_option(item) for item in value))
+    return value
+
+
+def _options_key(image: ProgramImage, options: Mapping[str, Any]) -> tuple[Any, ...] | None:
+    """Pool key for *options*, or ``None`` when a value cannot be hashed."""
+    key = (id(image), *sorted((name, _hashable_option(value)) for name, value in options.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class ProgramImageCache:
+    """Session-wide program images and a pool of reusable runners.
+
+    :meth:`image` builds one ``ProgramImage`` per logic object.  :meth:`plc`
+    leases a runner built from that image, reusing a released runner with
+    the same options via ``PLC.reset_to()``.  The plugin releases every
+    lease after each test, so a runner must not be kept across tests.
+    """
+
+    def __init__(self) -> None:
+        self._images: dict[int, ProgramImage] = {}
+        self._idle: dict[tuple[Any, ...], list[PLC]] = {}
+        self._leased: list[tuple[tuple[Any, ...], PLC]] = []
+
+    def image(self, logic: Any, *, compile: bool = False) -> ProgramImage:
+        """Return the image for *logic*, building it on first use.
+
+        Keyed by the identity of *logic*; the image keeps it alive.
+        ``compile=True`` also builds the dependency graph and compiled
+        replay kernel up front.
+        """
+        from pyrung.core.image import ProgramImage
+
+        image = self._images.get(id(logic))
+        if image is None:
+            image = ProgramImage(logic, compile=compile)
+            self._images[id(logic)] = image
+        elif compile:
+            image.consumed_tags  # noqa: B018 - builds the PDG as a side effect
+            image.compiled_kernel()
+        return image
+
+    def plc(self, logic: Any, **options: Any) -> PLC:
+        """Lease a fresh-state runner for *logic* until the current test ends.
+
+        *options* are ``PLC`` keyword options (``dt``, ``history``, ...);
+        runners are pooled per image and option set.  Dict, list, and set
+        values are compared by content; a runner whose options still
+        cannot be hashed is built fresh and never pooled.
+        """
+        from pyrung.core.runner import PLC
+
+        if "initial_state" in options:
+            raise TypeError("plc() does not accept initial_state; runners start from the image")
+        image = self.image(logic)
+        key = _options_key(image, options)
+        idle = self._idle.get(key) if key is not None else None
+        if idle:
+            runner = idle.pop()
+            runner.reset_to(image)
+        else:
+            runner = PLC(image, **options)
+        if key is not None:
+            self._leased.append((key, runner))
+        return runner
+
+    def release(self) -> None:
+        """Return every leased runner to the pool."""
+        for key, runner in self._leased:
+            self._idle.setdefault(key, []).append(runner)
+        self._leased.clear()
 
 
 # ---------------------------------------------------------------------------
@@ -159,8 +288,50 @@ def pyrung_coverage(request: pytest.FixtureRequest) -> CoverageCollector:
     return collector
 
 
+@pytest.fixture(scope="session")
+def pyrung_images(request: pytest.FixtureRequest) -> ProgramImageCache:
+    """Session-scoped program images and pooled runners.
+
+    Use ``pyrung_images.plc(logic)`` in place of ``PLC(logic)`` to skip
+    per-test program setup, or ``pyrung_images.image(logic)`` to get the
+    shared ``ProgramImage`` itself.
+    """
+    cache = ProgramImageCache()
+    request.config._pyrung_images = cache  # ty: ignore[unresolved-attribute]
+    return cache
+
+
 def pytest_configure(config: pytest.Config) -> None:
     config._pyrung_collector = None  # ty: ignore[unresolved-attribute]
+    config._pyrung_images = None  # ty: ignore[unresolved-attribute]
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_runtest_teardown(item: pytest.Item, nextitem: pytest.Item | None) -> None:
+    # Runs after fixture finalizers, so coverage has already been collected.
+    cache: ProgramImageCache | None = item.config._pyrung_images  # ty: ignore[unresolved-attribute]
+    if cache is not None:
+        cache.release()
+
+
+def _is_xdist_worker(config: pytest.Config) -> bool:
+    return hasattr(config, "workerinput")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node: Any, error: object) -> None:
+    """xdist controller: merge the report a finished worker sent back."""
+    data = getattr(node, "workeroutput", {}).get(_WORKER_OUTPUT_KEY)
+    if data is None:
+        return
+    from pyrung.core.analysis.query import CoverageReport
+
+    config = node.config
+    collector: CoverageCollector | None = config._pyrung_collector  # ty: ignore[unresolved-attribute]
+    if collector is None:
+        collector = CoverageCollector()
+        config._pyrung_collector = collector  # ty: ignore[unresolved-attribute]
+    collector.collect_report(CoverageReport.from_bytes(data))
 
 
 def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
@@ -172,6 +343,11 @@ def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
     if merged is None:
         return
 
+    if _is_xdist_worker(session.config):
+        # The controller writes JSON and gates once, over every worker.
+        session.config.workeroutput[_WORKER_OUTPUT_KEY] = merged.to_bytes()  # ty: ignore[unresolved-attribute]
+        return
+
     # Write JSON report
     json_path = session.config.getoption("pyrung_coverage_json")
     if json_path:
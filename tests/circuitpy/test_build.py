@@ -0,0 +1,137 @@
+"""Tests for the ahead-of-time .mpy build (``pyrung build-circuitpy``)."""
+
+from __future__ import annotations
+
+import platform
+import sys
+from pathlib import Path
+
+import pytest
+
+from pyrung import Program, Rung, out
+from pyrung.circuitpy import P1AM
+from pyrung.circuitpy.build import (
+    BuildBudget,
+    BuildBudgetError,
+    build_circuitpy,
+    find_mpy_cross,
+)
+
+_MPY_CROSS = Path(__file__).resolve().parents[2] / "devtools" / "mpy-cross-linux-amd64-8.2.3.static"
+
+needs_mpy_cross = pytest.mark.skipif(
+    not (_MPY_CROSS.is_file() and sys.platform == "linux" and platform.machine() == "x86_64"),
+    reason="bundled mpy-cross binary is linux-amd64 only",
+)
+
+
+def _program_and_hw() -> tuple[Program, P1AM]:
+    hw = P1AM()
+    inputs = hw.slot(1, "P1-08SIM")
+    outputs = hw.slot(2, "P1-08TRS")
+    with Program(strict=False) as prog:
+        with Rung(inputs[1]):
+            out(outputs[1])
+    return prog, hw
+
+
+def _tree(root: Path) -> dict[str, bytes]:
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in sorted(root.rglob("*"))
+        if path.is_file()
+    }
+
+
+@needs_mpy_cross
+def test_build_writes_drive_layout_deterministically(tmp_path):
+    prog, hw = _program_and_hw()
+    first = build_circuitpy(
+        prog, hw, output_dir=tmp_path / "a", target_scan_ms=10.0, mpy_cross=_MPY_CROSS
+    )
+    build_circuitpy(prog, hw, output_dir=tmp_path / "b", target_scan_ms=10.0, mpy_cross=_MPY_CROSS)
+
+    files = _tree(tmp_path / "a")
+    assert sorted(files) == ["code.py", "lib/pyrung_rt.mpy", "pyrung_app.mpy"]
+    assert files["code.py"].decode().endswith("import pyrung_app\n")
+    assert files["pyrung_app.mpy"][:1] == b"C"
+    assert files == _tree(tmp_path / "b")
+
+    assert [f.path for f in first.files] == ["code.py", "pyrung_app.mpy", "lib/pyrung_rt.mpy"]
+    assert first.flash_bytes == sum(len(data) for data in files.values())
+    assert first.import_heap_bytes > first.bytecode_bytes
+    assert "CircuitPython" in first.mpy_cross_version
+    assert first.violations == []
+
+
+@needs_mpy_cross
+def test_build_counts_profile_layout_toward_flash(tmp_path):
+    prog, hw = _program_and_hw()
+    report = build_circuitpy(
+        prog, hw, output_dir=tmp_path, target_scan_ms=10.0, profile=True, mpy_cross=_MPY_CROSS
+    )
+
+    files = _tree(tmp_path)
+    assert "pyrung_profile.json" in [f.path for f in report.files]
+    assert sorted(f.path for f in report.files) == sorted(files)
+    assert report.flash_bytes == sum(len(data) for data in files.values())
+
+
+@needs_mpy_cross
+def test_build_over_budget_raises_and_writes_nothing(tmp_path):
+    prog, hw = _program_and_hw()
+    with pytest.raises(BuildBudgetError, match="flash") as excinfo:
+        build_circuitpy(
+            prog,
+            hw,
+            output_dir=tmp_path / "out",
+            target_scan_ms=10.0,
+            budget=BuildBudget(flash_bytes=1024, ram_bytes=1 << 20),
+            mpy_cross=_MPY_CROSS,
+        )
+    assert len(excinfo.value.report.violations) == 1
+    assert not (tmp_path / "out").exists()
+
+
+@needs_mpy_cross
+def test_cli_build_circuitpy(tmp_path, monkeypatch, capsys):
+    from pyrung import cli
+
+    (tmp_path / "cpy_build_app.py").write_text(
+        "from pyrung import Program, Rung, out\n"
+        "from pyrung.circuitpy import P1AM\n"
+        "hw = P1AM()\n"
+        "inputs = hw.slot(1, 'P1-08SIM')\n"
+        "outputs = hw.slot(2, 'P1-08TRS')\n"
+        "with Program(strict=False) as logic:\n"
+        "    with Rung(inputs[1]):\n"
+        "        out(outputs[1])\n",
+        encoding="utf-8",
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("MPY_CROSS", str(_MPY_CROSS))
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["pyrung", "build-circuitpy", "cpy_build_app", "-o", "drive", "--flash-budget", "64k"],
+    )
+    cli.main()
+    assert "Flash:" in capsys.readouterr().out
+    assert (tmp_path / "drive" / "pyrung_app.mpy").is_file()
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["pyrung", "build-circuitpy", "cpy_build_app", "-o", "small", "--ram-budget", "1k"],
+    )
+    with pytest.raises(SystemExit) as excinfo:
+        cli.main()
+    assert excinfo.value.code == 1
+    assert "Over budget: RAM" in capsys.readouterr().err
+
+
+def test_find_mpy_cross_reports_missing_tool(monkeypatch, tmp_path):
+    monkeypatch.delenv("MPY_CROSS", raising=False)
+    monkeypatch.setenv("PATH", str(tmp_path))
+    with pytest.raises(FileNotFoundError, match="mpy-cross not found"):
+        find_mpy_cross()
@@ -455,7 +455,8 @@ class TestPrevSnapshotScope:
                 out(Bool("Light"))
 
         source_code = generate_circuitpy(prog, hw, target_scan_ms=10.0).code
-        assert '_prev["' not in source_code
+        assert "_prev = []" in source_code
+        assert "_prev[" not in source_code
 
     def test_prev_snapshots_only_include_edge_tags(self):
         hw = P1AM()
@@ -474,11 +475,11 @@ class TestPrevSnapshotScope:
                 out(light)
 
         source_code = generate_circuitpy(prog, hw, target_scan_ms=10.0).code
-        assert '_prev["Car_Sensor"]' in source_code
-        assert '_prev["Car_LogEnable"]' in source_code
-        assert source_code.count('_prev["') == 2
-        assert '_prev["Aux"]' not in source_code
-        assert '_prev["Light"]' not in source_code
+        assert "_prev = [False] * 2" in source_code
+        assert "_prev[0] = _t_Car_Sensor  # Car_Sensor" in source_code
+        assert "_prev[1] = _t_Car_LogEnable  # Car_LogEnable" in source_code
+        assert source_code.count("    _prev[") == 2
+        assert "_rise(bool(_cond_snap_1), bool(_prev[0]))" in source_code
 
 
 class TestConditionAndExpressionCompiler:
@@ -814,6 +815,77 @@ class TestInstructionCoverage:
         assert compiled.blockless is True
         assert "\n    else:\n    _cond_snap_" not in compiled.source
 
+    def test_compile_kernel_optimized_step_uses_locals_and_inlines_edges(self):
+        button = Bool("Button")
+        step = Int("Step")
+        count = Int("Count")
+        unused = Int("Unused")
+
+        with Program(strict=False) as prog:
+            with Rung(RisingEdgeCondition(button)):
+                copy(step + 1, step)
+            with Rung(button):
+                on_delay(Timer[1], preset=5, unit="Tms")
+            with Rung(FallingEdgeCondition(button), unused > 0):
+                call("worker")
+            with subroutine("worker"):
+                with Rung():
+                    copy(count + 1, count)
+
+        source = compile_kernel(prog).source
+        step_fn = source[source.index("def _kernel_step(") :]
+
+        assert "global _t_Count\n" in step_fn
+        assert "_t_Step = tags['Step']" in step_fn
+        assert "tags['Step'] = _t_Step" in step_fn
+        assert "tags['Unused'] = " not in step_fn
+        assert "_rise(" not in source and "_fall(" not in source
+        assert "_preset = 5\n" in step_fn
+
+        plain = compile_kernel(prog, optimize=False).source
+        assert "_rise(" in plain
+        assert "_preset = int(5)" in plain
+
+    @pytest.mark.parametrize("blockless", [False, True])
+    def test_compile_kernel_optimized_matches_unoptimized(self, blockless):
+        button = Bool("Button")
+        reset = Bool("Reset")
+        step = Int("Step")
+        count = Int("Count")
+        ds = Block("DS", TagType.INT, 1, 4)
+
+        with Program(strict=False) as prog:
+            with Rung(RisingEdgeCondition(button)):
+                copy(step + 1, step)
+                copy(step, ds[2])
+            with Rung(button):
+                on_delay(Timer[1], preset=3, unit="Tms")
+                count_up(Counter[1], preset=4).reset(reset)
+            with Rung(FallingEdgeCondition(button)):
+                call("worker")
+            with subroutine("worker"):
+                with Rung():
+                    copy(count + 1, count)
+                    copy(count, ds[3])
+
+        results = []
+        for optimize in (False, True):
+            compiled = compile_kernel(prog, blockless=blockless, optimize=optimize)
+            kernel = compiled.create_kernel()
+            trace = []
+            for scan in range(24):
+                kernel.tags["Button"] = scan % 5 < 3
+                kernel.tags["Reset"] = scan == 17
+                compiled.step_fn(kernel.tags, kernel.blocks, kernel.memory, kernel.prev, 0.001)
+                kernel.capture_prev(compiled.edge_tags)
+                for spec in compiled.block_specs.values():
+                    if not blockless:
+                        kernel.flush_block_to_tags(spec)
+                trace.append(dict(kernel.tags))
+            results.append(trace)
+
+        assert results[0] == results[1]
+
     def test_function_call_subroutine_and_return_emit(self):
         hw = P1AM()
         hw.slot(1, "P1-08SIM")
@@ -1159,6 +1231,90 @@ class TestBoardPeripheralsAndRunStop:
         out_values = _namespace_list(namespace, out_block_symbol)
         assert out_values[0] is False
 
+    def test_write_outputs_only_touches_bus_when_values_change(self, monkeypatch):
+        hw = P1AM()
+        hw.slot(1, "P1-08SIM")
+        outputs = hw.slot(2, "P1-08TRS")
+        enable = Bool("Enable", default=True)
+
+        with Program(strict=False) as prog:
+            with Rung(enable):
+                out(outputs[1])
+
+        result = generate_circuitpy(prog, hw, target_scan_ms=10.0, runstop=None)
+        assert "_out_last = [None] * 1" in result.code
+
+        class StubBase:
+            def __init__(self):
+                self.discrete_writes: list[tuple[int, int]] = []
+
+            def rollCall(self, modules):
+                return None
+
+            def readDiscrete(self, slot):
+                return 0
+
+            def writeDiscrete(self, value, slot):
+                self.discrete_writes.append((slot, value))
+
+            def readAnalog(self, slot, ch):
+                return 0
+
+            def writeAnalog(self, value, slot, ch):
+                return None
+
+            def readTemperature(self, slot, ch):
+                return 0.0
+
+        stub_base = StubBase()
+        namespace = _run_single_scan_source(
+            result.code, monkeypatch, stub_base, runtime_source=result.runtime
+        )
+        assert stub_base.discrete_writes == [(2, 1)]
+
+        write_outputs = namespace["_write_outputs"]
+        write_outputs()
+        assert stub_base.discrete_writes == [(2, 1)]
+
+        out_block_symbol = _context_for_program(prog, hw).symbol_for_block(outputs)
+        _namespace_list(namespace, out_block_symbol)[2] = True
+        write_outputs()
+        assert stub_base.discrete_writes == [(2, 1), (2, 5)]
+
+    def test_large_bool_blocks_are_packed_and_reported(self):
+        hw = P1AM()
+        hw.slot(1, "P1-08SIM")
+        outputs = hw.slot(2, "P1-08TRS")
+        flags = Block("Flag", TagType.BOOL, 1, 64)
+        counts = Block("Count", TagType.INT, 1, 4)
+
+        with Program(strict=False) as prog:
+            with Rung(flags[1]):
+                out(outputs[1])
+            with Rung(RisingEdgeCondition(flags[2])):
+                blockcopy(counts.select(1, 2), counts.select(3, 4))
+            with Rung(flags[3]):
+                fill(True, flags.select(1, 64))
+
+        result = generate_circuitpy(
+            prog, hw, target_scan_ms=10.0, watchdog_ms=100, runstop=None, resource_report=True
+        )
+        ctx = _context_for_program(prog, hw)
+        assert f"{ctx.symbol_for_block(flags)} = bytearray(64)" in result.code
+        assert f"{ctx.symbol_for_block(counts)} = [0] * 4" in result.code
+
+        report = result.resources
+        assert report is not None
+        assert report.packed_bool_elements == 64
+        assert report.block_elements == 64 + 4 + 8 + 8
+        assert report.edge_tags == 1
+        assert report.bus_reads_per_scan == 1
+        assert report.bus_writes_per_scan == 1
+        assert report.watchdog_pets_per_scan == 1
+        assert report.estimated_ram_bytes > 64
+        assert "Estimated data RAM" in report.format()
+        assert generate_circuitpy(prog, hw, target_scan_ms=10.0).resources is None
+
     def test_runstop_run_when_high_false_keeps_runtime_in_run(self, monkeypatch):
         hw = P1AM()
         hw.slot(1, "P1-08SIM")
@@ -0,0 +1,202 @@
+"""Tests for on-target scan profiling in generated CircuitPython code."""
+
+from __future__ import annotations
+
+import socket
+import struct
+import sys
+import threading
+
+from pyrung import Bool, Int, Program, Rung, call, copy, out, return_early, subroutine
+from pyrung.circuitpy import P1AM, ModbusServerConfig, generate_circuitpy, write_circuitpy
+from pyrung.circuitpy.profile import (
+    PROFILE_LAYOUT_FILENAME,
+    PROFILE_REGISTER_BASE,
+    BoardProfile,
+    ProfileBucket,
+    ProfileLayout,
+    ProfileSample,
+    main,
+    read_profile_registers,
+    reset_profile_registers,
+)
+from pyrung.click import TagMap
+from tests.circuitpy.test_codegen import _run_single_scan_source
+
+
+def _mbap(tid: int, pdu: bytes, uid: int = 1) -> bytes:
+    return struct.pack(">HHHB", tid, 0, len(pdu) + 1, uid) + pdu
+
+
+class _StubBase:
+    def rollCall(self, modules):
+        return None
+
+    def readDiscrete(self, slot):
+        return 0b11
+
+    def writeDiscrete(self, value, slot):
+        return None
+
+    def readAnalog(self, slot, ch):
+        return 0
+
+    def writeAnalog(self, value, slot, ch):
+        return None
+
+    def readTemperature(self, slot, ch):
+        return 0.0
+
+
+def _program_and_hw() -> tuple[Program, P1AM]:
+    hw = P1AM()
+    inputs = hw.slot(1, "P1-08SIM")
+    outputs = hw.slot(2, "P1-08TRS")
+    count = Int("Count")
+    with Program(strict=False) as prog:
+        with Rung(inputs[1]):
+            out(outputs[1])
+        with Rung(inputs[2]):
+            call("Fill")
+        with subroutine("Fill"):
+            with Rung(Bool("Never")):
+                copy(1, count)
+            with Rung():
+                return_early()
+    return prog, hw
+
+
+def test_unprofiled_code_has_no_accumulators():
+    prog, hw = _program_and_hw()
+    result = generate_circuitpy(prog, hw, target_scan_ms=10.0)
+    assert "_prof_" not in result.code
+    assert result.profile_layout is None
+
+
+def test_profiled_scan_reports_over_modbus_and_serial(monkeypatch, capsys):
+    prog, hw = _program_and_hw()
+    result = generate_circuitpy(
+        prog,
+        hw,
+        target_scan_ms=10.0,
+        runstop=None,
+        modbus_server=ModbusServerConfig(ip="192.168.1.200"),
+        tag_map=TagMap(),
+        profile=True,
+    )
+    layout = result.profile_layout
+    assert layout is not None
+    assert [b.name for b in layout.buckets if b.kind == "phase"] == [
+        "scan",
+        "sd_commands",
+        "read_inputs",
+        "logic",
+        "write_outputs",
+        "modbus_server",
+        "retentive_save",
+    ]
+    assert [b.kind for b in layout.buckets if b.kind != "phase"] == ["rung", "rung", "subroutine"]
+
+    source = result.code.replace("PROFILE_PRINT_S = 5.0", "PROFILE_PRINT_S = 0.0")
+    namespace = _run_single_scan_source(
+        source, monkeypatch, _StubBase(), runtime_source=result.runtime
+    )
+
+    serial = ProfileSample.from_serial(capsys.readouterr().out.splitlines())
+    assert serial.counts[0] == 1
+
+    request = struct.pack(">BHH", 3, PROFILE_REGISTER_BASE, layout.register_count)
+    resp = namespace["_mb_handle"](_mbap(1, request), 12)
+    registers = struct.unpack(f">{layout.register_count}H", resp[9:])
+    profile = BoardProfile.from_sample(layout, ProfileSample.from_registers(registers))
+    assert profile.scans == 1
+    assert {entry.name: entry.calls for entry in profile.phases}["logic"] == 1
+    assert [entry.calls for entry in profile.logic.rungs] == [1, 1]
+    assert [(entry.name, entry.calls) for entry in profile.logic.subroutines] == [("Fill", 1)]
+    assert "Fill" in profile.format()
+
+    resp = namespace["_mb_handle"](_mbap(2, struct.pack(">BHH", 6, PROFILE_REGISTER_BASE, 0)), 12)
+    assert resp == _mbap(2, struct.pack(">BHH", 6, PROFILE_REGISTER_BASE, 0))
+    assert namespace["_prof_n"] == [0] * len(layout.buckets)
+
+
+def _serve_handler(handle) -> tuple[socket.socket, int]:
+    """Answer Modbus TCP on a free localhost port with the generated ``_mb_handle``."""
+    listener = socket.create_server(("127.0.0.1", 0))
+    port = listener.getsockname()[1]
+
+    def _serve() -> None:
+        while True:
+            try:
+                conn, _addr = listener.accept()
+            except OSError:
+                return
+            with conn:
+                while data := conn.recv(260):
+                    resp = handle(data, len(data))
+                    if resp:
+                        conn.sendall(resp)
+
+    threading.Thread(target=_serve, daemon=True).start()
+    return listener, port
+
+
+def test_read_and_reset_profile_registers_over_modbus_tcp(monkeypatch):
+    prog, hw = _program_and_hw()
+    result = generate_circuitpy(
+        prog,
+        hw,
+        target_scan_ms=10.0,
+        runstop=None,
+        modbus_server=ModbusServerConfig(ip="192.168.1.200"),
+        tag_map=TagMap(),
+        profile=True,
+    )
+    layout = result.profile_layout
+    assert layout is not None
+    namespace = _run_single_scan_source(
+        result.code, monkeypatch, _StubBase(), runtime_source=result.runtime
+    )
+    listener, port = _serve_handler(namespace["_mb_handle"])
+    try:
+        sample = read_profile_registers("127.0.0.1", layout, port=port)
+        assert BoardProfile.from_sample(layout, sample).scans == 1
+
+        reset_profile_registers("127.0.0.1", layout, port=port)
+        assert read_profile_registers("127.0.0.1", layout, port=port).counts == (0,) * len(
+            layout.buckets
+        )
+    finally:
+        listener.close()
+
+
+def test_sample_since_tolerates_register_wrap():
+    earlier = ProfileSample(max_scan_us=10, totals_us=(2**32 - 5,), counts=(7,))
+    later = ProfileSample(max_scan_us=12, totals_us=(15,), counts=(9,))
+    assert later.since(earlier) == ProfileSample(max_scan_us=12, totals_us=(20,), counts=(2,))
+
+
+def test_write_circuitpy_saves_layout_and_cli_reads_serial_log(tmp_path, monkeypatch, capsys):
+    prog, hw = _program_and_hw()
+    write_circuitpy(prog, hw, target_scan_ms=10.0, output_dir=tmp_path, profile=True)
+    layout_path = tmp_path / PROFILE_LAYOUT_FILENAME
+    layout = ProfileLayout.from_json(layout_path.read_text(encoding="utf-8"))
+    assert ProfileBucket("subroutine", "Fill") in layout.buckets
+
+    n = len(layout.buckets)
+    log = tmp_path / "serial.log"
+    log.write_text(
+        "Mode: RUN\n"
+        f"PYRUNG_PROFILE [900, {[0] * n}, {[0] * n}]\n"
+        f"PYRUNG_PROFILE [1200, {[4000] + [100] * (n - 1)}, {[4] * n}]\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["pyrung circuitpy-profile", "--layout", str(layout_path), "--serial-log", str(log)],
+    )
+    main()
+    output = capsys.readouterr().out
+    assert output.startswith("4 scan(s), 1000.0 us/scan mean, 1200 us max")
+    assert "Fill" in output
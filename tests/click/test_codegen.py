@@ -235,6 +235,38 @@ class TestCsvParsing:
         raw_rungs = _parse_csv(csv_path)
         assert len(raw_rungs) == 2
 
+    def test_iter_csv_streams_rungs(self, tmp_path: Path):
+        from pyrung.click.codegen.analyzer import _iter_analyzed_rungs
+        from pyrung.click.codegen.parser import _iter_csv
+
+        csv_path = tmp_path / "test.csv"
+        header = [
+            "marker",
+            *[chr(ord("A") + i) for i in range(26)],
+            *[f"A{chr(ord('A') + i)}" for i in range(5)],
+            "AF",
+        ]
+        rows = [
+            header,
+            ["R", "X001", *["-"] * 30, "out(Y001)"],
+            ["R", "X002", *["-"] * 30, "latch(Y002)"],
+            ["R", *[""] * 31, "end()"],
+        ]
+        with csv_path.open("w", newline="") as f:
+            csv.writer(f).writerows(rows)
+
+        stream = _iter_csv(csv_path)
+        first = next(stream)
+        assert first.rows == [rows[1]]
+        assert [rung.rows for rung in stream] == [[rows[2]], [rows[3]]]
+
+        analyzed = list(_iter_analyzed_rungs(_iter_csv(csv_path)))
+        assert analyzed == _analyze_rungs(_parse_csv(csv_path))
+        assert [rung.instructions[0].af_token for rung in analyzed] == [
+            "out(Y001)",
+            "latch(Y002)",
+        ]
+
 
 # ---------------------------------------------------------------------------
 # Phase 2: Topology analysis tests
@@ -2292,6 +2324,85 @@ class TestInMemoryRoundTrip:
         assert (csv_dir / "subroutines" / "my_sub.csv").exists()
         assert ladder_to_pyrung(csv_dir / "main.csv") == ladder_to_pyrung(csv_dir)
 
+    def test_disk_round_trip_with_subroutines_in_workers(self, tmp_path: Path):
+        """Subroutine files analyzed in worker processes give the same source."""
+        from pyrung.core.program import call, subroutine
+
+        A = Bool("A")
+        B = Bool("B")
+        Y = Bool("Y")
+        Z = Bool("Z")
+
+        with Program() as logic:
+            with rung(A):
+                call("fill")
+            with rung(B):
+                call("drain")
+
+            with subroutine("fill"):
+                with rung(A):
+                    out(Y)
+
+            with subroutine("drain"):
+                with rung(B):
+                    out(Z)
+
+        mapping = TagMap({A: x[1], B: x[2], Y: y[1], Z: y[2]}, include_system=False)
+        csv_dir = tmp_path / "ref"
+        pyrung_to_ladder(logic, mapping).write(csv_dir)
+
+        assert ladder_to_pyrung(csv_dir, workers=2) == ladder_to_pyrung(csv_dir)
+
+    def test_iter_ladder_to_pyrung_emits_without_holding_the_program(self, tmp_path: Path):
+        """The emit pass re-reads the CSV, so analyzed rungs are not kept around."""
+        import gc
+
+        from pyrung.click import iter_ladder_to_pyrung
+        from pyrung.click.codegen.models import _AnalyzedRung
+        from pyrung.core.program import call, forloop, subroutine
+
+        A = Bool("A")
+        coils = [Bool(f"Coil{i}") for i in range(80)]
+
+        with Program(strict=False) as logic:
+            for coil in coils:
+                with rung(A):
+                    out(coil)
+            with rung(A):
+                with forloop(3):
+                    out(coils[0])
+            with rung(A):
+                call("service")
+
+            with subroutine("service"):
+                for coil in coils[:10]:
+                    with rung(A):
+                        latch(coil)
+
+        mapping = TagMap(
+            {A: x[1], **{coil: c[i + 1] for i, coil in enumerate(coils)}}, include_system=False
+        )
+        bundle = pyrung_to_ladder(logic, mapping)
+        csv_dir = tmp_path / "ref"
+        bundle.write(csv_dir)
+
+        def live_rungs() -> int:
+            gc.collect()
+            return sum(isinstance(obj, _AnalyzedRung) for obj in gc.get_objects())
+
+        baseline = live_rungs()
+        chunks = []
+        peak = 0
+        for i, chunk in enumerate(iter_ladder_to_pyrung(csv_dir)):
+            chunks.append(chunk)
+            if i % 40 == 0:
+                peak = max(peak, live_rungs() - baseline)
+
+        assert "".join(chunks) == ladder_to_pyrung(csv_dir)
+        assert "".join(iter_ladder_to_pyrung(bundle)) == ladder_to_pyrung(bundle)
+        assert len(chunks) > len(coils)
+        assert peak < 5
+
     def test_disk_import_requires_subroutines_directory(self, tmp_path: Path):
         """Subroutine imports require the sibling subroutines directory."""
         from pyrung.core.program import call, subroutine
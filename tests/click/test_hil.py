@@ -0,0 +1,239 @@
+"""Tests for hardware-in-the-loop replay of recorded sessions."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from pyrung.click import TagMap, c, ds, td, x, y
+from pyrung.click.hil import ModbusReplayTarget, SoftPlcTarget, _address_runs, replay_hil
+from pyrung.core import (
+    PLC,
+    Bool,
+    Int,
+    Program,
+    Rung,
+    Timer,
+    copy,
+    latch,
+    on_delay,
+    out,
+    reset,
+    system,
+)
+
+
+def _build(*, seal_in: bool = True, writable_inputs: bool = False) -> tuple[Program, TagMap]:
+    start = Bool("Start")
+    stop = Bool("Stop")
+    motor = Bool("Motor")
+    speed = Int("Speed")
+    shown = Int("Shown")
+    motor_coil = latch if seal_in else out
+    with Program() as logic:
+        with Rung(start):
+            motor_coil(motor)
+        with Rung(stop):
+            reset(motor)
+        with Rung():
+            copy(speed, shown)
+    mapping = TagMap(
+        {
+            start: c[1] if writable_inputs else x[1],
+            stop: c[2] if writable_inputs else x[2],
+            motor: y[1],
+            speed: ds[1],
+            shown: ds[2],
+        },
+        include_system=False,
+    )
+    return logic, mapping
+
+
+def _record(logic: Program) -> PLC:
+    plc = PLC(logic=logic, dt=0.01)
+    plc.run(2)
+    plc.patch({"Start": True, "Speed": 1200})
+    plc.step()
+    plc.patch({"Start": False, "Unmapped": True})
+    plc.run(3)
+    plc.patch({"Stop": True})
+    plc.step()
+    plc.patch({"Stop": False})
+    plc.run(2)
+    return plc
+
+
+def test_soft_target_replays_recording_without_mismatches():
+    logic, mapping = _build()
+    recorded = _record(logic)
+    target = SoftPlcTarget(PLC(logic=logic, dt=0.01), mapping)
+
+    report = replay_hil(recorded, mapping, target, outputs=["Motor", "Shown"], speed=None)
+
+    assert report.ok, report.mismatches
+    assert (report.start_scan_id, report.end_scan_id, report.scans) == (1, 9, 9)
+    assert report.skipped == ("Unmapped",)
+    assert target.runner.current_state.scan_id == 9
+
+
+def test_changed_logic_is_reported_scan_by_scan():
+    logic, mapping = _build()
+    recorded = _record(logic)
+    changed, _ = _build(seal_in=False)
+
+    report = replay_hil(recorded, mapping, SoftPlcTarget(PLC(logic=changed), mapping), speed=None)
+
+    # Without the latch, Motor drops as soon as Start is released.
+    assert [(m.scan_id, m.tag, m.address, m.expected, m.actual) for m in report.mismatches] == [
+        (4, "Motor", "Y001", True, False),
+        (5, "Motor", "Y001", True, False),
+        (6, "Motor", "Y001", True, False),
+    ]
+    assert "3 mismatch(es)" in report.summary()
+
+
+def test_soft_target_follows_realtime_dts_and_rtc_changes():
+    start = Bool("Start")
+    done = Bool("Done")
+    second = Int("Second")
+    with Program() as logic:
+        with Rung(start):
+            on_delay(Timer[1], preset=25, unit="Tms")
+        with Rung(Timer[1].Done):
+            out(done)
+        with Rung():
+            copy(system.rtc.second, second)
+    mapping = TagMap(
+        {start: x[1], done: y[1], second: ds[1], Timer[1].Acc: td[1]},
+        include_system=False,
+    )
+
+    recorded = PLC(logic=logic, realtime=True)
+    recorded.step()
+    recorded.set_rtc(datetime(2026, 1, 1, 8, 0, 30))
+    recorded.patch({"Start": True})
+    for _ in range(6):
+        time.sleep(0.007)
+        recorded.step()
+    assert recorded.current_state.tags["Done"] is True
+
+    # A fixed-step target with its own 100 ms dt and wall-clock RTC would
+    # finish the timer on the first scan and report a different second.
+    target = SoftPlcTarget(PLC(logic=logic, dt=0.1), mapping)
+    report = replay_hil(
+        recorded, mapping, target, outputs=["Done", "Second", Timer[1].Acc], speed=None
+    )
+
+    assert report.ok, report.mismatches
+    assert target.runner.current_state.timestamp == pytest.approx(recorded.current_state.timestamp)
+
+
+class _OneScanLate(SoftPlcTarget):
+    """Reports outputs as they stood before the latest scan."""
+
+    def advance(self, dt: float) -> None:
+        self._stale = super().read(["Y001"])
+        super().advance(dt)
+
+    def read(self, addresses):
+        return self._stale
+
+
+def test_tolerance_accepts_lagging_outputs():
+    logic, mapping = _build()
+    recorded = _record(logic)
+
+    strict = replay_hil(recorded, mapping, _OneScanLate(PLC(logic=logic), mapping), speed=None)
+    tolerant = replay_hil(
+        recorded,
+        mapping,
+        _OneScanLate(PLC(logic=logic), mapping),
+        speed=None,
+        tolerance_scans=1,
+    )
+
+    assert [m.scan_id for m in strict.mismatches] == [3, 7]
+    assert tolerant.ok
+
+
+def test_partial_window_and_pacing():
+    logic, mapping = _build()
+    recorded = _record(logic)
+    target = SoftPlcTarget(recorded.fork(3), mapping)
+
+    report = replay_hil(recorded, mapping, target, start=4, end=7, speed=4.0)
+
+    assert report.ok
+    assert report.scans == 4
+    # Four 10 ms scans at 4x take at least 10 ms of wall time.
+    assert report.elapsed >= 0.009
+
+
+def test_rejects_bad_arguments():
+    logic, mapping = _build()
+    recorded = _record(logic)
+    target = SoftPlcTarget(PLC(logic=logic), mapping)
+
+    with pytest.raises(ValueError, match="outside the replayable recording"):
+        replay_hil(recorded, mapping, target, start=5, end=50)
+    with pytest.raises(ValueError, match="speed"):
+        replay_hil(recorded, mapping, target, speed=0)
+    with pytest.raises(KeyError, match="Unmapped"):
+        replay_hil(recorded, mapping, target, outputs=["Unmapped"])
+
+
+def test_address_runs_batch_consecutive_addresses_per_bank():
+    assert _address_runs(["DS3", "ds1", "DS2", "Y001", "Y002", "DS10", "XD0", "XD0u"]) == [
+        ("DS", 1, 3),
+        ("DS", 10, 10),
+        ("XD", 0, 0),
+        ("XD", 1, 1),
+        ("Y", 1, 2),
+    ]
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+@pytest.mark.integration
+def test_modbus_target_replays_against_click_server():
+    from pyclickplc.server import ClickServer
+
+    from pyrung.click import ClickDataProvider
+
+    # X inputs are read-only over Modbus, so the device takes stimulus on C bits.
+    logic, mapping = _build(writable_inputs=True)
+    recorded = _record(logic)
+    device = PLC(logic=logic, dt=0.01)
+    port = _free_port()
+    loop = asyncio.new_event_loop()
+    server = ClickServer(ClickDataProvider(device, mapping), host="127.0.0.1", port=port)
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+
+    class _Stepped(ModbusReplayTarget):
+        # Step the served soft PLC in place of a controller's own scan clock.
+        def advance(self, dt: float) -> None:
+            asyncio.run_coroutine_threadsafe(asyncio.to_thread(device.step), loop).result()
+
+    try:
+        with _Stepped("127.0.0.1", port) as target:
+            report = replay_hil(recorded, mapping, target, outputs=["Motor", "Shown"], speed=None)
+    finally:
+        asyncio.run_coroutine_threadsafe(server.stop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    assert report.ok, report.mismatches
+    assert report.scans == 9
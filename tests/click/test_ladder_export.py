@@ -1925,3 +1925,130 @@ class TestContinuedExport:
             ,X002,C1,-,-,-,-,-,-,-,-,-,-,-,-,-,-,-,-,-,-,-,-,-,-,-,-,-,-,-,-,-,out(Y002)
             """,
         )
+
+
+# ---------------------------------------------------------------------------
+# Incremental export (LadderExportCache)
+# ---------------------------------------------------------------------------
+
+
+def _cache_program(second_contact: Bool) -> tuple[Program, tuple[Bool, ...]]:
+    X1, X3, Y1, Y2, Y3 = (Bool(name) for name in ("X1", "X3", "Y1", "Y2", "Y3"))
+    with Program() as logic:
+        with Rung(X1):
+            out(Y1)
+        with Rung(second_contact):
+            out(Y2)
+        with Rung(X3).continued():
+            out(Y3)
+    return logic, (X1, second_contact, X3, Y1, Y2, Y3)
+
+
+def _cache_mapping(tags: tuple[Bool, ...], *, y1: int = 1) -> TagMap:
+    X1, second, X3, Y1, Y2, Y3 = tags
+    return TagMap(
+        {X1: x[1], second: x[2], X3: x[3], Y1: y[y1], Y2: y[2], Y3: y[3]},
+        include_system=False,
+    )
+
+
+def test_export_cache_reuses_unchanged_rungs_only():
+    from pyrung.click import LadderExportCache
+
+    cache = LadderExportCache()
+    logic, tags = _cache_program(Bool("X2"))
+    first = pyrung_to_ladder(logic, _cache_mapping(tags), cache=cache)
+    assert (cache.hits, cache.misses, len(cache)) == (0, 2, 2)
+
+    # A fresh build of the same source hits every unit, including the continued pair.
+    logic, tags = _cache_program(Bool("X2"))
+    assert pyrung_to_ladder(logic, _cache_mapping(tags), cache=cache) == first
+    assert (cache.hits, cache.misses) == (2, 2)
+    # Strict prevalidation is cached per rung alongside the rendered rows.
+    assert (cache.validation.hits, cache.validation.misses) == (3, 3)
+
+    # Editing the rung before a continued() rung re-renders that unit only.
+    logic, tags = _cache_program(Bool("X4"))
+    edited = pyrung_to_ladder(logic, _cache_mapping(tags), cache=cache)
+    assert (cache.hits, cache.misses) == (3, 3)
+    assert edited == pyrung_to_ladder(logic, _cache_mapping(tags))
+
+    # Remapping a tag invalidates the rungs that use it.
+    remapped = pyrung_to_ladder(logic, _cache_mapping(tags, y1=5), cache=cache)
+    assert (cache.hits, cache.misses) == (4, 4)
+    assert remapped.main_rows[1][-1] == "out(Y005)"
+
+
+def test_export_cache_save_and_load(tmp_path):
+    from pyrung.click import LadderExportCache
+
+    cache = LadderExportCache()
+    logic, tags = _cache_program(Bool("X2"))
+    bundle = pyrung_to_ladder(logic, _cache_mapping(tags), cache=cache)
+    cache.save(tmp_path / "ladder_cache.json")
+
+    restored = LadderExportCache.load(tmp_path / "ladder_cache.json")
+    assert pyrung_to_ladder(logic, _cache_mapping(tags), cache=restored) == bundle
+    assert (restored.hits, restored.misses) == (2, 0)
+    assert len(LadderExportCache.load(tmp_path / "missing.json")) == 0
+
+
+def test_export_cache_load_discards_other_versions(tmp_path):
+    import json
+
+    from pyrung.click import LadderExportCache
+
+    cache = LadderExportCache()
+    logic, tags = _cache_program(Bool("X2"))
+    pyrung_to_ladder(logic, _cache_mapping(tags), cache=cache)
+    path = tmp_path / "ladder_cache.json"
+    cache.save(path)
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload["versions"]["pyclickplc"] = "0.0.0"
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+    assert len(LadderExportCache.load(path)) == 0
+
+
+def test_rung_fingerprint_covers_function_bodies_and_captures():
+    from pyrung.click._fingerprint import _RungFingerprinter
+    from pyrung.core import Int, run_function
+
+    def rung_calling(fn):
+        with Program(strict=False) as logic:
+            with Rung(Bool("Go")):
+                run_function(fn, outs={"value": Int("Out")})
+        return _RungFingerprinter(TagMap(include_system=False)).rung_key(logic.rungs[0])
+
+    # Two lambdas from one scope share a qualname but not a body or capture.
+    doubled, tripled = (lambda: {"value": 2}), (lambda: {"value": 3})
+    assert rung_calling(doubled) != rung_calling(tripled)
+    scaled = [lambda factor=factor: {"value": factor} for factor in (2, 3)]
+    assert rung_calling(scaled[0]) != rung_calling(scaled[1])
+
+    # Recompiling the same body elsewhere in the file keeps the key.
+    namespace: dict[str, object] = {}
+    exec("def f():\n    return {'value': 2}", namespace)
+    first = rung_calling(namespace["f"])
+    exec("\n\n\ndef f():\n    return {'value': 2}", namespace)
+    assert rung_calling(namespace["f"]) == first
+    exec("def f():\n    return {'value': 5}", namespace)
+    assert rung_calling(namespace["f"]) != first
+
+
+def test_export_cache_does_not_hide_errors():
+    from pyrung.click import LadderExportCache
+
+    logic, mapping = build_program("""
+        with Program() as p:
+            comment("No rows should be emitted.")
+            with Rung(X1):
+                with branch(C1):
+                    pass
+    """)
+    cache = LadderExportCache()
+    for _ in range(2):
+        with pytest.raises(LadderExportError) as exc_info:
+            pyrung_to_ladder(logic, mapping, cache=cache)
+        assert exc_info.value.issues[0]["path"] == "main"
+    assert len(cache) == 0
@@ -557,3 +557,21 @@ def test_realistic_compare_condition():
             if "DS3>0" in cells:
                 return
     pytest.fail("Could not find compare condition cell with DS3>0")
+
+
+def test_realistic_export_is_identical_with_cache_and_workers(monkeypatch):
+    """Cached and multi-process exports produce the same bundle as a plain export."""
+    from pyrung.click import LadderExportCache
+    from pyrung.click.ladder import _exporter
+
+    logic, mapping = _build_program_and_mapping()
+    expected = pyrung_to_ladder(logic, mapping)
+
+    cache = LadderExportCache()
+    assert pyrung_to_ladder(logic, mapping, cache=cache) == expected
+    rebuilt_logic, rebuilt_mapping = _build_program_and_mapping()
+    assert pyrung_to_ladder(rebuilt_logic, rebuilt_mapping, cache=cache) == expected
+    assert cache.misses == cache.hits == len(cache)
+
+    monkeypatch.setattr(_exporter, "_MIN_PARALLEL_UNITS", 1)
+    assert pyrung_to_ladder(logic, mapping, workers=2) == expected
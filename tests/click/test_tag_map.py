@@ -44,6 +44,39 @@ def test_resolve_block_slot_sparse_bank():
     assert mapping.resolve(alarms, 17) == "X021"
 
 
+def test_resolve_many_matches_resolve():
+    valve = Bool("Valve")
+    speed = Tag("Speed", TagType.INT)
+    alarms = Block("Alarm", TagType.BOOL, 1, 17)
+    gaps = Block("Gap", TagType.INT, 1, 10, valid_ranges=((1, 3), (8, 10)))
+    mapping = TagMap({valve: c[1], speed: ds[1], alarms: x.select(1, 21), gaps: ds.select(11, 16)})
+
+    sources = [valve, "Speed", alarms[17], (alarms, 17), (gaps, 8), "sys.always_on"]
+    assert mapping.resolve_many(sources) == [mapping.resolve(s) for s in sources[:3]] + [
+        mapping.resolve(alarms, 17),
+        mapping.resolve(gaps, 8),
+        mapping.resolve("sys.always_on"),
+    ]
+    assert mapping.resolve_many([(gaps, 3), (gaps, 8)]) == ["DS13", "DS14"]
+
+    with pytest.raises(IndexError, match="out of range"):
+        mapping.resolve_many([(gaps, 5)])
+    with pytest.raises(KeyError, match="Missing"):
+        mapping.resolve_many([valve, "Missing"])
+    with pytest.raises(KeyError, match="Other"):
+        mapping.resolve_many([(Block("Other", TagType.BOOL, 1, 2), 1)])
+
+
+def test_resolve_many_survives_pickling():
+    import pickle
+
+    alarms = Block("Alarm", TagType.BOOL, 1, 3)
+    mapping = pickle.loads(pickle.dumps(TagMap({alarms: c.select(101, 103)})))
+    restored_alarms = mapping.blocks()[0].logical
+
+    assert mapping.resolve_many([(restored_alarms, 2), restored_alarms[3]]) == ["C102", "C103"]
+
+
 def test_offset_for_block():
     alarms = Block("Alarm", TagType.BOOL, 1, 3)
     mapping = TagMap({alarms: c.select(101, 103)})
@@ -322,6 +355,133 @@ def test_from_nickname_file_round_trip(tmp_path):
     assert restored_block[2].comment == "Last alarm"
 
 
+def _count_nickname_parses(monkeypatch) -> list[int]:
+    from pyrung.click.tag_map import _map
+
+    calls = [0]
+    original = _map.tag_map_from_nickname_file
+
+    def counting(*args, **kwargs):
+        calls[0] += 1
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(_map, "tag_map_from_nickname_file", counting)
+    return calls
+
+
+def test_from_nickname_file_cache_returns_independent_copies(tmp_path, monkeypatch):
+    from pyrung.click.tag_map._cache import clear_cache
+
+    alarms = Block("Alarm", TagType.BOOL, 1, 3)
+    path = tmp_path / "cached.csv"
+    TagMap({Bool("Valve"): c[1], alarms: c.select(101, 103)}).to_nickname_file(path)
+    clear_cache()
+    calls = _count_nickname_parses(monkeypatch)
+
+    first = TagMap.from_nickname_file(path)
+    second = TagMap.from_nickname_file(path)
+    assert calls[0] == 1
+    assert second.mapped_slots() == first.mapped_slots()
+
+    first_block = first.blocks()[0].logical
+    second_block = second.blocks()[0].logical
+    assert second_block is not first_block
+    assert second_block in second and second_block[2] in second
+    assert second.resolve(second_block, 2) == "C102"
+    assert second.blocks()[0].hardware.block is first.blocks()[0].hardware.block
+
+    TagMap({Bool("Valve"): c[2]}).to_nickname_file(path)
+    assert TagMap.from_nickname_file(path).resolve("Valve") == "C2"
+    TagMap.from_nickname_file(path, cache=False)
+    assert calls[0] == 3
+
+
+def test_from_nickname_file_disk_cache_is_shared_between_processes(tmp_path, monkeypatch):
+    from pyrung.click.tag_map._cache import CACHE_DIR_ENV, clear_cache
+
+    path = tmp_path / "disk.csv"
+    TagMap({Bool("Valve"): c[1]}).to_nickname_file(path)
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "cache"))
+    clear_cache()
+    calls = _count_nickname_parses(monkeypatch)
+
+    TagMap.from_nickname_file(path)
+    assert len(list((tmp_path / "cache").glob("tagmap-*.pickle"))) == 1
+    clear_cache()  # simulate a fresh worker process
+    restored = TagMap.from_nickname_file(path)
+    assert calls[0] == 1
+    assert restored.resolve("Valve") == "C1"
+
+    for entry in (tmp_path / "cache").glob("tagmap-*.pickle"):
+        entry.write_bytes(b"not a pickle")
+    clear_cache()
+    assert TagMap.from_nickname_file(path).resolve("Valve") == "C1"
+    assert calls[0] == 2
+
+
+def test_tag_map_cache_key_follows_builder_source(monkeypatch):
+    from pyrung.click.tag_map import _cache
+
+    key = _cache.cache_key(b"data", "strict")
+    assert _cache.cache_key(b"data", "strict") == key
+    monkeypatch.setattr(_cache, "_source_digest", lambda: "edited")
+    assert _cache.cache_key(b"data", "strict") != key
+
+
+def test_tag_map_disk_cache_removes_temp_file_on_failed_write(tmp_path, monkeypatch):
+    from pyrung.click.tag_map import _cache
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(_cache.os, "replace", fail)
+    _cache._write_disk(tmp_path / "tagmap-key.pickle", b"blob")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_from_nickname_file_cache_round_trips_structures(tmp_path):
+    path = tmp_path / "udt_cached.csv"
+    records = {
+        get_addr_key("DS", 1000 + i): AddressRecord(
+            memory_type="DS",
+            address=1000 + i,
+            nickname=f"Motor{i}_speed",
+            comment="<Motor.speed:udt>" if i == 1 else "</Motor.speed:udt>",
+            initial_value="0",
+            retentive=False,
+            data_type=DataType.INT,
+        )
+        for i in (1, 2)
+    }
+    pyclickplc.write_csv(path, records)
+
+    first = TagMap.from_nickname_file(path)
+    second = TagMap.from_nickname_file(path)
+    motor = second.structure_by_name("Motor")
+    assert motor is not None and motor is not first.structure_by_name("Motor")
+    speed = motor.runtime[2].speed
+    assert speed.name == "Motor2_speed"
+    assert speed in second
+    assert second.resolve(speed) == "DS1002"
+    owner = second._owner_of("DS1002")
+    assert owner is not None and (owner.instance, owner.field) == (2, "speed")
+
+
+def test_iter_mapped_slots_filters_by_source_lazily():
+    alarms = Block("Alarm", TagType.BOOL, 1, 2)
+    mapping = TagMap({Bool("Valve"): c[1], alarms: c.select(101, 102)})
+
+    assert tuple(mapping.iter_mapped_slots()) == mapping.mapped_slots()
+    assert [slot.hardware_address for slot in mapping.iter_mapped_slots("user")] == [
+        "C1",
+        "C101",
+        "C102",
+    ]
+    system = list(mapping.iter_mapped_slots("system"))
+    assert system and all(slot.source == "system" for slot in system)
+    assert next(iter(mapping.iter_mapped_slots())).logical_name == "Valve"
+
+
 def test_tag_meta_parser_round_trips_valid_metadata():
     meta, remaining = parse_tag_meta("[choices=IDLE:0|RUN:1, readonly] Motor speed")
 
@@ -22,6 +22,7 @@ from pyrung.click.validation import (
     CLK_PTR_POINTER_MUST_BE_DS,
     CLK_TILDE_BOOL_CONTACT_ONLY,
     CLK_TIMER_PRESET_OVERFLOW,
+    ClickValidationCache,
     ClickValidationReport,
     validate_click_program,
 )
@@ -1310,3 +1311,93 @@ class TestTimerPresetOverflow:
         )
         report = validate_click_program(prog, tag_map, mode="warn")
         assert CLK_TIMER_PRESET_OVERFLOW not in _finding_codes(report)
+
+
+# ---------------------------------------------------------------------------
+# Test: Incremental validation cache
+# ---------------------------------------------------------------------------
+
+
+class TestValidationCache:
+    @staticmethod
+    def _program(preset: int):
+        A = Tag("A", TagType.INT)
+
+        def logic():
+            with Rung():
+                copy(A * 2, Tag("Dest", TagType.INT))
+            with Rung():
+                on_delay(Timer[1], preset=preset, unit="Tms")
+            with Rung(x[1]):
+                out(y[1])
+
+        return _build_program(logic)
+
+    @staticmethod
+    def _tag_map():
+        return TagMap(
+            [Timer[1].Done.map_to(c[1]), Timer[1].Acc.map_to(ds[1])],
+            include_system=False,
+        )
+
+    def test_cached_report_matches_uncached(self):
+        prog = self._program(60000)
+        tag_map = self._tag_map()
+        cache = ClickValidationCache()
+
+        first = validate_click_program(prog, tag_map, mode="warn", cache=cache)
+        second = validate_click_program(prog, tag_map, mode="warn", cache=cache)
+
+        assert first == validate_click_program(prog, tag_map, mode="warn")
+        assert second == first
+        assert cache.misses == 3
+        assert cache.hits == 3
+
+    def test_rebuilt_program_reuses_unchanged_rungs(self):
+        tag_map = self._tag_map()
+        cache = ClickValidationCache()
+        validate_click_program(self._program(60000), tag_map, cache=cache)
+
+        changed = self._program(100)
+        report = tag_map.validate(changed, cache=cache)
+
+        assert cache.hits == 2
+        assert cache.misses == 4
+        assert CLK_TIMER_PRESET_OVERFLOW not in _finding_codes(report)
+        assert report == validate_click_program(changed, tag_map)
+
+    def test_inserting_rung_at_top_revalidates_only_that_rung(self):
+        A = Tag("A", TagType.INT)
+        tag_map = self._tag_map()
+        cache = ClickValidationCache()
+        validate_click_program(self._program(60000), tag_map, cache=cache)
+
+        def logic():
+            with Rung():
+                copy(A * 3, Tag("Other", TagType.INT))
+            with Rung():
+                copy(A * 2, Tag("Dest", TagType.INT))
+            with Rung():
+                on_delay(Timer[1], preset=60000, unit="Tms")
+            with Rung(x[1]):
+                out(y[1])
+
+        shifted = _build_program(logic)
+        cache.hits = cache.misses = 0
+        report = validate_click_program(shifted, tag_map, cache=cache)
+
+        assert cache.misses == 1
+        assert cache.hits == 3
+        assert report == validate_click_program(shifted, tag_map)
+        assert any(f.location.startswith("main.rung[2].") for f in report.hints)
+
+    def test_mode_change_clears_cache(self):
+        prog = self._program(60000)
+        tag_map = self._tag_map()
+        cache = ClickValidationCache()
+
+        validate_click_program(prog, tag_map, mode="warn", cache=cache)
+        report = validate_click_program(prog, tag_map, mode="strict", cache=cache)
+
+        assert cache.hits == 0
+        assert any(f.code == CLK_EXPR_ONLY_IN_CALC for f in report.errors)
@@ -0,0 +1,103 @@
+"""BatchPLC: one compiled program over many lanes."""
+
+from __future__ import annotations
+
+import pytest
+
+from pyrung.core import (
+    PLC,
+    BatchPLC,
+    Bool,
+    Int,
+    Program,
+    ProgramImage,
+    Rung,
+    Timer,
+    copy,
+    latch,
+    on_delay,
+    out,
+    reset,
+    rise,
+)
+
+Start = Bool("Start")
+Stop = Bool("Stop")
+Motor = Bool("Motor")
+Pulse = Bool("Pulse")
+Preset = Int("Preset")
+Count = Int("Count")
+Ready = Timer.clone("Ready")
+
+
+def _build() -> Program:
+    with Program() as logic:
+        with Rung(Start):
+            latch(Motor)
+        with Rung(Stop):
+            reset(Motor)
+        with Rung(rise(Start)):
+            out(Pulse)
+        with Rung(Motor):
+            on_delay(Ready, preset=Preset)
+            copy(Preset, Count)
+    return logic
+
+
+def test_lanes_match_independent_runners():
+    logic = _build()
+    presets = [20, 80, 200]
+    batch = BatchPLC(logic, lanes=3, dt=0.01)
+    plcs = [PLC(logic, dt=0.01) for _ in presets]
+
+    batch.patch({Preset: presets, Start: True})
+    for plc, preset in zip(plcs, presets, strict=True):
+        plc.patch({"Preset": preset, "Start": True})
+    batch.run(6)
+    for plc in plcs:
+        plc.run(6)
+
+    for name in ("Motor", "Pulse", "Count", "Ready_Done", "Ready_Acc"):
+        assert batch.column(name) == [plc.current_state.tags[name] for plc in plcs]
+    assert batch.column(Ready.Done) == [True, False, False]
+    assert batch.scan_id == 6
+    assert batch.simulation_time == pytest.approx(0.06)
+
+
+def test_forces_and_lane_selection():
+    batch = BatchPLC(_build(), lanes=4)
+
+    batch.force(Start, True, lanes=[1, 3])
+    batch.force(Stop, [True, False], lanes=[1, 3])
+    batch.step()
+    assert batch.column(Motor) == [False, False, False, True]
+
+    batch.unforce(Stop, lanes=[1, 3])
+    batch.patch({Stop: False}, lanes=[1, 3])
+    batch.step()
+    assert batch.column(Motor) == [False, True, False, True]
+    assert batch.lane(1).forces == {"Start": True}
+
+    batch.clear_forces()
+    batch.patch({Stop: True})
+    batch.step()
+    assert batch.column(Motor) == [False] * 4
+    assert batch.state(1).tags["Motor"] is False
+
+
+def test_shares_compiled_kernel_from_image():
+    image = ProgramImage(_build())
+    batch = BatchPLC(image, lanes=2)
+
+    assert batch.compiled is image.compiled_kernel()
+    assert all(batch.lane(i)._compiled is batch.compiled for i in range(len(batch)))
+
+
+def test_rejects_bad_arguments():
+    with pytest.raises(ValueError, match="at least one lane"):
+        BatchPLC(_build(), lanes=0)
+    with pytest.raises(TypeError, match="Program or ProgramImage"):
+        BatchPLC([], lanes=1)  # type: ignore[arg-type]
+    batch = BatchPLC(_build(), lanes=2)
+    with pytest.raises(ValueError, match="expected 2"):
+        batch.patch({Preset: [1, 2, 3]})
@@ -623,3 +623,86 @@ class TestGroupedOr:
 
         with pytest.raises(TypeError, match="And\\(\\.\\.\\.\\)"):
             Or([A, B], C)
+
+
+class TestCompiledConditions:
+    """Compiled rung conditions agree with the object-tree evaluation."""
+
+    def _states(self):
+        import itertools
+
+        for start, stop, prev, speed, limit in itertools.product(
+            (False, True), (False, True), (False, True), (0, 5, 50), (5, 40)
+        ):
+            yield (
+                SystemState()
+                .with_tags({"Start": start, "Stop": stop, "Speed": speed, "Limit": limit, "Idx": 2})
+                .with_memory({"_prev:Start": prev, "_prev:Stop": not prev})
+            )
+
+    def test_compiled_matches_tree(self):
+        from pyrung.core import And, Block, Or, TagType, fall, rise
+        from pyrung.core.condition import _as_condition, _compile_conditions
+        from pyrung.core.context import ScanContext
+
+        Start = Bool("Start")
+        Stop = Bool("Stop")
+        Speed = Int("Speed")
+        Limit = Int("Limit")
+        Idx = Int("Idx")
+        DS = Block("DS", TagType.INT, 1, 3)
+
+        cases = [
+            [Start],
+            [~Stop],
+            [Speed],
+            [Speed == 5, Start],
+            [Speed != Limit],
+            [Speed > Limit],
+            [Speed <= Limit + 1],
+            [rise(Start)],
+            [fall(Stop)],
+            [Or(Start, And(Stop, Speed >= 5)), ~Stop],
+            [Or(Speed, Limit)],
+            [DS[Idx] == 0],
+            [],
+        ]
+        for raw in cases:
+            conditions = [_as_condition(cond) for cond in raw]
+            compiled = _compile_conditions(conditions)
+            for state in self._states():
+                expected = all(cond.evaluate(ScanContext(state)) for cond in conditions)
+                result = compiled(ScanContext(state))
+                assert result is expected, (conditions, dict(state.tags))
+
+    def test_condition_subclass_uses_its_own_evaluate(self):
+        from pyrung.core.condition import BitCondition, _compile_conditions
+        from pyrung.core.context import ScanContext
+
+        class Inverted(BitCondition):
+            def evaluate(self, ctx):
+                return not super().evaluate(ctx)
+
+        compiled = _compile_conditions([Inverted(Bool("Start"))])
+
+        assert compiled(ScanContext(SystemState().with_tags({"Start": True}))) is False
+        assert compiled(ScanContext(SystemState().with_tags({"Start": False}))) is True
+
+    def test_compiled_rung_pickles(self):
+        import pickle
+
+        from pyrung.core.instruction import OutInstruction
+        from pyrung.core.rung import Rung
+        from tests.conftest import evaluate_rung
+
+        Start = Bool("Start")
+        Light = Bool("Light")
+        rung = Rung(Start, Int("Speed") > 3)
+        rung.add_instruction(OutInstruction(Light))
+        state = SystemState().with_tags({"Start": True, "Speed": 4, "Light": False})
+        assert evaluate_rung(rung, state).tags["Light"] is True
+
+        clone = pickle.loads(pickle.dumps(rung))
+
+        assert clone._condition_fn is None
+        assert evaluate_rung(clone, state).tags["Light"] is True
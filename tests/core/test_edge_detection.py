@@ -275,6 +275,48 @@ class TestPrevValueTracking:
         assert runner.current_state.memory.get("_prev:A") is False
         assert runner.current_state.memory.get("_prev:B") is True
 
+    def test_incremental_capture_matches_full_pass(self, runner_factory):
+        """Scans that only revisit written tags keep the same _prev:* values."""
+        from pyrung.core import Counter, Int, Timer, copy, count_up, on_delay, rise
+
+        Start = Bool("Start")
+        Reset = Bool("Reset")
+        Pulse = Bool("Pulse")
+        Speed = Int("Speed")
+        Shown = Int("Shown")
+        T = Timer.clone("T")
+        C = Counter.clone("C")
+
+        with Program() as logic:
+            with Rung(Start):
+                on_delay(T, 30)
+            with Rung(rise(Start)):
+                out(Pulse)
+                count_up(C, 3).reset(Reset)
+            with Rung(T.Done):
+                copy(Speed, Shown)
+
+        incremental = runner_factory(logic, dt=0.01)
+        full = runner_factory(logic, dt=0.01)
+        inputs = [
+            {"Start": True, "Speed": 5},
+            {},
+            {"Start": False},
+            {"Start": True, "Speed": 9},
+            {},
+            {},
+            {"Reset": True},
+            {"Reset": False, "Start": False},
+        ]
+        for patch in inputs:
+            incremental.patch(patch)
+            full.patch(patch)
+            full._prev_synced_state = None
+            incremental.step()
+            full.step()
+            assert incremental.current_state.tags == full.current_state.tags
+            assert incremental.current_state.memory == full.current_state.memory
+
 
 class TestEdgeCombinations:
     """Test edge conditions combined with other conditions."""
@@ -19,7 +19,7 @@ from pyrung.core import (
     profile,
     udt,
 )
-from pyrung.core.harness import _profile_registry
+from pyrung.core.harness import _profile_registry, _vectorized_profiles
 from pyrung.core.physical import Physical
 
 # --- Fixtures: Physical declarations ---
@@ -66,6 +66,13 @@ class EncoderDevice:
     Fb_Pulse: Bool = Field(physical=ENCODER, link="En")
 
 
+@udt(count=3)
+class HeaterBank:
+    En: Bool
+    Fb_Contact: Bool = Field(physical=LIMIT_SWITCH, link="En")
+    Fb_Temp: Real = Field(physical=TEMP_SENSOR, link="En", min=0, max=250, uom="degC")
+
+
 # --- Helpers ---
 
 
@@ -367,6 +374,82 @@ class TestAnalogAutoharness:
         assert decayed < peak
 
 
+class TestVectorizedProfile:
+    def setup_method(self):
+        _profile_registry.clear()
+        _vectorized_profiles.clear()
+
+    def _bank_plc(self):
+        Cmd = Bool("Cmd")
+        with Program() as logic:
+            with Rung(Cmd):
+                out(HeaterBank[1].En)
+                out(HeaterBank[3].En)
+        return PLC(logic, dt=0.010), Cmd
+
+    def test_called_once_per_scan_for_all_active_couplings(self):
+        calls: list[tuple[list[float], list[bool], float]] = []
+
+        @profile("test_thermal", vectorized=True)
+        def thermal(cur, en, dt):
+            calls.append((list(cur), list(en), dt))
+            return [c + 10.0 * dt if e else c for c, e in zip(cur, en, strict=True)]
+
+        plc, Cmd = self._bank_plc()
+        harness = Harness(plc)
+        harness.install()
+
+        plc.patch({Cmd: True})
+        plc.run(5)
+
+        assert len(calls) == 4
+        assert all(len(cur) == len(en) == 2 for cur, en, _dt in calls)
+        assert calls[-1][1] == [True, True]
+        temps = [_fb(plc, HeaterBank[i].Fb_Temp) for i in (1, 2, 3)]
+        assert temps[0] == pytest.approx(0.4)
+        assert temps[1] == 0.0
+        assert temps[2] == pytest.approx(0.4)
+
+    def test_matches_scalar_profile(self):
+        def run(vectorized: bool) -> list[float]:
+            if vectorized:
+
+                @profile("test_thermal", vectorized=True)
+                def thermal_vec(cur, en, dt):
+                    return [c + 5.0 * dt if e else c - dt for c, e in zip(cur, en, strict=True)]
+
+            else:
+
+                @profile("test_thermal")
+                def thermal(cur, en, dt):
+                    return cur + 5.0 * dt if en else cur - dt
+
+            plc, Cmd = self._bank_plc()
+            Harness(plc).install()
+            plc.patch({Cmd: True})
+            plc.run(10)
+            plc.patch({Cmd: False})
+            plc.run(3)
+            return [_fb(plc, HeaterBank[i].Fb_Temp) for i in (1, 2, 3)]
+
+        assert run(vectorized=True) == pytest.approx(run(vectorized=False))
+        assert "test_thermal" not in _vectorized_profiles
+
+    def test_edges_come_from_commit_not_monitors(self):
+        plc, Cmd = self._bank_plc()
+        harness = Harness(plc)
+        harness.install()
+
+        assert plc._monitors_by_id == {}
+        plc.patch({Cmd: True})
+        plc.run_for(0.050)
+        assert _fb(plc, HeaterBank[1].Fb_Contact) is True
+        assert _fb(plc, HeaterBank[2].Fb_Contact) is False
+
+        harness.uninstall()
+        assert harness._on_commit not in plc._post_commit_callbacks
+
+
 class TestBoolProfileAutoharness:
     def setup_method(self):
         _profile_registry.clear()
@@ -15,6 +15,7 @@ import pytest
 
 from pyrung.core import PLC, TimeMode
 from pyrung.core.state import SystemState
+from pyrung.core.system_points import _MODE_RUN_KEY
 
 
 def _scan_ids(runner: PLC, n: int = 100) -> list[int]:
@@ -60,6 +61,36 @@ def test_history_range_is_start_inclusive_end_exclusive() -> None:
     assert runner.history.range(9, 12) == []
 
 
+def test_history_columns_export_values_edges_and_true_mask() -> None:
+    initial = SystemState().with_tags({"A": False, "N": 0})
+    runner = PLC(logic=[], initial_state=initial)
+    runner.patch({"A": True})
+    runner.step()
+    runner.patch({"N": 5})
+    runner.step()
+    runner.patch({"A": False})
+    runner.step()
+
+    columns = runner.history.columns(["A", "N", "Missing"], 0, 4)
+
+    assert list(columns.scan_ids) == [0, 1, 2, 3]
+    assert columns.values["A"] == [False, True, True, False]
+    assert columns.values["Missing"] == [None, None, None, None]
+    assert columns.value_at("N", 2) == 5
+    assert columns.edges("A") == [(1, False, True), (3, True, False)]
+    assert columns.edges("N") == [(2, 0, 5)]
+    assert columns.true_mask("A") == 0b0110
+    assert 4 not in columns
+
+
+def test_history_columns_clamp_to_addressable_range() -> None:
+    runner = PLC(logic=[])
+    runner.run(cycles=2)
+
+    assert len(runner.history.columns(["A"], 1, 10)) == 2
+    assert len(runner.history.columns(["A"], 5, 10)) == 0
+
+
 def test_history_latest_returns_chronological_window_with_bounds() -> None:
     runner = PLC(logic=[])
     runner.run(cycles=4)
@@ -210,6 +241,34 @@ def test_diff_raises_for_unknown_scan() -> None:
         runner.diff(0, 99)
 
 
+def test_changed_tags_since_accumulates_commits() -> None:
+    initial = SystemState().with_tags({"A": 0, "B": 0, "C": 0})
+    runner = PLC(logic=[], initial_state=initial)
+    runner.step()  # first scan materializes system points
+
+    runner.patch({"A": 1})
+    runner.step()
+    runner.patch({"B": 2, "C": 0})
+    runner.step()
+    runner.step()
+
+    assert runner.changed_tags_since(1) == {"A", "B"}
+    assert runner.changed_tags_since(2) == {"B"}
+    assert runner.changed_tags_since(4) == frozenset()
+
+
+def test_changed_tags_since_returns_none_outside_journal() -> None:
+    runner = PLC(logic=[])
+    runner.step()
+
+    assert runner.changed_tags_since(5) is None
+
+    runner.reboot()
+    assert runner.changed_tags_since(0) == frozenset()
+    runner.step()
+    assert runner.changed_tags_since(-1) is None
+
+
 def test_fork_defaults_to_current_tip_even_if_playhead_is_in_the_past() -> None:
     runner = PLC(logic=[])
     runner.run(cycles=3)
@@ -280,6 +339,77 @@ def test_fork_starts_clean_and_parent_fork_evolve_independently() -> None:
     assert _scan_ids(fork) == [1, 2]
 
 
+def test_fork_shares_snapshot_and_tag_registry_until_written() -> None:
+    from pyrung.core import Bool, Program, Rung, out
+
+    start = Bool("Start")
+    lamp = Bool("Lamp")
+    with Program() as logic:
+        with Rung(start):
+            out(lamp)
+    runner = PLC(logic)
+    runner.patch({"Start": True})
+    runner.step()
+
+    fork = runner.fork()
+    assert fork.current_state is runner.current_state
+    assert fork._known_tags_by_name is runner._known_tags_by_name
+
+    fork.patch({Bool("AdHoc"): True})
+    fork.step()
+    assert "AdHoc" in fork.tags
+    assert "AdHoc" not in runner.tags
+    assert fork.current_state.tags["Lamp"] is True
+
+
+def test_many_forks_from_one_snapshot_evolve_independently() -> None:
+    runner = PLC(logic=[])
+    runner.patch({"X": 0})
+    runner.step()
+
+    forks = [runner.fork() for _ in range(50)]
+    for value, fork in enumerate(forks):
+        fork.patch({"X": value})
+        fork.step()
+
+    assert [fork.current_state.tags["X"] for fork in forks] == list(range(50))
+    assert runner.current_state.tags["X"] == 0
+    assert all(_scan_ids(fork) == [1, 2] for fork in forks)
+
+
+def test_fork_reads_pre_fork_scans_through_parent_history() -> None:
+    runner = PLC(logic=[])
+    for value in range(1, 6):
+        runner.patch({"X": value})
+        runner.step()
+
+    fork = runner.fork(scan_id=3)
+    fork.patch({"X": 99})
+    fork.step()
+    grandchild = fork.fork()
+
+    assert fork.history.at(2).tags["X"] == 2
+    assert fork.history.at(3).tags["X"] == 3
+    assert fork.history.at(4).tags["X"] == 99
+    assert fork.replay_to(1).current_state.tags["X"] == 1
+    assert grandchild.history.at(2).tags["X"] == 2
+    assert grandchild.history.at(4).tags["X"] == 99
+    assert fork.history.oldest_scan_id == 3
+    with pytest.raises(KeyError):
+        PLC(logic=[]).fork().history.at(-1)
+
+
+def test_fork_of_stopped_runner_starts_in_run_mode() -> None:
+    runner = PLC(logic=[])
+    runner.step()
+    runner.stop()
+
+    fork = runner.fork()
+
+    assert fork.current_state.memory[_MODE_RUN_KEY] is True
+    assert runner.current_state.memory[_MODE_RUN_KEY] is False
+
+
 def test_fork_raises_for_unknown_scan() -> None:
     runner = PLC(logic=[])
 
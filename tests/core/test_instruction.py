@@ -274,6 +274,20 @@ class TestOneShotBehavior:
         plc.step()
         assert plc.current_state.tags["Light"] is True
 
+    def test_memory_key_follows_reassigned_state_key(self):
+        """Cached memory keys are rebuilt when the program renumbers instructions."""
+        from pyrung.core.instruction import OutInstruction
+
+        instr = OutInstruction(Bool("Light"), oneshot=True)
+        assert instr.memory_key("_oneshot") == f"_oneshot:{id(instr)}"
+
+        instr._state_key = "i1"
+        assert instr.memory_key("_oneshot") == "_oneshot:i1"
+        assert instr.memory_key("_oneshot") is instr.memory_key("_oneshot")
+
+        instr._state_key = "i7"
+        assert instr.memory_key("_oneshot") == "_oneshot:i7"
+
 
 class TestInstructionImmutability:
     """Test that instructions don't mutate input state."""
@@ -0,0 +1,87 @@
+"""Tests for the PLC(profile=True) scan profiler."""
+
+from __future__ import annotations
+
+import pytest
+
+from pyrung.core import PLC, Bool, Int, Program, Rung, branch, call, copy, out, subroutine
+
+
+def _program() -> Program:
+    Button = Bool("Button")
+    Light = Bool("Light")
+    Aux = Bool("Aux")
+    Step = Int("Step")
+    SubLight = Bool("SubLight")
+
+    with Program(strict=False) as logic:
+        with Rung(Button):
+            out(Light)
+            with branch(Aux):
+                copy(1, Step)
+            call("my_sub")
+        with Rung():
+            copy(2, Step)
+
+        with subroutine("my_sub"):
+            with Rung():
+                out(SubLight)
+    return logic
+
+
+def test_profile_records_rungs_branches_subroutines_and_instructions() -> None:
+    runner = PLC(_program(), profile=True)
+    runner.patch({"Button": True, "Aux": True})
+    runner.run(cycles=3)
+
+    report = runner.debug.profile()
+
+    assert report.scans == 3
+    assert sorted(e.name.split(" (")[0] for e in report.rungs) == ["rung 0", "rung 1"]
+    assert all(e.calls == 3 for e in report.rungs)
+    assert [e.calls for e in report.branches] == [3]
+    assert [(e.name, e.calls) for e in report.subroutines] == [("my_sub", 3)]
+    calls = {e.name: e.calls for e in report.instructions}
+    assert calls["OutInstruction"] == 6
+    assert calls["CopyInstruction"] == 6
+    assert calls["CallInstruction"] == 3
+    assert sum(e.total_ns for e in report.rungs) <= report.total_ns
+    assert "Subroutines" in report.format()
+
+
+def test_subroutine_time_counts_toward_calling_rung() -> None:
+    runner = PLC(_program(), profile=True)
+    runner.patch({"Button": True})
+    runner.run(cycles=2)
+
+    report = runner.debug.profile()
+    rung0 = next(e for e in report.rungs if e.name.startswith("rung 0"))
+
+    assert rung0.total_ns >= report.subroutines[0].total_ns
+
+
+def test_profile_reset_clears_counters() -> None:
+    runner = PLC(_program(), profile=True)
+    runner.step()
+
+    assert runner.debug.profile(reset=True).scans == 1
+    assert runner.debug.profile().scans == 0
+
+
+def test_profile_on_rung_list_records_top_level_rungs() -> None:
+    from pyrung.core.rung import Rung as RungLogic
+
+    runner = PLC([RungLogic(), RungLogic()], profile=True)
+    runner.run(cycles=2)
+
+    report = runner.debug.profile()
+    assert [e.calls for e in report.rungs] == [2, 2]
+    assert report.instructions == []
+
+
+def test_profile_requires_opt_in() -> None:
+    runner = PLC(_program())
+    runner.step()
+
+    with pytest.raises(RuntimeError, match="profile=True"):
+        runner.debug.profile()
@@ -0,0 +1,146 @@
+"""Shared program images and PLC.reset_to()."""
+
+from __future__ import annotations
+
+import pytest
+
+from pyrung.core import PLC, Bool, Int, Program, ProgramImage, Rung, copy, latch, out, reset, rise
+
+
+def _build() -> Program:
+    start = Bool("Start")
+    stop = Bool("Stop")
+    motor = Bool("Motor")
+    pulse = Bool("Pulse")
+    speed = Int("Speed", max=100)
+    shown = Int("Shown")
+    with Program() as logic:
+        with Rung(start):
+            latch(motor)
+        with Rung(stop):
+            reset(motor)
+        with Rung(rise(start)):
+            out(pulse)
+        with Rung(motor):
+            copy(speed, shown)
+    return logic
+
+
+def _drive(plc: PLC) -> list[dict]:
+    plc.patch({"Start": True, "Speed": 42})
+    plc.step()
+    plc.patch({"Start": False})
+    plc.run(3)
+    plc.patch({"Stop": True})
+    plc.step()
+    return [dict(plc.history.at(scan_id).tags) for scan_id in range(plc.current_state.scan_id + 1)]
+
+
+def test_plc_from_image_matches_plc_from_logic():
+    logic = _build()
+    image = ProgramImage(logic)
+
+    from_logic = PLC(logic)
+    from_image = PLC(image)
+
+    assert from_image.current_state == from_logic.current_state
+    assert dict(from_image.tags) == dict(from_logic.tags)
+    assert from_image.program is logic
+    assert _drive(from_image) == _drive(from_logic)
+    assert from_image.query.cold_rungs() == from_logic.query.cold_rungs()
+
+
+def test_runners_share_the_image_analysis():
+    image = ProgramImage(_build(), compile=True)
+    first = PLC(image)
+    second = PLC(image)
+
+    assert first._ensure_pdg() is second._ensure_pdg() is image.pdg
+    assert first._consumed_tags_for_capture() is image.consumed_tags
+    assert image.compiled_kernel() is not None
+    assert first._compiled_replay_supported_kernel() is image.compiled_kernel()
+    assert first.fork()._image is image
+
+
+def test_runner_tag_registrations_do_not_leak_into_image():
+    image = ProgramImage(_build())
+    plc = PLC(image)
+
+    plc.patch({Bool("AdHoc"): True})
+
+    assert "AdHoc" in plc.tags
+    assert "AdHoc" not in image.tags
+    assert "AdHoc" not in PLC(image).tags
+
+
+def test_initial_state_is_still_seeded_from_image():
+    image = ProgramImage(_build())
+    base = PLC(image).current_state.with_tags({"Speed": 7}).set(scan_id=5)
+
+    plc = PLC(image, initial_state=base)
+
+    assert plc.current_state.tags["Speed"] == 7
+    assert plc.current_state.tags["Motor"] is False
+    assert plc.current_state.scan_id == 5
+
+
+def test_reset_to_matches_a_fresh_runner():
+    logic = _build()
+    image = ProgramImage(logic)
+    plc = PLC(image, dt=0.05)
+    expected = _drive(PLC(image, dt=0.05))
+
+    fired: list[object] = []
+    plc.monitor("Motor", lambda current, previous: fired.append(current))
+    plc.when(Bool("Motor")).pause()
+    plc.force("Stop", True)
+    plc.patch({"Start": True})
+    plc.run(5)
+    plc.patch({"Speed": 500})
+
+    state = plc.reset_to(image)
+    fired.clear()
+
+    assert state is image.initial_state
+    assert plc.current_state is image.initial_state
+    assert plc.forces == {}
+    assert plc.history.oldest_scan_id == plc.history.newest_scan_id == 0
+    assert plc.rung_firings(0) == {}
+    assert _drive(plc) == expected
+    assert fired == []
+    assert plc.current_state.timestamp == pytest.approx(0.25)
+
+
+def test_reset_to_drops_a_forks_parent_history():
+    image = ProgramImage(_build())
+    parent = PLC(image)
+    parent.patch({"Speed": 9})
+    parent.run(20)
+    fork = parent.fork()
+
+    fork.reset_to(image)
+    fork.run(5)
+
+    assert fork.replay_to(3).current_state.tags["Speed"] == 0
+    with pytest.raises(KeyError):
+        fork.history.at(10)
+
+
+def test_reset_to_switches_programs():
+    plc = PLC(_build())
+    plc.patch({"Start": True})
+    plc.step()
+
+    other_start = Bool("Other")
+    other_lamp = Bool("Lamp")
+    with Program() as other:
+        with Rung(other_start):
+            out(other_lamp)
+    image = ProgramImage(other)
+    plc.reset_to(image)
+
+    assert plc.program is other
+    assert set(plc.tags) == {"Other", "Lamp"}
+    plc.patch({"Other": True})
+    plc.step()
+    assert plc.current_state.tags["Lamp"] is True
@@ -1,5 +1,10 @@
 """Public pyrung facade exports."""
 
+import subprocess
+import sys
+
+import pyrung
+import pyrung.core
 from pyrung import Harness, profile
 from pyrung.core import Harness as CoreHarness
 from pyrung.core import profile as core_profile
@@ -8,3 +13,27 @@ from pyrung.core import profile as core_profile
 def test_harness_and_profile_are_top_level_exports():
     assert Harness is CoreHarness
     assert profile is core_profile
+
+
+def test_lazy_exports_resolve_and_are_listed():
+    from pyrung.core.analysis.dataview import DataView
+    from pyrung.core.instruction.send_receive import send
+
+    assert pyrung.core.DataView is DataView
+    assert pyrung.send is pyrung.core.send is send
+    assert {"Harness", "send"} <= set(dir(pyrung))
+    assert {"DataView", "Harness", "send"} <= set(dir(pyrung.core))
+
+
+def test_import_defers_analysis_and_modbus_stacks():
+    probe = (
+        "import sys, pyrung\n"
+        "deferred = ('pyclickplc', 'pymodbus', 'asyncio', 'executing',"
+        " 'pyrung.core.analysis', 'pyrung.core.harness',"
+        " 'pyrung.core.instruction.send_receive')\n"
+        "print(sorted(name for name in deferred if name in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
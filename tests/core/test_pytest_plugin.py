@@ -3,11 +3,14 @@
 Covers:
 - H3: CoverageCollector, session merge, JSON output
 - H4: Whitelist loading (TOML), check_whitelist, CI gating
+- xdist: binary report transfer and controller-side merge
+- Program images: session image cache and pooled runners
 """
 
 from __future__ import annotations
 
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -15,9 +18,13 @@ from pyrung.core import PLC, And, Bool, Program, Rung, latch, out, reset
 from pyrung.core.analysis.query import CoverageReport
 from pyrung.pytest_plugin import (
     CoverageCollector,
+    ProgramImageCache,
     Whitelist,
+    _options_key,
     check_whitelist,
     load_whitelist,
+    pytest_sessionfinish,
+    pytest_testnodedown,
 )
 
 # ---------------------------------------------------------------------------
@@ -149,6 +156,167 @@ class TestCoverageCollector:
         stranded_tags = {tag for tag, _ in merged.stranded_chains}
         assert "Fault" not in stranded_tags
 
+    def test_collect_skips_stranded_analysis_once_cleared(self) -> None:
+        """After a report with no stranded chains, later tests skip cause()."""
+        logic, *_ = _build_stranded()
+        clean = PLC(logic)
+        clean.step()
+
+        tripped = PLC(logic)
+        tripped.patch({"Sensor": True})
+        tripped.step()
+
+        def _fail(*_args, **_kwargs):
+            raise AssertionError("stranded analysis should be skipped")
+
+        tripped.cause = _fail  # type: ignore[method-assign]
+
+        collector = CoverageCollector()
+        collector.collect(clean)
+        collector.collect(tripped)
+
+        merged = collector.merge()
+        assert merged is not None
+        assert merged.stranded_chains == frozenset()
+
+    def test_collect_keeps_analyzing_still_stranded_bits(self) -> None:
+        logic, *_ = _build_stranded()
+        collector = CoverageCollector()
+        for _ in range(2):
+            runner = PLC(logic)
+            runner.patch({"Sensor": True})
+            runner.step()
+            collector.collect(runner)
+
+        merged = collector.merge()
+        assert merged is not None
+        assert {tag for tag, _ in merged.stranded_chains} == {"Fault"}
+        assert merged == collector.reports[0].merge(collector.reports[1])
+
+
+# ---------------------------------------------------------------------------
+# xdist: binary reports, worker output, controller merge
+# ---------------------------------------------------------------------------
+
+
+def _stranded_report() -> CoverageReport:
+    return CoverageReport(
+        cold_rungs=frozenset({0, 3, 70}),
+        hot_rungs=frozenset({1}),
+        stranded_chains=frozenset(
+            {
+                ("Fault", ((0, "Sensor", True, "no_observed_transition"),)),
+                ("Trip", ((-1, "Trip", False, "blocked_upstream"),)),
+            }
+        ),
+    )
+
+
+class TestXdistTransfer:
+    def test_report_bytes_round_trip(self) -> None:
+        report = _stranded_report()
+        data = report.to_bytes()
+
+        assert isinstance(data, bytes)
+        assert CoverageReport.from_bytes(data) == report
+        assert CoverageReport.from_bytes(CoverageReport().to_bytes()) == CoverageReport()
+
+    def test_to_dict_orders_multiple_stranded_chains(self) -> None:
+        data = _stranded_report().to_dict()
+        assert [entry["tag"] for entry in data["stranded_chains"]] == ["Fault", "Trip"]
+
+    def test_worker_ships_report_instead_of_writing_json(self) -> None:
+        collector = CoverageCollector()
+        collector.collect_report(_stranded_report())
+        # No getoption(): a worker must return before reading report options.
+        config = SimpleNamespace(
+            workerinput={"workerid": "gw0"},
+            workeroutput={},
+            _pyrung_collector=collector,
+        )
+
+        pytest_sessionfinish(SimpleNamespace(config=config), 0)  # type: ignore[arg-type]
+
+        assert CoverageReport.from_bytes(config.workeroutput["pyrung_coverage"]) == (
+            _stranded_report()
+        )
+
+    def test_controller_merges_worker_reports(self) -> None:
+        config = SimpleNamespace(_pyrung_collector=None)
+        other = CoverageReport(cold_rungs=frozenset({3}), hot_rungs=frozenset({1}))
+        for report in (_stranded_report(), other):
+            node = SimpleNamespace(
+                config=config, workeroutput={"pyrung_coverage": report.to_bytes()}
+            )
+            pytest_testnodedown(node, None)
+        pytest_testnodedown(SimpleNamespace(config=config, workeroutput={}), None)
+
+        merged = config._pyrung_collector.merge()
+        assert merged == _stranded_report().merge(other)
+
+
+# ---------------------------------------------------------------------------
+# Program images: session cache and runner pool
+# ---------------------------------------------------------------------------
+
+
+class TestProgramImageCache:
+    def test_image_is_built_once_per_logic(self) -> None:
+        logic, *_ = _build_stranded()
+        cache = ProgramImageCache()
+
+        image = cache.image(logic)
+
+        assert cache.image(logic) is image
+        assert image.program is logic
+        assert cache.image(_build_stranded()[0]) is not image
+
+    def test_released_runner_is_reset_and_reused(self) -> None:
+        logic, *_ = _build_stranded()
+        cache = ProgramImageCache()
+        first = cache.plc(logic, dt=0.05)
+        first.patch({"Sensor": True})
+        first.step()
+
+        # Leased runners are never handed out twice.
+        second = cache.plc(logic, dt=0.05)
+        other = cache.plc(logic, dt=0.1)
+        assert len({id(first), id(second), id(other)}) == 3
+
+        cache.release()
+        reused = {cache.plc(logic, dt=0.05), cache.plc(logic, dt=0.05)}
+
+        assert reused == {first, second}
+        assert first.current_state is cache.image(logic).initial_state
+        assert first._dt == 0.05
+
+    def test_container_options_are_keyed_by_content(self) -> None:
+        image = ProgramImageCache().image(_build_stranded()[0])
+
+        first = _options_key(image, {"extra": {"b": [1, 2], "a": {3}}, "dt": 0.1})
+        second = _options_key(image, {"dt": 0.1, "extra": {"a": {3}, "b": [1, 2]}})
+
+        assert first is not None and first == second
+        assert _options_key(image, {"extra": {"b": (1, 2), "a": {3}}, "dt": 0.1}) != first
+
+    def test_unhashable_option_bypasses_the_pool(self) -> None:
+        class _Duration(str):
+            __hash__ = None  # type: ignore[assignment]  # ty: ignore[invalid-assignment]
+
+        logic, *_ = _build_stranded()
+        cache = ProgramImageCache()
+        first = cache.plc(logic, history=_Duration("10s"))
+        cache.release()
+        second = cache.plc(logic, history=_Duration("10s"))
+
+        assert second is not first
+        assert second._history_retention_scans == first._history_retention_scans
+
+    def test_rejects_initial_state(self) -> None:
+        logic, *_ = _build_stranded()
+        with pytest.raises(TypeError, match="initial_state"):
+            ProgramImageCache().plc(logic, initial_state=None)
+
 
 # ---------------------------------------------------------------------------
 # H4: Whitelist
@@ -464,3 +632,45 @@ class TestPluginIntegration:
         data = json.loads((pytester.path / "coverage.json").read_text(encoding="utf-8"))
         # test_trip_and_reset exercises rung 1 → no cold rungs
         assert 1 not in data["cold_rungs"]
+
+    def test_pooled_runners_start_fresh_each_test(self, pytester: pytest.Pytester) -> None:
+        pytester.makeconftest(
+            """
+            import pytest
+            from pyrung.core import Bool, Program, Rung, latch
+
+            pytest_plugins = ["pyrung.pytest_plugin"]
+
+            Sensor = Bool("Sensor")
+            Fault = Bool("Fault")
+            with Program() as logic:
+                with Rung(Sensor):
+                    latch(Fault)
+
+            RUNNERS = []
+
+            @pytest.fixture
+            def plc(pyrung_images, pyrung_coverage):
+                runner = pyrung_images.plc(logic)
+                RUNNERS.append(runner)
+                yield runner
+                pyrung_coverage.collect(runner)
+            """
+        )
+        pytester.makepyfile(
+            """
+            from conftest import RUNNERS
+
+            def test_trip(plc):
+                plc.patch({"Sensor": True})
+                plc.step()
+                assert plc.current_state.tags["Fault"] is True
+
+            def test_starts_clear(plc):
+                assert plc is RUNNERS[0]
+                assert plc.current_state.tags["Fault"] is False
+                assert plc.current_state.scan_id == 0
+            """
+        )
+        result = pytester.runpytest("--pyrung-coverage-json=coverage.json")
+        result.assert_outcomes(passed=2)
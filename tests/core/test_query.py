@@ -222,6 +222,66 @@ class TestHotRungs:
         assert 0 not in hot
 
 
+class TestCoverageMatrix:
+    """plc.query.coverage_matrix() — per-rung stats from firing ranges."""
+
+    @staticmethod
+    def _run_latch_pattern() -> PLC:
+        A = Bool("A")
+        X = Bool("X")
+        B = Bool("B")
+        Y = Bool("Y")
+
+        with Program() as logic:
+            with Rung(A):
+                latch(X)
+            with Rung(B):
+                out(Y)
+            with Rung(And(A, B)):
+                latch(Bool("Never"))
+
+        runner = PLC(logic)
+        runner.run(2)  # scans 1-2: latch idle
+        runner.patch({"A": True})
+        runner.run(2)  # scans 3-4
+        runner.patch({"A": False})
+        runner.run(4)  # scans 5-8: idle
+        runner.patch({"A": True})
+        runner.step()  # scan 9
+        runner.patch({"A": False})
+        runner.step()  # scan 10
+        return runner
+
+    def test_counts_first_last_and_duty_cycle(self) -> None:
+        runner = self._run_latch_pattern()
+
+        latch_row, out_row, never_row = runner.query.coverage_matrix()
+
+        assert latch_row.window == (1, 10)
+        assert (latch_row.fire_count, latch_row.first_fired, latch_row.last_fired) == (3, 3, 9)
+        assert latch_row.duty_cycle == 0.3
+        assert out_row.hot and out_row.duty_cycle == 1.0
+        assert never_row.cold and never_row.first_fired is None
+
+    def test_window_restricts_the_query(self) -> None:
+        runner = self._run_latch_pattern()
+
+        assert runner.query.fire_counts((4, 8)) == {0: 1, 1: 5, 2: 0}
+        assert runner.query.hot_rungs((3, 4)) == [0, 1]
+        assert runner.query.cold_rungs((5, 8)) == [0, 2]
+        assert runner.query.cold_rungs() == [2]
+
+    def test_matches_per_scan_firings(self) -> None:
+        runner = self._run_latch_pattern()
+        timelines = runner._rung_firing_timelines
+
+        for row in runner.query.coverage_matrix((2, 9)):
+            fired = [sid for sid in range(2, 10) if row.rung_index in timelines.fired_on(sid)]
+            assert row.fire_count == len(fired)
+            assert row.first_fired == (fired[0] if fired else None)
+            assert row.last_fired == (fired[-1] if fired else None)
+
+
 # ---------------------------------------------------------------------------
 # G3: stranded_bits
 # ---------------------------------------------------------------------------
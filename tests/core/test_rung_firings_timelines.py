@@ -52,6 +52,21 @@ def test_stable_rung_single_range() -> None:
     assert range_.payload.pattern == pattern
 
 
+def test_window_coverage_clips_ranges_to_window() -> None:
+    """Fire counts and first/last come from range overlap, not per-scan lookups."""
+    timelines = RungFiringTimelines()
+    a = pmap({"X": True})
+    b = pmap({"X": False})
+    for scan_id in (*range(10, 20), *range(30, 34), 50):
+        timelines.append(0, scan_id, a if scan_id % 2 else b)
+
+    assert timelines.window_coverage(0, 0, 100) == (15, 10, 50)
+    assert timelines.window_coverage(0, 15, 31) == (7, 15, 31)
+    assert timelines.window_coverage(0, 20, 29) == (0, None, None)
+    assert timelines.window_coverage(0, 40, 30) == (0, None, None)
+    assert timelines.window_coverage(1, 0, 100) == (0, None, None)
+
+
 def test_pattern_cycle_interning() -> None:
     """Three stable runs of A, B, A produce three ranges and two canonical PMaps."""
     timelines = RungFiringTimelines()
@@ -0,0 +1,124 @@
+"""Tests for measured scan timing, sys.scan_exec_* points, and the watchdog."""
+
+from __future__ import annotations
+
+import pytest
+
+from pyrung.core import PLC, Bool, Dint, Program, Rung, copy, out, system
+from pyrung.core.scan_stats import ScanStats, ScanWatchdogError
+
+
+def _program() -> Program:
+    with Program(strict=False) as logic:
+        with Rung(Bool("Button")):
+            out(Bool("Light"))
+    return logic
+
+
+def _resolved(runner: PLC, tag_name: str):
+    found, value = runner.debug.system_runtime.resolve(tag_name, runner.current_state)
+    assert found is True
+    return value
+
+
+def test_scan_stats_aggregates_and_histogram() -> None:
+    stats = ScanStats(window=4, budget_ns=10_000)
+    for scan_id, total_us in enumerate([3, 5, 12, 7, 1], start=1):
+        stats.record(scan_id, 0, total_us * 1000, 0, 0)
+
+    assert stats.count == 5
+    assert stats.overruns == 1
+    assert stats.min_ns == 1_000
+    assert stats.max_ns == 12_000
+    assert [t.scan_id for t in stats.recent()] == [2, 3, 4, 5]
+    assert stats.percentile(50) == 5_000
+    assert stats.percentile(100) == 12_000
+    assert stats.histogram() == [(1, 1), (2, 0), (4, 0), (8, 2), (16, 1)]
+
+
+def test_runner_records_timing_and_exposes_sys_points() -> None:
+    runner = PLC(_program())
+    assert runner.current_state.tags.get("sys.scan_exec_us") is None
+
+    runner.run(cycles=3)
+
+    stats = runner.scan_stats
+    assert stats.count == 3
+    last = stats.last
+    assert last is not None
+    assert last.scan_id == runner.current_state.scan_id
+    assert min(last.prepare_ns, last.logic_ns, last.commit_ns, last.history_ns) >= 0
+    assert _resolved(runner, system.sys.scan_exec_us.name) == last.total_ns // 1000
+    assert _resolved(runner, system.sys.scan_exec_max_us.name) == stats.max_ns // 1000
+    assert _resolved(runner, system.sys.scan_overrun_count.name) == 0
+    # Measured timing never lands in state, so replay stays deterministic.
+    assert "sys.scan_exec_us" not in runner.current_state.tags
+
+
+def test_scan_stats_window_wraps_in_order() -> None:
+    stats = ScanStats(window=3)
+    assert stats.last is None
+    assert stats.recent() == []
+    for scan_id in range(1, 6):
+        stats.record(scan_id, scan_id, 0, 0, 0)
+
+    assert [t.scan_id for t in stats.recent()] == [3, 4, 5]
+    last = stats.last
+    assert last is not None and last.scan_id == 5 and last.total_ns == 5
+    stats.reset()
+    assert stats.recent() == [] and stats.count == 0
+
+
+def test_scan_exec_reads_are_logged_and_replayed() -> None:
+    seen = Dint("Seen")
+    with Program(strict=False) as logic:
+        with Rung():
+            copy(system.sys.scan_exec_us, seen)
+    runner = PLC(logic)
+    runner.run(cycles=4)
+    assert runner._compiled_replay_supported_kernel() is not None
+
+    recorded = runner._scan_log.snapshot().scan_exec_by_scan
+    assert sorted(recorded) == [1, 2, 3, 4]
+    assert recorded[1][0] == 0
+    for scan_id in range(1, 5):
+        expected = runner.history.at(scan_id).tags["Seen"]
+        assert expected == recorded[scan_id][0]
+        assert runner.replay_to(scan_id).current_state.tags["Seen"] == expected
+        assert runner._replay_to_interpreted(scan_id).current_state.tags["Seen"] == expected
+
+
+def test_scans_without_scan_exec_reads_log_nothing() -> None:
+    runner = PLC(_program())
+    runner.run(cycles=3)
+    assert runner._scan_log.snapshot().scan_exec_by_scan == {}
+
+
+def test_watchdog_warns_by_default() -> None:
+    runner = PLC(_program(), watchdog=1e-9)
+    with pytest.warns(RuntimeWarning, match="watchdog budget"):
+        runner.step()
+    assert runner.scan_stats.overruns == 1
+    assert _resolved(runner, system.sys.scan_overrun_count.name) == 1
+
+
+def test_watchdog_raise_after_commit() -> None:
+    runner = PLC(_program(), watchdog=1e-9, watchdog_action="raise")
+    with pytest.raises(ScanWatchdogError) as excinfo:
+        runner.step()
+    assert excinfo.value.timing.scan_id == runner.current_state.scan_id == 1
+
+
+def test_watchdog_stop_ends_run_loop() -> None:
+    runner = PLC(_program(), watchdog=1e-9, watchdog_action="stop")
+    runner.run(cycles=5)
+    assert runner.current_state.scan_id == 1
+    assert _resolved(runner, system.sys.mode_run.name) is False
+
+
+def test_watchdog_argument_validation() -> None:
+    assert PLC(watchdog="5ms").scan_stats.budget_ns == 5_000_000
+    with pytest.raises(ValueError, match="watchdog_action"):
+        PLC(watchdog=0.01, watchdog_action="panic")  # ty: ignore[invalid-argument-type]
+    with pytest.raises(ValueError, match="watchdog must be > 0"):
+        PLC(watchdog=0)
@@ -13,6 +13,7 @@ from pyrung.core import (
     Int,
     Program,
     Rung,
+    SystemState,
     TagType,
     TimeMode,
     calc,
@@ -333,6 +334,16 @@ def test_read_only_system_points_reject_logic_and_patch_writes(runner_factory):
         runner.patch({system.sys.always_on.name: False})
 
 
+def test_read_only_system_points_reject_paired_writes():
+    from pyrung.core.context import ScanContext
+
+    ctx = ScanContext(SystemState(), read_only_tags=frozenset({system.sys.always_on.name}))
+
+    with pytest.raises(ValueError, match="read-only system point"):
+        ctx.set_tag_pair("Done", True, system.sys.always_on.name, False)
+    assert ctx._tags_pending == {}
+
+
 def test_storage_sd_read_only_status_points_reject_logic_patch_and_force(runner_factory):
     with Program() as program:
         with Rung():
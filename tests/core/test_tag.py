@@ -528,6 +528,21 @@ class TestTagNameInference:
         assert Light.name == "Light"
         assert not any(issubclass(x.category, PyrungNameWarning) for x in w)
 
+    def test_internal_definitions_skip_inference(self, monkeypatch):
+        import warnings
+
+        from pyrung.core import Bool, _naming
+
+        def fail(frame):
+            raise AssertionError("inference should not run")
+
+        monkeypatch.setattr(_naming, "_infer_assignment_name", fail)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            Foo = Bool("sys.bar", _internal=True)
+
+        assert Foo.name == "sys.bar"
+
     def test_no_assignment_raises(self):
         import pytest
 
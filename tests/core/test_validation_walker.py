@@ -29,6 +29,7 @@ from pyrung.core.validation.walker import (
     OperandFact,
     ProgramFacts,
     walk_program,
+    walk_rung,
 )
 
 # ---------------------------------------------------------------------------
@@ -623,3 +624,41 @@ class TestImmediateWrapperFacts:
         assert wrapped.metadata["wrapped_value_kind"] == "block_range"
         assert child.value_kind == "block_range"
         assert child.metadata["block_name"] == "Y"
+
+
+class TestWalkRung:
+    def test_walk_rung_matches_program_facts(self):
+        A = Bool("A")
+        B = Bool("B")
+
+        with Program() as prog:
+            with Rung(A):
+                out(B)
+            with Rung(A, B):
+                out(Bool("C"))
+            with subroutine("sub"):
+                with Rung(B):
+                    copy(1, DS[1])
+
+        program_facts = walk_program(prog).operands
+        per_rung = [
+            *walk_rung(prog.rungs[0]),
+            *walk_rung(prog.rungs[1], rung_index=1),
+            *walk_rung(prog.subroutines["sub"][0], scope="subroutine", subroutine="sub"),
+        ]
+
+        assert tuple(per_rung) == program_facts
+
+    def test_walk_program_is_memoized_until_program_changes(self):
+        with Program(strict=False) as prog:
+            with Rung(Bool("A")):
+                out(Bool("B"))
+
+        facts = walk_program(prog)
+        assert walk_program(prog) is facts
+
+        with prog:
+            with Rung(Bool("C")):
+                out(Bool("D"))
+
+        assert walk_program(prog) is not facts
@@ -3072,6 +3072,78 @@ def test_continue_emits_scan_frames(tmp_path: Path):
         assert "monitors" in body
 
 
+def _toggle_pair_script() -> str:
+    return (
+        "from pyrung.core import Bool, PLC, Program, Rung, out\n"
+        "\n"
+        "TickA = Bool('TickA')\n"
+        "TickB = Bool('TickB')\n"
+        "\n"
+        "with Program(strict=False) as prog:\n"
+        "    with Rung(~TickA):\n"
+        "        out(TickA)\n"
+        "    with Rung(~TickB):\n"
+        "        out(TickB)\n"
+        "\n"
+        "runner = PLC(prog)\n"
+    )
+
+
+def test_subscribe_tags_limits_scan_frame_changes(tmp_path: Path):
+    out_stream = io.BytesIO()
+    adapter = DAPAdapter(in_stream=io.BytesIO(), out_stream=out_stream)
+    script = _write_script(tmp_path, "logic.py", _toggle_pair_script())
+
+    _send_request(adapter, out_stream, seq=1, command="launch", arguments={"program": str(script)})
+    _send_request(adapter, out_stream, seq=2, command="configurationDone")
+    response = _single_response(
+        _send_request(
+            adapter,
+            out_stream,
+            seq=3,
+            command="pyrungSubscribeTags",
+            arguments={"tags": ["TickA"]},
+        )
+    )
+    assert response["success"] is True
+    assert response["body"] == {"tags": ["TickA"]}
+
+    _send_request(adapter, out_stream, seq=4, command="continue")
+    time.sleep(0.05)
+    _send_request(adapter, out_stream, seq=5, command="pause")
+
+    frames: list[dict[str, Any]] = []
+    for _ in range(200):
+        _drain_internal_events_with_wait(adapter)
+        flushed = _drain_messages(out_stream)
+        frames.extend(_scan_frame_events(flushed))
+        if _stopped_events(flushed):
+            break
+
+    changed = {change["tag"] for frame in frames for change in frame["body"]["changes"]}
+    assert changed == {"TickA"}
+    assert "TickB" in frames[-1]["body"]["trace"]["tagValues"]
+
+
+def test_subscribe_tags_rejects_non_string_entries(tmp_path: Path):
+    out_stream = io.BytesIO()
+    adapter = DAPAdapter(in_stream=io.BytesIO(), out_stream=out_stream)
+    script = _write_script(tmp_path, "logic.py", _runner_script())
+
+    _send_request(adapter, out_stream, seq=1, command="launch", arguments={"program": str(script)})
+    response = _single_response(
+        _send_request(
+            adapter,
+            out_stream,
+            seq=2,
+            command="pyrungSubscribeTags",
+            arguments={"tags": [1]},
+        )
+    )
+    assert response["success"] is False
+    assert adapter._session.subscribed_tags is None
+
+
 def test_continue_scan_frame_requires_configuration_done(tmp_path: Path):
     out_stream = io.BytesIO()
     adapter = DAPAdapter(in_stream=io.BytesIO(), out_stream=out_stream)
@@ -0,0 +1,219 @@
+"""Tests for the per-scan telemetry stream."""
+
+from __future__ import annotations
+
+import time
+import warnings
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pyrung.core import PLC, Bool, Int, Program, Rung, copy, out
+from pyrung.dap.live import send_command
+from pyrung.dap.telemetry import (
+    TelemetryClient,
+    TelemetryFrame,
+    TelemetryServer,
+    _ClientStream,
+    _ScanRecord,
+    decode_records,
+)
+from tests.dap.test_live import _setup_with_session
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _program() -> PLC:
+    button = Bool("Button")
+    light = Bool("Light")
+    count = Int("Count")
+    with Program(strict=False) as prog:
+        with Rung(button):
+            out(light)
+            copy(7, count)
+    return PLC(prog, dt=0.010)
+
+
+def _wait_for_snapshot(client: TelemetryClient) -> TelemetryFrame:
+    deadline = time.monotonic() + 2.0
+    while time.monotonic() < deadline:
+        frames = client.read(timeout=0.1)
+        if frames:
+            assert frames[0].snapshot
+            return frames[0]
+    raise AssertionError("client never received its snapshot")
+
+
+def _read_frames(client: TelemetryClient, count: int) -> list[TelemetryFrame]:
+    frames: list[TelemetryFrame] = []
+    deadline = time.monotonic() + 2.0
+    while len(frames) < count and time.monotonic() < deadline:
+        frames.extend(client.read(timeout=0.1))
+    return frames
+
+
+@pytest.fixture()
+def server():
+    plc = _program()
+    server = TelemetryServer(plc, f"test_{id(plc)}")
+    server.start()
+    yield plc, server
+    server.stop()
+
+
+# ---------------------------------------------------------------------------
+# Encoding
+# ---------------------------------------------------------------------------
+
+
+def test_encode_decode_round_trip_with_drops() -> None:
+    stream = _ClientStream(conn=None, subscribed=None, last_seq=0)
+    records = [
+        _ScanRecord(1, 10, 0.1, 25, (0, 2), {"A": True, "N": -5}),
+        _ScanRecord(4, 13, 0.13, 30, (), {"R": 1.5, "S": "hi", "A": None}),
+    ]
+    tag_names: dict[int, str] = {}
+
+    frames = decode_records(stream.encode(records), tag_names)
+
+    assert frames == [
+        TelemetryFrame(10, 0.1, 25, (0, 2), {"A": True, "N": -5}),
+        TelemetryFrame(13, 0.13, 30, (), {"R": 1.5, "S": "hi", "A": None}, dropped=2),
+    ]
+    assert sorted(tag_names.values()) == ["A", "N", "R", "S"]
+
+
+def test_subscription_filters_values_but_keeps_scan_records() -> None:
+    stream = _ClientStream(conn=None, subscribed=frozenset({"B"}))
+    records = [_ScanRecord(1, 1, 0.0, 0, (0,), {"A": 1, "B": 2})]
+
+    (frame,) = decode_records(stream.encode(records), {})
+
+    assert frame.values == {"B": 2}
+    assert frame.rungs == (0,)
+
+
+def test_snapshot_record_carries_full_state_and_resets_drop_count() -> None:
+    stream = _ClientStream(conn=None, subscribed=None, needs_snapshot=True)
+    snapshot = _ScanRecord(5, 3, 0.03, 0, (), {"A": True, "N": 4})
+
+    payload = stream.encode_snapshot(snapshot) + stream.encode(
+        [_ScanRecord(6, 4, 0.04, 10, (), {"N": 5})]
+    )
+    frames = decode_records(payload, {})
+
+    assert frames == [
+        TelemetryFrame(3, 0.03, 0, (), {"A": True, "N": 4}, snapshot=True),
+        TelemetryFrame(4, 0.04, 10, (), {"N": 5}),
+    ]
+    assert not stream.needs_snapshot
+
+
+def test_tag_id_overflow_warns_once() -> None:
+    stream = _ClientStream(conn=None, subscribed=None, last_seq=0)
+    stream.tag_ids = {f"T{i}": i for i in range(0x10000)}
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        (frame,) = decode_records(
+            stream.encode([_ScanRecord(1, 1, 0.0, 0, (), {"Extra": 1, "More": 2})]),
+            {},
+        )
+        stream.encode([_ScanRecord(2, 2, 0.0, 0, (), {"Other": 3})])
+
+    assert frame.values == {}
+    assert [w.category for w in caught] == [RuntimeWarning]
+    assert "ran out of tag ids" in str(caught[0].message)
+
+
+# ---------------------------------------------------------------------------
+# Server ↔ client
+# ---------------------------------------------------------------------------
+
+
+def test_client_tails_changed_tags_and_rung_firings(server: Any) -> None:
+    plc, srv = server
+    with TelemetryClient(srv.session_name) as client:
+        _wait_for_snapshot(client)
+        plc.patch({"Button": True})
+        plc.step()
+        plc.step()
+
+        frames = _read_frames(client, 2)
+
+    assert [f.scan_id for f in frames] == [1, 2]
+    assert frames[0].values["Light"] is True
+    assert frames[0].values["Count"] == 7
+    assert frames[0].rungs == (0,)
+    assert "Light" not in frames[1].values
+
+
+def test_client_receives_full_snapshot_on_attach(server: Any) -> None:
+    plc, srv = server
+    plc.patch({"Button": True})
+    plc.step()
+    with TelemetryClient(srv.session_name, tags=["Light", "Count"]) as client:
+        snapshot = _wait_for_snapshot(client)
+        plc.step()
+
+        (frame,) = _read_frames(client, 1)
+
+    assert snapshot.scan_id == 1
+    assert snapshot.values == {"Light": True, "Count": 7}
+    assert frame.scan_id == 2
+    assert frame.dropped == 0
+
+
+def test_client_subscription_limits_stream(server: Any) -> None:
+    plc, srv = server
+    with TelemetryClient(srv.session_name, tags=["Count"]) as client:
+        _wait_for_snapshot(client)
+        plc.patch({"Button": True})
+        plc.step()
+
+        (frame,) = _read_frames(client, 1)
+
+    assert frame.values == {"Count": 7}
+
+
+def test_stop_detaches_hooks_and_removes_port_file(server: Any) -> None:
+    plc, srv = server
+    srv.stop()
+
+    assert srv._on_commit not in plc._post_commit_callbacks
+    assert srv._on_pre_scan not in plc._pre_scan_callbacks
+    with pytest.raises(FileNotFoundError):
+        TelemetryClient(srv.session_name)
+
+
+# ---------------------------------------------------------------------------
+# DAP console
+# ---------------------------------------------------------------------------
+
+
+def test_console_telemetry_follows_runner(tmp_path: Path) -> None:
+    session_name = f"test_telemetry_{id(tmp_path)}"
+    adapter, _out = _setup_with_session(tmp_path, session_name)
+    try:
+        ok, text = send_command(session_name, "telemetry start")
+        assert ok, text
+        server = adapter._telemetry
+        assert server is not None
+        runner = adapter._runner
+        assert server._on_commit in runner._post_commit_callbacks
+
+        forked = runner.fork()
+        adapter._runner = forked
+        assert server._on_commit not in runner._post_commit_callbacks
+        assert server._on_commit in forked._post_commit_callbacks
+
+        ok, text = send_command(session_name, "telemetry stop")
+        assert ok, text
+        assert adapter._telemetry is None
+        assert server._on_commit not in forked._post_commit_callbacks
+    finally:
+        if adapter._live_server is not None:
+            adapter._live_server.stop()